@@ -47,9 +47,14 @@ class SimParams:
     contact_gap_max: float = 1e-3
     wall_gap: float = 1e-3
     enable_ccd: bool = True
+    enable_contact_cache: bool = False
+    contact_cache_margin: float = 0.002
+    adaptive_contact_detection: bool = False
+    contact_redetect_margin: float = 0.001
     enable_friction: bool = False
     friction_mu: float = 0.1
     friction_epsilon: float = 1e-5
+    friction_lagged: bool = False
     velocity_damping: float = 0.0
     contact_restitution: float = 0.0
     enable_strain_limiting: bool = False
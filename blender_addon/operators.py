@@ -1,5 +1,7 @@
 import bpy
 from bpy.types import Operator
+from bpy_extras.io_utils import ExportHelper
+import json
 import numpy as np
 from collections import Counter
 from pathlib import Path
@@ -15,6 +17,7 @@ def _core_supports_full_simulation(module) -> bool:
         "Integrator",
         "EnergyTracker",
         "CollisionValidator",
+        "Diagnostics",
         "AdaptiveTimestep",
         "RigidBody",
     ]
@@ -110,6 +113,9 @@ def _default_stats():
         # Energy tracking
         'kinetic_energy': 0.0,
         'elastic_energy': 0.0,
+        'barrier_energy': 0.0,
+        'strain_limit_energy': 0.0,
+        'friction_energy': 0.0,
         'total_energy': 0.0,
         'initial_energy': 0.0,
         'energy_drift_percent': 0.0,
@@ -132,9 +138,41 @@ def _default_stats():
         'has_tunneling': False,
         'has_major_penetration': False,
         'num_rigid_bodies': 0,
+        # Native step profile (per-step means): last frame's substeps and whole run
+        'step_profile': {},
+        'run_profile': {},
     }
 
 
+# Material and solver fields shared by the live simulation and the batch scene
+# export; ``dt`` is kept out of PARAM_FIELDS because the property is in ms.
+MATERIAL_FIELDS = ('youngs_modulus', 'poisson_ratio', 'density', 'thickness')
+PARAM_FIELDS = (
+    'beta_max', 'min_newton_steps', 'max_newton_steps',
+    'pcg_tol', 'pcg_max_iters',
+    'line_search_toi', 'line_search_toi_safety',
+    'contact_gap_max', 'wall_gap', 'enable_ccd',
+    'enable_contact_cache', 'contact_cache_margin',
+    'adaptive_contact_detection', 'contact_redetect_margin',
+    'enable_friction', 'friction_mu', 'friction_epsilon', 'friction_lagged',
+    'velocity_damping', 'contact_restitution',
+    'enable_strain_limiting', 'strain_limit', 'strain_tau',
+)
+
+
+def _material_values_from_props(props):
+    """Material property values keyed by Material attribute name"""
+    mat_props = props.material_properties
+    return {key: getattr(mat_props, key) for key in MATERIAL_FIELDS}
+
+
+def _param_values_from_props(props):
+    """Solver property values keyed by SimParams attribute name (dt in seconds)"""
+    values = {'dt': props.dt / 1000.0}  # Convert ms to seconds
+    values.update((key, getattr(props, key)) for key in PARAM_FIELDS)
+    return values
+
+
 def _init_material_from_props(abc, props):
     """Initialize a Material object from Blender scene properties.
     
@@ -145,12 +183,9 @@ def _init_material_from_props(abc, props):
     Returns:
         Initialized Material object
     """
-    mat_props = props.material_properties
     material = abc.Material()
-    material.youngs_modulus = mat_props.youngs_modulus
-    material.poisson_ratio = mat_props.poisson_ratio
-    material.density = mat_props.density
-    material.thickness = mat_props.thickness
+    for key, value in _material_values_from_props(props).items():
+        setattr(material, key, value)
     return material
 
 
@@ -165,23 +200,8 @@ def _init_params_from_props(abc, props):
         Initialized SimParams object
     """
     params = abc.SimParams()
-    params.dt = props.dt / 1000.0  # Convert ms to seconds
-    params.beta_max = props.beta_max
-    params.min_newton_steps = props.min_newton_steps
-    params.max_newton_steps = props.max_newton_steps
-    params.pcg_tol = props.pcg_tol
-    params.pcg_max_iters = props.pcg_max_iters
-    params.contact_gap_max = props.contact_gap_max
-    params.wall_gap = props.wall_gap
-    params.enable_ccd = props.enable_ccd
-    params.enable_friction = props.enable_friction
-    params.friction_mu = props.friction_mu
-    params.friction_epsilon = props.friction_epsilon
-    params.velocity_damping = props.velocity_damping
-    params.contact_restitution = props.contact_restitution
-    params.enable_strain_limiting = props.enable_strain_limiting
-    params.strain_limit = props.strain_limit
-    params.strain_tau = props.strain_tau
+    for key, value in _param_values_from_props(props).items():
+        setattr(params, key, value)
     return params
 
 
@@ -244,7 +264,6 @@ def _collect_rigid_bodies(context, exclude_obj=None, reporter=None):
         rigid_entries.append({
             'object': obj,
             'body': body,
-            'rest_vertices': rest_vertices,
             'initial_matrix': obj.matrix_world.copy(),
             'name': obj.name,
         })
@@ -252,34 +271,14 @@ def _collect_rigid_bodies(context, exclude_obj=None, reporter=None):
     return rigid_entries
 
 
-def _compute_rigid_transform(rest_vertices, new_vertices):
-    """Find best-fit rigid transform that maps rest vertices to new vertices."""
-
-    if len(rest_vertices) < 3 or len(new_vertices) < 3:
-        return None, None
-
-    rest = np.asarray(rest_vertices, dtype=np.float64)
-    new = np.asarray(new_vertices, dtype=np.float64)
-
-    rest_center = rest.mean(axis=0)
-    new_center = new.mean(axis=0)
-
-    rest_zero = rest - rest_center
-    new_zero = new - new_center
-
-    H = rest_zero.T @ new_zero
-    try:
-        U, _S, Vt = np.linalg.svd(H)
-    except np.linalg.LinAlgError:
-        return None, None
-
-    R = Vt.T @ U.T
-    if np.linalg.det(R) < 0:
-        Vt[-1, :] *= -1
-        R = Vt.T @ U.T
+def _bake_trace_path(obj) -> str:
+    """Trace file for a bake: next to the .blend, or the temp dir if unsaved."""
 
-    t = new_center - R @ rest_center
-    return R, t
+    safe_name = ''.join(c if c.isalnum() or c in '-_.' else '_' for c in obj.name)
+    filename = f"{safe_name}_bake.trace.json"
+    if bpy.data.filepath:
+        return str(Path(bpy.path.abspath("//")) / filename)
+    return str(Path(bpy.app.tempdir or ".") / filename)
 
 
 def _update_rigid_objects(rigid_entries):
@@ -293,24 +292,14 @@ def _update_rigid_objects(rigid_entries):
         obj = entry['object']
 
         try:
-            new_vertices = np.array(body.world_vertices(), dtype=np.float64)
+            transform = body.transform()
         except AttributeError:
             continue
 
-        if new_vertices.size == 0:
-            continue
-
-        transform = _compute_rigid_transform(entry['rest_vertices'], new_vertices)
-        if not transform or transform[0] is None:
-            continue
-
-        R, t = transform
-        rot_mat = Matrix(((R[0, 0], R[0, 1], R[0, 2]),
-                          (R[1, 0], R[1, 1], R[1, 2]),
-                          (R[2, 0], R[2, 1], R[2, 2])))
-        rot_mat.resize_4x4()
-        rot_mat.translation = Vector((t[0], t[1], t[2]))
-        obj.matrix_world = rot_mat
+        # The body was initialised from world-space vertices, so its transform
+        # maps the starting world pose to the current one
+        world_delta = Matrix(transform.tolist())
+        obj.matrix_world = world_delta @ entry['initial_matrix']
 
 
 # Global simulation state for real-time preview
@@ -322,9 +311,11 @@ _sim_state = {
     'initialized': False,
     'frame': 0,
     'playing': False,
-    'debug_contacts': [],  # List of per-contact dicts
+    'debug_contacts': {},  # Contact arrays: positions, normals, types (ContactType values)
     'debug_pins': [],  # List of pinned vertex positions
     'stats': _default_stats(),
+    'profile_summary': None,  # StepProfileSummary over the current session
+    'dt_controller': None,  # AdaptiveTimestep (cached edge stats, dt history)
     'rigid_entries': [],
     'rigids': [],
     'rigid_objects': [],
@@ -453,7 +444,17 @@ class ANDO_OT_bake_simulation(Operator):
         # Baking loop
         start_frame = props.cache_start
         end_frame = props.cache_end
-        steps_per_frame = max(1, int(1.0 / (props.dt / 1000.0) / 24.0))  # Aim for 24 fps
+        fps = context.scene.render.fps / context.scene.render.fps_base
+        frame_dt = 1.0 / fps
+        steps_per_frame = max(1, int(frame_dt / (props.dt / 1000.0)))
+
+        # Adaptive timestep: variable substeps per frame, sized by solver difficulty
+        scheduler = None
+        if props.enable_adaptive_dt:
+            scheduler = abc.SubstepScheduler(params.dt)
+            scheduler.settings.dt_min = props.dt_min / 1000.0  # ms → s
+            scheduler.settings.dt_max = props.dt_max / 1000.0
+            scheduler.settings.cfl_safety = props.cfl_safety_factor
         
         # Create shape keys for animation
         if not obj.data.shape_keys:
@@ -467,7 +468,10 @@ class ANDO_OT_bake_simulation(Operator):
         
         basis = obj.data.shape_keys.key_blocks['Basis']
         
-        self.report({'INFO'}, f"Baking frames {start_frame} to {end_frame} ({steps_per_frame} substeps/frame at {props.dt}ms)")
+        if scheduler is not None:
+            self.report({'INFO'}, f"Baking frames {start_frame} to {end_frame} (adaptive substeps, {props.dt_min}-{props.dt_max}ms)")
+        else:
+            self.report({'INFO'}, f"Baking frames {start_frame} to {end_frame} ({steps_per_frame} substeps/frame at {props.dt}ms)")
         
         # Gravity vector (Blender Z-up)
         gravity = np.array([0.0, 0.0, -9.81], dtype=np.float32)
@@ -479,6 +483,12 @@ class ANDO_OT_bake_simulation(Operator):
         wm = context.window_manager
         wm.progress_begin(0, total_frames)
         
+        bake_profile = abc.StepProfileSummary()
+        rejected_substeps = 0
+        if props.cache_trace:
+            abc.TraceRecorder.clear()
+            abc.TraceRecorder.enable()
+        
         try:
             for frame_idx, frame in enumerate(range(start_frame, end_frame + 1)):
                 # Update progress bar
@@ -493,15 +503,24 @@ class ANDO_OT_bake_simulation(Operator):
                 shape_key = obj.shape_key_add(name=f'frame_{frame:04d}', from_mix=False)
                 
                 # Simulate steps for this frame
-                for step in range(steps_per_frame):
-                    # Apply gravity acceleration
-                    state.apply_gravity(gravity, params.dt)
-                    
-                    # Take physics step
-                    if rigid_bodies:
-                        abc.Integrator.step(mesh, state, constraints, params, rigid_bodies)
-                    else:
-                        abc.Integrator.step(mesh, state, constraints, params)
+                if scheduler is not None:
+                    report = scheduler.advance_frame(
+                        mesh, state, constraints, params, frame_dt, gravity,
+                        rigid_bodies if rigid_bodies else None,
+                    )
+                    bake_profile.merge(report.profile)
+                    rejected_substeps += report.rejected
+                else:
+                    for step in range(steps_per_frame):
+                        # Apply gravity acceleration
+                        state.apply_gravity(gravity, params.dt)
+
+                        # Take physics step
+                        if rigid_bodies:
+                            abc.Integrator.step(mesh, state, constraints, params, rigid_bodies)
+                        else:
+                            abc.Integrator.step(mesh, state, constraints, params)
+                        bake_profile.accumulate(abc.Integrator.last_step_profile(constraints))
                 
                 # Update shape key with new positions
                 positions_world = state.get_positions()
@@ -525,13 +544,108 @@ class ANDO_OT_bake_simulation(Operator):
         finally:
             # Always clean up progress bar
             wm.progress_end()
+            if props.cache_trace:
+                abc.TraceRecorder.disable()
+        
+        if props.cache_trace:
+            trace_path = _bake_trace_path(obj)
+            if abc.TraceRecorder.write(trace_path):
+                self.report({'INFO'}, f"Trace written to {trace_path}")
+            else:
+                self.report({'WARNING'}, f"Could not write trace to {trace_path}")
         
         # Final report with statistics
         num_pins = constraints.num_active_pins()
         self.report({'INFO'}, f"✓ Baking complete! {total_frames} frames with {num_pins} pins and {num_pins_added} pinned vertices")
+        if scheduler is not None and bake_profile.steps:
+            self.report(
+                {'INFO'},
+                f"{bake_profile.steps} substeps ({bake_profile.steps / total_frames:.1f}/frame, "
+                f"{rejected_substeps} retried)",
+            )
+        if bake_profile.steps:
+            mean = bake_profile.mean()
+            self.report(
+                {'INFO'},
+                f"Mean step {mean['total_ms']:.1f}ms: collision {mean['collision_ms']:.1f}, "
+                f"gradient {mean['gradient_ms']:.1f}, assembly {mean['assembly_ms']:.1f}, "
+                f"PCG {mean['pcg_ms']:.1f} ({mean['pcg_iterations']:.0f} it), "
+                f"line search {mean['line_search_ms']:.1f} ({mean['line_search_backtracks']:.1f} backtracks)",
+            )
         
         return {'FINISHED'}
 
+class ANDO_OT_export_batch_scene(Operator, ExportHelper):
+    """Export selected deformable meshes as a batch bake scene description"""
+    bl_idname = "ando.export_batch_scene"
+    bl_label = "Export Batch Scene"
+    bl_options = {'REGISTER'}
+
+    filename_ext = ".json"
+    filter_glob: bpy.props.StringProperty(default="*.json", options={'HIDDEN'})
+
+    def execute(self, context):
+        props = context.scene.ando_barrier
+        depsgraph = context.evaluated_depsgraph_get()
+
+        scene_desc = {
+            'version': 1,
+            'fps': context.scene.render.fps / context.scene.render.fps_base,
+            'frame_start': props.cache_start,
+            'frame_end': props.cache_end,
+            'gravity': [0.0, 0.0, -9.81],
+            'material': _material_values_from_props(props),
+            'params': _param_values_from_props(props),
+            'ground_plane': {'height': props.ground_plane_height} if props.enable_ground_plane else None,
+            'jobs': [],
+        }
+
+        for obj in context.selected_objects:
+            if obj.type != 'MESH':
+                continue
+            obj_props = getattr(obj, "ando_barrier_body", None)
+            if obj_props and obj_props.enabled and obj_props.role != 'DEFORMABLE':
+                continue
+
+            obj_eval = obj.evaluated_get(depsgraph)
+            mesh_eval = obj_eval.to_mesh()
+            if mesh_eval is None:
+                continue
+            mesh_eval.calc_loop_triangles()
+            matrix_world = obj_eval.matrix_world
+            vertices = [list(matrix_world @ v.co) for v in mesh_eval.vertices]
+            triangles = [list(tri.vertices) for tri in mesh_eval.loop_triangles]
+
+            # Read pins from the evaluated mesh so indices match the exported vertices
+            pins = []
+            if "ando_pins" in obj.vertex_groups:
+                pin_index = obj.vertex_groups["ando_pins"].index
+                for i, vertex in enumerate(mesh_eval.vertices):
+                    if any(g.group == pin_index and g.weight > 0.5 for g in vertex.groups):
+                        pins.append(i)
+            obj_eval.to_mesh_clear()
+
+            if not triangles:
+                self.report({'WARNING'}, f"'{obj.name}' has no triangles; skipped")
+                continue
+
+            scene_desc['jobs'].append({
+                'name': obj.name,
+                'vertices': vertices,
+                'triangles': triangles,
+                'pins': pins,
+            })
+
+        if not scene_desc['jobs']:
+            self.report({'ERROR'}, "No deformable mesh objects selected")
+            return {'CANCELLED'}
+
+        with open(self.filepath, 'w') as f:
+            json.dump(scene_desc, f)
+
+        self.report({'INFO'}, f"Exported {len(scene_desc['jobs'])} objects to {self.filepath}")
+        return {'FINISHED'}
+
 class ANDO_OT_reset_simulation(Operator):
     """Reset simulation to initial state"""
     bl_idname = "ando.reset_simulation"
@@ -751,6 +865,8 @@ class ANDO_OT_init_realtime_simulation(Operator):
         _sim_state['frame'] = 0
         _sim_state['playing'] = False
         _sim_state['stats'] = _default_stats()
+        _sim_state['profile_summary'] = None
+        _sim_state['dt_controller'] = None
         _sim_state['debug_pins'] = pin_positions_world
         _sim_state['stats']['num_pins'] = num_pins_added
         _sim_state['rigid_entries'] = rigid_entries
@@ -868,26 +984,16 @@ class ANDO_OT_step_simulation(Operator):
         # Adaptive timestepping (if enabled)
         props = context.scene.ando_barrier
         if props.enable_adaptive_dt:
-            # Compute next timestep using CFL condition
-            velocities = state.get_velocities()
-            current_dt_sec = params.dt  # In seconds
-            dt_min_sec = props.dt_min / 1000.0  # Convert ms to seconds
-            dt_max_sec = props.dt_max / 1000.0
-            
-            new_dt_sec = abc.AdaptiveTimestep.compute_next_dt(
-                velocities, mesh, current_dt_sec,
-                dt_min_sec, dt_max_sec, props.cfl_safety_factor
+            # CFL timestep from the state; the controller keeps the dt history
+            controller = _sim_state.get('dt_controller')
+            if controller is None:
+                controller = abc.AdaptiveTimestep()
+                _sim_state['dt_controller'] = controller
+            params.dt = controller.next_dt(
+                mesh, state, params.dt,
+                props.dt_min / 1000.0, props.dt_max / 1000.0,  # ms → s
+                props.cfl_safety_factor
             )
-            
-            # Update params
-            params.dt = new_dt_sec
-            
-            # Store dt history for diagnostics
-            if 'dt_history' not in _sim_state['stats']:
-                _sim_state['stats']['dt_history'] = []
-            _sim_state['stats']['dt_history'].append(new_dt_sec * 1000.0)  # Store as ms
-            if len(_sim_state['stats']['dt_history']) > 100:
-                _sim_state['stats']['dt_history'].pop(0)
         
         # Calculate steps per frame (aiming for 24 fps)
         steps_per_frame = max(1, int(1.0 / (props.dt / 1000.0) / 24.0))
@@ -896,6 +1002,11 @@ class ANDO_OT_step_simulation(Operator):
         gravity = np.array([0.0, 0.0, -9.81], dtype=np.float32)
         
         # Simulate steps for this frame (with timing)
+        frame_profile = abc.StepProfileSummary()
+        run_profile = _sim_state.get('profile_summary')
+        if run_profile is None:
+            run_profile = abc.StepProfileSummary()
+            _sim_state['profile_summary'] = run_profile
         start_time = time.time()
         for step in range(steps_per_frame):
             state.apply_gravity(gravity, params.dt)
@@ -903,10 +1014,15 @@ class ANDO_OT_step_simulation(Operator):
                 abc.Integrator.step(mesh, state, constraints, params, rigid_bodies)
             else:
                 abc.Integrator.step(mesh, state, constraints, params)
+            step_profile = abc.Integrator.last_step_profile(constraints)
+            frame_profile.accumulate(step_profile)
+            run_profile.accumulate(step_profile)
         end_time = time.time()
 
-        # Compute energy diagnostics
-        energy_diag = abc.EnergyTracker.compute(mesh, state, constraints, params)
+        # Energy, momentum and contact diagnostics in one native pass over
+        # the contacts of the last step (no second collision detection)
+        diagnostics = abc.Diagnostics.compute(mesh, state, constraints, params, rigid_bodies or None)
+        energy_diag = diagnostics.energy
         
         # Get stats reference
         stats = _sim_state['stats']
@@ -926,6 +1042,9 @@ class ANDO_OT_step_simulation(Operator):
         # Update current energy values
         stats['kinetic_energy'] = energy_diag.kinetic_energy
         stats['elastic_energy'] = energy_diag.elastic_energy
+        stats['barrier_energy'] = energy_diag.barrier_energy
+        stats['strain_limit_energy'] = energy_diag.strain_limit_energy
+        stats['friction_energy'] = energy_diag.friction_energy
         stats['total_energy'] = energy_diag.total_energy
         stats['max_velocity'] = energy_diag.max_velocity
         stats['linear_momentum'] = energy_diag.linear_momentum
@@ -962,39 +1081,23 @@ class ANDO_OT_step_simulation(Operator):
         step_time_ms = (end_time - start_time) * 1000.0 / steps_per_frame
         _sim_state['stats']['last_step_time'] = step_time_ms
         _sim_state['stats']['num_pins'] = len(_sim_state['debug_pins'])
+        _sim_state['stats']['step_profile'] = frame_profile.mean()
+        _sim_state['stats']['run_profile'] = run_profile.mean()
         
-        # Collect contact data for visualization and statistics
-        if rigid_bodies:
-            contacts = abc.Integrator.compute_contacts(mesh, state, rigid_bodies)
-        else:
-            contacts = abc.Integrator.compute_contacts(mesh, state)
-        
-        # Compute collision validation metrics
-        collision_metrics = abc.CollisionValidator.compute_metrics(
-            mesh, state, contacts, params.contact_gap_max, params.enable_ccd
-        )
-        
-        debug_contacts = []
-        contact_counter = Counter()
-        for contact in contacts:
-            # Convert Eigen vectors to plain Python tuples for Blender GPU API
-            contact_pos = tuple(float(x) for x in np.asarray(contact.witness_p))
-            contact_normal = tuple(float(x) for x in np.asarray(contact.normal))
-            contact_type = getattr(contact.type, "name", str(contact.type))
-            if isinstance(contact_type, str) and contact_type.startswith("ContactType."):
-                contact_type = contact_type.split(".", 1)[1]
-            debug_contacts.append({
-                'position': contact_pos,
-                'normal': contact_normal,
-                'type': contact_type,
-            })
-            contact_counter[contact_type] += 1
+        # Contact data for visualization and statistics
+        collision_metrics = diagnostics.collision
+        contact_counts = diagnostics.contact_counts
+        debug_contacts = {
+            'positions': diagnostics.contact_positions,
+            'normals': diagnostics.contact_normals,
+            'types': diagnostics.contact_types,
+        }
         
         _sim_state['debug_contacts'] = debug_contacts
         stats = _sim_state['stats']
-        current_count = len(debug_contacts)
+        current_count = diagnostics.num_contacts
         stats['num_contacts'] = current_count
-        stats['contact_counts'] = dict(contact_counter)
+        stats['contact_counts'] = contact_counts
         stats['peak_contacts'] = max(stats.get('peak_contacts', 0), current_count)
         
         # Update collision quality metrics
@@ -1010,7 +1113,7 @@ class ANDO_OT_step_simulation(Operator):
         stats['has_tunneling'] = collision_metrics.has_tunneling
         stats['has_major_penetration'] = collision_metrics.has_major_penetration
         peak_by_type = dict(stats.get('peak_contact_counts', {}))
-        for ctype, count in contact_counter.items():
+        for ctype, count in contact_counts.items():
             peak_by_type[ctype] = max(peak_by_type.get(ctype, 0), count)
         stats['peak_contact_counts'] = peak_by_type
         
@@ -1026,17 +1129,17 @@ class ANDO_OT_step_simulation(Operator):
             # Update heatmaps if enabled
             props = context.scene.ando_barrier
             if props.show_gap_heatmap:
-                # Convert contacts to format needed by heatmap
-                heatmap_contacts = []
-                for c in contacts:
-                    heatmap_contacts.append({
-                        'position': tuple(float(x) for x in np.asarray(c.witness_p)),
-                        'gap': float(c.gap) if hasattr(c, 'gap') else props.contact_gap_max,
-                    })
-                visualization.update_gap_heatmap(obj, heatmap_contacts, props.contact_gap_max)
+                visualization.update_gap_heatmap(
+                    obj,
+                    diagnostics.contact_vertices,
+                    diagnostics.contact_gaps,
+                    props.contact_gap_max,
+                    positions_world,
+                )
             
             if props.show_strain_overlay:
-                visualization.update_strain_heatmap(obj, state, props.strain_limit / 100.0)
+                visualization.update_strain_heatmap(mesh, state, props.strain_limit / 100.0,
+                                                    positions_world)
         
         self.report({'INFO'}, f"Frame {_sim_state['frame']}")
         return {'FINISHED'}
@@ -1076,9 +1179,11 @@ class ANDO_OT_reset_realtime_simulation(Operator):
         _sim_state['initialized'] = False
         _sim_state['frame'] = 0
         _sim_state['playing'] = False
-        _sim_state['debug_contacts'] = []
+        _sim_state['debug_contacts'] = {}
         _sim_state['debug_pins'] = []
         _sim_state['stats'] = _default_stats()
+        _sim_state['profile_summary'] = None
+        _sim_state['dt_controller'] = None
         rigid_entries = _sim_state.get('rigid_entries', [])
         _sim_state['rigid_entries'] = []
         _sim_state['rigids'] = []
@@ -1186,6 +1291,7 @@ class ANDO_OT_toggle_debug_visualization(Operator):
 classes = (
     ANDO_OT_select_core_module,
     ANDO_OT_bake_simulation,
+    ANDO_OT_export_batch_scene,
     ANDO_OT_reset_simulation,
     ANDO_OT_add_pin_constraint,
     ANDO_OT_add_wall_constraint,
@@ -360,7 +360,7 @@ class AndoBarrierSceneProperties(PropertyGroup):
     # Adaptive timestepping
     enable_adaptive_dt: BoolProperty(
         name="Enable Adaptive Timestep",
-        description="Dynamically adjust timestep based on CFL condition",
+        description="Dynamically adjust timestep based on CFL condition; bakes also fit variable substeps into each frame from solver statistics",
         default=False,
     )
     
@@ -459,6 +459,50 @@ class AndoBarrierSceneProperties(PropertyGroup):
         description="Enable continuous collision detection in line search",
         default=True,
     )
+
+    enable_contact_cache: BoolProperty(
+        name="Contact Cache",
+        description="Reuse contacts and their stiffness between steps, re-detecting only after vertices move past the margin",
+        default=False,
+    )
+
+    contact_cache_margin: FloatProperty(
+        name="Cache Margin",
+        description="Vertex motion allowed before the contact cache runs a full detection",
+        default=0.002,
+        min=0.0,
+        max=0.05,
+        unit='LENGTH',
+    )
+
+    adaptive_contact_detection: BoolProperty(
+        name="Adaptive Contact Detection",
+        description="Detect contacts within the barrier gap plus a margin and re-detect during the step once vertices move past it",
+        default=False,
+    )
+
+    contact_redetect_margin: FloatProperty(
+        name="Re-detect Margin",
+        description="Vertex motion allowed within a step before contacts are detected again",
+        default=0.001,
+        min=0.0001,
+        max=0.01,
+        unit='LENGTH',
+    )
+
+    line_search_toi: BoolProperty(
+        name="Time-of-Impact Line Search",
+        description="Take the step directly from the smallest time of impact instead of halving it repeatedly",
+        default=False,
+    )
+
+    line_search_toi_safety: FloatProperty(
+        name="TOI Safety",
+        description="Fraction of the time-of-impact bound taken per step",
+        default=0.9,
+        min=0.1,
+        max=0.99,
+    )
     
     # Friction (optional)
     enable_friction: BoolProperty(
@@ -487,6 +531,13 @@ class AndoBarrierSceneProperties(PropertyGroup):
         update=_mark_scene_custom,
     )
 
+    friction_lagged: BoolProperty(
+        name="Lagged Friction",
+        description="Freeze friction normals and stiffness once per β iteration (no 32 Newton iteration minimum)",
+        default=False,
+        update=_mark_scene_custom,
+    )
+
     # Damping & restitution
     velocity_damping: FloatProperty(
         name="Velocity Damping",
@@ -587,6 +638,12 @@ class AndoBarrierSceneProperties(PropertyGroup):
         default=250,
     )
 
+    cache_trace: BoolProperty(
+        name="Write Trace",
+        description="Record a Chrome trace of the bake (open in ui.perfetto.dev), saved next to the .blend file",
+        default=False,
+    )
+
     # Material properties (nested)
     material_properties: PointerProperty(
         type=AndoBarrierMaterialProperties,
@@ -323,6 +323,14 @@ class ANDO_PT_main_panel(Panel):
         pcg.prop(props, "pcg_tol", text="Tolerance")
         pcg.prop(props, "pcg_max_iters", text="Max Iterations")
 
+        solver_col.separator()
+
+        line_search = solver_col.column(align=True)
+        line_search.label(text="Line Search", icon='SETTINGS')
+        line_search.prop(props, "line_search_toi", text="Time of Impact")
+        if props.line_search_toi:
+            line_search.prop(props, "line_search_toi_safety", text="Safety")
+
 
 class ANDO_PT_scene_setup_panel(Panel):
     """Panel guiding users through hybrid scene preparation."""
@@ -401,6 +409,12 @@ class ANDO_PT_contact_panel(Panel):
         col.prop(props, "contact_gap_max", text="Contact Gap")
         col.prop(props, "wall_gap", text="Wall Gap")
         col.prop(props, "enable_ccd", text="Continuous Collision Detection")
+        col.prop(props, "enable_contact_cache", text="Contact Cache")
+        if props.enable_contact_cache:
+            col.prop(props, "contact_cache_margin", text="Margin")
+        col.prop(props, "adaptive_contact_detection", text="Adaptive Detection")
+        if props.adaptive_contact_detection:
+            col.prop(props, "contact_redetect_margin", text="Re-detect Margin")
 
         ground_box = layout.box()
         ground_toggle = ground_box.row(align=True)
@@ -444,6 +458,7 @@ class ANDO_PT_friction_panel(Panel):
         layout.enabled = props.enable_friction
         layout.prop(props, "friction_mu")
         layout.prop(props, "friction_epsilon")
+        layout.prop(props, "friction_lagged")
 
 class ANDO_PT_damping_panel(Panel):
     """Damping and restitution controls"""
@@ -557,11 +572,13 @@ class ANDO_PT_cache_panel(Panel):
         range_row = layout.row(align=True)
         range_row.prop(props, "cache_start", text="Start")
         range_row.prop(props, "cache_end", text="End")
+        layout.prop(props, "cache_trace")
         
         actions = layout.row(align=True)
         actions.enabled = props.cache_enabled
         actions.operator("ando.bake_simulation", text="Bake", icon='RENDER_ANIMATION')
         actions.operator("ando.reset_simulation", text="Clear", icon='FILE_REFRESH')
+        layout.operator("ando.export_batch_scene", text="Export Batch Scene", icon='EXPORT')
 
 class ANDO_PT_realtime_panel(Panel):
     """Real-time preview panel"""
@@ -669,6 +686,37 @@ class ANDO_PT_debug_panel(Panel):
                     fps = 1000.0 / stats['last_step_time'] if stats['last_step_time'] > 0 else 0
                     col.label(text=f"FPS: {fps:.1f}")
 
+                profile = stats.get('step_profile', {})
+                if profile:
+                    box.separator()
+                    box.label(text="Phase Breakdown (per step)", icon='SORTTIME')
+                    col = box.column(align=True)
+                    for phase, label in (
+                        ('collision', "Collision"),
+                        ('gradient', "Gradient"),
+                        ('assembly', "Assembly"),
+                        ('pcg', "PCG"),
+                        ('line_search', "Line search"),
+                        ('velocity_update', "Velocity"),
+                    ):
+                        col.label(text=f"{label}: {profile.get(phase + '_ms', 0.0):.2f} ms")
+                    col.label(text=f"β iters: {profile.get('beta_iterations', 0.0):.1f} | "
+                                   f"Newton: {profile.get('newton_iterations', 0.0):.1f}")
+                    col.label(text=f"PCG iters: {profile.get('pcg_iterations', 0.0):.1f} | "
+                                   f"Backtracks: {profile.get('line_search_backtracks', 0.0):.1f}")
+                    if profile.get('line_search_sweeps_saved', 0.0) > 0.0:
+                        col.label(text=f"TOI sweeps saved: {profile.get('line_search_sweeps_saved', 0.0):.1f}")
+                    if profile.get('active_wall_vertices', 0.0) > 0.0:
+                        col.label(text=f"Wall vertices: {profile.get('active_wall_vertices', 0.0):.1f}")
+                    if profile.get('contact_cache_hits', 0.0) > 0.0:
+                        col.label(text=f"Cache hits: {profile.get('contact_cache_hits', 0.0):.1f} | "
+                                       f"Rebuilds: {profile.get('contact_cache_rebuilds', 0.0):.2f}")
+                    if profile.get('contact_redetections', 0.0) > 0.0:
+                        col.label(text=f"Re-detections: {profile.get('contact_redetections', 0.0):.2f}")
+                    run_profile = stats.get('run_profile', {})
+                    if run_profile:
+                        col.label(text=f"Run mean: {run_profile.get('total_ms', 0.0):.2f} ms/step")
+
                 counts = stats.get('contact_counts', {})
                 if counts:
                     box.separator()
@@ -691,6 +739,13 @@ class ANDO_PT_debug_panel(Panel):
                 col.label(text=f"Total: {total_e:.3e} J")
                 col.label(text=f"Kinetic: {kinetic_e:.3e} J")
                 col.label(text=f"Elastic: {elastic_e:.3e} J")
+                col.label(text=f"Barrier: {stats.get('barrier_energy', 0.0):.3e} J")
+                strain_e = stats.get('strain_limit_energy', 0.0)
+                if strain_e > 0.0:
+                    col.label(text=f"Strain limit: {strain_e:.3e} J")
+                friction_e = stats.get('friction_energy', 0.0)
+                if friction_e > 0.0:
+                    col.label(text=f"Friction (dissipative): {friction_e:.3e} J")
                 
                 # Energy drift warning
                 drift_pct = stats.get('energy_drift_percent', 0.0)
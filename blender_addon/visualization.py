@@ -6,7 +6,6 @@ Draws debug overlays for contacts, normals, constraints, and heatmaps
 import bpy
 import gpu
 from gpu_extras.batch import batch_for_shader
-from mathutils import Vector
 import numpy as np
 
 from ._core_loader import get_core_module
@@ -16,14 +15,26 @@ _draw_handler = None
 _shader = None
 _flat_shader = None
 
-# Heatmap data cache
+# Heatmap data cache (GPU batches are built on the first draw after an update)
 _heatmap_cache = {
     'gap_colors': None,
     'gap_vertices': None,
     'gap_indices': None,
+    'gap_batch': None,
     'strain_colors': None,
     'strain_vertices': None,
     'strain_indices': None,
+    'strain_batch': None,
+}
+
+# Triangulated topology per mesh datablock, reused across frames
+_topology_cache = {}
+
+# Triangles and flat-shaded index buffer of the simulation mesh
+_sim_triangle_cache = {
+    'mesh': None,
+    'triangles': None,
+    'indices': None,
 }
 
 # Color palette per contact type (R, G, B, A)
@@ -34,6 +45,9 @@ CONTACT_COLORS = {
 }
 DEFAULT_CONTACT_COLOR = (0.9, 0.9, 0.9, 1.0)    # Light gray for unknown types
 
+# ContactType names indexed by their integer value (Diagnostics.contact_types)
+CONTACT_TYPE_NAMES = ('POINT_TRIANGLE', 'EDGE_EDGE', 'WALL', 'RIGID_POINT_TRIANGLE')
+
 
 def get_shader():
     """Get or create shader for drawing"""
@@ -80,6 +94,26 @@ def gap_to_color(gap, gap_max=0.001):
     
     return (r, g, b, 0.7)  # Semi-transparent
 
+def gap_to_colors(gaps, gap_max=0.001):
+    """
+    Vectorized gap_to_color
+    
+    Args:
+        gaps: Array of gap distances in meters, shape (N,)
+        gap_max: Maximum gap distance for color mapping
+        
+    Returns:
+        float32 array of (r, g, b, a) rows, shape (N, 4)
+    """
+    t = np.clip(np.asarray(gaps, dtype=np.float32) / gap_max, 0.0, 1.0)
+    low = t < 0.3
+    
+    colors = np.zeros((len(t), 4), dtype=np.float32)
+    colors[:, 0] = np.where(low, 1.0, 1.0 - (t - 0.3) / 0.7)  # Red -> Yellow -> Green
+    colors[:, 1] = np.where(low, t / 0.3, 1.0)
+    colors[:, 3] = 0.7  # Semi-transparent
+    return colors
+
 def strain_to_color(strain, strain_limit=0.05):
     """
     Convert strain magnitude to heatmap color
@@ -117,166 +151,163 @@ def strain_to_color(strain, strain_limit=0.05):
     
     return (r, g, b, 0.7)  # Semi-transparent
 
-def compute_gap_heatmap(mesh_obj, contacts, gap_max=0.001):
+def get_mesh_topology(mesh):
+    """
+    Loop and triangle buffers of a Blender mesh, cached until its topology changes
+    
+    Every loop becomes one render vertex so faces can be colored flat.
+    
+    Args:
+        mesh: Blender mesh datablock
+        
+    Returns:
+        dict with 'loop_vertices' (L,) vertex index per loop, 'loop_faces' (L,)
+        polygon index per loop and 'tri_indices' (T, 3) loop indices per triangle
+    """
+    key = mesh.as_pointer()
+    counts = (len(mesh.vertices), len(mesh.loops), len(mesh.polygons))
+    cached = _topology_cache.get(key)
+    if cached is not None and cached['counts'] == counts:
+        return cached
+    
+    loop_vertices = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vertices)
+    
+    mesh.calc_loop_triangles()
+    tri_indices = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("loops", tri_indices)
+    tri_indices = tri_indices.reshape(-1, 3)
+    tri_faces = np.empty(len(mesh.loop_triangles), dtype=np.int32)
+    mesh.loop_triangles.foreach_get("polygon_index", tri_faces)
+    
+    loop_faces = np.zeros(len(mesh.loops), dtype=np.int32)
+    loop_faces[tri_indices.ravel()] = np.repeat(tri_faces, 3)
+    
+    cached = {
+        'counts': counts,
+        'loop_vertices': loop_vertices,
+        'loop_faces': loop_faces,
+        'tri_indices': tri_indices,
+    }
+    _topology_cache[key] = cached
+    return cached
+
+def _world_positions(mesh_obj):
+    """World-space vertex positions of a mesh object, shape (V, 3)"""
+    mesh = mesh_obj.data
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    matrix = np.array(mesh_obj.matrix_world, dtype=np.float32)
+    return co.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+
+def strain_to_colors(strains, strain_limit=0.05):
+    """
+    Vectorized strain_to_color
+    
+    Args:
+        strains: Array of strain values, shape (N,)
+        strain_limit: Strain limit threshold
+        
+    Returns:
+        float32 array of (r, g, b, a) rows, shape (N, 4)
+    """
+    t = np.clip(np.asarray(strains, dtype=np.float32) / strain_limit, 0.0, 1.0)
+    low = t < 0.3
+    mid = (t >= 0.3) & (t < 0.7)
+    
+    # Blue -> Green -> Yellow -> Red
+    colors = np.zeros((len(t), 4), dtype=np.float32)
+    colors[:, 0] = np.select([low, mid], [0.0, (t - 0.3) / 0.4], 1.0)
+    colors[:, 1] = np.select([low, mid], [t / 0.3, 1.0], 1.0 - (t - 0.7) / 0.3)
+    colors[:, 2] = np.where(low, 1.0 - t / 0.3, 0.0)
+    colors[:, 3] = 0.7  # Semi-transparent
+    return colors
+
+def compute_gap_heatmap(mesh_obj, contact_vertices, contact_gaps, gap_max=0.001, positions=None):
     """
     Compute gap heatmap for mesh faces
     
+    Each face takes the smallest gap of the contacts touching one of its
+    vertices; faces without contacts map to the safe color.
+    
     Args:
         mesh_obj: Blender mesh object
-        contacts: List of contact dictionaries with 'position' and 'gap'
+        contact_vertices: Cloth vertex indices per contact, shape (N, 4), -1 where unused
+            (FrameDiagnostics.contact_vertices)
+        contact_gaps: Contact gaps, shape (N,)
         gap_max: Maximum gap for color mapping
+        positions: World-space vertex positions, shape (V, 3); read from the mesh if None
         
     Returns:
         (vertices, indices, colors) for rendering
     """
-    if not contacts or not mesh_obj or not mesh_obj.data:
+    if contact_gaps is None or len(contact_gaps) == 0 or not mesh_obj or not mesh_obj.data:
         return None, None, None
     
     mesh = mesh_obj.data
-    matrix_world = mesh_obj.matrix_world
-    
-    # Build spatial lookup: for each face, find nearest contact
-    face_gaps = np.full(len(mesh.polygons), gap_max * 2.0)  # Initialize with large gap
-    
-    for contact in contacts:
-        contact_pos = Vector(contact['position'])
-        contact_gap = contact.get('gap', gap_max)
-        
-        # Find closest face to this contact
-        for i, poly in enumerate(mesh.polygons):
-            # Compute face center in world space
-            face_center = matrix_world @ poly.center
-            distance = (face_center - contact_pos).length
-            
-            # If this contact is close to this face, update gap
-            if distance < gap_max * 2.0:
-                face_gaps[i] = min(face_gaps[i], contact_gap)
-    
-    # Build render geometry with per-vertex colors
-    vertices = []
-    indices = []
-    colors = []
-    vertex_offset = 0
-    
-    for i, poly in enumerate(mesh.polygons):
-        gap = face_gaps[i]
-        color = gap_to_color(gap, gap_max)
-        
-        # Add face vertices
-        for loop_idx in poly.loop_indices:
-            vert_idx = mesh.loops[loop_idx].vertex_index
-            vert_pos = matrix_world @ mesh.vertices[vert_idx].co
-            vertices.append(vert_pos)
-            colors.append(color)
-        
-        # Triangulate face (simple fan triangulation)
-        num_verts = len(poly.loop_indices)
-        for j in range(1, num_verts - 1):
-            indices.extend([vertex_offset, vertex_offset + j, vertex_offset + j + 1])
-        
-        vertex_offset += num_verts
-    
-    return vertices, indices, colors
+    topology = get_mesh_topology(mesh)
+    if positions is None:
+        positions = _world_positions(mesh_obj)
+    
+    # Scatter-min contact gaps to vertices, then vertices to faces
+    contact_vertices = np.asarray(contact_vertices)
+    gaps = np.broadcast_to(np.asarray(contact_gaps, dtype=np.float32)[:, None], contact_vertices.shape)
+    valid = (contact_vertices >= 0) & (contact_vertices < len(mesh.vertices))
+    vertex_gaps = np.full(len(mesh.vertices), np.inf, dtype=np.float32)
+    np.minimum.at(vertex_gaps, contact_vertices[valid], gaps[valid])
+    
+    loop_vertices = topology['loop_vertices']
+    loop_faces = topology['loop_faces']
+    face_gaps = np.full(len(mesh.polygons), np.inf, dtype=np.float32)
+    np.minimum.at(face_gaps, loop_faces, vertex_gaps[loop_vertices])
+    
+    # One render vertex per loop, colored by its face
+    vertices = np.asarray(positions, dtype=np.float32)[loop_vertices]
+    colors = gap_to_colors(face_gaps, gap_max)[loop_faces]
+    return vertices, topology['tri_indices'], colors
 
-def compute_strain_heatmap(mesh_obj, state, strain_limit=0.05):
+def _sim_triangles(sim_mesh):
+    """Triangles (M, 3) and a flat-shaded index buffer of the simulation mesh, cached per mesh"""
+    if _sim_triangle_cache['mesh'] is not sim_mesh:
+        triangles = np.asarray(sim_mesh.get_triangles(), dtype=np.int32)
+        _sim_triangle_cache['mesh'] = sim_mesh
+        _sim_triangle_cache['triangles'] = triangles
+        _sim_triangle_cache['indices'] = np.arange(triangles.size, dtype=np.int32).reshape(-1, 3)
+    return _sim_triangle_cache['triangles'], _sim_triangle_cache['indices']
+
+def compute_strain_heatmap(sim_mesh, state, strain_limit=0.05, positions=None):
     """
-    Compute strain heatmap for mesh faces
+    Compute strain heatmap for the faces of the simulation mesh
     
     Args:
-        mesh_obj: Blender mesh object
+        sim_mesh: Simulation mesh (ando_barrier_core.Mesh) holding the rest shape
         state: Simulation state with positions
         strain_limit: Strain limit threshold
+        positions: World-space positions, shape (V, 3); read from the state if None
         
     Returns:
         (vertices, indices, colors) for rendering
     """
-    if not mesh_obj or not mesh_obj.data:
+    if sim_mesh is None or state is None:
         return None, None, None
     
     abc = get_core_module(context="Visualization strain heatmap")
     if abc is None:
         return None, None, None
     
-    mesh = mesh_obj.data
-    matrix_world = mesh_obj.matrix_world
-    
-    # Extract mesh topology
-    positions = []
-    for v in mesh.vertices:
-        world_pos = matrix_world @ v.co
-        positions.extend([world_pos.x, world_pos.y, world_pos.z])
-    
-    triangles = []
-    for poly in mesh.polygons:
-        if len(poly.vertices) >= 3:
-            triangles.extend([poly.vertices[0], poly.vertices[1], poly.vertices[2]])
-    
-    if not triangles:
+    triangles, indices = _sim_triangles(sim_mesh)
+    if len(triangles) == 0:
         return None, None, None
+    if positions is None:
+        positions = state.get_positions()
     
-    # Create temporary mesh for strain computation
-    from . import operators
-    rest_mesh = operators._create_mesh_from_blender(mesh_obj)
-    
-    # Compute per-face strain (σ_max - 1.0)
-    num_faces = len(triangles) // 3
-    face_strains = []
-    
-    for face_idx in range(num_faces):
-        tri_start = face_idx * 3
-        v0_idx = triangles[tri_start + 0]
-        v1_idx = triangles[tri_start + 1]
-        v2_idx = triangles[tri_start + 2]
-        
-        # Get current positions
-        v0 = Vector(positions[v0_idx*3:v0_idx*3+3])
-        v1 = Vector(positions[v1_idx*3:v1_idx*3+3])
-        v2 = Vector(positions[v2_idx*3:v2_idx*3+3])
-        
-        # Get rest positions
-        rest_v0 = rest_mesh.get_vertex_position(v0_idx)
-        rest_v1 = rest_mesh.get_vertex_position(v1_idx)
-        rest_v2 = rest_mesh.get_vertex_position(v2_idx)
-        
-        # Compute deformation gradient (simplified 2D)
-        e1_rest = Vector(rest_v1) - Vector(rest_v0)
-        e2_rest = Vector(rest_v2) - Vector(rest_v0)
-        e1_curr = v1 - v0
-        e2_curr = v2 - v0
-        
-        # Compute stretch ratios (approximate σ_max)
-        stretch1 = e1_curr.length / max(e1_rest.length, 1e-6)
-        stretch2 = e2_curr.length / max(e2_rest.length, 1e-6)
-        sigma_max = max(stretch1, stretch2)
-        
-        # Strain is (σ_max - 1.0)
-        strain = max(sigma_max - 1.0, 0.0)
-        face_strains.append(strain)
-    
-    # Build render geometry
-    vertices = []
-    indices = []
-    colors = []
-    vertex_offset = 0
-    
-    for i, poly in enumerate(mesh.polygons):
-        strain = face_strains[i] if i < len(face_strains) else 0.0
-        color = strain_to_color(strain, strain_limit)
-        
-        # Add face vertices
-        for loop_idx in poly.loop_indices:
-            vert_idx = mesh.loops[loop_idx].vertex_index
-            vert_pos = matrix_world @ mesh.vertices[vert_idx].co
-            vertices.append(vert_pos)
-            colors.append(color)
-        
-        # Triangulate face
-        num_verts = len(poly.loop_indices)
-        for j in range(1, num_verts - 1):
-            indices.extend([vertex_offset, vertex_offset + j, vertex_offset + j + 1])
-        
-        vertex_offset += num_verts
+    # Per-face strain σ_max - 1.0 from the native SVD of F
+    singular_values = abc.StrainLimiting.face_singular_values(sim_mesh, state)
+    face_strains = np.maximum(singular_values[:, 0] - 1.0, 0.0)
     
+    # Three render vertices per face for flat colors
+    vertices = np.asarray(positions, dtype=np.float32)[triangles].reshape(-1, 3)
+    colors = np.repeat(strain_to_colors(face_strains, strain_limit), 3, axis=0)
     return vertices, indices, colors
 
 def draw_debug_callback():
@@ -294,36 +325,42 @@ def draw_debug_callback():
     gpu.state.depth_test_set('LESS_EQUAL')
     
     # Draw gap heatmap if enabled
-    if props.show_gap_heatmap and _heatmap_cache['gap_vertices']:
+    if props.show_gap_heatmap and _heatmap_cache['gap_vertices'] is not None:
         try:
             flat_shader = get_flat_shader()
-            batch = batch_for_shader(
-                flat_shader,
-                'TRIS',
-                {
-                    "pos": _heatmap_cache['gap_vertices'],
-                    "color": _heatmap_cache['gap_colors'],
-                },
-                indices=_heatmap_cache['gap_indices']
-            )
+            batch = _heatmap_cache['gap_batch']
+            if batch is None:
+                batch = batch_for_shader(
+                    flat_shader,
+                    'TRIS',
+                    {
+                        "pos": _heatmap_cache['gap_vertices'],
+                        "color": _heatmap_cache['gap_colors'],
+                    },
+                    indices=_heatmap_cache['gap_indices']
+                )
+                _heatmap_cache['gap_batch'] = batch
             flat_shader.bind()
             batch.draw(flat_shader)
         except Exception as e:
             print(f"Error drawing gap heatmap: {e}")
     
     # Draw strain heatmap if enabled
-    if props.show_strain_overlay and _heatmap_cache['strain_vertices']:
+    if props.show_strain_overlay and _heatmap_cache['strain_vertices'] is not None:
         try:
             flat_shader = get_flat_shader()
-            batch = batch_for_shader(
-                flat_shader,
-                'TRIS',
-                {
-                    "pos": _heatmap_cache['strain_vertices'],
-                    "color": _heatmap_cache['strain_colors'],
-                },
-                indices=_heatmap_cache['strain_indices']
-            )
+            batch = _heatmap_cache['strain_batch']
+            if batch is None:
+                batch = batch_for_shader(
+                    flat_shader,
+                    'TRIS',
+                    {
+                        "pos": _heatmap_cache['strain_vertices'],
+                        "color": _heatmap_cache['strain_colors'],
+                    },
+                    indices=_heatmap_cache['strain_indices']
+                )
+                _heatmap_cache['strain_batch'] = batch
             flat_shader.bind()
             batch.draw(flat_shader)
         except Exception as e:
@@ -335,34 +372,29 @@ def draw_debug_callback():
         gpu.state.point_size_set(8.0)
 
         # Draw contact points grouped by type
-        contact_groups = {}
-        for contact in sim_state['debug_contacts']:
-            ctype = contact.get('type', 'UNKNOWN')
-            contact_groups.setdefault(ctype, []).append(contact)
-
-        for contact_type, contacts in contact_groups.items():
+        contacts = sim_state['debug_contacts']
+        types = contacts.get('types') if contacts else None
+        for type_value in (np.unique(types) if types is not None else ()):
+            contact_type = (CONTACT_TYPE_NAMES[type_value]
+                            if 0 <= type_value < len(CONTACT_TYPE_NAMES) else 'UNKNOWN')
             color = CONTACT_COLORS.get(contact_type, DEFAULT_CONTACT_COLOR)
 
-            positions = [Vector(contact['position']) for contact in contacts]
-            if positions:
-                batch = batch_for_shader(shader, 'POINTS', {"pos": positions})
-                shader.bind()
-                shader.uniform_float("color", color)
-                batch.draw(shader)
+            mask = types == type_value
+            positions = contacts['positions'][mask]
+            batch = batch_for_shader(shader, 'POINTS', {"pos": positions})
+            shader.bind()
+            shader.uniform_float("color", color)
+            batch.draw(shader)
 
             # Draw contact normals as lines with half alpha for readability
-            lines = []
-            for contact in contacts:
-                start = Vector(contact['position'])
-                end = start + Vector(contact['normal']) * 0.05  # Scale normal for visibility
-                lines.extend([start, end])
-
-            if lines:
-                line_batch = batch_for_shader(shader, 'LINES', {"pos": lines})
-                shader.bind()
-                r, g, b, a = color
-                shader.uniform_float("color", (r, g, b, min(1.0, a * 0.6)))
-                line_batch.draw(shader)
+            lines = np.empty((2 * len(positions), 3), dtype=np.float32)
+            lines[0::2] = positions
+            lines[1::2] = positions + contacts['normals'][mask] * 0.05  # Scale normal for visibility
+            line_batch = batch_for_shader(shader, 'LINES', {"pos": lines})
+            shader.bind()
+            r, g, b, a = color
+            shader.uniform_float("color", (r, g, b, min(1.0, a * 0.6)))
+            line_batch.draw(shader)
     
     # Draw pinned vertices (blue dots)
     if sim_state['debug_pins']:
@@ -429,36 +461,41 @@ def update_debug_data(contacts=None, pins=None, stats=None):
         if area.type == 'VIEW_3D':
             area.tag_redraw()
 
-def update_gap_heatmap(mesh_obj, contacts=None, gap_max=None):
+def update_gap_heatmap(mesh_obj, contact_vertices=None, contact_gaps=None, gap_max=None,
+                       positions=None):
     """Update gap heatmap data for rendering"""
     global _heatmap_cache
     
     if gap_max is None:
         gap_max = bpy.context.scene.ando_barrier.contact_gap_max
     
-    vertices, indices, colors = compute_gap_heatmap(mesh_obj, contacts or [], gap_max)
+    vertices, indices, colors = compute_gap_heatmap(
+        mesh_obj, contact_vertices, contact_gaps, gap_max, positions
+    )
     
     _heatmap_cache['gap_vertices'] = vertices
     _heatmap_cache['gap_indices'] = indices
     _heatmap_cache['gap_colors'] = colors
+    _heatmap_cache['gap_batch'] = None
     
     # Force viewport redraw
     for area in bpy.context.screen.areas:
         if area.type == 'VIEW_3D':
             area.tag_redraw()
 
-def update_strain_heatmap(mesh_obj, state=None, strain_limit=None):
+def update_strain_heatmap(sim_mesh, state=None, strain_limit=None, positions=None):
     """Update strain heatmap data for rendering"""
     global _heatmap_cache
     
     if strain_limit is None:
         strain_limit = bpy.context.scene.ando_barrier.strain_limit / 100.0  # Convert from percentage
     
-    vertices, indices, colors = compute_strain_heatmap(mesh_obj, state, strain_limit)
+    vertices, indices, colors = compute_strain_heatmap(sim_mesh, state, strain_limit, positions)
     
     _heatmap_cache['strain_vertices'] = vertices
     _heatmap_cache['strain_indices'] = indices
     _heatmap_cache['strain_colors'] = colors
+    _heatmap_cache['strain_batch'] = None
     
     # Force viewport redraw
     for area in bpy.context.screen.areas:
@@ -472,7 +509,11 @@ def clear_heatmap_cache():
         'gap_colors': None,
         'gap_vertices': None,
         'gap_indices': None,
+        'gap_batch': None,
         'strain_colors': None,
         'strain_vertices': None,
         'strain_indices': None,
+        'strain_batch': None,
     }
+    _topology_cache.clear()
+    _sim_triangle_cache.update(mesh=None, triangles=None, indices=None)
@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+Headless Batch Baker
+Bakes many cloth objects / shots in parallel worker processes
+
+Reads a JSON scene description (as written by the Blender add-on's
+"Export Batch Scene" operator, or by hand), distributes every job across a
+process pool with one worker pinned per CPU core, and writes each result to
+a binary ``.andocache`` file.
+
+Scene description layout::
+
+    {
+      "version": 1,
+      "fps": 24,
+      "frame_start": 1,
+      "frame_end": 250,
+      "gravity": [0.0, 0.0, -9.81],
+      "material": {"youngs_modulus": 1e6, "poisson_ratio": 0.3, ...},
+      "params": {"dt": 0.002, "beta_max": 0.25, ...},
+      "ground_plane": {"height": 0.0},          # optional
+      "jobs": [
+        {
+          "name": "Cloth.001",                   # unique; names the cache file
+          "vertices": [[x, y, z], ...],          # world space
+          "triangles": [[i, j, k], ...],
+          "pins": [0, 1, 2],                     # optional
+          "material": {...}, "params": {...},    # optional per-job overrides
+          "frame_start": 1, "frame_end": 120     # optional per-job overrides
+        }
+      ]
+    }
+
+``params.dt`` is in seconds (the add-on exports its millisecond property
+already converted).
+"""
+
+import argparse
+import json
+import multiprocessing as mp
+import os
+import struct
+import sys
+import time
+
+import numpy as np
+
+# Add build directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'build'))
+
+SCENE_VERSION = 1
+
+# Binary cache layout (little endian):
+#   header   : magic(8s) version(u32) num_frames(u32) num_vertices(u32)
+#              num_triangles(u32) frame_start(i32) fps(f32) dt(f32)
+#   triangles: int32[num_triangles, 3]
+#   frames   : float32[num_frames, num_vertices, 3]
+CACHE_MAGIC = b'ANDOCACH'
+CACHE_VERSION = 1
+CACHE_EXTENSION = '.andocache'
+_CACHE_HEADER = struct.Struct('<8sIIIIiff')
+
+def write_cache(path, frames, triangles, frame_start=1, fps=24.0, dt=0.0):
+    """Write a baked frame sequence to ``path`` in the binary cache format"""
+    frames = np.ascontiguousarray(frames, dtype=np.float32)
+    triangles = np.ascontiguousarray(triangles, dtype=np.int32).reshape(-1, 3)
+    if frames.ndim != 3 or frames.shape[2] != 3:
+        raise ValueError(f"Frames must have shape (frames, vertices, 3), got {frames.shape}")
+
+    header = _CACHE_HEADER.pack(
+        CACHE_MAGIC, CACHE_VERSION,
+        frames.shape[0], frames.shape[1], triangles.shape[0],
+        int(frame_start), float(fps), float(dt),
+    )
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        f.write(triangles.tobytes())
+        f.write(frames.tobytes())
+    os.replace(tmp_path, path)
+
+
+def read_cache(path):
+    """Read a binary cache file
+
+    Returns:
+        dict with 'frames', 'triangles', 'frame_start', 'fps' and 'dt'
+    """
+    with open(path, 'rb') as f:
+        raw = f.read(_CACHE_HEADER.size)
+        if len(raw) != _CACHE_HEADER.size:
+            raise ValueError(f"Truncated cache header: {path}")
+        magic, version, num_frames, num_vertices, num_triangles, frame_start, fps, dt = \
+            _CACHE_HEADER.unpack(raw)
+        if magic != CACHE_MAGIC:
+            raise ValueError(f"Not an Ando cache file: {path}")
+        if version != CACHE_VERSION:
+            raise ValueError(f"Unsupported cache version {version} in {path}")
+
+        triangles = np.fromfile(f, dtype=np.int32, count=num_triangles * 3)
+        frames = np.fromfile(f, dtype=np.float32, count=num_frames * num_vertices * 3)
+
+    if frames.size != num_frames * num_vertices * 3:
+        raise ValueError(f"Truncated cache payload: {path}")
+
+    return {
+        'frames': frames.reshape(num_frames, num_vertices, 3),
+        'triangles': triangles.reshape(num_triangles, 3),
+        'frame_start': frame_start,
+        'fps': fps,
+        'dt': dt,
+    }
+
+
+def load_scene(path):
+    """Load a scene description and expand it into self-contained job dicts"""
+    with open(path, 'r') as f:
+        scene = json.load(f)
+
+    version = scene.get('version', SCENE_VERSION)
+    if version != SCENE_VERSION:
+        raise ValueError(f"Unsupported scene version {version} (expected {SCENE_VERSION})")
+
+    jobs = []
+    for index, entry in enumerate(scene.get('jobs', [])):
+        if 'vertices' not in entry or 'triangles' not in entry:
+            raise ValueError(f"Job {index} is missing 'vertices' or 'triangles'")
+
+        material = dict(scene.get('material', {}))
+        material.update(entry.get('material', {}))
+        params = dict(scene.get('params', {}))
+        params.update(entry.get('params', {}))
+
+        jobs.append({
+            'index': index,
+            'name': entry.get('name', f'job_{index:03d}'),
+            'vertices': entry['vertices'],
+            'triangles': entry['triangles'],
+            'pins': entry.get('pins', []),
+            'material': material,
+            'params': params,
+            'gravity': entry.get('gravity', scene.get('gravity', [0.0, 0.0, -9.81])),
+            'ground_plane': entry.get('ground_plane', scene.get('ground_plane')),
+            'fps': float(entry.get('fps', scene.get('fps', 24))),
+            'frame_start': int(entry.get('frame_start', scene.get('frame_start', 1))),
+            'frame_end': int(entry.get('frame_end', scene.get('frame_end', 250))),
+        })
+
+    _check_unique_names(jobs)
+    return jobs
+
+
+TRACE_SUFFIX = '.trace.json'
+
+
+def _safe_name(name):
+    return ''.join(c if c.isalnum() or c in '-_.' else '_' for c in name)
+
+
+def _cache_filename(name):
+    return _safe_name(name) + CACHE_EXTENSION
+
+
+def _check_unique_names(jobs):
+    """Reject jobs whose names map to the same cache file"""
+    seen = {}
+    for job in jobs:
+        safe = _safe_name(job['name'])
+        if safe in seen:
+            raise ValueError(f"Jobs '{seen[safe]}' and '{job['name']}' would both write "
+                             f"{safe}{CACHE_EXTENSION}; give them distinct names")
+        seen[safe] = job['name']
+
+
+def _apply_fields(target, values, section):
+    """Copy scene values onto a core Material/SimParams, rejecting unknown keys
+
+    Every attribute the core exposes is accepted, so the add-on's exported
+    field list and this loader cannot drift apart.
+    """
+    for key, value in values.items():
+        if key.startswith('_') or not hasattr(target, key):
+            raise ValueError(f"Unknown {section} field '{key}'")
+        setattr(target, key, value)
+    return target
+
+
+# Worker state ---------------------------------------------------------------
+
+_worker_core = None
+
+
+def _init_worker(core_queue):
+    """Pool initializer: claim one core and pin this worker process to it"""
+    global _worker_core
+
+    # Keep any threaded runtime inside the core from oversubscribing the pin.
+    os.environ['OMP_NUM_THREADS'] = '1'
+
+    try:
+        _worker_core = core_queue.get_nowait()
+    except Exception:
+        _worker_core = None
+
+    if _worker_core is not None and hasattr(os, 'sched_setaffinity'):
+        try:
+            os.sched_setaffinity(0, {_worker_core})
+        except OSError:
+            _worker_core = None
+
+
+def bake_job(job, output_dir, trace=False):
+    """Simulate one job and write its cache; returns a result summary dict
+
+    With ``trace`` set, a Chrome trace of the bake is written next to the
+    cache as ``<name>.trace.json``.
+    """
+    import ando_barrier_core as abc
+
+    material = _apply_fields(abc.Material(), job['material'], 'material')
+    params = _apply_fields(abc.SimParams(), job['params'], 'params')
+
+    vertices = np.asarray(job['vertices'], dtype=np.float32).reshape(-1, 3)
+    triangles = np.asarray(job['triangles'], dtype=np.int32).reshape(-1, 3)
+
+    mesh = abc.Mesh()
+    mesh.initialize(vertices, triangles, material)
+    state = abc.State()
+    state.initialize(mesh)
+
+    constraints = abc.Constraints()
+    for pin_idx in job['pins']:
+        constraints.add_pin(int(pin_idx), vertices[int(pin_idx)])
+    if job['ground_plane'] is not None:
+        ground_normal = np.array([0.0, 0.0, 1.0], dtype=np.float32)
+        constraints.add_wall(ground_normal, float(job['ground_plane'].get('height', 0.0)),
+                             params.wall_gap)
+
+    gravity = np.asarray(job['gravity'], dtype=np.float32)
+    fps = job['fps']
+    steps_per_frame = max(1, int(round(1.0 / (params.dt * fps))))
+    num_frames = max(0, job['frame_end'] - job['frame_start'] + 1)
+
+    frames = np.empty((num_frames + 1, len(vertices), 3), dtype=np.float32)
+    frames[0] = state.get_positions()
+
+    if trace:
+        abc.TraceRecorder.clear()
+        abc.TraceRecorder.enable()
+
+    start = time.perf_counter()
+    for frame in range(num_frames):
+        for _ in range(steps_per_frame):
+            state.apply_gravity(gravity, params.dt)
+            abc.Integrator.step(mesh, state, constraints, params)
+        frames[frame + 1] = state.get_positions()
+    wall_time = time.perf_counter() - start
+
+    cache_path = os.path.join(output_dir, _cache_filename(job['name']))
+    write_cache(cache_path, frames, triangles,
+                frame_start=job['frame_start'] - 1, fps=fps, dt=params.dt)
+
+    trace_path = None
+    if trace:
+        abc.TraceRecorder.disable()
+        trace_path = os.path.join(output_dir, _safe_name(job['name']) + TRACE_SUFFIX)
+        abc.TraceRecorder.write(trace_path)
+
+    return {
+        'name': job['name'],
+        'cache': cache_path,
+        'trace': trace_path,
+        'core': _worker_core,
+        'vertices': len(vertices),
+        'frames': num_frames,
+        'steps': num_frames * steps_per_frame,
+        'sim_seconds': num_frames * steps_per_frame * params.dt,
+        'wall_seconds': wall_time,
+    }
+
+
+def _bake_job_star(args):
+    return bake_job(*args)
+
+
+def run_batch(jobs, output_dir, workers=None, pin_cores=True, trace=False):
+    """Bake all jobs across a process pool
+
+    Returns:
+        (results, wall_seconds, num_workers)
+    """
+    _check_unique_names(jobs)
+    os.makedirs(output_dir, exist_ok=True)
+
+    if hasattr(os, 'sched_getaffinity'):
+        cores = sorted(os.sched_getaffinity(0))
+    else:
+        cores = list(range(os.cpu_count() or 1))
+
+    num_workers = max(1, min(workers or len(cores), len(jobs) or 1))
+
+    ctx = mp.get_context('spawn')
+    core_queue = ctx.Queue()
+    if pin_cores:
+        for core in cores[:num_workers]:
+            core_queue.put(core)
+
+    start = time.perf_counter()
+    with ctx.Pool(num_workers, initializer=_init_worker, initargs=(core_queue,)) as pool:
+        results = []
+        for result in pool.imap_unordered(_bake_job_star, [(job, output_dir, trace) for job in jobs]):
+            results.append(result)
+            print(f"  [{len(results)}/{len(jobs)}] {result['name']}: "
+                  f"{result['frames']} frames in {result['wall_seconds']:.1f}s "
+                  f"(core {result['core'] if result['core'] is not None else '-'})")
+    wall_seconds = time.perf_counter() - start
+
+    results.sort(key=lambda r: r['name'])
+    return results, wall_seconds, num_workers
+
+
+def throughput_report(results, wall_seconds, num_workers):
+    """Summarize a batch run (sim-seconds per wall-second per core)"""
+    sim_seconds = sum(r['sim_seconds'] for r in results)
+    busy_seconds = sum(r['wall_seconds'] for r in results)
+    per_core = sim_seconds / (wall_seconds * num_workers) if wall_seconds > 0 else 0.0
+    return {
+        'jobs': len(results),
+        'workers': num_workers,
+        'sim_seconds': sim_seconds,
+        'wall_seconds': wall_seconds,
+        'throughput': sim_seconds / wall_seconds if wall_seconds > 0 else 0.0,
+        'throughput_per_core': per_core,
+        'utilization': busy_seconds / (wall_seconds * num_workers) if wall_seconds > 0 else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Headless parallel batch baker')
+    parser.add_argument('scene', help='Scene description JSON')
+    parser.add_argument('--output', type=str, default='output/batch_cache',
+                        help='Directory for .andocache files (default: output/batch_cache)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes (default: one per available core)')
+    parser.add_argument('--no-pin', action='store_true',
+                        help='Do not pin worker processes to cores')
+    parser.add_argument('--report', type=str, default=None,
+                        help='Optional path for a JSON throughput report')
+    parser.add_argument('--trace', action='store_true',
+                        help='Write a Chrome trace (<name>.trace.json) next to each cache')
+    args = parser.parse_args()
+
+    jobs = load_scene(args.scene)
+    if not jobs:
+        print("Scene contains no jobs")
+        return 1
+
+    print(f"\n{'='*60}")
+    print("BATCH BAKE")
+    print(f"Scene: {args.scene}")
+    print(f"Jobs: {len(jobs)}")
+    print(f"{'='*60}\n")
+
+    results, wall_seconds, num_workers = run_batch(
+        jobs, args.output, workers=args.workers, pin_cores=not args.no_pin,
+        trace=args.trace)
+    report = throughput_report(results, wall_seconds, num_workers)
+
+    print(f"\n{'='*60}")
+    print("Batch complete!")
+    print(f"Workers: {report['workers']}")
+    print(f"Simulated: {report['sim_seconds']:.2f}s in {report['wall_seconds']:.2f}s wall")
+    print(f"Throughput: {report['throughput']:.3f} sim-s/wall-s "
+          f"({report['throughput_per_core']:.3f} per core)")
+    print(f"Worker utilization: {report['utilization'] * 100.0:.0f}%")
+    print(f"Caches written to {args.output}/")
+    print(f"{'='*60}\n")
+
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump({'summary': report, 'jobs': results}, f, indent=2)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
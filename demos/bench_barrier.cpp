@@ -0,0 +1,145 @@
+/**
+ * Contact barrier micro-benchmark
+ *
+ * Measures contacts per second for the barrier gradient and Hessian
+ * (12×12 blocks) evaluated one ContactPair at a time against the batched
+ * SoA kernels used by the integrator, on the same random contact set, and
+ * reports the difference between the two results.
+ *
+ * Usage: bench_barrier [num_contacts] [repeats]
+ */
+
+#include "../src/core/types.h"
+#include "../src/core/barrier.h"
+#include <algorithm>
+#include <chrono>
+#include <cmath>
+#include <cstdlib>
+#include <iostream>
+#include <random>
+#include <vector>
+
+using namespace ando_barrier;
+
+namespace {
+
+const Real kGapMax = 0.01;
+const Real kNormalEpsilon = 1e-8;
+const Real kTolerance = 1e-12;
+
+// Point-triangle contacts between random vertices of a cloth with
+// num_vertices vertices; ~2/3 of the gaps fall inside the barrier domain.
+std::vector<ContactPair> make_contacts(int count, int num_vertices, std::mt19937& rng) {
+    std::uniform_real_distribution<Real> unit(0.0, 1.0);
+    std::uniform_int_distribution<int> vertex(0, num_vertices - 1);
+    std::vector<ContactPair> contacts(count);
+
+    for (ContactPair& contact : contacts) {
+        contact.type = ContactType::POINT_TRIANGLE;
+        contact.idx0 = vertex(rng);
+        contact.idx1 = vertex(rng);
+        contact.idx2 = vertex(rng);
+        contact.idx3 = vertex(rng);
+        contact.vertex_count = 4;
+        contact.gap = 1.5 * kGapMax * unit(rng);
+        contact.normal = Vec3(unit(rng) - 0.5, unit(rng) - 0.5, unit(rng) + 0.1);
+        Real b0 = unit(rng), b1 = unit(rng) * (1 - b0);
+        contact.weights = {1.0, -b0, -b1, -(1 - b0 - b1)};
+    }
+    return contacts;
+}
+
+double seconds_since(std::chrono::steady_clock::time_point start) {
+    return std::chrono::duration<double>(std::chrono::steady_clock::now() - start).count();
+}
+
+} // namespace
+
+int main(int argc, char** argv) {
+    const int count = argc > 1 ? std::atoi(argv[1]) : 20000;
+    const int repeats = argc > 2 ? std::atoi(argv[2]) : 20;
+    const int num_vertices = std::max(count / 2, 4);
+    std::mt19937 rng(42);
+
+    std::vector<ContactPair> contacts = make_contacts(count, num_vertices, rng);
+    std::uniform_real_distribution<Real> stiffness(100.0, 1100.0);
+    std::vector<Real> k_bars(count);
+    for (Real& k : k_bars) k = stiffness(rng);
+
+    std::cout << "========================================" << std::endl;
+    std::cout << "Barrier micro-benchmark (" << count << " contacts × " << repeats << ")" << std::endl;
+    std::cout << "========================================" << std::endl;
+
+    VecX g_scalar = VecX::Zero(3 * num_vertices);
+    VecX g_batch = VecX::Zero(3 * num_vertices);
+    std::vector<Triplet> t_scalar, t_batch;
+    t_scalar.reserve(static_cast<size_t>(count) * 144);
+    t_batch.reserve(static_cast<size_t>(count) * 144);
+
+    // Scalar path: one ContactPair per call (pattern cache lookup per block)
+    auto start = std::chrono::steady_clock::now();
+    for (int r = 0; r < repeats; ++r) {
+        g_scalar.setZero();
+        for (int c = 0; c < count; ++c) {
+            Barrier::compute_contact_gradient(contacts[c], kGapMax, k_bars[c], kNormalEpsilon, g_scalar);
+        }
+    }
+    const double scalar_grad_s = seconds_since(start);
+
+    start = std::chrono::steady_clock::now();
+    for (int r = 0; r < repeats; ++r) {
+        t_scalar.clear();
+        for (int c = 0; c < count; ++c) {
+            Barrier::compute_contact_hessian(contacts[c], kGapMax, k_bars[c], kNormalEpsilon,
+                                             kTolerance, t_scalar);
+        }
+    }
+    const double scalar_hess_s = seconds_since(start);
+
+    // Batched path: SoA build (once per assembly in the integrator) and kernels
+    ContactBatch batch;
+    start = std::chrono::steady_clock::now();
+    for (int r = 0; r < repeats; ++r) {
+        batch.clear();
+        batch.reserve(count);
+        for (int c = 0; c < count; ++c) batch.add(contacts[c], k_bars[c]);
+    }
+    const double build_s = seconds_since(start);
+
+    start = std::chrono::steady_clock::now();
+    for (int r = 0; r < repeats; ++r) {
+        g_batch.setZero();
+        Barrier::compute_contact_gradient_batch(batch, kGapMax, kNormalEpsilon, g_batch);
+    }
+    const double batch_grad_s = seconds_since(start);
+
+    start = std::chrono::steady_clock::now();
+    for (int r = 0; r < repeats; ++r) {
+        t_batch.clear();
+        Barrier::compute_contact_hessian_batch(batch, kGapMax, kNormalEpsilon, kTolerance, t_batch);
+    }
+    const double batch_hess_s = seconds_since(start);
+
+    const double evaluated = static_cast<double>(count) * repeats;
+    auto rate = [&](double seconds) { return seconds > 0.0 ? static_cast<long>(evaluated / seconds) : 0L; };
+
+    std::cout << "SoA build: " << rate(build_s) << " contacts/s" << std::endl;
+    std::cout << "Gradient" << std::endl;
+    std::cout << "  scalar:  " << rate(scalar_grad_s) << " contacts/s" << std::endl;
+    std::cout << "  batched: " << rate(batch_grad_s) << " contacts/s ("
+              << scalar_grad_s / std::max(batch_grad_s, 1e-12) << "x)" << std::endl;
+    std::cout << "Hessian (" << t_batch.size() << " triplets)" << std::endl;
+    std::cout << "  scalar:  " << rate(scalar_hess_s) << " contacts/s" << std::endl;
+    std::cout << "  batched: " << rate(batch_hess_s) << " contacts/s ("
+              << scalar_hess_s / std::max(batch_hess_s, 1e-12) << "x)" << std::endl;
+
+    Real max_triplet_diff = 0.0;
+    const size_t compared = std::min(t_scalar.size(), t_batch.size());
+    for (size_t i = 0; i < compared; ++i) {
+        max_triplet_diff = std::max(max_triplet_diff, std::abs(t_scalar[i].value() - t_batch[i].value()));
+    }
+    std::cout << "Max |Δ| gradient: " << (g_scalar - g_batch).lpNorm<Eigen::Infinity>()
+              << ", Hessian: " << max_triplet_diff
+              << (t_scalar.size() == t_batch.size() ? "" : " (triplet counts differ!)") << std::endl;
+    return 0;
+}
@@ -0,0 +1,191 @@
+/**
+ * Elasticity micro-benchmark
+ *
+ * Measures faces per second for the elastic gradient and Hessian on a
+ * perturbed grid: Elasticity (precomputed per-face constants, parallel
+ * face kernels with a gather instead of a scatter) against a reference
+ * loop that recomputes μ, k and the SPD projection of every block per
+ * call as the serial implementation did. Reports the difference between
+ * the two results.
+ *
+ * Usage: bench_elasticity [grid_resolution] [repeats]
+ */
+
+#include "../src/core/types.h"
+#include "../src/core/mesh.h"
+#include "../src/core/state.h"
+#include "../src/core/elasticity.h"
+#include "../src/core/stiffness.h"
+#include <algorithm>
+#include <chrono>
+#include <cmath>
+#include <cstdlib>
+#include <iostream>
+#include <random>
+#include <vector>
+
+using namespace ando_barrier;
+
+namespace {
+
+void build_grid(int res, Mesh& mesh, std::mt19937& rng) {
+    std::vector<Vec3> vertices;
+    std::vector<Triangle> triangles;
+    for (int y = 0; y < res; ++y) {
+        for (int x = 0; x < res; ++x) {
+            vertices.emplace_back(Real(x) / (res - 1), Real(y) / (res - 1), 0.0);
+        }
+    }
+    for (int y = 0; y < res - 1; ++y) {
+        for (int x = 0; x < res - 1; ++x) {
+            int i0 = y * res + x;
+            triangles.emplace_back(i0, i0 + res, i0 + 1);
+            triangles.emplace_back(i0 + 1, i0 + res, i0 + res + 1);
+        }
+    }
+
+    Material material;
+    material.youngs_modulus = 1e5;
+    material.thickness = 0.001;
+    mesh.initialize(vertices, triangles, material);
+
+    // Deform so the gradient is non-trivial
+    std::normal_distribution<Real> noise(0.0, 0.1 / res);
+    for (Vec3& v : mesh.vertices) {
+        v += Vec3(noise(rng), noise(rng), noise(rng));
+    }
+}
+
+// Serial per-call path: μ, k, frame and F per face, SPD projection per block
+void reference_gradient(const Mesh& mesh, VecX& gradient) {
+    gradient.setZero();
+    for (size_t i = 0; i < mesh.num_triangles(); ++i) {
+        const Triangle& tri = mesh.triangles[i];
+        Mat2 F = mesh.compute_F(i);
+        Real mu = mesh.material.youngs_modulus / (2.0 * (1.0 + mesh.material.poisson_ratio));
+        Real k = mesh.rest_areas[i] * mesh.material.thickness * mu;
+        Mat2 P = 2.0 * k * (F - Mat2::Identity());
+        Mat2 H = P * mesh.Dm_inv[i].transpose();
+
+        Vec3 e1 = mesh.vertices[tri.v[1]] - mesh.vertices[tri.v[0]];
+        Vec3 e2 = mesh.vertices[tri.v[2]] - mesh.vertices[tri.v[0]];
+        Vec3 n = e1.cross(e2).normalized();
+        Vec3 t1 = e1.normalized();
+        Vec3 t2 = n.cross(t1);
+
+        Vec3 f1 = H(0, 0) * t1 + H(1, 0) * t2;
+        Vec3 f2 = H(0, 1) * t1 + H(1, 1) * t2;
+        gradient.segment<3>(3 * tri.v[0]) -= f1 + f2;
+        gradient.segment<3>(3 * tri.v[1]) += f1;
+        gradient.segment<3>(3 * tri.v[2]) += f2;
+    }
+}
+
+void reference_hessian(const Mesh& mesh, std::vector<Triplet>& triplets) {
+    for (size_t i = 0; i < mesh.num_triangles(); ++i) {
+        const Triangle& tri = mesh.triangles[i];
+        Real mu = mesh.material.youngs_modulus / (2.0 * (1.0 + mesh.material.poisson_ratio));
+        Real k = mesh.rest_areas[i] * mesh.material.thickness * mu;
+        Mat2 K = k * (mesh.Dm_inv[i].transpose() * mesh.Dm_inv[i]);
+
+        // Same block layout as Elasticity::face_hessian (in-plane 2×2 diagonal)
+        const Real diag[3] = {K(0, 0) + K(1, 1) + Real(2) * K(0, 1), K(0, 0), K(1, 1)};
+        const Real off[3][3] = {{Real(0), -K(0, 0), -K(1, 1)},
+                                {-K(0, 0), Real(0), -K(0, 1)},
+                                {-K(1, 1), -K(0, 1), Real(0)}};
+        for (int a = 0; a < 3; ++a) {
+            for (int b = 0; b < 3; ++b) {
+                Real value = a == b ? diag[a] : off[a][b];
+                Mat3 block = Mat3::Zero();
+                block(0, 0) = value;
+                block(1, 1) = value;
+                Stiffness::enforce_spd(block);
+                for (int r = 0; r < 3; ++r) {
+                    for (int c = 0; c < 3; ++c) {
+                        triplets.emplace_back(tri.v[a] * 3 + r, tri.v[b] * 3 + c, block(r, c));
+                    }
+                }
+            }
+        }
+    }
+}
+
+double seconds_since(std::chrono::steady_clock::time_point start) {
+    return std::chrono::duration<double>(std::chrono::steady_clock::now() - start).count();
+}
+
+} // namespace
+
+int main(int argc, char** argv) {
+    const int res = argc > 1 ? std::max(std::atoi(argv[1]), 2) : 200;
+    const int repeats = argc > 2 ? std::atoi(argv[2]) : 10;
+    std::mt19937 rng(42);
+
+    Mesh mesh;
+    build_grid(res, mesh, rng);
+    State state;
+    state.initialize(mesh);
+    const size_t faces = mesh.num_triangles();
+    const int dofs = static_cast<int>(3 * mesh.num_vertices());
+
+    std::cout << "========================================" << std::endl;
+    std::cout << "Elasticity micro-benchmark (" << faces << " faces × " << repeats << ")" << std::endl;
+    std::cout << "========================================" << std::endl;
+
+    VecX g_ref(dofs), g_new(dofs);
+    std::vector<Triplet> t_ref, t_new;
+    t_ref.reserve(81 * faces);
+    t_new.reserve(81 * faces);
+
+    auto start = std::chrono::steady_clock::now();
+    for (int r = 0; r < repeats; ++r) reference_gradient(mesh, g_ref);
+    const double ref_grad_s = seconds_since(start);
+
+    start = std::chrono::steady_clock::now();
+    for (int r = 0; r < repeats; ++r) {
+        t_ref.clear();
+        reference_hessian(mesh, t_ref);
+    }
+    const double ref_hess_s = seconds_since(start);
+
+    // First call builds the per-face constants
+    start = std::chrono::steady_clock::now();
+    Elasticity::face_constants(mesh);
+    const double setup_s = seconds_since(start);
+
+    start = std::chrono::steady_clock::now();
+    for (int r = 0; r < repeats; ++r) Elasticity::compute_gradient(mesh, state, g_new);
+    const double grad_s = seconds_since(start);
+
+    start = std::chrono::steady_clock::now();
+    for (int r = 0; r < repeats; ++r) {
+        t_new.clear();
+        Elasticity::compute_hessian(mesh, state, t_new);
+    }
+    const double hess_s = seconds_since(start);
+
+    const double evaluated = static_cast<double>(faces) * repeats;
+    auto rate = [&](double seconds) { return seconds > 0.0 ? static_cast<long>(evaluated / seconds) : 0L; };
+
+    std::cout << "Constant setup: " << setup_s * 1000.0 << " ms (once per mesh/material)" << std::endl;
+    std::cout << "Gradient" << std::endl;
+    std::cout << "  reference:   " << rate(ref_grad_s) << " faces/s" << std::endl;
+    std::cout << "  precomputed: " << rate(grad_s) << " faces/s ("
+              << ref_grad_s / std::max(grad_s, 1e-12) << "x)" << std::endl;
+    std::cout << "Hessian (" << t_new.size() << " triplets)" << std::endl;
+    std::cout << "  reference:   " << rate(ref_hess_s) << " faces/s" << std::endl;
+    std::cout << "  precomputed: " << rate(hess_s) << " faces/s ("
+              << ref_hess_s / std::max(hess_s, 1e-12) << "x)" << std::endl;
+    std::cout << "Gradient + Hessian: " << rate(ref_grad_s + ref_hess_s) << " → "
+              << rate(grad_s + hess_s) << " faces/s" << std::endl;
+
+    Real max_triplet_diff = 0.0;
+    const size_t compared = std::min(t_ref.size(), t_new.size());
+    for (size_t i = 0; i < compared; ++i) {
+        max_triplet_diff = std::max(max_triplet_diff, std::abs(t_ref[i].value() - t_new[i].value()));
+    }
+    std::cout << "Max |Δ| gradient: " << (g_ref - g_new).lpNorm<Eigen::Infinity>()
+              << ", Hessian: " << max_triplet_diff
+              << (t_ref.size() == t_new.size() ? "" : " (triplet counts differ!)") << std::endl;
+    return 0;
+}
@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+Performance Benchmark Suite
+Reproducible timings for canonical scenes with baseline regression checks
+
+Scenes:
+    drape       Free grid dropped onto the ground plane
+    curtain     Vertical grid pinned along its top edge
+    tablecloth  Grid draped over a rigid box collider resting on the ground
+    fold        Grid pre-folded over itself so the top half lands on the bottom
+
+Every scene is run at each requested resolution in a fresh worker process
+(so peak memory is per case). Reported per case: per-phase step timings,
+steps per second, peak resident memory and PCG/Newton iteration counts.
+
+Results are written as JSON; pass a previous result file with --baseline to
+flag regressions beyond --tolerance (relative).
+
+Examples:
+    python benchmark.py --resolutions 10,20,30 --output output/bench.json
+    python benchmark.py --baseline benchmarks/baseline.json --tolerance 0.15
+    python benchmark.py --scenes drape,fold --save-baseline benchmarks/baseline.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing as mp
+
+import numpy as np
+
+# Add build directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'build'))
+
+BENCHMARK_VERSION = 1
+
+SCENES = ('drape', 'curtain', 'tablecloth', 'fold')
+
+PHASES = ('prediction', 'collision', 'gradient', 'assembly',
+          'pcg', 'line_search', 'velocity_update')
+
+# Metric -> True if larger values are worse
+COMPARED_METRICS = {
+    'mean_step_ms': True,
+    'steps_per_second': False,
+    'peak_memory_mb': True,
+    'mean_pcg_iterations': True,
+    'mean_newton_iterations': True,
+}
+COMPARED_METRICS.update({f'{phase}_ms': True for phase in PHASES})
+
+# Differences below these absolute amounts are treated as noise
+ABSOLUTE_FLOORS = {
+    'peak_memory_mb': 2.0,
+    'mean_pcg_iterations': 1.0,
+    'mean_newton_iterations': 0.5,
+}
+MS_FLOOR = 0.05
+
+
+# Scene construction ----------------------------------------------------------
+
+def _grid(resolution, size):
+    """Flat grid in the XY plane (same layout as demo_framework.create_grid_mesh)"""
+    xs = np.linspace(-size / 2, size / 2, resolution)
+    gx, gy = np.meshgrid(xs, xs)
+    vertices = np.stack([gx.ravel(), gy.ravel(), np.zeros(gx.size)], axis=1).astype(np.float32)
+
+    triangles = []
+    for yi in range(resolution - 1):
+        for xi in range(resolution - 1):
+            i0 = yi * resolution + xi
+            triangles.append([i0, i0 + resolution, i0 + 1])
+            triangles.append([i0 + 1, i0 + resolution, i0 + resolution + 1])
+    return vertices, np.array(triangles, dtype=np.int32)
+
+
+def _box(center, half):
+    """Closed axis-aligned box as (vertices, triangles)"""
+    cx, cy, cz = center
+    hx, hy, hz = half
+    vertices = np.array([[cx + sx * hx, cy + sy * hy, cz + sz * hz]
+                         for sz in (-1, 1) for sy in (-1, 1) for sx in (-1, 1)],
+                        dtype=np.float32)
+    triangles = np.array([
+        [0, 2, 1], [1, 2, 3],  # bottom
+        [4, 5, 6], [5, 7, 6],  # top
+        [0, 1, 4], [1, 5, 4],  # front
+        [2, 6, 3], [3, 6, 7],  # back
+        [0, 4, 2], [2, 4, 6],  # left
+        [1, 3, 5], [3, 7, 5],  # right
+    ], dtype=np.int32)
+    return vertices, triangles
+
+
+def build_scene(scene, resolution):
+    """Build one canonical scene
+
+    Returns:
+        dict with mesh, state, constraints, params, rigid_bodies (list or None)
+    """
+    import ando_barrier_core as abc
+
+    material = abc.Material()
+    material.youngs_modulus = 5e5
+    material.poisson_ratio = 0.3
+    material.density = 300.0
+    material.thickness = 0.001
+
+    params = abc.SimParams()
+    params.dt = 0.005
+    params.beta_max = 0.25
+    params.contact_gap_max = 0.002
+    params.wall_gap = 0.001
+    params.enable_ccd = True
+
+    pins = []
+    rigid_bodies = None
+    ground = True
+
+    if scene == 'drape':
+        vertices, triangles = _grid(resolution, 1.0)
+        vertices[:, 2] = 0.05
+    elif scene == 'curtain':
+        vertices, triangles = _grid(resolution, 1.0)
+        # Rotate into the XZ plane, top edge at z = 1
+        vertices = np.stack([vertices[:, 0], np.zeros(len(vertices)),
+                             1.0 - (vertices[:, 1] + 0.5)], axis=1).astype(np.float32)
+        pins = [i for i in range(len(vertices)) if vertices[i, 2] > 1.0 - 1e-6]
+        ground = False
+    elif scene == 'tablecloth':
+        vertices, triangles = _grid(resolution, 1.0)
+        vertices[:, 2] = 0.32
+        box_vertices, box_triangles = _box((0.0, 0.0, 0.15), (0.2, 0.2, 0.15))
+        body = abc.RigidBody()
+        body.initialize(box_vertices, box_triangles, 5000.0)
+        rigid_bodies = [body]
+    elif scene == 'fold':
+        vertices, triangles = _grid(resolution, 1.0)
+        # Fold the +x half back over the -x half with a small gap
+        gap = 0.02
+        folded = vertices[:, 0] > 0.0
+        vertices[folded, 2] = gap
+        vertices[folded, 0] = -vertices[folded, 0]
+        vertices[:, 2] += 0.01
+    else:
+        raise ValueError(f"Unknown scene '{scene}' (expected one of {', '.join(SCENES)})")
+
+    mesh = abc.Mesh()
+    mesh.initialize(vertices, triangles, material)
+    state = abc.State()
+    state.initialize(mesh)
+
+    constraints = abc.Constraints()
+    for pin in pins:
+        constraints.add_pin(int(pin), vertices[pin])
+    if ground:
+        constraints.add_wall(np.array([0.0, 0.0, 1.0], dtype=np.float32), 0.0, params.wall_gap)
+
+    return {
+        'mesh': mesh,
+        'state': state,
+        'constraints': constraints,
+        'params': params,
+        'rigid_bodies': rigid_bodies,
+        'num_vertices': len(vertices),
+        'num_triangles': len(triangles),
+    }
+
+
+# Measurement ------------------------------------------------------------------
+
+def _peak_memory_mb():
+    """Peak resident set size of this process in MiB (0 if unavailable)"""
+    try:
+        import resource
+    except ImportError:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024.0 * 1024.0) if sys.platform == 'darwin' else peak / 1024.0
+
+
+def run_case(scene, resolution, steps, warmup=2):
+    """Simulate one scene/resolution and summarize it (executes in a worker)"""
+    import ando_barrier_core as abc
+
+    setup = build_scene(scene, resolution)
+    mesh, state = setup['mesh'], setup['state']
+    constraints, params = setup['constraints'], setup['params']
+    rigid_bodies = setup['rigid_bodies']
+    gravity = np.array([0.0, 0.0, -9.81], dtype=np.float32)
+
+    def step():
+        state.apply_gravity(gravity, params.dt)
+        abc.Integrator.step(mesh, state, constraints, params, rigid_bodies)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(warmup):
+            step()
+
+        summary = abc.StepProfileSummary()
+        start = time.perf_counter()
+        for _ in range(steps):
+            step()
+            summary.accumulate(abc.Integrator.last_step_profile(constraints))
+        wall = time.perf_counter() - start
+
+    mean = summary.mean()
+    positions = state.get_positions()
+    result = {
+        'scene': scene,
+        'resolution': resolution,
+        'vertices': setup['num_vertices'],
+        'triangles': setup['num_triangles'],
+        'steps': steps,
+        'wall_seconds': wall,
+        'mean_step_ms': wall * 1000.0 / steps if steps else 0.0,
+        'steps_per_second': steps / wall if wall > 0 else 0.0,
+        'peak_memory_mb': _peak_memory_mb(),
+        'mean_pcg_iterations': mean['pcg_iterations'],
+        'max_pcg_iterations': summary.peak.pcg_iterations,
+        'mean_newton_iterations': mean['newton_iterations'],
+        'mean_contacts': mean['num_contacts'],
+        'line_search_backtracks': mean['line_search_backtracks'],
+        'finite': bool(np.all(np.isfinite(positions))),
+    }
+    for phase in PHASES:
+        result[f'{phase}_ms'] = mean[f'{phase}_ms']
+    return result
+
+
+def case_key(scene, resolution):
+    return f'{scene}@{resolution}'
+
+
+def run_suite(scenes, resolutions, steps, warmup=2):
+    """Run every scene × resolution, each in its own fresh process
+
+    Returns:
+        Result document (dict) with environment info and per-case metrics
+    """
+    cases = {}
+    ctx = mp.get_context('spawn')
+    for scene in scenes:
+        for resolution in resolutions:
+            # One process per case keeps peak RSS attributable to that case.
+            with ProcessPoolExecutor(1, mp_context=ctx) as pool:
+                result = pool.submit(run_case, scene, resolution, steps, warmup).result()
+            cases[case_key(scene, resolution)] = result
+            print(f"  {case_key(scene, resolution):<16} {result['vertices']:6d} verts | "
+                  f"{result['mean_step_ms']:8.2f}ms/step | {result['steps_per_second']:7.1f} steps/s | "
+                  f"PCG {result['mean_pcg_iterations']:6.1f} | {result['peak_memory_mb']:6.1f} MiB")
+
+    return {
+        'version': BENCHMARK_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'machine': {
+            'platform': platform.platform(),
+            'processor': platform.processor(),
+            'cpu_count': os.cpu_count(),
+            'python': platform.python_version(),
+        },
+        'steps': steps,
+        'warmup': warmup,
+        'cases': cases,
+    }
+
+
+# Baseline comparison ---------------------------------------------------------
+
+def compare(current, baseline, tolerance=0.15, metric_tolerances=None):
+    """Compare a result document against a baseline
+
+    A metric regresses when it is worse than the baseline by more than the
+    relative tolerance (and by more than its absolute noise floor).
+
+    Args:
+        metric_tolerances: Optional {metric: tolerance} overriding ``tolerance``
+
+    Returns:
+        List of finding dicts (case, metric, baseline, current, change, regression)
+    """
+    metric_tolerances = metric_tolerances or {}
+    findings = []
+
+    for key, case in current['cases'].items():
+        base_case = baseline.get('cases', {}).get(key)
+        if base_case is None:
+            continue
+        for metric, larger_is_worse in COMPARED_METRICS.items():
+            if metric not in case or metric not in base_case:
+                continue
+            base_value = float(base_case[metric])
+            value = float(case[metric])
+            tol = metric_tolerances.get(metric, tolerance)
+            floor = ABSOLUTE_FLOORS.get(metric, MS_FLOOR if metric.endswith('_ms') else 0.0)
+
+            worse_by = (value - base_value) if larger_is_worse else (base_value - value)
+            change = (value - base_value) / base_value if base_value else 0.0
+            regression = worse_by > abs(base_value) * tol and worse_by > floor
+
+            findings.append({
+                'case': key,
+                'metric': metric,
+                'baseline': base_value,
+                'current': value,
+                'change': change,
+                'regression': regression,
+            })
+
+    return findings
+
+
+def _parse_metric_tolerances(items):
+    tolerances = {}
+    for item in items:
+        name, _, value = item.partition('=')
+        if not value or name not in COMPARED_METRICS:
+            raise ValueError(f"Expected metric=tolerance with metric in "
+                             f"{', '.join(COMPARED_METRICS)}; got '{item}'")
+        tolerances[name] = float(value)
+    return tolerances
+
+
+def _write_json(document, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(document, f, indent=2, sort_keys=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Performance benchmarks for canonical cloth scenes',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--scenes', type=str, default=','.join(SCENES),
+                        help=f"Comma-separated scenes (default: {','.join(SCENES)})")
+    parser.add_argument('--resolutions', type=str, default='10,20,30',
+                        help='Comma-separated grid resolutions (default: 10,20,30)')
+    parser.add_argument('--steps', type=int, default=20,
+                        help='Timed steps per case (default: 20)')
+    parser.add_argument('--warmup', type=int, default=2,
+                        help='Untimed warm-up steps per case (default: 2)')
+    parser.add_argument('--output', type=str, default='output/benchmark.json',
+                        help='Result JSON path (default: output/benchmark.json)')
+    parser.add_argument('--baseline', type=str, default=None,
+                        help='Baseline JSON to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.15,
+                        help='Allowed relative slowdown before flagging (default: 0.15)')
+    parser.add_argument('--metric-tolerance', action='append', default=[],
+                        help='Per-metric override as metric=tolerance (repeatable)')
+    parser.add_argument('--save-baseline', type=str, default=None,
+                        help='Also write the results as a new baseline file')
+    args = parser.parse_args()
+
+    scenes = [s.strip() for s in args.scenes.split(',') if s.strip()]
+    unknown = [s for s in scenes if s not in SCENES]
+    if unknown:
+        parser.error(f"Unknown scene(s): {', '.join(unknown)}")
+    resolutions = [int(r) for r in args.resolutions.split(',') if r.strip()]
+    try:
+        metric_tolerances = _parse_metric_tolerances(args.metric_tolerance)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    print(f"\n{'='*60}")
+    print("BENCHMARK SUITE")
+    print(f"Scenes: {', '.join(scenes)}")
+    print(f"Resolutions: {resolutions} | {args.steps} steps (+{args.warmup} warm-up)")
+    print(f"{'='*60}\n")
+
+    results = run_suite(scenes, resolutions, args.steps, args.warmup)
+    _write_json(results, args.output)
+    if args.save_baseline:
+        _write_json(results, args.save_baseline)
+
+    print("\nScaling (steps/s by resolution):")
+    for scene in scenes:
+        row = ' '.join(f"{results['cases'][case_key(scene, r)]['steps_per_second']:8.1f}"
+                       for r in resolutions)
+        print(f"  {scene:<12}{row}")
+
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        findings = compare(results, baseline, args.tolerance, metric_tolerances)
+        regressions = [f for f in findings if f['regression']]
+
+        print(f"\nBaseline comparison ({args.baseline}, tolerance {args.tolerance * 100:.0f}%):")
+        if not findings:
+            print("  No matching cases in baseline")
+        for finding in regressions:
+            print(f"  REGRESSION {finding['case']:<16} {finding['metric']:<24} "
+                  f"{finding['baseline']:10.3f} -> {finding['current']:10.3f} "
+                  f"({finding['change'] * 100:+.1f}%)")
+        if findings and not regressions:
+            print(f"  OK: {len(findings)} metrics within tolerance")
+        exit_code = 1 if regressions else 0
+
+    print(f"\nResults written to {args.output}")
+    print(f"{'='*60}\n")
+    return exit_code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -145,6 +145,8 @@ if __name__ == '__main__':
                         help='Time step in seconds (default: 0.004)')
     parser.add_argument('--output', type=str, default='output/cascading_curtains',
                         help='Output directory for OBJ files (default: output/cascading_curtains)')
+    parser.add_argument('--trace', action='store_true',
+                        help='Write a Chrome trace (trace.json) next to the OBJ sequence')
     args = parser.parse_args()
     
     demo = CascadingCurtainsDemo()
@@ -154,7 +156,8 @@ if __name__ == '__main__':
         demo.load_cached(args.output)
     else:
         # Run simulation
-        demo.run(num_frames=args.frames, dt=args.dt)
+        demo.run(num_frames=args.frames, dt=args.dt,
+                 trace_path=os.path.join(args.output, 'trace.json') if args.trace else None)
         
         # Export OBJ sequence
         demo.export_obj_sequence(args.output)
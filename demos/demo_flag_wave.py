@@ -102,7 +102,7 @@ class WavingFlagDemo(PhysicsDemo):
         print(f"Flag mesh: {len(vertices)} vertices, {len(triangles)} triangles")
         print(f"Pinned: {len(self.pin_indices)} vertices (left edge)")
         
-    def run(self, num_frames=300, dt=None):
+    def run(self, num_frames=300, dt=None, trace_path=None):
         """Override run to add wind forces"""
         # Setup if not already done
         if self.mesh is None:
@@ -126,6 +126,7 @@ class WavingFlagDemo(PhysicsDemo):
         base_gravity = np.array([0.0, 0.0, -9.81], dtype=np.float32)
         
         print("Running simulation...")
+        self._begin_trace(trace_path)
         start_time = time.time()
         
         for frame in range(num_frames):
@@ -148,6 +149,7 @@ class WavingFlagDemo(PhysicsDemo):
             # Store frame
             self.frames.append(self.state.get_positions().copy())
             self.stats.append({'frame': frame, 'step_time_ms': step_time})
+            self._record_metrics()
             
             # Progress
             if (frame + 1) % 30 == 0:
@@ -165,6 +167,8 @@ class WavingFlagDemo(PhysicsDemo):
         print(f"Total time: {total_time:.1f}s")
         print(f"Average FPS: {avg_fps:.1f}")
         print(f"Average step time: {avg_step:.1f}ms")
+        self.print_profile_summary()
+        self._end_trace(trace_path)
         print(f"{'='*60}\n")
     
     def get_pin_positions(self):
@@ -187,6 +191,8 @@ if __name__ == '__main__':
                         help='Number of frames to simulate (default: 300)')
     parser.add_argument('--output', type=str, default='output/flag_wave',
                         help='Output directory for OBJ files (default: output/flag_wave)')
+    parser.add_argument('--trace', action='store_true',
+                        help='Write a Chrome trace (trace.json) next to the OBJ sequence')
     args = parser.parse_args()
     
     demo = WavingFlagDemo()
@@ -196,7 +202,8 @@ if __name__ == '__main__':
         demo.load_cached(args.output)
     else:
         # Run simulation
-        demo.run(num_frames=args.frames)
+        demo.run(num_frames=args.frames,
+                 trace_path=os.path.join(args.output, 'trace.json') if args.trace else None)
         
         # Export OBJ sequence
         demo.export_obj_sequence(args.output)
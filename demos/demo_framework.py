@@ -55,6 +55,9 @@ class PhysicsDemo:
         self.stats = []
         self.triangles = None  # Store triangles for export
         self.rest_positions = None  # Store initial positions
+        self.collect_metrics = False  # Record contacts/energy per frame in stats
+        self.profile_summary = None  # abc.StepProfileSummary over the run
+        self._initial_energy = None
         
     def setup(self):
         """Override: Set up mesh, materials, constraints"""
@@ -120,8 +123,109 @@ class PhysicsDemo:
         
         return np.array(vertices, dtype=np.float32), np.array(faces, dtype=np.int32)
         
-    def run(self, num_frames=200, dt=0.01):
-        """Run simulation and collect frames"""
+    def apply_overrides(self, overrides):
+        """Override material and SimParams fields after setup(), before running
+        
+        Keys naming a Material field (e.g. 'youngs_modulus') go to the mesh
+        material, everything else must be a SimParams field.
+        """
+        rebuild_masses = False
+        for key, value in overrides.items():
+            if hasattr(self.mesh.material, key):
+                setattr(self.mesh.material, key, value)
+                rebuild_masses |= key in ('density', 'thickness')
+            elif hasattr(self.params, key):
+                setattr(self.params, key, value)
+            else:
+                raise AttributeError(f"Unknown material/parameter override: {key}")
+        
+        if rebuild_masses:
+            self.state.initialize(self.mesh)
+    
+    def _record_metrics(self):
+        """Append solver profile (and optionally contacts/energy) to the latest stats entry"""
+        if not self.stats:
+            return
+        
+        profile = abc.Integrator.last_step_profile(self.constraints)
+        if self.profile_summary is None:
+            self.profile_summary = abc.StepProfileSummary()
+        self.profile_summary.accumulate(profile)
+        self.stats[-1].update({
+            'pcg_iterations': profile.pcg_iterations,
+            'newton_iterations': profile.newton_iterations,
+            'line_search_backtracks': profile.line_search_backtracks,
+        })
+        
+        if not self.collect_metrics:
+            return
+        
+        contacts = abc.Integrator.compute_contacts(self.mesh, self.state)
+        energy = abc.EnergyTracker.compute(self.mesh, self.state, self.constraints, self.params)
+        if self._initial_energy is None:
+            self._initial_energy = energy.total_energy
+        
+        drift = 0.0
+        if self._initial_energy > 1e-12:
+            drift = (energy.total_energy - self._initial_energy) / self._initial_energy * 100.0
+        
+        self.stats[-1].update({
+            'num_contacts': len(contacts),
+            'total_energy': energy.total_energy,
+            'energy_drift_percent': drift,
+            'max_velocity': energy.max_velocity,
+        })
+    
+    def print_profile_summary(self):
+        """Print where the step time went (per-step means over the run)"""
+        if self.profile_summary is None or self.profile_summary.steps == 0:
+            return
+        
+        mean = self.profile_summary.mean()
+        total = max(mean['total_ms'], 1e-9)
+        print("Phase breakdown (mean per step):")
+        for phase in ('prediction', 'collision', 'gradient', 'assembly',
+                      'pcg', 'line_search', 'velocity_update', 'coupling'):
+            ms = mean[f'{phase}_ms']
+            print(f"  {phase:<16} {ms:8.2f}ms ({ms / total * 100.0:4.1f}%)")
+        print(f"  β iterations: {mean['beta_iterations']:.1f} | "
+              f"Newton: {mean['newton_iterations']:.1f} | "
+              f"PCG iters: {mean['pcg_iterations']:.1f} | "
+              f"backtracks: {mean['line_search_backtracks']:.1f} | "
+              f"CCD calls: {mean['ccd_calls']:.0f}")
+        if mean['line_search_sweeps_saved'] > 0.0:
+            print(f"  Line-search sweeps: {mean['line_search_sweeps']:.1f} "
+                  f"({mean['line_search_sweeps_saved']:.1f} saved by TOI bound)")
+        if mean['active_wall_vertices'] > 0.0:
+            print(f"  Active wall vertices: {mean['active_wall_vertices']:.1f} (peak per step)")
+        if mean['contact_cache_hits'] > 0.0:
+            print(f"  Contact cache: {mean['contact_cache_hits']:.1f} hits, "
+                  f"{mean['contact_cache_misses']:.1f} misses, "
+                  f"{mean['contact_cache_rebuilds']:.2f} rebuilds per step")
+        if mean['contact_redetections'] > 0.0:
+            print(f"  Contact re-detections: {mean['contact_redetections']:.2f} per step")
+        
+    def _begin_trace(self, trace_path):
+        """Start a fresh timeline recording if a trace file was requested"""
+        if trace_path:
+            abc.TraceRecorder.clear()
+            abc.TraceRecorder.enable()
+    
+    def _end_trace(self, trace_path):
+        """Stop recording and write the Chrome trace (open in ui.perfetto.dev)"""
+        if not trace_path:
+            return
+        abc.TraceRecorder.disable()
+        os.makedirs(os.path.dirname(os.path.abspath(trace_path)), exist_ok=True)
+        if abc.TraceRecorder.write(trace_path):
+            print(f"Trace: {abc.TraceRecorder.event_count()} events -> {trace_path}")
+        
+    def run(self, num_frames=200, dt=0.01, trace_path=None):
+        """Run simulation and collect frames
+        
+        Args:
+            trace_path: Optional Chrome trace JSON written after the run
+        """
         print(f"\n{'='*60}")
         print(f"Demo: {self.name}")
         print(f"{'='*60}")
@@ -129,8 +233,9 @@ class PhysicsDemo:
         print(f"Frames: {num_frames}, dt: {dt}s")
         print()
         
-        # Setup simulation
-        self.setup()
+        # Setup simulation (skipped if the caller already set up / overrode it)
+        if self.mesh is None:
+            self.setup()
         self.params.dt = dt
         
         # Collect initial frame
@@ -141,6 +246,7 @@ class PhysicsDemo:
         gravity = np.array([0.0, 0.0, -9.81], dtype=np.float32)
         
         print("Running simulation...")
+        self._begin_trace(trace_path)
         start_time = time.time()
         
         for frame in range(num_frames):
@@ -158,6 +264,7 @@ class PhysicsDemo:
                 'frame': frame,
                 'step_time_ms': step_time,
             })
+            self._record_metrics()
             
             # Progress
             if (frame + 1) % 20 == 0:
@@ -175,6 +282,8 @@ class PhysicsDemo:
         print(f"Total time: {total_time:.1f}s")
         print(f"Average FPS: {avg_fps:.1f}")
         print(f"Average step time: {avg_step:.1f}ms")
+        self.print_profile_summary()
+        self._end_trace(trace_path)
         print(f"{'='*60}\n")
         
     def visualize(self, window_size=(1280, 720), fps=30):
@@ -105,7 +105,7 @@ class TableclothPullDemo(PhysicsDemo):
         print(f"Tablecloth: {len(vertices)} vertices, {len(triangles)} triangles")
         print(f"Pull vertices: {len(self.pull_vertices)} (right edge)")
         
-    def run(self, num_frames=400, dt=None):
+    def run(self, num_frames=400, dt=None, trace_path=None):
         """Override run to apply pull force"""
         # Setup if not already done
         if self.mesh is None:
@@ -129,6 +129,7 @@ class TableclothPullDemo(PhysicsDemo):
         base_gravity = np.array([0.0, 0.0, -9.81], dtype=np.float32)
         
         print("Running simulation...")
+        self._begin_trace(trace_path)
         start_time = time.time()
         
         for frame in range(num_frames):
@@ -162,6 +163,7 @@ class TableclothPullDemo(PhysicsDemo):
             # Store frame
             self.frames.append(self.state.get_positions().copy())
             self.stats.append({'frame': frame, 'step_time_ms': step_time})
+            self._record_metrics()
             
             # Progress
             if (frame + 1) % 40 == 0:
@@ -179,6 +181,8 @@ class TableclothPullDemo(PhysicsDemo):
         print(f"Total time: {total_time:.1f}s")
         print(f"Average FPS: {avg_fps:.1f}")
         print(f"Average step time: {avg_step:.1f}ms")
+        self.print_profile_summary()
+        self._end_trace(trace_path)
         print(f"{'='*60}\n")
     
     def has_ground_plane(self):
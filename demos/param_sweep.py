@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Parameter Sweep Runner
+Runs a demo over every combination of a material/solver parameter grid
+
+Each combination is simulated in its own worker process on top of
+PhysicsDemo, and the per-run step time, PCG iterations, contact count and
+energy drift are gathered into a single table (CSV, or a columnar .npz).
+Runs are ranked so the fastest stable settings for a shot are easy to pick.
+
+Examples:
+    python param_sweep.py stress --resolution 20 --frames 60 \\
+        --param youngs_modulus=1e5,1e6 --param beta_max=0.1,0.25 \\
+        --output output/sweep.csv
+    python param_sweep.py flag --grid grid.json --output output/sweep.npz
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import itertools
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import multiprocessing as mp
+
+import numpy as np
+
+# Add build directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'build'))
+
+# Demo name -> (module, class)
+DEMOS = {
+    'flag': ('demo_flag_wave', 'WavingFlagDemo'),
+    'tablecloth': ('demo_tablecloth_pull', 'TableclothPullDemo'),
+    'curtains': ('demo_cascading_curtains', 'CascadingCurtainsDemo'),
+    'stress': ('demo_stress_test', 'StressTestDemo'),
+}
+
+INT_PARAMS = ('min_newton_steps', 'max_newton_steps', 'pcg_max_iters')
+
+METRIC_COLUMNS = (
+    'stable',
+    'mean_step_ms',
+    'max_step_ms',
+    'total_time_s',
+    'mean_pcg_iterations',
+    'mean_contacts',
+    'max_contacts',
+    'max_energy_drift_percent',
+    'final_energy_drift_percent',
+    'max_velocity',
+)
+
+
+def expand_grid(grid):
+    """Expand {name: [values]} into a list of {name: value} combinations"""
+    names = list(grid.keys())
+    combos = []
+    for values in itertools.product(*(grid[name] for name in names)):
+        combo = {}
+        for name, value in zip(names, values):
+            combo[name] = int(value) if name in INT_PARAMS else value
+        combos.append(combo)
+    return combos
+
+
+def parse_param_args(param_args):
+    """Parse repeated ``name=v1,v2,...`` arguments into a grid dict"""
+    grid = {}
+    for item in param_args:
+        if '=' not in item:
+            raise ValueError(f"Expected name=v1,v2,... but got '{item}'")
+        name, values = item.split('=', 1)
+        grid[name.strip()] = [float(v) for v in values.split(',') if v.strip()]
+    return grid
+
+
+def _mean(values):
+    values = [v for v in values if v is not None]
+    return float(np.mean(values)) if values else float('nan')
+
+
+def run_case(demo_key, overrides, num_frames, dt=None, demo_kwargs=None, max_speed=50.0):
+    """Run one demo configuration and summarize it (executes in a worker)"""
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    module_name, class_name = DEMOS[demo_key]
+
+    # Demos are chatty; keep worker output out of the sweep log.
+    with contextlib.redirect_stdout(io.StringIO()):
+        module = __import__(module_name)
+        demo = getattr(module, class_name)(**(demo_kwargs or {}))
+        demo.setup()
+        demo.apply_overrides(overrides)
+        demo.collect_metrics = True
+
+        start = time.perf_counter()
+        error = ''
+        try:
+            demo.run(num_frames=num_frames, dt=dt if dt is not None else demo.params.dt)
+        except Exception as exc:  # Diverged configs are data, not failures
+            error = str(exc)
+        total_time = time.perf_counter() - start
+
+    stats = demo.stats
+    step_times = [s['step_time_ms'] for s in stats]
+    contacts = [s.get('num_contacts') for s in stats]
+    drifts = [abs(s.get('energy_drift_percent', 0.0)) for s in stats]
+    speeds = [s.get('max_velocity', 0.0) for s in stats]
+
+    positions_finite = bool(demo.frames) and bool(np.all(np.isfinite(demo.frames[-1])))
+    max_velocity = max(speeds) if speeds else float('nan')
+    stable = (not error and len(stats) == num_frames and positions_finite
+              and math.isfinite(max_velocity) and max_velocity < max_speed)
+
+    return {
+        'overrides': overrides,
+        'stable': stable,
+        'mean_step_ms': _mean(step_times),
+        'max_step_ms': max(step_times) if step_times else float('nan'),
+        'total_time_s': total_time,
+        'mean_pcg_iterations': _mean([s.get('pcg_iterations') for s in stats]),
+        'mean_contacts': _mean(contacts),
+        'max_contacts': max((c for c in contacts if c is not None), default=0),
+        'max_energy_drift_percent': max(drifts) if drifts else float('nan'),
+        'final_energy_drift_percent': stats[-1].get('energy_drift_percent', float('nan')) if stats else float('nan'),
+        'max_velocity': max_velocity,
+        'error': error,
+    }
+
+
+def run_sweep(demo_key, grid, num_frames, dt=None, demo_kwargs=None, workers=None,
+              max_speed=50.0):
+    """Run all grid combinations in parallel worker processes
+
+    Returns:
+        List of result dicts in grid order
+    """
+    combos = expand_grid(grid)
+    results = [None] * len(combos)
+    num_workers = max(1, min(workers or os.cpu_count() or 1, len(combos)))
+
+    with ProcessPoolExecutor(num_workers, mp_context=mp.get_context('spawn')) as pool:
+        futures = {
+            pool.submit(run_case, demo_key, combo, num_frames, dt, demo_kwargs, max_speed): i
+            for i, combo in enumerate(combos)
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            index = futures[future]
+            results[index] = future.result()
+            result = results[index]
+            status = 'stable' if result['stable'] else 'UNSTABLE'
+            print(f"  [{done}/{len(combos)}] {_format_overrides(result['overrides'])} -> "
+                  f"{result['mean_step_ms']:.1f}ms/step, {status}")
+
+    return results
+
+
+def _format_overrides(overrides):
+    return ', '.join(f"{k}={v:g}" if isinstance(v, float) else f"{k}={v}"
+                     for k, v in overrides.items())
+
+
+def results_to_columns(results):
+    """Convert result dicts into a column name -> NumPy array mapping"""
+    param_names = list(results[0]['overrides'].keys()) if results else []
+    columns = {}
+    for name in param_names:
+        columns[name] = np.array([r['overrides'][name] for r in results], dtype=np.float64)
+    for name in METRIC_COLUMNS:
+        dtype = bool if name == 'stable' else np.float64
+        columns[name] = np.array([r[name] for r in results], dtype=dtype)
+    columns['error'] = np.array([r['error'] for r in results], dtype=str)
+    return columns
+
+
+def write_table(results, path):
+    """Write the sweep table as CSV or columnar .npz (chosen by extension)"""
+    columns = results_to_columns(results)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    if path.endswith('.npz'):
+        np.savez(path, **columns)
+        return
+
+    names = list(columns.keys())
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(names)
+        for row in range(len(results)):
+            writer.writerow([columns[name][row] for name in names])
+
+
+def rank_results(results):
+    """Stable runs first, fastest mean step time first"""
+    return sorted(results, key=lambda r: (not r['stable'], r['mean_step_ms']))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Parameter sweep over material and solver settings',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"Sweepable: any Material or SimParams field, e.g. youngs_modulus, "
+               f"contact_gap_max, beta_max, pcg_tol, max_newton_steps"
+    )
+    parser.add_argument('demo', choices=sorted(DEMOS.keys()), help='Demo scene to sweep')
+    parser.add_argument('--param', action='append', default=[],
+                        help='Grid axis as name=v1,v2,... (repeatable)')
+    parser.add_argument('--grid', type=str, default=None,
+                        help='JSON file mapping parameter names to value lists')
+    parser.add_argument('--frames', type=int, default=60,
+                        help='Frames per run (default: 60)')
+    parser.add_argument('--dt', type=float, default=None,
+                        help='Time step in seconds (default: demo setting)')
+    parser.add_argument('--resolution', type=int, default=None,
+                        help='Mesh resolution for the stress demo')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes (default: CPU count)')
+    parser.add_argument('--max-speed', type=float, default=50.0,
+                        help='Runs exceeding this vertex speed (m/s) count as unstable')
+    parser.add_argument('--output', type=str, default='output/param_sweep.csv',
+                        help='Output table (.csv or .npz)')
+    args = parser.parse_args()
+
+    grid = {}
+    if args.grid:
+        with open(args.grid, 'r') as f:
+            grid.update(json.load(f))
+    grid.update(parse_param_args(args.param))
+    if not grid:
+        parser.error("No parameters to sweep; use --param or --grid")
+
+    demo_kwargs = {}
+    if args.resolution is not None:
+        if args.demo != 'stress':
+            parser.error("--resolution only applies to the stress demo")
+        demo_kwargs['resolution'] = args.resolution
+
+    num_runs = int(np.prod([len(v) for v in grid.values()]))
+    print(f"\n{'='*60}")
+    print(f"PARAMETER SWEEP: {args.demo}")
+    for name, values in grid.items():
+        print(f"  {name}: {values}")
+    print(f"Runs: {num_runs} × {args.frames} frames")
+    print(f"{'='*60}\n")
+
+    results = run_sweep(args.demo, grid, args.frames, dt=args.dt, demo_kwargs=demo_kwargs,
+                        workers=args.workers, max_speed=args.max_speed)
+    write_table(results, args.output)
+
+    print(f"\n{'='*60}")
+    print("Ranking (stable first, fastest first):")
+    for rank, result in enumerate(rank_results(results)[:10], 1):
+        status = 'stable' if result['stable'] else 'UNSTABLE'
+        print(f"  {rank:2d}. {_format_overrides(result['overrides'])}")
+        print(f"      {result['mean_step_ms']:.1f}ms/step | "
+              f"PCG {result['mean_pcg_iterations']:.1f} | "
+              f"contacts {result['mean_contacts']:.1f} | "
+              f"drift {result['max_energy_drift_percent']:.1f}% | {status}")
+    print(f"\nTable written to {args.output}")
+    print(f"{'='*60}\n")
+
+
+if __name__ == '__main__':
+    main()
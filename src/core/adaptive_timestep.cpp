@@ -5,6 +5,90 @@
 
 namespace ando_barrier {
 
+namespace {
+
+// Below this many vertices/edges the fused statistics pass stays serial
+constexpr int kParallelMinItems = 4096;
+
+} // namespace
+
+AdaptiveTimestep::AdaptiveTimestep(size_t history_capacity)
+    : m_history(history_capacity, static_cast<Real>(0.0)) {}
+
+Real AdaptiveTimestep::next_dt(
+    const Mesh& mesh,
+    const State& state,
+    Real current_dt,
+    Real dt_min,
+    Real dt_max,
+    Real safety_factor
+) {
+    // Rest edge lengths only change with the mesh
+    if (m_mesh != &mesh || m_num_vertices != mesh.vertices.size() ||
+        m_num_edges != mesh.edges.size()) {
+        m_rest_min_edge = compute_min_edge_length(mesh);
+        m_mesh = &mesh;
+        m_num_vertices = mesh.vertices.size();
+        m_num_edges = mesh.edges.size();
+    }
+
+    compute_motion_statistics(mesh, state, m_last_max_velocity, m_current_min_edge);
+
+    Real dt_next = dt_max;
+    if (m_last_max_velocity >= kStaticVelocityThreshold) {
+        Real min_edge = m_rest_min_edge;
+        if (m_current_min_edge > static_cast<Real>(0.0) &&
+            (min_edge <= static_cast<Real>(0.0) || m_current_min_edge < min_edge)) {
+            min_edge = m_current_min_edge;
+        }
+        min_edge = std::max(min_edge, kMinEdgeLengthThreshold);
+
+        Real dt_cfl = compute_cfl_timestep(m_last_max_velocity, min_edge, safety_factor);
+        Real dt_target = std::clamp(dt_cfl, dt_min, dt_max);
+        dt_next = std::clamp(smooth_dt_change(current_dt, dt_target), dt_min, dt_max);
+    }
+
+    if (!m_history.empty()) {
+        m_history[m_history_next] = dt_next;
+        m_history_next = (m_history_next + 1) % m_history.size();
+        m_history_count = std::min(m_history_count + 1, m_history.size());
+    }
+    return dt_next;
+}
+
+void AdaptiveTimestep::reset() {
+    m_mesh = nullptr;
+    m_num_vertices = 0;
+    m_num_edges = 0;
+    m_rest_min_edge = 0.0;
+    m_current_min_edge = 0.0;
+    m_last_max_velocity = 0.0;
+    m_history_next = 0;
+    m_history_count = 0;
+}
+
+std::vector<Real> AdaptiveTimestep::dt_history() const {
+    std::vector<Real> out;
+    out.reserve(m_history_count);
+    const size_t capacity = m_history.size();
+    for (size_t i = 0; i < m_history_count; ++i) {
+        out.push_back(m_history[(m_history_next + capacity - m_history_count + i) % capacity]);
+    }
+    return out;
+}
+
+void AdaptiveTimestep::set_history_capacity(size_t capacity) {
+    std::vector<Real> recent = dt_history();
+    if (recent.size() > capacity) {
+        recent.erase(recent.begin(), recent.end() - capacity);
+    }
+
+    m_history.assign(capacity, static_cast<Real>(0.0));
+    std::copy(recent.begin(), recent.end(), m_history.begin());
+    m_history_count = recent.size();
+    m_history_next = capacity > 0 ? m_history_count % capacity : 0;
+}
+
 Real AdaptiveTimestep::compute_next_dt(
     const VecX& velocities,
     const Mesh& mesh,
@@ -148,4 +232,52 @@ Real AdaptiveTimestep::compute_max_velocity(const VecX& velocities) {
     return std::sqrt(max_vel_sq);
 }
 
+void AdaptiveTimestep::compute_motion_statistics(const Mesh& mesh,
+                                                 const State& state,
+                                                 Real& max_velocity,
+                                                 Real& min_edge_length) {
+    const int num_velocities = static_cast<int>(state.velocities.size());
+    const int num_edges = static_cast<int>(mesh.edges.size());
+    const size_t num_positions = state.positions.size();
+    const int n = std::max(num_velocities, num_edges);
+
+    Real max_vel_sq = static_cast<Real>(0.0);
+    Real min_edge_sq = std::numeric_limits<Real>::max();
+    // Per-thread extrema merged by hand: MSVC's OpenMP 2.0 has no min/max reductions
+    #pragma omp parallel if(n >= kParallelMinItems)
+    {
+        Real local_max_vel_sq = static_cast<Real>(0.0);
+        Real local_min_edge_sq = std::numeric_limits<Real>::max();
+        #pragma omp for schedule(static) nowait
+        for (int i = 0; i < n; ++i) {
+            if (i < num_velocities) {
+                local_max_vel_sq = std::max(local_max_vel_sq, state.velocities[i].squaredNorm());
+            }
+            if (i < num_edges) {
+                const Index v0 = mesh.edges[i].v[0];
+                const Index v1 = mesh.edges[i].v[1];
+                if (v0 < 0 || v1 < 0 ||
+                    static_cast<size_t>(v0) >= num_positions ||
+                    static_cast<size_t>(v1) >= num_positions) {
+                    continue;
+                }
+                const Real edge_length_sq = (state.positions[v1] - state.positions[v0]).squaredNorm();
+                if (std::isfinite(edge_length_sq)) {
+                    local_min_edge_sq = std::min(local_min_edge_sq, edge_length_sq);
+                }
+            }
+        }
+        #pragma omp critical(ando_motion_statistics)
+        {
+            max_vel_sq = std::max(max_vel_sq, local_max_vel_sq);
+            min_edge_sq = std::min(min_edge_sq, local_min_edge_sq);
+        }
+    }
+
+    max_velocity = std::sqrt(max_vel_sq);
+    min_edge_length = min_edge_sq < std::numeric_limits<Real>::max()
+                          ? std::sqrt(min_edge_sq)
+                          : static_cast<Real>(0.0);
+}
+
 } // namespace ando_barrier
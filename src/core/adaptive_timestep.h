@@ -3,6 +3,8 @@
 #include "types.h"
 #include "mesh.h"
 #include "state.h"
+#include <cstddef>
+#include <vector>
 
 namespace ando_barrier {
 
@@ -17,10 +19,44 @@ namespace ando_barrier {
  * Increases dt when velocities are low (cloth settling)
  * Decreases dt when velocities spike (collisions)
  * 
+ * The static functions are stateless. An instance is a controller for one
+ * simulation: it caches the rest edge statistics of the mesh, measures max
+ * velocity and min current edge length in one fused pass over State, and
+ * keeps the history of chosen timesteps.
+ * 
  * Reference: Phase 4 Task 3 specification
  */
 class AdaptiveTimestep {
 public:
+    explicit AdaptiveTimestep(size_t history_capacity = 100);
+
+    /**
+     * Next timestep for the current state (same rules as compute_next_dt)
+     * 
+     * The CFL length is the smaller of the cached rest min edge and the
+     * current min edge, so compressed cloth shortens dt. The result is
+     * appended to the dt history.
+     */
+    Real next_dt(const Mesh& mesh,
+                 const State& state,
+                 Real current_dt,
+                 Real dt_min,
+                 Real dt_max,
+                 Real safety_factor = static_cast<Real>(0.5));
+
+    // Drop cached edge statistics (e.g. after the rest shape changed) and the history
+    void reset();
+
+    Real rest_min_edge_length() const { return m_rest_min_edge; }
+    Real current_min_edge_length() const { return m_current_min_edge; }
+    Real last_max_velocity() const { return m_last_max_velocity; }
+
+    // Chosen timesteps, oldest first (at most history_capacity entries)
+    std::vector<Real> dt_history() const;
+    size_t history_capacity() const { return m_history.size(); }
+    void set_history_capacity(size_t capacity);
+
+
     /**
      * Compute next timestep using CFL condition
      * 
@@ -108,6 +144,19 @@ public:
      * Returns 0 if all velocities are below threshold (1e-6 m/s).
      */
     static Real compute_max_velocity(const VecX& velocities);
+
+    /**
+     * Max velocity magnitude and min current edge length in one parallel pass
+     * 
+     * @param mesh Mesh topology (edges)
+     * @param state Current positions and velocities
+     * @param max_velocity Output: largest |v| in m/s
+     * @param min_edge_length Output: shortest edge at the current positions (0 if none)
+     */
+    static void compute_motion_statistics(const Mesh& mesh,
+                                          const State& state,
+                                          Real& max_velocity,
+                                          Real& min_edge_length);
     
 private:
     // Velocity threshold for "static" detection (m/s)
@@ -115,6 +164,20 @@ private:
     
     // Minimum edge length threshold (meters)
     static constexpr Real kMinEdgeLengthThreshold = static_cast<Real>(1e-5);
+
+    // Rest statistics are valid for this mesh layout
+    const Mesh* m_mesh = nullptr;
+    size_t m_num_vertices = 0;
+    size_t m_num_edges = 0;
+    Real m_rest_min_edge = 0.0;
+
+    Real m_current_min_edge = 0.0;
+    Real m_last_max_velocity = 0.0;
+
+    // Ring buffer of chosen timesteps
+    std::vector<Real> m_history;
+    size_t m_history_next = 0;
+    size_t m_history_count = 0;
 };
 
 } // namespace ando_barrier
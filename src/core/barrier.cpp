@@ -24,8 +24,69 @@ inline int contact_vertex_count(const ContactPair& contact) {
     return std::max(contact.vertex_count, 1);
 }
 
+// Contacts per chunk in the batched kernels (fits the stack scratch arrays)
+constexpr int kBatchChunk = 64;
+
+// Unit normals for one chunk, falling back to +y like normalize_or_default
+inline void normalize_chunk(const ContactBatch& batch, int begin, int count, Real eps,
+                            Real* nx, Real* ny, Real* nz) {
+    const Real eps2 = eps * eps;
+    #pragma omp simd
+    for (int k = 0; k < count; ++k) {
+        const Real x = batch.normal_x[begin + k];
+        const Real y = batch.normal_y[begin + k];
+        const Real z = batch.normal_z[begin + k];
+        const Real sq = x * x + y * y + z * z;
+        const bool valid = sq > eps2;
+        const Real norm = valid ? std::sqrt(sq) : static_cast<Real>(1.0);
+        nx[k] = valid ? x / norm : static_cast<Real>(0.0);
+        ny[k] = valid ? y / norm : static_cast<Real>(1.0);
+        nz[k] = valid ? z / norm : static_cast<Real>(0.0);
+    }
+}
+
 } // namespace
 
+void ContactBatch::clear() {
+    gap.clear();
+    normal_x.clear();
+    normal_y.clear();
+    normal_z.clear();
+    k_bar.clear();
+    for (int s = 0; s < 4; ++s) {
+        weight[s].clear();
+        index[s].clear();
+    }
+}
+
+void ContactBatch::reserve(size_t count) {
+    gap.reserve(count);
+    normal_x.reserve(count);
+    normal_y.reserve(count);
+    normal_z.reserve(count);
+    k_bar.reserve(count);
+    for (int s = 0; s < 4; ++s) {
+        weight[s].reserve(count);
+        index[s].reserve(count);
+    }
+}
+
+void ContactBatch::add(const ContactPair& contact, Real k) {
+    gap.push_back(contact.gap);
+    normal_x.push_back(contact.normal.x());
+    normal_y.push_back(contact.normal.y());
+    normal_z.push_back(contact.normal.z());
+    k_bar.push_back(k);
+
+    const std::array<Index, 4> indices = {contact.idx0, contact.idx1, contact.idx2, contact.idx3};
+    const int count = contact_vertex_count(contact);
+    for (int s = 0; s < 4; ++s) {
+        const bool used = s < count && indices[s] >= 0;
+        weight[s].push_back(used ? contact.weights[s] : static_cast<Real>(0.0));
+        index[s].push_back(used ? indices[s] : -1);
+    }
+}
+
 Real Barrier::compute_energy(Real g, Real g_max, Real k) {
     if (g_max <= static_cast<Real>(0.0) || g >= g_max) {
         return static_cast<Real>(0.0);
@@ -158,6 +219,120 @@ void Barrier::compute_rigid_contact_hessian(
     compute_contact_hessian(contact, g_max, k_bar, normal_epsilon, tolerance, triplets);
 }
 
+void Barrier::compute_contact_gradient_batch(
+    const ContactBatch& batch,
+    Real g_max,
+    Real normal_epsilon,
+    VecX& gradient) {
+
+    if (g_max <= static_cast<Real>(0.0)) {
+        return;
+    }
+
+    const int total = static_cast<int>(batch.size());
+    const Real inv_gmax = static_cast<Real>(1.0) / g_max;
+    alignas(64) Real dV[kBatchChunk];
+    alignas(64) Real nx[kBatchChunk], ny[kBatchChunk], nz[kBatchChunk];
+
+    for (int begin = 0; begin < total; begin += kBatchChunk) {
+        const int count = std::min(kBatchChunk, total - begin);
+
+        // dV/dg = -(3k̄/2ḡ)(ḡ - g)², zero outside the domain
+        #pragma omp simd
+        for (int k = 0; k < count; ++k) {
+            const Real delta = std::max(g_max - batch.gap[begin + k], static_cast<Real>(0.0));
+            dV[k] = -static_cast<Real>(1.5) * batch.k_bar[begin + k] * inv_gmax * delta * delta;
+        }
+        normalize_chunk(batch, begin, count, normal_epsilon, nx, ny, nz);
+
+        for (int k = 0; k < count; ++k) {
+            if (dV[k] == static_cast<Real>(0.0)) {
+                continue;
+            }
+            for (int s = 0; s < 4; ++s) {
+                const Index idx = batch.index[s][begin + k];
+                const Real w = batch.weight[s][begin + k];
+                if (idx < 0 || w == static_cast<Real>(0.0)) {
+                    continue;
+                }
+                const Real scale = dV[k] * w;
+                gradient[3 * idx + 0] += scale * nx[k];
+                gradient[3 * idx + 1] += scale * ny[k];
+                gradient[3 * idx + 2] += scale * nz[k];
+            }
+        }
+    }
+}
+
+void Barrier::compute_contact_hessian_batch(
+    const ContactBatch& batch,
+    Real g_max,
+    Real normal_epsilon,
+    Real tolerance,
+    std::vector<Triplet>& triplets) {
+
+    if (g_max <= static_cast<Real>(0.0)) {
+        return;
+    }
+
+    const int total = static_cast<int>(batch.size());
+    const Real inv_gmax = static_cast<Real>(1.0) / g_max;
+    alignas(64) Real d2V[kBatchChunk];
+    alignas(64) Real nx[kBatchChunk], ny[kBatchChunk], nz[kBatchChunk];
+    // ∂g/∂x_s = w_s n for each vertex slot s and axis
+    alignas(64) Real grad[4][3][kBatchChunk];
+
+    for (int begin = 0; begin < total; begin += kBatchChunk) {
+        const int count = std::min(kBatchChunk, total - begin);
+
+        // d²V/dg² = (3k̄/ḡ)(ḡ - g), zero outside the domain
+        #pragma omp simd
+        for (int k = 0; k < count; ++k) {
+            const Real delta = std::max(g_max - batch.gap[begin + k], static_cast<Real>(0.0));
+            d2V[k] = static_cast<Real>(3.0) * batch.k_bar[begin + k] * inv_gmax * delta;
+        }
+        normalize_chunk(batch, begin, count, normal_epsilon, nx, ny, nz);
+        for (int s = 0; s < 4; ++s) {
+            const Real* w = batch.weight[s].data() + begin;
+            #pragma omp simd
+            for (int k = 0; k < count; ++k) {
+                grad[s][0][k] = w[k] * nx[k];
+                grad[s][1][k] = w[k] * ny[k];
+                grad[s][2][k] = w[k] * nz[k];
+            }
+        }
+
+        // Rank-one blocks d²V (w_i n)(w_j n)ᵀ, emitted in the same order as
+        // compute_contact_hessian
+        for (int k = 0; k < count; ++k) {
+            if (d2V[k] == static_cast<Real>(0.0)) {
+                continue;
+            }
+            for (int i = 0; i < 4; ++i) {
+                const Index row_vertex = batch.index[i][begin + k];
+                if (row_vertex < 0 || batch.weight[i][begin + k] == static_cast<Real>(0.0)) {
+                    continue;
+                }
+                for (int j = 0; j < 4; ++j) {
+                    const Index col_vertex = batch.index[j][begin + k];
+                    if (col_vertex < 0 || batch.weight[j][begin + k] == static_cast<Real>(0.0)) {
+                        continue;
+                    }
+                    for (int r = 0; r < 3; ++r) {
+                        for (int c = 0; c < 3; ++c) {
+                            const Real value = d2V[k] * (grad[i][r][k] * grad[j][c][k]);
+                            if (std::abs(value) < tolerance) {
+                                continue;
+                            }
+                            triplets.emplace_back(row_vertex * 3 + r, col_vertex * 3 + c, value);
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
+
 void Barrier::compute_pin_gradient(
     Index vertex_idx,
     const Vec3& pin_target,
@@ -3,9 +3,26 @@
 #include "types.h"
 #include "constraints.h"
 #include "collision.h"
+#include <array>
+#include <vector>
 
 namespace ando_barrier {
 
+// Contacts in structure-of-arrays layout for the batched barrier kernels.
+// Unused vertex slots (and vertices that are not cloth DOFs) have index -1.
+struct ContactBatch {
+    std::vector<Real> gap;
+    std::vector<Real> normal_x, normal_y, normal_z;
+    std::vector<Real> k_bar;
+    std::array<std::vector<Real>, 4> weight;
+    std::array<std::vector<Index>, 4> index;
+
+    void clear();
+    void reserve(size_t count);
+    void add(const ContactPair& contact, Real k_bar);
+    size_t size() const { return gap.size(); }
+};
+
 // Weak cubic barrier energy (Eq. 3 in paper)
 // V_weak(g, ḡ, k̄) = (k̄ / (2ḡ)) (ḡ - g)³ for g ≤ ḡ, else 0
 class Barrier {
@@ -53,6 +70,25 @@ public:
         std::vector<Triplet>& triplets
     );
 
+    // Batched point-triangle contact derivatives. Contacts are processed in
+    // fixed-size chunks: barrier derivatives and normals are computed in
+    // branch-free loops over the SoA arrays, then scattered in contact order,
+    // so results match the per-contact functions above.
+    static void compute_contact_gradient_batch(
+        const ContactBatch& batch,
+        Real g_max,
+        Real normal_epsilon,
+        VecX& gradient
+    );
+
+    static void compute_contact_hessian_batch(
+        const ContactBatch& batch,
+        Real g_max,
+        Real normal_epsilon,
+        Real tolerance,
+        std::vector<Triplet>& triplets  // Append 12×12 blocks, no pattern cache lookup
+    );
+
     // Pin constraint derivatives: gap = ||x_i - p_target||
     static void compute_pin_gradient(
         Index vertex_idx,
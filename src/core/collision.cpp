@@ -3,11 +3,18 @@
 #include <limits>
 
 #include "rigid_body.h"
+#include "trace.h"
 
 namespace ando_barrier {
 
 namespace {
 
+// Half size of the point box in the point-triangle broad phase
+constexpr Real kPointBoxHalfSize = 1e-4;
+
+// Relative padding of rigid body boxes, covering rounding in the transform
+constexpr Real kRigidBoundsPadding = 1e-5;
+
 static Vec3 compute_triangle_barycentric(const Vec3& p, const Vec3& a,
                                          const Vec3& b, const Vec3& c) {
     Vec3 v0 = b - a;
@@ -135,7 +142,8 @@ void Collision::build_triangle_bvh(const Mesh& mesh, const State& state,
 // Build edge BVH
 void Collision::build_edge_bvh(const Mesh& mesh, const State& state,
                               std::vector<BVHNode>& nodes,
-                              std::vector<int>& prim_indices) {
+                              std::vector<int>& prim_indices,
+                              Real margin) {
     nodes.clear();
     prim_indices.clear();
     
@@ -146,6 +154,10 @@ void Collision::build_edge_bvh(const Mesh& mesh, const State& state,
     for (size_t i = 0; i < mesh.edges.size(); ++i) {
         const auto& edge = mesh.edges[i];
         edge_boxes[i] = compute_edge_aabb(state.positions[edge.v[0]], state.positions[edge.v[1]]);
+        if (margin > 0.0) {
+            edge_boxes[i].min -= Vec3::Constant(margin);
+            edge_boxes[i].max += Vec3::Constant(margin);
+        }
     }
     
     // Initialize primitive indices
@@ -197,15 +209,19 @@ void Collision::traverse_bvh_pair(const std::vector<BVHNode>& bvh1,
 // Broad phase for vertex-triangle
 void Collision::broad_phase_triangles(const Mesh& mesh, const State& state,
                                      const std::vector<BVHNode>& bvh,
-                                     std::vector<ContactPair>& candidates) {
+                                     std::vector<ContactPair>& candidates,
+                                     Real margin) {
     if (bvh.empty()) return;
     
+    // Point and triangle can each move by margin before the next detection
+    const Real half_size = kPointBoxHalfSize + Real(2.0) * margin;
+    
     // For each vertex, find overlapping triangles
     for (size_t v = 0; v < state.positions.size(); ++v) {
         const Vec3& p = state.positions[v];
         
         // Create point AABB with small epsilon
-        AABB point_box(p - Vec3::Constant(1e-4), p + Vec3::Constant(1e-4));
+        AABB point_box(p - Vec3::Constant(half_size), p + Vec3::Constant(half_size));
         
         // Traverse BVH to find overlapping triangles
         std::vector<int> overlapping_tris;
@@ -451,15 +467,75 @@ bool Collision::narrow_phase_edge_edge(const Vec3& p0, const Vec3& p1,
     return true;
 }
 
+bool Collision::update_contact(const State& state,
+                               const std::vector<Vec3>* rigid_vertices,
+                               ContactPair& pair) {
+    if (pair.type == ContactType::POINT_TRIANGLE) {
+        const Vec3& p = state.positions[pair.idx0];
+        const Vec3& a = state.positions[pair.idx1];
+        const Vec3& b = state.positions[pair.idx2];
+        const Vec3& c = state.positions[pair.idx3];
+
+        if (!narrow_phase_point_triangle(p, a, b, c, pair.gap, pair.normal,
+                                         pair.witness_p, pair.witness_q)) {
+            return false;
+        }
+        Vec3 bary = compute_triangle_barycentric(pair.witness_q, a, b, c);
+        pair.barycentric = bary;
+        pair.weights[0] = static_cast<Real>(1.0);
+        pair.weights[1] = -bary[0];
+        pair.weights[2] = -bary[1];
+        pair.weights[3] = -bary[2];
+        pair.vertex_count = 4;
+        return true;
+    }
+
+    if (pair.type == ContactType::EDGE_EDGE) {
+        const Vec3& p0 = state.positions[pair.idx0];
+        const Vec3& p1 = state.positions[pair.idx1];
+        const Vec3& q0 = state.positions[pair.idx2];
+        const Vec3& q1 = state.positions[pair.idx3];
+
+        if (!narrow_phase_edge_edge(p0, p1, q0, q1, pair.gap, pair.normal,
+                                    pair.witness_p, pair.witness_q)) {
+            return false;
+        }
+        pair.vertex_count = 4;
+        pair.weights[0] = static_cast<Real>(0.5);
+        pair.weights[1] = static_cast<Real>(0.5);
+        pair.weights[2] = static_cast<Real>(-0.5);
+        pair.weights[3] = static_cast<Real>(-0.5);
+        return true;
+    }
+
+    if (pair.type == ContactType::RIGID_POINT_TRIANGLE && rigid_vertices) {
+        const Vec3& p = state.positions[pair.idx0];
+        const Vec3& a = (*rigid_vertices)[pair.idx1];
+        const Vec3& b = (*rigid_vertices)[pair.idx2];
+        const Vec3& c = (*rigid_vertices)[pair.idx3];
+
+        if (!narrow_phase_point_triangle(p, a, b, c, pair.gap, pair.normal,
+                                         pair.witness_p, pair.witness_q)) {
+            return false;
+        }
+        pair.vertex_count = 1;
+        pair.weights[0] = static_cast<Real>(1.0);
+        return true;
+    }
+
+    return false;
+}
+
 // Wall collision detection
 void Collision::detect_wall_collisions(const State& state,
                                       const Vec3& plane_normal,
                                       Real plane_offset,
-                                      std::vector<ContactPair>& contacts) {
+                                      std::vector<ContactPair>& contacts,
+                                      Real threshold) {
     for (size_t i = 0; i < state.positions.size(); ++i) {
         Real signed_dist = plane_normal.dot(state.positions[i]) - plane_offset;
         
-        if (signed_dist < 0.01) {  // Within collision threshold
+        if (signed_dist < threshold) {  // Within collision threshold
             ContactPair pair;
             pair.type = ContactType::WALL;
             pair.idx0 = i;
@@ -475,8 +551,36 @@ void Collision::detect_wall_collisions(const State& state,
 }
 
 // Full collision detection
+bool Collision::broad_phase_overlaps(const State& state, const ContactPair& pair, Real margin) {
+    if (pair.type == ContactType::POINT_TRIANGLE) {
+        const Vec3& p = state.positions[pair.idx0];
+        const Real half_size = kPointBoxHalfSize + Real(2.0) * margin;
+        AABB point_box(p - Vec3::Constant(half_size), p + Vec3::Constant(half_size));
+        return point_box.overlaps(compute_triangle_aabb(state.positions[pair.idx1],
+                                                        state.positions[pair.idx2],
+                                                        state.positions[pair.idx3]));
+    }
+
+    if (pair.type == ContactType::EDGE_EDGE) {
+        AABB box0 = compute_edge_aabb(state.positions[pair.idx0], state.positions[pair.idx1]);
+        AABB box1 = compute_edge_aabb(state.positions[pair.idx2], state.positions[pair.idx3]);
+        if (margin > 0.0) {
+            box0.min -= Vec3::Constant(margin);
+            box0.max += Vec3::Constant(margin);
+            box1.min -= Vec3::Constant(margin);
+            box1.max += Vec3::Constant(margin);
+        }
+        return box0.overlaps(box1);
+    }
+
+    return true;
+}
+
 void Collision::detect_all_collisions(const Mesh& mesh, const State& state,
-                                     std::vector<ContactPair>& contacts) {
+                                     std::vector<ContactPair>& contacts,
+                                     Real threshold,
+                                     Real margin) {
+    ANDO_TRACE_SCOPE("Collision::detect_all_collisions");
     contacts.clear();
     
     // Build BVHs
@@ -484,74 +588,69 @@ void Collision::detect_all_collisions(const Mesh& mesh, const State& state,
     std::vector<int> tri_indices, edge_indices;
     
     build_triangle_bvh(mesh, state, tri_bvh, tri_indices);
-    build_edge_bvh(mesh, state, edge_bvh, edge_indices);
+    build_edge_bvh(mesh, state, edge_bvh, edge_indices, margin);
     
     // Broad phase
     std::vector<ContactPair> candidates;
-    broad_phase_triangles(mesh, state, tri_bvh, candidates);
+    broad_phase_triangles(mesh, state, tri_bvh, candidates, margin);
     broad_phase_edges(mesh, state, tri_bvh, edge_bvh, candidates);
     
     // Narrow phase
     for (auto& pair : candidates) {
-        if (pair.type == ContactType::POINT_TRIANGLE) {
-            const Vec3& p = state.positions[pair.idx0];
-            const Vec3& a = state.positions[pair.idx1];
-            const Vec3& b = state.positions[pair.idx2];
-            const Vec3& c = state.positions[pair.idx3];
-
-            if (narrow_phase_point_triangle(p, a, b, c, pair.gap, pair.normal,
-                                           pair.witness_p, pair.witness_q)) {
-                if (pair.gap < 0.01) {  // Within collision threshold
-                    Vec3 bary = compute_triangle_barycentric(pair.witness_q, a, b, c);
-                    pair.barycentric = bary;
-                    pair.weights[0] = static_cast<Real>(1.0);
-                    pair.weights[1] = -bary[0];
-                    pair.weights[2] = -bary[1];
-                    pair.weights[3] = -bary[2];
-                    pair.vertex_count = 4;
-                    contacts.push_back(pair);
-                }
-            }
-        } else if (pair.type == ContactType::EDGE_EDGE) {
-            const Vec3& p0 = state.positions[pair.idx0];
-            const Vec3& p1 = state.positions[pair.idx1];
-            const Vec3& q0 = state.positions[pair.idx2];
-            const Vec3& q1 = state.positions[pair.idx3];
-
-            if (narrow_phase_edge_edge(p0, p1, q0, q1, pair.gap, pair.normal,
-                                      pair.witness_p, pair.witness_q)) {
-                if (pair.gap < 0.01) {  // Within collision threshold
-                    pair.vertex_count = 4;
-                    pair.weights[0] = static_cast<Real>(0.5);
-                    pair.weights[1] = static_cast<Real>(0.5);
-                    pair.weights[2] = static_cast<Real>(-0.5);
-                    pair.weights[3] = static_cast<Real>(-0.5);
-                    contacts.push_back(pair);
-                }
-            }
+        if (update_contact(state, nullptr, pair) && pair.gap < threshold) {
+            contacts.push_back(pair);
         }
     }
 }
 
 void Collision::detect_all_collisions(const Mesh& mesh, const State& state,
                                       const std::vector<RigidBody>& rigids,
-                                      std::vector<ContactPair>& contacts) {
+                                      std::vector<ContactPair>& contacts,
+                                      Real threshold,
+                                      Real margin,
+                                      const RigidSceneBVH* scene) {
+    ANDO_TRACE_SCOPE("Collision::detect_all_collisions(rigid)");
     contacts.clear();
 
     // Deformable self collisions
-    detect_all_collisions(mesh, state, contacts);
+    detect_all_collisions(mesh, state, contacts, threshold, margin);
 
     if (rigids.empty()) {
         return;
     }
 
+    // Bodies outside the cloth box grown by the threshold cannot produce a
+    // pair with gap < threshold; use the caller's refit tree when it matches
+    RigidSceneBVH local_scene;
+    if (!scene || scene->num_bodies() != rigids.size()) {
+        local_scene.refit(rigids);
+        scene = &local_scene;
+    }
+
+    AABB cloth_box;
+    for (const Vec3& p : state.positions) {
+        cloth_box.expand(p);
+    }
+    cloth_box.min -= Vec3::Constant(threshold);
+    cloth_box.max += Vec3::Constant(threshold);
+
+    std::vector<int> nearby;
+    scene->query(cloth_box, nearby);
+
     // Deformable vs rigid
-    for (size_t rb = 0; rb < rigids.size(); ++rb) {
+    for (int rb : nearby) {
         const RigidBody& body = rigids[rb];
-        std::vector<Vec3> rigid_vertices = body.world_vertices();
+        const std::vector<Vec3>& rigid_vertices = body.world_vertices();
+
+        AABB body_box = scene->body_bounds(rb);
+        body_box.min -= Vec3::Constant(threshold);
+        body_box.max += Vec3::Constant(threshold);
 
         for (size_t v = 0; v < state.positions.size(); ++v) {
             const Vec3& p = state.positions[v];
+            if (!body_box.overlaps(AABB(p, p))) {
+                continue;
+            }
 
             for (const Triangle& tri : body.triangles()) {
                 const Vec3& a = rigid_vertices[tri.v[0]];
@@ -564,11 +663,11 @@ void Collision::detect_all_collisions(const Mesh& mesh, const State& state,
                 pair.idx1 = tri.v[0];
                 pair.idx2 = tri.v[1];
                 pair.idx3 = tri.v[2];
-                pair.rigid_body_index = static_cast<int>(rb);
+                pair.rigid_body_index = rb;
 
                 if (narrow_phase_point_triangle(p, a, b, c, pair.gap, pair.normal,
                                                 pair.witness_p, pair.witness_q)) {
-                    if (pair.gap < 0.01) {
+                    if (pair.gap < threshold) {
                         pair.vertex_count = 1;
                         pair.weights[0] = static_cast<Real>(1.0);
                         contacts.push_back(pair);
@@ -579,4 +678,118 @@ void Collision::detect_all_collisions(const Mesh& mesh, const State& state,
     }
 }
 
+// ============================================================================
+// Rigid scene BVH
+// ============================================================================
+
+AABB RigidSceneBVH::world_bounds(const RigidBody& body) {
+    const Vec3 local_center = (body.local_bounds_min() + body.local_bounds_max()) * 0.5;
+    const Vec3 local_half = (body.local_bounds_max() - body.local_bounds_min()) * 0.5;
+
+    // Rotated box: centre R·c + p, half extents |R|·h
+    const Vec3 center = body.position() + body.rotation() * local_center;
+    Vec3 half = body.rotation().cwiseAbs() * local_half;
+    half += Vec3::Constant(kRigidBoundsPadding *
+                           (Real(1) + center.cwiseAbs().maxCoeff() + half.maxCoeff()));
+    return AABB(center - half, center + half);
+}
+
+void RigidSceneBVH::clear() {
+    m_nodes.clear();
+    m_body_boxes.clear();
+}
+
+int RigidSceneBVH::build(std::vector<int>& order, int start, int end) {
+    const int node_idx = static_cast<int>(m_nodes.size());
+    m_nodes.emplace_back();
+
+    AABB bbox;
+    for (int i = start; i < end; ++i) {
+        bbox.expand(m_body_boxes[order[i]]);
+    }
+    m_nodes[node_idx].bbox = bbox;
+
+    // One body per leaf
+    if (end - start == 1) {
+        m_nodes[node_idx].prim_idx = order[start];
+        return node_idx;
+    }
+
+    const int axis = bbox.longest_axis();
+    const int mid = start + (end - start) / 2;
+    std::nth_element(order.begin() + start, order.begin() + mid, order.begin() + end,
+                     [&](int a, int b) {
+                         return m_body_boxes[a].center()[axis] < m_body_boxes[b].center()[axis];
+                     });
+
+    // Children are appended after their parent (refit relies on this)
+    const int left = build(order, start, mid);
+    const int right = build(order, mid, end);
+    m_nodes[node_idx].left = left;
+    m_nodes[node_idx].right = right;
+    return node_idx;
+}
+
+void RigidSceneBVH::refit(const std::vector<RigidBody>& bodies) {
+    ANDO_TRACE_SCOPE("RigidSceneBVH::refit");
+    const bool rebuild = bodies.size() != m_body_boxes.size() || m_nodes.empty();
+
+    m_body_boxes.resize(bodies.size());
+    for (size_t i = 0; i < bodies.size(); ++i) {
+        m_body_boxes[i] = world_bounds(bodies[i]);
+    }
+
+    if (bodies.empty()) {
+        m_nodes.clear();
+        return;
+    }
+
+    if (rebuild) {
+        m_nodes.clear();
+        m_nodes.reserve(2 * bodies.size() - 1);
+        std::vector<int> order(bodies.size());
+        for (size_t i = 0; i < order.size(); ++i) {
+            order[i] = static_cast<int>(i);
+        }
+        build(order, 0, static_cast<int>(order.size()));
+        return;
+    }
+
+    for (int i = static_cast<int>(m_nodes.size()) - 1; i >= 0; --i) {
+        BVHNode& node = m_nodes[i];
+        if (node.is_leaf()) {
+            node.bbox = m_body_boxes[node.prim_idx];
+        } else {
+            node.bbox = m_nodes[node.left].bbox;
+            node.bbox.expand(m_nodes[node.right].bbox);
+        }
+    }
+}
+
+void RigidSceneBVH::query(const AABB& box, std::vector<int>& bodies) const {
+    bodies.clear();
+    if (m_nodes.empty()) {
+        return;
+    }
+
+    std::vector<int> stack;
+    stack.push_back(0);
+    while (!stack.empty()) {
+        const BVHNode& node = m_nodes[stack.back()];
+        stack.pop_back();
+        if (!node.bbox.overlaps(box)) {
+            continue;
+        }
+        if (node.is_leaf()) {
+            bodies.push_back(node.prim_idx);
+        } else {
+            stack.push_back(node.right);
+            stack.push_back(node.left);
+        }
+    }
+
+    // Callers emit contacts body by body; keep the scene order
+    std::sort(bodies.begin(), bodies.end());
+}
+
 } // namespace ando_barrier
@@ -10,6 +10,10 @@
 namespace ando_barrier {
 
 class RigidBody;
+class RigidSceneBVH;
+
+// Gap below which narrow-phase pairs become contacts
+constexpr Real kContactDetectionThreshold = 0.01;
 
 // Axis-aligned bounding box
 struct AABB {
@@ -81,6 +85,7 @@ struct ContactPair {
     // Indices (interpretation depends on type)
     // POINT_TRIANGLE: idx0 = vertex, idx1/2/3 = triangle vertices
     // EDGE_EDGE: idx0/1 = edge0 vertices, idx2/3 = edge1 vertices
+    // WALL: idx0 = vertex, idx1 = wall index (set by the integrator)
     Index idx0, idx1, idx2, idx3;
 
     // Geometric data (computed in narrow phase)
@@ -94,10 +99,12 @@ struct ContactPair {
 
     int rigid_body_index;
 
+    Real stiffness;     // k̄ from the contact cache or the first evaluation (< 0: not evaluated)
+
     ContactPair() : type(ContactType::POINT_TRIANGLE),
                    idx0(-1), idx1(-1), idx2(-1), idx3(-1),
                    gap(0.0), barycentric(Vec3::Zero()), vertex_count(0),
-                   rigid_body_index(-1) {
+                   rigid_body_index(-1), stiffness(-1.0) {
         weights.fill(static_cast<Real>(0));
     }
 };
@@ -109,14 +116,18 @@ public:
     static void build_triangle_bvh(const Mesh& mesh, const State& state,
                                    std::vector<BVHNode>& nodes, std::vector<int>& prim_indices);
     
-    // Build BVH from mesh edges
+    // Build BVH from mesh edges (edge boxes grown by margin on every side)
     static void build_edge_bvh(const Mesh& mesh, const State& state,
-                              std::vector<BVHNode>& nodes, std::vector<int>& prim_indices);
+                              std::vector<BVHNode>& nodes, std::vector<int>& prim_indices,
+                              Real margin = 0.0);
     
     // Broad phase: find potential contact pairs using BVH
+    // (point boxes grown by 2·margin so pairs stay candidates while every
+    // vertex moves less than margin)
     static void broad_phase_triangles(const Mesh& mesh, const State& state,
                                      const std::vector<BVHNode>& bvh,
-                                     std::vector<ContactPair>& candidates);
+                                     std::vector<ContactPair>& candidates,
+                                     Real margin = 0.0);
     
     static void broad_phase_edges(const Mesh& mesh, const State& state,
                                  const std::vector<BVHNode>& tri_bvh,
@@ -134,19 +145,44 @@ public:
                                       Real& distance, Vec3& normal,
                                       Vec3& witness_p, Vec3& witness_q);
     
-    // Wall collision
+    /**
+     * Recompute gap, normal, witness points and extended-direction weights
+     * of an existing pair from current positions (cloth pairs, or rigid
+     * pairs given that body's world-space vertices).
+     * @return false if the narrow phase rejects the pair
+     */
+    static bool update_contact(const State& state,
+                               const std::vector<Vec3>* rigid_vertices,
+                               ContactPair& pair);
+
+    /**
+     * Broad-phase test for one cloth pair at the current positions, with the
+     * same boxes as broad_phase_triangles / broad_phase_edges for this margin.
+     * Rigid pairs have no broad phase and always pass.
+     */
+    static bool broad_phase_overlaps(const State& state, const ContactPair& pair,
+                                     Real margin = 0.0);
+    
+    // Wall collision: appends a WALL pair for every vertex with signed distance < threshold
     static void detect_wall_collisions(const State& state,
                                       const Vec3& plane_normal,
                                       Real plane_offset,
-                                      std::vector<ContactPair>& contacts);
+                                      std::vector<ContactPair>& contacts,
+                                      Real threshold = 0.01);
     
-    // Full collision detection pipeline
+    // Full collision detection pipeline: pairs with gap < threshold.
+    // A positive margin also widens the broad phase (see broad_phase_triangles).
     static void detect_all_collisions(const Mesh& mesh, const State& state,
-                                     std::vector<ContactPair>& contacts);
+                                     std::vector<ContactPair>& contacts,
+                                     Real threshold = kContactDetectionThreshold,
+                                     Real margin = 0.0);
 
     static void detect_all_collisions(const Mesh& mesh, const State& state,
                                       const std::vector<RigidBody>& rigids,
-                                      std::vector<ContactPair>& contacts);
+                                      std::vector<ContactPair>& contacts,
+                                      Real threshold = kContactDetectionThreshold,
+                                      Real margin = 0.0,
+                                      const RigidSceneBVH* scene = nullptr);
 
 private:
     // Helper: build BVH recursively
@@ -162,4 +198,33 @@ private:
                                  std::vector<std::pair<int, int>>& overlaps);
 };
 
+/**
+ * Scene-level broad phase over rigid bodies: an AABB tree with one body per
+ * leaf. The topology is built once per body count; refit() recomputes the
+ * world boxes from each body's transform and its cached local bounds, then
+ * refits the internal nodes bottom-up, so per-step cost is O(bodies).
+ */
+class RigidSceneBVH {
+public:
+    // Recompute body boxes from the current transforms (rebuilds the
+    // topology when the number of bodies changed)
+    void refit(const std::vector<RigidBody>& bodies);
+
+    // Indices of bodies whose box overlaps the query box, in ascending order
+    void query(const AABB& box, std::vector<int>& bodies) const;
+
+    size_t num_bodies() const { return m_body_boxes.size(); }
+    const AABB& body_bounds(int body) const { return m_body_boxes[body]; }
+    void clear();
+
+    // World-space box of a body from its transform and local bounds
+    static AABB world_bounds(const RigidBody& body);
+
+private:
+    int build(std::vector<int>& order, int start, int end);
+
+    std::vector<BVHNode> m_nodes;
+    std::vector<AABB> m_body_boxes;
+};
+
 } // namespace ando_barrier
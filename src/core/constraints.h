@@ -1,6 +1,8 @@
 #pragma once
 
 #include "types.h"
+#include "contact_cache.h"
+#include "step_profile.h"
 #include <vector>
 
 namespace ando_barrier {
@@ -43,6 +45,27 @@ struct StrainConstraint {
     bool active = true;
 };
 
+// Per-face SVD F = U Σ Vᵀ of the 3×2 deformation gradient at the positions
+// it was computed for. StrainLimiting reuses an entry while F is unchanged,
+// so one Newton iteration does a single SVD per face.
+struct StrainSVDCache {
+    std::vector<Eigen::Matrix<Real, 3, 2>> F;
+    std::vector<Eigen::Matrix<Real, 3, 2>> U;
+    std::vector<Vec2> sigma;
+    std::vector<Mat2> V;
+    std::vector<char> filled;   // Entry holds the SVD of F
+    std::vector<char> ok;       // ... and that SVD was finite
+
+    void resize(size_t num_faces) {
+        F.resize(num_faces);
+        U.resize(num_faces);
+        sigma.resize(num_faces);
+        V.resize(num_faces);
+        filled.assign(num_faces, 0);
+        ok.assign(num_faces, 0);
+    }
+};
+
 // Container for all constraints
 class Constraints {
 public:
@@ -50,6 +73,12 @@ public:
     std::vector<WallConstraint> walls;
     std::vector<ContactConstraint> contacts;  // Dynamic, rebuilt each step
     std::vector<StrainConstraint> strain_limits; // Dynamic, rebuilt each step
+    StrainSVDCache strain_svd_cache;             // Face SVDs of the current iterate
+    ContactCache contact_cache;                  // Contacts carried between steps (if enabled)
+    RigidSceneBVH rigid_scene;                   // Broad phase over rigid bodies, refit each step
+    std::vector<ContactPair> last_step_contacts; // Contacts of the last Integrator::step
+    StepProfile last_step_profile;               // Timings and counters of the last Integrator::step
+    StepProfileSummary profile_summary;          // Step profiles accumulated since the last reset
     
     Constraints() = default;
     
@@ -0,0 +1,152 @@
+#include "contact_cache.h"
+#include "rigid_body.h"
+#include "trace.h"
+#include <algorithm>
+#include <cmath>
+
+namespace ando_barrier {
+
+namespace {
+
+// Carried k̄ is dropped once the normal turns further than this (cos ≈ 25°)
+constexpr Real kMinNormalAlignment = 0.9;
+
+} // namespace
+
+size_t ContactCache::PairKeyHash::operator()(const PairKey& key) const {
+    size_t h = static_cast<size_t>(key.type) * 31 + static_cast<size_t>(key.rigid_body_index + 1);
+    for (Index idx : key.indices) {
+        h ^= static_cast<size_t>(idx) + 0x9e3779b97f4a7c15ull + (h << 6) + (h >> 2);
+    }
+    return h;
+}
+
+ContactCache::PairKey ContactCache::key_of(const ContactPair& contact) {
+    return PairKey{static_cast<int>(contact.type), contact.rigid_body_index,
+                   {contact.idx0, contact.idx1, contact.idx2, contact.idx3}};
+}
+
+Real ContactCache::max_displacement(const State& state,
+                                    const std::vector<const std::vector<Vec3>*>& rigid_vertices) const {
+    Real max_sq = 0.0;
+    for (size_t i = 0; i < state.positions.size(); ++i) {
+        max_sq = std::max(max_sq, (state.positions[i] - m_reference_positions[i]).squaredNorm());
+    }
+    for (size_t b = 0; b < rigid_vertices.size(); ++b) {
+        const std::vector<Vec3>& body = *rigid_vertices[b];
+        for (size_t i = 0; i < body.size(); ++i) {
+            max_sq = std::max(max_sq, (body[i] - m_reference_rigid[b][i]).squaredNorm());
+        }
+    }
+    return std::sqrt(max_sq);
+}
+
+void ContactCache::update(const Mesh& mesh,
+                          const State& state,
+                          const std::vector<RigidBody>* rigid_bodies,
+                          Real threshold,
+                          Real margin,
+                          Real broad_phase_margin,
+                          std::vector<ContactPair>& contacts,
+                          ContactCacheStats* stats,
+                          const RigidSceneBVH* scene) {
+    ANDO_TRACE_SCOPE("ContactCache::update");
+    contacts.clear();
+
+    // Each body's cached world vertices (recomputed only for bodies that moved)
+    std::vector<const std::vector<Vec3>*> rigid_vertices;
+    if (rigid_bodies) {
+        rigid_vertices.reserve(rigid_bodies->size());
+        for (const auto& body : *rigid_bodies) {
+            rigid_vertices.push_back(&body.world_vertices());
+        }
+    }
+
+    // Candidate set still valid? Same topology, same settings, motion within margin
+    bool rebuild = !m_valid || threshold != m_threshold || margin != m_margin ||
+                   broad_phase_margin != m_broad_phase_margin ||
+                   m_reference_positions.size() != state.positions.size() ||
+                   m_reference_rigid.size() != rigid_vertices.size();
+    for (size_t b = 0; !rebuild && b < rigid_vertices.size(); ++b) {
+        rebuild = m_reference_rigid[b].size() != rigid_vertices[b]->size();
+    }
+    if (!rebuild) {
+        rebuild = max_displacement(state, rigid_vertices) > margin;
+    }
+
+    ContactCacheStats local;
+    if (rebuild) {
+        const Real widened = threshold + Real(2.0) * margin;
+        const Real broad_margin = margin + broad_phase_margin;
+        if (rigid_bodies) {
+            Collision::detect_all_collisions(mesh, state, *rigid_bodies, m_candidates, widened,
+                                             broad_margin, scene);
+        } else {
+            Collision::detect_all_collisions(mesh, state, m_candidates, widened, broad_margin);
+        }
+        m_reference_positions = state.positions;
+        m_reference_rigid.resize(rigid_vertices.size());
+        for (size_t b = 0; b < rigid_vertices.size(); ++b) {
+            m_reference_rigid[b] = *rigid_vertices[b];
+        }
+        m_threshold = threshold;
+        m_margin = margin;
+        m_broad_phase_margin = broad_phase_margin;
+        m_valid = true;
+        local.full_detections = 1;
+    } else {
+        local.revalidations = 1;
+    }
+
+    // Narrow phase on the candidates at the current positions
+    contacts.reserve(m_candidates.size());
+    for (const ContactPair& candidate : m_candidates) {
+        ContactPair pair = candidate;
+        const std::vector<Vec3>* body_vertices =
+            pair.rigid_body_index >= 0 ? rigid_vertices[pair.rigid_body_index] : nullptr;
+        if (!Collision::update_contact(state, body_vertices, pair) || pair.gap >= threshold ||
+            !Collision::broad_phase_overlaps(state, pair, broad_phase_margin)) {
+            continue;
+        }
+
+        pair.stiffness = -1.0;
+        auto it = m_persistent.find(key_of(pair));
+        if (it != m_persistent.end()) {
+            local.hits++;
+            if (it->second.normal.dot(pair.normal) >= kMinNormalAlignment) {
+                pair.stiffness = it->second.stiffness;
+            }
+        } else {
+            local.misses++;
+        }
+        contacts.push_back(pair);
+    }
+
+    m_totals.hits += local.hits;
+    m_totals.misses += local.misses;
+    m_totals.full_detections += local.full_detections;
+    m_totals.revalidations += local.revalidations;
+    if (stats) {
+        *stats = local;
+    }
+}
+
+void ContactCache::store(const std::vector<ContactPair>& contacts) {
+    m_persistent.clear();
+    m_persistent.reserve(contacts.size());
+    for (const ContactPair& contact : contacts) {
+        m_persistent[key_of(contact)] = Persistent{contact.stiffness, contact.normal};
+    }
+}
+
+void ContactCache::clear() {
+    m_valid = false;
+    m_candidates.clear();
+    m_reference_positions.clear();
+    m_reference_rigid.clear();
+    m_broad_phase_margin = 0.0;
+    m_persistent.clear();
+    m_totals = ContactCacheStats();
+}
+
+} // namespace ando_barrier
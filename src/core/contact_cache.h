@@ -0,0 +1,112 @@
+#pragma once
+
+#include "types.h"
+#include "mesh.h"
+#include "state.h"
+#include "collision.h"
+#include <array>
+#include <cstddef>
+#include <unordered_map>
+#include <vector>
+
+namespace ando_barrier {
+
+class RigidBody;
+
+// Cache activity for one update (or running totals)
+struct ContactCacheStats {
+    int hits = 0;              // Contacts carried over from the previous step
+    int misses = 0;            // Contacts seen for the first time
+    int full_detections = 0;   // Updates that rebuilt the candidate set
+    int revalidations = 0;     // Updates served from cached candidates
+};
+
+/**
+ * Contact manifold cache with temporal coherence across steps
+ * 
+ * A full detection stores every pair with gap < threshold + 2·margin
+ * (broad phase widened to match) together with the vertex positions at
+ * that time. While no cloth or rigid vertex has moved more than margin
+ * since then, each of those pairs can change its gap by at most 2·margin,
+ * so re-running only the narrow phase on the stored pairs finds exactly
+ * the contacts a full detection would (each candidate is re-checked
+ * against the gap threshold and its broad-phase boxes). Beyond the
+ * margin the candidate set is rebuilt.
+ * 
+ * Contacts present in consecutive steps (keyed by primitive pair) are
+ * hits and carry their k̄ in ContactPair::stiffness, as long as the
+ * normal has not turned by more than ~25°.
+ */
+class ContactCache {
+public:
+    /**
+     * Contacts for the current positions
+     * 
+     * @param rigid_bodies Optional rigid colliders (nullptr for cloth only)
+     * @param threshold Contact gap threshold (as in Collision::detect_all_collisions)
+     * @param margin Per-vertex displacement allowed before a full detection
+     * @param broad_phase_margin Broad-phase margin of the detection being
+     *        replaced (Collision::detect_all_collisions margin)
+     * @param contacts Output contacts; stiffness ≥ 0 for carried contacts
+     * @param stats Optional per-update activity
+     * @param scene Optional rigid scene broad phase refit for rigid_bodies
+     */
+    void update(const Mesh& mesh,
+                const State& state,
+                const std::vector<RigidBody>* rigid_bodies,
+                Real threshold,
+                Real margin,
+                Real broad_phase_margin,
+                std::vector<ContactPair>& contacts,
+                ContactCacheStats* stats = nullptr,
+                const RigidSceneBVH* scene = nullptr);
+
+    // Remember the contacts (and their k̄) used this step for the next update
+    void store(const std::vector<ContactPair>& contacts);
+
+    // Drop everything; the next update runs a full detection
+    void clear();
+
+    size_t num_candidates() const { return m_candidates.size(); }
+    size_t num_persistent() const { return m_persistent.size(); }
+    const ContactCacheStats& totals() const { return m_totals; }
+
+private:
+    struct PairKey {
+        int type;
+        int rigid_body_index;
+        std::array<Index, 4> indices;
+
+        bool operator==(const PairKey& other) const {
+            return type == other.type && rigid_body_index == other.rigid_body_index &&
+                   indices == other.indices;
+        }
+    };
+
+    struct PairKeyHash {
+        size_t operator()(const PairKey& key) const;
+    };
+
+    struct Persistent {
+        Real stiffness;
+        Vec3 normal;
+    };
+
+    static PairKey key_of(const ContactPair& contact);
+
+    // Largest vertex displacement (cloth and rigid) since the last full detection
+    Real max_displacement(const State& state,
+                          const std::vector<const std::vector<Vec3>*>& rigid_vertices) const;
+
+    bool m_valid = false;
+    Real m_threshold = 0.0;
+    Real m_margin = 0.0;
+    Real m_broad_phase_margin = 0.0;
+    std::vector<ContactPair> m_candidates;
+    std::vector<Vec3> m_reference_positions;
+    std::vector<std::vector<Vec3>> m_reference_rigid;
+    std::unordered_map<PairKey, Persistent, PairKeyHash> m_persistent;
+    ContactCacheStats m_totals;
+};
+
+} // namespace ando_barrier
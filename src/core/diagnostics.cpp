@@ -0,0 +1,190 @@
+#include "diagnostics.h"
+#include "integrator.h"
+#include "trace.h"
+#include <algorithm>
+#include <cmath>
+
+namespace ando_barrier {
+
+namespace {
+
+// Below this size the contact update runs serially
+constexpr int kParallelMinContacts = 256;
+
+// Contact indices refer to this state (not to a mesh simulated earlier)
+bool indices_in_range(const ContactPair& pair, Index num_vertices) {
+    if (pair.idx0 < 0 || pair.idx0 >= num_vertices) {
+        return false;
+    }
+    if (pair.type == ContactType::RIGID_POINT_TRIANGLE) {
+        return true;
+    }
+    const int count = pair.type == ContactType::WALL ? 1 : 4;
+    const Index idx[4] = {pair.idx0, pair.idx1, pair.idx2, pair.idx3};
+    for (int k = 1; k < count; ++k) {
+        if (idx[k] < 0 || idx[k] >= num_vertices) {
+            return false;
+        }
+    }
+    return true;
+}
+
+// Approach speed along the contact normal (as CollisionValidator)
+Real relative_normal_speed(const ContactPair& pair,
+                           const State& state,
+                           const std::vector<RigidBody>* rigid_bodies) {
+    const auto& v = state.velocities;
+    Vec3 v_rel = Vec3::Zero();
+    switch (pair.type) {
+        case ContactType::POINT_TRIANGLE:
+            v_rel = v[pair.idx0] - (v[pair.idx1] + v[pair.idx2] + v[pair.idx3]) / 3.0;
+            break;
+        case ContactType::EDGE_EDGE:
+            v_rel = (v[pair.idx0] + v[pair.idx1]) / 2.0 - (v[pair.idx2] + v[pair.idx3]) / 2.0;
+            break;
+        case ContactType::WALL:
+            v_rel = v[pair.idx0];
+            break;
+        case ContactType::RIGID_POINT_TRIANGLE:
+            v_rel = v[pair.idx0] -
+                    (*rigid_bodies)[pair.rigid_body_index].velocity_at_point(pair.witness_q);
+            break;
+    }
+    return std::abs(v_rel.dot(pair.normal));
+}
+
+// idx0..idx3 that are cloth vertices (walls and rigid triangles only have idx0)
+std::array<Index, 4> cloth_vertices(const ContactPair& pair) {
+    if (pair.type == ContactType::WALL || pair.type == ContactType::RIGID_POINT_TRIANGLE) {
+        return {pair.idx0, -1, -1, -1};
+    }
+    return {pair.idx0, pair.idx1, pair.idx2, pair.idx3};
+}
+
+} // namespace
+
+FrameDiagnostics Diagnostics::compute(const Mesh& mesh,
+                                      const State& state,
+                                      const Constraints& constraints,
+                                      const SimParams& params,
+                                      const std::vector<RigidBody>* rigid_bodies) {
+    ANDO_TRACE_SCOPE("Diagnostics::compute");
+    FrameDiagnostics diag;
+
+    // Move the last step's contacts to the current positions
+    std::vector<ContactPair> pairs = Integrator::last_step_contacts(constraints);
+    std::vector<const std::vector<Vec3>*> rigid_vertices;
+    if (rigid_bodies) {
+        // Refresh the bodies' cached world vertices before the parallel loop reads them
+        rigid_vertices.reserve(rigid_bodies->size());
+        for (const auto& body : *rigid_bodies) {
+            rigid_vertices.push_back(&body.world_vertices());
+        }
+    }
+
+    const Index n = static_cast<Index>(state.num_vertices());
+    const int num_pairs = static_cast<int>(pairs.size());
+    std::vector<char> keep(num_pairs, 0);
+    std::vector<Real> speeds(num_pairs, 0.0);
+    #pragma omp parallel for schedule(static) if(num_pairs >= kParallelMinContacts)
+    for (int c = 0; c < num_pairs; ++c) {
+        ContactPair& pair = pairs[c];
+        if (!indices_in_range(pair, n)) {
+            continue;
+        }
+        const std::vector<Vec3>* body_vertices = nullptr;
+        if (pair.type == ContactType::RIGID_POINT_TRIANGLE) {
+            if (pair.rigid_body_index < 0 ||
+                pair.rigid_body_index >= static_cast<int>(rigid_vertices.size())) {
+                continue;
+            }
+            body_vertices = rigid_vertices[pair.rigid_body_index];
+        }
+        if (pair.type != ContactType::WALL && !Collision::update_contact(state, body_vertices, pair)) {
+            continue;
+        }
+        keep[c] = 1;
+        speeds[c] = relative_normal_speed(pair, state, rigid_bodies);
+    }
+
+    int kept = 0;
+    for (int c = 0; c < num_pairs; ++c) {
+        if (keep[c]) {
+            speeds[kept] = speeds[c];
+            pairs[kept++] = pairs[c];
+        }
+    }
+    pairs.resize(kept);
+    speeds.resize(kept);
+
+    diag.energy = EnergyTracker::compute(mesh, state, constraints, params, &pairs);
+
+    // One pass over the kept contacts for metrics, counts and arrays
+    const Real gap_max = params.contact_gap_max;
+    CollisionMetrics& metrics = diag.collision;
+    metrics.ccd_enabled = params.enable_ccd;
+    diag.contact_positions.reserve(kept);
+    diag.contact_normals.reserve(kept);
+    diag.contact_gaps.reserve(kept);
+    diag.contact_types.reserve(kept);
+    diag.contact_vertices.reserve(kept);
+
+    Real sum_gap = 0.0;
+    Real sum_penetration = 0.0;
+    Real sum_speed = 0.0;
+    for (int c = 0; c < kept; ++c) {
+        const ContactPair& pair = pairs[c];
+        const Real gap = pair.gap;
+        const int count = metrics.num_total_contacts++;
+
+        diag.contact_type_counts[static_cast<int>(pair.type)]++;
+        switch (pair.type) {
+            case ContactType::POINT_TRIANGLE: metrics.num_point_triangle++; break;
+            case ContactType::EDGE_EDGE: metrics.num_edge_edge++; break;
+            case ContactType::WALL: metrics.num_wall++; break;
+            case ContactType::RIGID_POINT_TRIANGLE: break;
+        }
+
+        metrics.min_gap = count == 0 ? gap : std::min(metrics.min_gap, gap);
+        metrics.max_gap = count == 0 ? gap : std::max(metrics.max_gap, gap);
+        sum_gap += gap;
+        if (gap < 0.0) {
+            const Real penetration = -gap;
+            metrics.num_penetrations++;
+            metrics.max_penetration = std::max(metrics.max_penetration, penetration);
+            sum_penetration += penetration;
+            metrics.has_major_penetration = metrics.has_major_penetration || penetration > 0.001;
+            metrics.has_tunneling = metrics.has_tunneling || penetration > 0.1 * gap_max;
+        }
+        if (metrics.ccd_enabled && gap < gap_max * 0.5) {
+            metrics.num_ccd_contacts++;
+        } else {
+            metrics.num_broad_phase_contacts++;
+        }
+        metrics.max_relative_velocity = std::max(metrics.max_relative_velocity, speeds[c]);
+        sum_speed += speeds[c];
+
+        diag.contact_positions.push_back(pair.witness_p);
+        diag.contact_normals.push_back(pair.normal);
+        diag.contact_gaps.push_back(gap);
+        diag.contact_types.push_back(static_cast<int>(pair.type));
+        diag.contact_vertices.push_back(cloth_vertices(pair));
+    }
+
+    const int total = metrics.num_total_contacts;
+    if (total > 0) {
+        metrics.avg_gap = sum_gap / total;
+        metrics.avg_relative_velocity = sum_speed / total;
+        if (metrics.ccd_enabled) {
+            metrics.ccd_effectiveness = (Real)metrics.num_ccd_contacts / (Real)total * 100.0;
+        }
+    }
+    if (metrics.num_penetrations > 0) {
+        metrics.avg_penetration = sum_penetration / metrics.num_penetrations;
+        metrics.is_stable = false;
+    }
+
+    return diag;
+}
+
+} // namespace ando_barrier
@@ -0,0 +1,53 @@
+#pragma once
+
+#include "types.h"
+#include "mesh.h"
+#include "state.h"
+#include "constraints.h"
+#include "collision.h"
+#include "rigid_body.h"
+#include "energy_tracker.h"
+#include "collision_validator.h"
+#include <array>
+#include <vector>
+
+namespace ando_barrier {
+
+// Per-frame diagnostics: energy, contact quality and the contacts themselves
+struct FrameDiagnostics {
+    EnergyDiagnostics energy;
+    CollisionMetrics collision;
+    std::array<int, 4> contact_type_counts{};  // Indexed by ContactType
+
+    // One entry per contact
+    std::vector<Vec3> contact_positions;       // Witness point on primitive 0
+    std::vector<Vec3> contact_normals;
+    std::vector<Real> contact_gaps;
+    std::vector<int> contact_types;            // ContactType
+    std::vector<std::array<Index, 4>> contact_vertices;  // Cloth vertices (idx0..idx3), -1 if unused
+};
+
+/**
+ * Post-step diagnostics without another collision detection
+ *
+ * compute() takes the contacts the last Integrator::step left on the
+ * simulation's Constraints, moves their gaps, normals and witness points to
+ * the current positions (Collision::update_contact) and gathers
+ * gap/penetration metrics, per-type counts, relative normal speeds and the
+ * per-contact arrays in one pass.
+ * Energy and momentum come from EnergyTracker::compute on the same contacts.
+ */
+class Diagnostics {
+public:
+    /**
+     * @param rigid_bodies Colliders of the last step; without them rigid
+     *        contacts are dropped
+     */
+    static FrameDiagnostics compute(const Mesh& mesh,
+                                    const State& state,
+                                    const Constraints& constraints,
+                                    const SimParams& params,
+                                    const std::vector<RigidBody>* rigid_bodies = nullptr);
+};
+
+} // namespace ando_barrier
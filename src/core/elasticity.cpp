@@ -4,12 +4,106 @@
 
 namespace ando_barrier {
 
+namespace {
+
+// Below this many faces (or vertices) the kernels run serially
+constexpr int kParallelMinFaces = 2048;
+
+// Deformed tangent frame (t1, t2) and F = Ds·Dm⁻¹ of a face, as in Mesh::compute_F
+inline void face_frame(const Mesh& mesh, int face, Vec3& t1, Vec3& t2, Mat2& F) {
+    const Triangle& tri = mesh.triangles[face];
+    const Vec3& v0 = mesh.vertices[tri.v[0]];
+    const Vec3& v1 = mesh.vertices[tri.v[1]];
+    const Vec3& v2 = mesh.vertices[tri.v[2]];
+    
+    Vec3 e1 = v1 - v0;
+    Vec3 e2 = v2 - v0;
+    Vec3 n = e1.cross(e2);
+    n.normalize();
+    t1 = e1.normalized();
+    t2 = n.cross(t1);
+    
+    Mat2 Ds;
+    Ds(0, 0) = e1.dot(t1);
+    Ds(1, 0) = e1.dot(t2);
+    Ds(0, 1) = e2.dot(t1);
+    Ds(1, 1) = e2.dot(t2);
+    F = Ds * mesh.Dm_inv[face];
+}
+
+} // namespace
+
+const ElasticFaceCache& Elasticity::face_constants(const Mesh& mesh) {
+    ElasticFaceCache& cache = mesh.elastic_cache;
+    const Material& mat = mesh.material;
+    const int num_faces = static_cast<int>(mesh.num_triangles());
+    
+    if (cache.valid &&
+        cache.youngs_modulus == mat.youngs_modulus &&
+        cache.poisson_ratio == mat.poisson_ratio &&
+        cache.thickness == mat.thickness &&
+        cache.stiffness.size() == static_cast<size_t>(num_faces)) {
+        return cache;
+    }
+    
+    cache.youngs_modulus = mat.youngs_modulus;
+    cache.poisson_ratio = mat.poisson_ratio;
+    cache.thickness = mat.thickness;
+    cache.stiffness.resize(num_faces);
+    cache.hessian_blocks.resize(9 * static_cast<size_t>(num_faces));
+    
+    // The Hessian approximation only depends on k and Dm_inv, so its SPD
+    // projection is done once here instead of on every assembly
+    Real mu = mat.youngs_modulus / (2.0 * (1.0 + mat.poisson_ratio));
+    #pragma omp parallel for schedule(static) if(num_faces >= kParallelMinFaces)
+    for (int f = 0; f < num_faces; ++f) {
+        Real k = mesh.rest_areas[f] * mat.thickness * mu;
+        cache.stiffness[f] = k;
+        
+        Mat3 H[3][3];
+        face_hessian(k, mesh.Dm_inv[f], H);
+        for (int a = 0; a < 3; ++a) {
+            for (int b = 0; b < 3; ++b) {
+                Mat3 H_spd = H[a][b];
+                Stiffness::enforce_spd(H_spd);
+                cache.hessian_blocks[9 * f + 3 * a + b] = H_spd;
+            }
+        }
+    }
+    
+    // Vertex → face corners in ascending face order (gather target of the gradient)
+    const int num_vertices = static_cast<int>(mesh.num_vertices());
+    cache.vertex_offsets.assign(num_vertices + 1, 0);
+    for (const Triangle& tri : mesh.triangles) {
+        for (int c = 0; c < 3; ++c) {
+            cache.vertex_offsets[tri.v[c] + 1]++;
+        }
+    }
+    for (int v = 0; v < num_vertices; ++v) {
+        cache.vertex_offsets[v + 1] += cache.vertex_offsets[v];
+    }
+    cache.vertex_corners.resize(3 * static_cast<size_t>(num_faces));
+    std::vector<int> fill(cache.vertex_offsets.begin(), cache.vertex_offsets.end() - 1);
+    for (int f = 0; f < num_faces; ++f) {
+        const Triangle& tri = mesh.triangles[f];
+        for (int c = 0; c < 3; ++c) {
+            cache.vertex_corners[fill[tri.v[c]]++] = 3 * f + c;
+        }
+    }
+    
+    cache.valid = true;
+    return cache;
+}
+
 Real Elasticity::compute_energy(const Mesh& mesh, const State& state) {
+    const ElasticFaceCache& constants = face_constants(mesh);
+    const int num_faces = static_cast<int>(mesh.num_triangles());
     Real energy = 0.0;
     
-    for (size_t i = 0; i < mesh.num_triangles(); ++i) {
+    #pragma omp parallel for schedule(static) reduction(+:energy) if(num_faces >= kParallelMinFaces)
+    for (int i = 0; i < num_faces; ++i) {
         Mat2 F = mesh.compute_F(i);
-        energy += face_energy(F, mesh.material, mesh.rest_areas[i]);
+        energy += face_energy(F, constants.stiffness[i]);
     }
     
     return energy;
@@ -18,71 +112,72 @@ Real Elasticity::compute_energy(const Mesh& mesh, const State& state) {
 void Elasticity::compute_gradient(const Mesh& mesh, const State& state, VecX& gradient) {
     gradient.setZero();
     
-    for (size_t i = 0; i < mesh.num_triangles(); ++i) {
-        const Triangle& tri = mesh.triangles[i];
-        
-        // Get current F
-        Mat2 F = mesh.compute_F(i);
+    const ElasticFaceCache& constants = face_constants(mesh);
+    const int num_faces = static_cast<int>(mesh.num_triangles());
+    
+    // Per-face forces into corner slots, then a per-vertex gather: no two
+    // threads write the same entry, and each vertex sums its faces in
+    // ascending order as the serial scatter did
+    std::vector<Vec3> corner_forces(3 * static_cast<size_t>(num_faces));
+    #pragma omp parallel for schedule(static) if(num_faces >= kParallelMinFaces)
+    for (int i = 0; i < num_faces; ++i) {
+        Vec3 t1, t2;
+        Mat2 F;
+        face_frame(mesh, i, t1, t2, F);
         
         // Compute PK1 stress: P = k * 2 * (F - I)
-        Real mu = mesh.material.youngs_modulus / (2.0 * (1.0 + mesh.material.poisson_ratio));
-        Real k = mesh.rest_areas[i] * mesh.material.thickness * mu;
+        Real k = constants.stiffness[i];
         Mat2 I = Mat2::Identity();
         Mat2 P = 2.0 * k * (F - I);
         
         // H = P * Dm_inv^T gives force gradient in material coordinates
         Mat2 H = P * mesh.Dm_inv[i].transpose();
         
-        // Get vertices and compute local frame
-        const Vec3& v0 = mesh.vertices[tri.v[0]];
-        const Vec3& v1 = mesh.vertices[tri.v[1]];
-        const Vec3& v2 = mesh.vertices[tri.v[2]];
-        
-        Vec3 e1 = v1 - v0;
-        Vec3 e2 = v2 - v0;
-        Vec3 n = e1.cross(e2);
-        n.normalize();
-        Vec3 t1 = e1.normalized();
-        Vec3 t2 = n.cross(t1);
-        
         // Map 2D forces back to 3D using the local frame
         // These are the forces on v1 and v2 (relative to v0)
         Vec3 f1_3d = H(0, 0) * t1 + H(1, 0) * t2;
         Vec3 f2_3d = H(0, 1) * t1 + H(1, 1) * t2;
-        Vec3 f0_3d = -(f1_3d + f2_3d);
-        
-        // Accumulate to global gradient (gradient = -force for energy minimization)
-        for (int k = 0; k < 3; ++k) {
-            gradient[tri.v[0] * 3 + k] += f0_3d[k];
-            gradient[tri.v[1] * 3 + k] += f1_3d[k];
-            gradient[tri.v[2] * 3 + k] += f2_3d[k];
+        corner_forces[3 * i] = -(f1_3d + f2_3d);
+        corner_forces[3 * i + 1] = f1_3d;
+        corner_forces[3 * i + 2] = f2_3d;
+    }
+    
+    // Accumulate to global gradient (gradient = -force for energy minimization)
+    const int num_vertices = static_cast<int>(mesh.num_vertices());
+    #pragma omp parallel for schedule(static) if(num_vertices >= kParallelMinFaces)
+    for (int v = 0; v < num_vertices; ++v) {
+        Vec3 sum = Vec3::Zero();
+        for (int c = constants.vertex_offsets[v]; c < constants.vertex_offsets[v + 1]; ++c) {
+            sum += corner_forces[constants.vertex_corners[c]];
         }
+        gradient.segment<3>(3 * v) = sum;
     }
 }
 
 void Elasticity::compute_hessian(const Mesh& mesh, const State& state,
                                  std::vector<Triplet>& triplets) {
-    for (size_t i = 0; i < mesh.num_triangles(); ++i) {
+    const ElasticFaceCache& constants = face_constants(mesh);
+    const int num_faces = static_cast<int>(mesh.num_triangles());
+    
+    // 81 triplets per face at a fixed offset (same order as a serial push_back)
+    const size_t base = triplets.size();
+    triplets.resize(base + 81 * static_cast<size_t>(num_faces));
+    
+    #pragma omp parallel for schedule(static) if(num_faces >= kParallelMinFaces)
+    for (int i = 0; i < num_faces; ++i) {
         const Triangle& tri = mesh.triangles[i];
-        Mat2 F = mesh.compute_F(i);
+        Triplet* out = &triplets[base + 81 * static_cast<size_t>(i)];
         
-        Mat3 H[3][3];
-        face_hessian(F, mesh.material, mesh.rest_areas[i], mesh.Dm_inv[i], H);
-        
-        // Add to triplet list
         for (int a = 0; a < 3; ++a) {
             for (int b = 0; b < 3; ++b) {
                 Index ia = tri.v[a];
                 Index ib = tri.v[b];
-                
-                // Enforce SPD using shared utility from Stiffness
-                Mat3 H_spd = H[a][b];
-                Stiffness::enforce_spd(H_spd);
+                const Mat3& H_spd = constants.hessian_blocks[9 * i + 3 * a + b];
                 
                 // Add 3×3 block
                 for (int k = 0; k < 3; ++k) {
                     for (int l = 0; l < 3; ++l) {
-                        triplets.push_back(Triplet(ia * 3 + k, ib * 3 + l, H_spd(k, l)));
+                        *out++ = Triplet(ia * 3 + k, ib * 3 + l, H_spd(k, l));
                     }
                 }
             }
@@ -90,56 +185,31 @@ void Elasticity::compute_hessian(const Mesh& mesh, const State& state,
     }
 }
 
-Real Elasticity::face_energy(const Mat2& F, const Material& mat, Real area) {
+Mat3 Elasticity::vertex_hessian_block(const ElasticFaceCache& constants, Index vertex) {
+    // Corners in ascending face order, as setFromTriplets sums the duplicates
+    Mat3 block = Mat3::Zero();
+    for (int c = constants.vertex_offsets[vertex]; c < constants.vertex_offsets[vertex + 1]; ++c) {
+        const int corner = constants.vertex_corners[c];
+        const int face = corner / 3;
+        const int a = corner % 3;
+        block += constants.hessian_blocks[9 * face + 4 * a];
+    }
+    return block;
+}
+
+Real Elasticity::face_energy(const Mat2& F, Real k) {
     // ARAP-style energy: E = k * ||F - I||_F^2
     // where k = (area * thickness * E) / (2 * (1 + ν))
-    Real mu = mat.youngs_modulus / (2.0 * (1.0 + mat.poisson_ratio));
-    Real k = area * mat.thickness * mu;
-    
     Mat2 I = Mat2::Identity();
     Mat2 diff = F - I;
     
     return k * diff.squaredNorm();
 }
 
-void Elasticity::face_gradient(const Mat2& F, const Material& mat, Real area,
-                               const Mat2& Dm_inv, Vec3 grad[3]) {
-    // ARAP energy: E = k * ||F - I||²
-    // Gradient: ∂E/∂x = 2k * (F - I) : ∂F/∂x
-    
-    Real mu = mat.youngs_modulus / (2.0 * (1.0 + mat.poisson_ratio));
-    Real k = area * mat.thickness * mu;
-    
-    Mat2 I = Mat2::Identity();
-    Mat2 P = 2.0 * k * (F - I);  // First Piola-Kirchhoff stress
-    
-    // H = P * Dm_inv^T gives forces in material coordinates
-    // Map to 3D vertex positions using the local frame
-    Mat2 H = P * Dm_inv.transpose();
-    
-    // For a triangle with vertices v0, v1, v2:
-    // F = Ds * Dm_inv where Ds = [e1_2d | e2_2d]
-    // e1 = v1 - v0, e2 = v2 - v0
-    // The gradient is distributed as:
-    // grad[1] = H.col(0), grad[2] = H.col(1), grad[0] = -(grad[1] + grad[2])
-    
-    // Embed 2D gradients in 3D by extending with zero z-component
-    Vec3 g1 = Vec3(H(0, 0), H(1, 0), 0.0);
-    Vec3 g2 = Vec3(H(0, 1), H(1, 1), 0.0);
-    
-    grad[1] = g1;
-    grad[2] = g2;
-    grad[0] = -(g1 + g2);
-}
-
-void Elasticity::face_hessian(const Mat2& F, const Material& mat, Real area,
-                              const Mat2& Dm_inv, Mat3 H[3][3]) {
+void Elasticity::face_hessian(Real k, const Mat2& Dm_inv, Mat3 H[3][3]) {
     // Constant Hessian approximation for ARAP
     // Full Hessian would include second derivatives of F
     
-    Real mu = mat.youngs_modulus / (2.0 * (1.0 + mat.poisson_ratio));
-    Real k = area * mat.thickness * mu;
-    
     // Constant Hessian: H_ij = k * (Dm_inv^T * Dm_inv)
     Mat2 K = k * (Dm_inv.transpose() * Dm_inv);
     
@@ -25,13 +25,19 @@ public:
     static void compute_hessian(const Mesh& mesh, const State& state, 
                                std::vector<Triplet>& triplets);
     
+    // Per-face constants for the mesh's current material, rebuilt if the
+    // material changed. Call outside parallel regions (fills mesh.elastic_cache).
+    static const ElasticFaceCache& face_constants(const Mesh& mesh);
+    
+    // Diagonal 3×3 block of the elastic Hessian at a vertex, summed from the
+    // cached face blocks (same value as the assembled matrix, no assembly).
+    // Requires face_constants to be current.
+    static Mat3 vertex_hessian_block(const ElasticFaceCache& constants, Index vertex);
+    
 private:
-    // Per-face energy and derivatives (ARAP-style)
-    static Real face_energy(const Mat2& F, const Material& mat, Real area);
-    static void face_gradient(const Mat2& F, const Material& mat, Real area,
-                             const Mat2& Dm_inv, Vec3 grad[3]);
-    static void face_hessian(const Mat2& F, const Material& mat, Real area,
-                            const Mat2& Dm_inv, Mat3 H[3][3]);
+    // Per-face energy and Hessian (ARAP-style), k = area·thickness·μ
+    static Real face_energy(const Mat2& F, Real k);
+    static void face_hessian(Real k, const Mat2& Dm_inv, Mat3 H[3][3]);
 };
 
 } // namespace ando_barrier
@@ -1,9 +1,41 @@
 #include "energy_tracker.h"
 #include "elasticity.h"
 #include "barrier.h"
+#include "stiffness.h"
+#include "strain_limiting.h"
+#include "friction.h"
+#include "integrator.h"
+#include <algorithm>
+#include <cmath>
 
 namespace ando_barrier {
 
+namespace {
+
+// Below these sizes the reductions run serially
+constexpr int kParallelMinVertices = 4096;
+constexpr int kParallelMinContacts = 256;
+
+bool is_point_triangle(const ContactPair& contact) {
+    return contact.type == ContactType::POINT_TRIANGLE ||
+           contact.type == ContactType::RIGID_POINT_TRIANGLE;
+}
+
+// Cloth vertices of a point-triangle contact lie in this state (contacts of
+// the last step may belong to a different mesh)
+bool cloth_indices_valid(const ContactPair& contact, Index num_vertices) {
+    const int count = contact.type == ContactType::RIGID_POINT_TRIANGLE ? 1 : 4;
+    const Index idx[4] = {contact.idx0, contact.idx1, contact.idx2, contact.idx3};
+    for (int k = 0; k < count; ++k) {
+        if (idx[k] < 0 || idx[k] >= num_vertices) {
+            return false;
+        }
+    }
+    return true;
+}
+
+} // namespace
+
 Real EnergyTracker::compute_kinetic_energy(const State& state) {
     Real ke = 0.0;
     for (size_t i = 0; i < state.num_vertices(); ++i) {
@@ -41,35 +73,170 @@ Real EnergyTracker::compute_max_velocity(const State& state) {
     return max_v;
 }
 
+void EnergyTracker::compute_vertex_statistics(const State& state, EnergyDiagnostics& diag) {
+    const int n = static_cast<int>(state.num_vertices());
+    Real ke = 0.0;
+    Real px = 0.0, py = 0.0, pz = 0.0;
+    Real lx = 0.0, ly = 0.0, lz = 0.0;
+    Real max_v_sq = 0.0;
+    // max_v_sq is merged by hand: MSVC's OpenMP 2.0 has no min/max reductions
+    #pragma omp parallel if(n >= kParallelMinVertices)
+    {
+        Real local_max_v_sq = 0.0;
+        #pragma omp for schedule(static) reduction(+:ke,px,py,pz,lx,ly,lz) nowait
+        for (int i = 0; i < n; ++i) {
+            const Vec3& v = state.velocities[i];
+            const Vec3 p = state.masses[i] * v;
+            const Vec3 l = state.positions[i].cross(p);
+            const Real v_squared = v.squaredNorm();
+            ke += 0.5 * state.masses[i] * v_squared;
+            px += p[0]; py += p[1]; pz += p[2];
+            lx += l[0]; ly += l[1]; lz += l[2];
+            local_max_v_sq = std::max(local_max_v_sq, v_squared);
+        }
+        #pragma omp critical(ando_vertex_statistics)
+        max_v_sq = std::max(max_v_sq, local_max_v_sq);
+    }
+    diag.kinetic_energy = ke;
+    diag.linear_momentum = Vec3(px, py, pz);
+    diag.angular_momentum = Vec3(lx, ly, lz);
+    diag.max_velocity = std::sqrt(max_v_sq);
+}
+
+Real EnergyTracker::compute_barrier_energy(
+    const Mesh& mesh,
+    const State& state,
+    const Constraints& constraints,
+    const SimParams& params,
+    const std::vector<ContactPair>& contacts
+) {
+    const Real g_max = params.contact_gap_max;
+    const Index n = static_cast<Index>(state.num_vertices());
+    
+    // Point-triangle contacts with the k̄ the integrator evaluated
+    const int num_contacts = static_cast<int>(contacts.size());
+    Real contact_energy = 0.0;
+    #pragma omp parallel for schedule(static) reduction(+:contact_energy) if(num_contacts >= kParallelMinContacts)
+    for (int c = 0; c < num_contacts; ++c) {
+        const ContactPair& contact = contacts[c];
+        if (!is_point_triangle(contact) || contact.stiffness < 0.0 ||
+            !cloth_indices_valid(contact, n)) {
+            continue;
+        }
+        contact_energy += Barrier::compute_energy(contact.gap, g_max, contact.stiffness);
+    }
+    
+    // Walls and pins: k̄ from the vertex's 3×3 block of M/Δt² + H_elastic, as in the step
+    const Real dt = params.dt;
+    if (dt <= 0.0 || (constraints.num_active_walls() == 0 && constraints.num_active_pins() == 0)) {
+        return contact_energy;
+    }
+    const ElasticFaceCache& face_constants = Elasticity::face_constants(mesh);
+    auto hessian_block = [&](Index vi) {
+        return Elasticity::vertex_hessian_block(face_constants, vi) +
+               Mat3::Identity() * (state.masses[vi] / (dt * dt));
+    };
+    
+    Real wall_energy = 0.0;
+    if (constraints.num_active_walls() > 0) {
+        const int num_vertices = static_cast<int>(n);
+        #pragma omp parallel for schedule(static) reduction(+:wall_energy) if(num_vertices >= kParallelMinVertices)
+        for (int i = 0; i < num_vertices; ++i) {
+            for (const WallConstraint& wall : constraints.walls) {
+                const Real length = wall.normal.norm();
+                if (!wall.active || length < 1e-12) {
+                    continue;
+                }
+                const Vec3 normal = wall.normal / length;
+                const Real gap = normal.dot(state.positions[i]) - wall.offset;
+                if (!Barrier::in_domain(gap, g_max)) {
+                    continue;
+                }
+                const Real k_bar = Stiffness::compute_wall_stiffness(
+                    state.masses[i], params.wall_gap, normal, hessian_block(i), params.min_gap);
+                wall_energy += Barrier::compute_energy(gap, g_max, k_bar);
+            }
+        }
+    }
+    
+    Real pin_energy = 0.0;
+    for (const PinConstraint& pin : constraints.pins) {
+        if (!pin.active || pin.vertex_idx < 0 || pin.vertex_idx >= n) {
+            continue;
+        }
+        const Vec3 offset = state.positions[pin.vertex_idx] - pin.target_position;
+        const Real gap = offset.norm();
+        if (!Barrier::in_domain(gap, g_max) || gap <= params.contact_normal_epsilon) {
+            continue;
+        }
+        const Real k_bar = Stiffness::compute_pin_stiffness(
+            state.masses[pin.vertex_idx], dt, offset, hessian_block(pin.vertex_idx), params.min_gap);
+        pin_energy += Barrier::compute_energy(gap, g_max, k_bar);
+    }
+    
+    return contact_energy + wall_energy + pin_energy;
+}
+
+Real EnergyTracker::compute_friction_energy(
+    const State& state,
+    const SimParams& params,
+    const std::vector<ContactPair>& contacts
+) {
+    if (!params.enable_friction || params.friction_mu <= 0.0) {
+        return 0.0;
+    }
+    
+    const Index n = static_cast<Index>(state.num_vertices());
+    const int num_contacts = static_cast<int>(contacts.size());
+    Real energy = 0.0;
+    #pragma omp parallel for schedule(static) reduction(+:energy) if(num_contacts >= kParallelMinContacts)
+    for (int c = 0; c < num_contacts; ++c) {
+        const ContactPair& contact = contacts[c];
+        if (!is_point_triangle(contact) || contact.stiffness < 0.0 ||
+            !cloth_indices_valid(contact, n)) {
+            continue;
+        }
+        const Vec3& x = state.positions[contact.idx0];
+        const Vec3& x_prev = state.positions_prev[contact.idx0];
+        const Vec3 tangential = FrictionModel::extract_tangential(x - x_prev, contact.normal);
+        if (!FrictionModel::should_apply_friction(tangential, params.friction_tangent_threshold)) {
+            continue;
+        }
+        const Real k_friction = FrictionModel::compute_friction_stiffness(
+            contact.stiffness * std::abs(contact.gap), params.friction_mu,
+            params.friction_epsilon, tangential.norm());
+        energy += FrictionModel::compute_energy(x, x_prev, contact.normal, k_friction);
+    }
+    return energy;
+}
+
 EnergyDiagnostics EnergyTracker::compute(
     const Mesh& mesh,
     const State& state,
     const Constraints& constraints,
-    const SimParams& params
+    const SimParams& params,
+    const std::vector<ContactPair>* contacts
 ) {
     EnergyDiagnostics diag;
+    const std::vector<ContactPair>& pairs = contacts ? *contacts : Integrator::last_step_contacts(constraints);
     
-    // Kinetic energy
-    diag.kinetic_energy = compute_kinetic_energy(state);
+    // Kinetic energy, momentum and velocity stats
+    compute_vertex_statistics(state, diag);
     
     // Elastic energy
     diag.elastic_energy = Elasticity::compute_energy(mesh, state);
     
-    // Barrier energy not currently tracked (typically small compared to elastic/kinetic)
-    diag.barrier_energy = 0.0;
-    
-    // Total energy
-    diag.total_energy = diag.kinetic_energy + diag.elastic_energy + diag.barrier_energy;
-    
-    // Momentum
-    diag.linear_momentum = compute_linear_momentum(state);
-    diag.angular_momentum = compute_angular_momentum(state);
+    // Barrier, strain-limit and friction terms of the active constraints
+    diag.barrier_energy = compute_barrier_energy(mesh, state, constraints, params, pairs);
+    diag.strain_limit_energy = StrainLimiting::compute_energy(mesh, state, constraints, params);
+    diag.friction_energy = compute_friction_energy(state, params, pairs);
     
-    // Velocity stats
-    diag.max_velocity = compute_max_velocity(state);
+    // Total energy (friction dissipates, so it is reported but not conserved)
+    diag.total_energy = diag.kinetic_energy + diag.elastic_energy + diag.barrier_energy +
+                        diag.strain_limit_energy;
     
     // Constraint counts
-    diag.num_contacts = static_cast<int>(constraints.num_active_contacts());
+    diag.num_contacts = static_cast<int>(pairs.size());
     diag.num_pins = static_cast<int>(constraints.num_active_pins());
     
     return diag;
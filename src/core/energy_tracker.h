@@ -4,6 +4,8 @@
 #include "mesh.h"
 #include "state.h"
 #include "constraints.h"
+#include "collision.h"
+#include <vector>
 
 namespace ando_barrier {
 
@@ -11,8 +13,10 @@ namespace ando_barrier {
 struct EnergyDiagnostics {
     Real kinetic_energy = 0.0;           // (1/2) m v²
     Real elastic_energy = 0.0;           // Stretching/bending
-    Real barrier_energy = 0.0;           // Contact barriers
-    Real total_energy = 0.0;             // Sum of all
+    Real barrier_energy = 0.0;           // Contact, wall and pin barriers
+    Real strain_limit_energy = 0.0;      // Strain-limit barriers of the active faces
+    Real friction_energy = 0.0;          // Quadratic friction potential (dissipative, not in total)
+    Real total_energy = 0.0;             // Kinetic + elastic + barrier + strain limit
     
     Vec3 linear_momentum = Vec3::Zero(); // Σ m v
     Vec3 angular_momentum = Vec3::Zero(); // Σ r × (m v)
@@ -34,12 +38,31 @@ class EnergyTracker {
 public:
     EnergyTracker() = default;
     
-    // Compute all energy terms and diagnostics
+    // Compute all energy terms and diagnostics. Contact terms use the given
+    // contacts, or those of the last Integrator::step with these constraints.
     static EnergyDiagnostics compute(
         const Mesh& mesh,
         const State& state,
         const Constraints& constraints,
-        const SimParams& params
+        const SimParams& params,
+        const std::vector<ContactPair>* contacts = nullptr
+    );
+    
+    // Weak barrier energy of point-triangle contacts (with the k̄ they
+    // carry; contacts without one are skipped), active walls and pins
+    static Real compute_barrier_energy(
+        const Mesh& mesh,
+        const State& state,
+        const Constraints& constraints,
+        const SimParams& params,
+        const std::vector<ContactPair>& contacts
+    );
+    
+    // Friction potential V_f = (k_f / 2) ||Δx_t||² of the contacts that carry k̄
+    static Real compute_friction_energy(
+        const State& state,
+        const SimParams& params,
+        const std::vector<ContactPair>& contacts
     );
     
     // Compute kinetic energy: (1/2) Σ m_i ||v_i||²
@@ -53,6 +76,9 @@ public:
     
     // Find maximum velocity magnitude
     static Real compute_max_velocity(const State& state);
+    
+    // Kinetic energy, linear/angular momentum and max velocity in one pass
+    static void compute_vertex_statistics(const State& state, EnergyDiagnostics& diag);
 };
 
 } // namespace ando_barrier
@@ -7,13 +7,20 @@
 #include "line_search.h"
 #include "pcg_solver.h"
 #include "matrix_assembly.h"
+#include "trace.h"
 #include <iostream>
 #include <algorithm>
+#include <chrono>
+#include <cmath>
 
 namespace ando_barrier {
 
 namespace {
 
+// Below these sizes the contact refresh runs serially
+constexpr int kParallelMinVertices = 4096;
+constexpr int kParallelMinContacts = 256;
+
 // Helper struct to hold friction computation results for a single contact
 struct FrictionData {
     Vec3 tangential;
@@ -23,13 +30,12 @@ struct FrictionData {
 };
 
 // Compute friction data for a contact. Returns false if friction should not be applied.
-// This helper extracts the duplicated friction stiffness computation from both
-// compute_gradient and assemble_system_matrix.
+// This helper extracts the duplicated friction stiffness computation from
+// compute_gradient, assemble_system_matrix and lag_friction.
 bool compute_friction_data(
     const ContactPair& contact,
     const State& state,
     Real dt,
-    const SparseMatrix& H_base,
     const SparseMatrix& H_elastic,
     const SimParams& params,
     FrictionData& out
@@ -65,35 +71,67 @@ bool compute_friction_data(
     return true;
 }
 
+// Diagonal 3×3 block of M/Δt² + H_elastic at a vertex from the cached face
+// blocks, so per-vertex stiffness does not scan the assembled matrix
+Mat3 vertex_base_block(const ElasticFaceCache& elastic, const State& state,
+                       Index vi, Real dt) {
+    return Elasticity::vertex_hessian_block(elastic, vi) +
+           Mat3::Identity() * (state.masses[vi] / (dt * dt));
+}
+
 } // namespace
 
 void Integrator::step(Mesh& mesh, State& state, Constraints& constraints,
                      const SimParams& params,
                      std::vector<RigidBody>* rigid_bodies) {
 
+    // SimParams::enable_trace records this step only (declared first so the
+    // step's own event is recorded before recording is switched back off)
+    TraceEnableScope trace_enable(params.enable_trace);
+    ANDO_TRACE_SCOPE("Integrator::step");
+
     const int n = static_cast<int>(state.num_vertices());
     const Real dt = params.dt;
+
+    StepProfile profile;
+    const auto step_start = std::chrono::steady_clock::now();
     
     // Cache initial positions for velocity update (Section 3.6)
     VecX x_old;
-    state.flatten_positions(x_old);
-    
-    // 1. Predict positions: x̂ = x + dt*v (forward Euler prediction)
     VecX x_target;
-    state.flatten_positions(x_target);
-    
-    VecX v_flat = VecX::Zero(3 * n);
-    for (int i = 0; i < n; ++i) {
-        v_flat[3*i]   = state.velocities[i][0];
-        v_flat[3*i+1] = state.velocities[i][1];
-        v_flat[3*i+2] = state.velocities[i][2];
+    {
+        PhaseTimer timer(profile.prediction_ms);
+        state.flatten_positions(x_old);
+        
+        // 1. Predict positions: x̂ = x + dt*v (forward Euler prediction)
+        x_target = x_old;
+        
+        VecX v_flat = VecX::Zero(3 * n);
+        for (int i = 0; i < n; ++i) {
+            v_flat[3*i]   = state.velocities[i][0];
+            v_flat[3*i+1] = state.velocities[i][1];
+            v_flat[3*i+2] = state.velocities[i][2];
+        }
+        
+        x_target += dt * v_flat;
     }
     
-    x_target += dt * v_flat;
-    
     // 2. Detect collisions
-    std::vector<ContactPair> contacts;
-    detect_collisions(mesh, state, contacts, rigid_bodies);
+    StepContacts contacts;
+    if (params.adaptive_contact_detection) {
+        // Pairs within ḡ + 2·margin now cover every pair within ḡ until some
+        // vertex has moved more than margin (refresh_contacts re-detects then)
+        contacts.threshold = params.contact_gap_max + 2.0 * params.contact_redetect_margin;
+        contacts.margin = params.contact_redetect_margin;
+    }
+    {
+        PhaseTimer timer(profile.collision_ms);
+        if (rigid_bodies && !rigid_bodies->empty()) {
+            // Bodies only move in apply_rigid_coupling, after every detection of this step
+            constraints.rigid_scene.refit(*rigid_bodies);
+        }
+        detect_step_contacts(mesh, state, constraints, params, rigid_bodies, contacts, profile);
+    }
     
     // 3. β accumulation loop (Section 3.6)
     Real beta = 0.0;
@@ -102,7 +140,7 @@ void Integrator::step(Mesh& mesh, State& state, Constraints& constraints,
     
     while (beta < params.beta_max && beta_iter < max_beta_iters) {
         Real alpha = inner_newton_step(mesh, state, x_target, contacts,
-                                      constraints, params, beta, rigid_bodies);
+                                      constraints, params, beta, rigid_bodies, profile);
         
         // Update β: β ← β + (1 - β) α
         beta = beta + (1.0 - beta) * alpha;
@@ -114,14 +152,18 @@ void Integrator::step(Mesh& mesh, State& state, Constraints& constraints,
             break;
         }
     }
+    profile.beta_iterations = beta_iter;
+    profile.final_beta = beta;
     
     // 4. Error reduction pass with full β
     if (beta > 1e-6) {
-        inner_newton_step(mesh, state, x_target, contacts, constraints, params, beta, rigid_bodies);
+        inner_newton_step(mesh, state, x_target, contacts, constraints, params, beta,
+                          rigid_bodies, profile);
     }
     
     // 5. Update velocities: v = (x_new - x_old) / (β Δt) (Section 3.6)
     if (beta > 1e-6) {
+        PhaseTimer timer(profile.velocity_update_ms);
         VecX x_new;
         state.flatten_positions(x_new);
         VecX dx = x_new - x_old;
@@ -145,31 +187,84 @@ void Integrator::step(Mesh& mesh, State& state, Constraints& constraints,
     }
 
     if (rigid_bodies && !rigid_bodies->empty()) {
-        apply_rigid_coupling(mesh, state, *rigid_bodies, constraints, params);
+        PhaseTimer timer(profile.coupling_ms);
+        apply_rigid_coupling(mesh, state, *rigid_bodies, contacts.pairs, params);
     }
+
+    profile.total_ms = std::chrono::duration<double, std::milli>(
+        std::chrono::steady_clock::now() - step_start).count();
+    constraints.last_step_profile = profile;
+    constraints.profile_summary.accumulate(profile);
+
+    constraints.last_step_contacts.swap(contacts.pairs);
+}
+
+const StepProfile& Integrator::last_step_profile(const Constraints& constraints) {
+    return constraints.last_step_profile;
+}
+
+const std::vector<ContactPair>& Integrator::last_step_contacts(const Constraints& constraints) {
+    return constraints.last_step_contacts;
+}
+
+const StepProfileSummary& Integrator::profile_summary(const Constraints& constraints) {
+    return constraints.profile_summary;
+}
+
+void Integrator::reset_profile_summary(Constraints& constraints) {
+    constraints.profile_summary.reset();
 }
 
 Real Integrator::inner_newton_step(
     const Mesh& mesh,
     State& state,
     const VecX& x_target,
-    const std::vector<ContactPair>& contacts,
+    StepContacts& contacts,
     Constraints& constraints,
     const SimParams& params,
     Real beta,
-    std::vector<RigidBody>* rigid_bodies) {
+    std::vector<RigidBody>* rigid_bodies,
+    StepProfile& profile) {
+    ANDO_TRACE_SCOPE("Integrator::inner_newton_step");
     
     const int n = static_cast<int>(state.num_vertices());
     
+    // Live friction changes k_f every iteration and needs the higher Newton
+    // floor; lagged friction is a fixed quadratic within this β iteration
+    const bool lagged_friction = params.enable_friction && params.friction_lagged &&
+                                 params.friction_mu > 0.0;
     int max_newton_iters = params.max_newton_steps;
-    if (params.enable_friction) {
+    if (params.enable_friction && !params.friction_lagged) {
         max_newton_iters = std::max(max_newton_iters, params.friction_min_newton_steps);
     }
 
+    std::vector<ContactPair> wall_contacts;
+    LaggedFriction friction;
+
     for (int newton_iter = 0; newton_iter < max_newton_iters; ++newton_iter) {
+        profile.newton_iterations++;
+
+        if (params.adaptive_contact_detection) {
+            refresh_contacts(mesh, state, constraints, params, rigid_bodies, contacts, profile);
+        }
+
+        if (lagged_friction && newton_iter == 0) {
+            PhaseTimer timer(profile.gradient_ms);
+            lag_friction(mesh, state, contacts.pairs, params, friction);
+        }
+
+        // Vertices inside a wall barrier's domain (positions move every iteration)
+        detect_wall_contacts(state, constraints, params, wall_contacts);
+        profile.active_wall_vertices = std::max(profile.active_wall_vertices,
+                                                static_cast<int>(wall_contacts.size()));
+
         // Compute gradient: g = ∇E
         VecX gradient = VecX::Zero(3 * n);
-        compute_gradient(mesh, state, x_target, contacts, constraints, params, beta, gradient, rigid_bodies);
+        {
+            PhaseTimer timer(profile.gradient_ms);
+            compute_gradient(mesh, state, x_target, contacts.pairs, wall_contacts, friction,
+                             constraints, params, beta, gradient, rigid_bodies);
+        }
         
         // Check convergence
         VecX x_current;
@@ -181,15 +276,29 @@ Real Integrator::inner_newton_step(
         
         // Assemble Hessian: H = ∇²E
         SparseMatrix hessian;
-        assemble_system_matrix(mesh, state, contacts, constraints, params, beta, hessian, rigid_bodies);
+        {
+            PhaseTimer timer(profile.assembly_ms);
+            assemble_system_matrix(mesh, state, contacts.pairs, wall_contacts, friction,
+                                   constraints, params, beta, hessian, rigid_bodies);
+        }
         
         // Solve: H d = -g
         VecX direction = VecX::Zero(3 * n);
         VecX neg_gradient = -gradient;
-        bool converged = PCGSolver::solve(hessian, neg_gradient, direction, 
-                                         params.pcg_tol, params.pcg_max_iters);
+        PCGStats pcg_stats;
+        bool converged;
+        {
+            PhaseTimer timer(profile.pcg_ms);
+            converged = PCGSolver::solve(hessian, neg_gradient, direction,
+                                         params.pcg_tol, params.pcg_max_iters, &pcg_stats);
+        }
+        profile.pcg_solves++;
+        profile.pcg_iterations += pcg_stats.iterations;
+        profile.pcg_residual = pcg_stats.residual;
+        profile.pcg_max_residual = std::max(profile.pcg_max_residual, pcg_stats.residual);
         
         if (!converged) {
+            profile.pcg_failures++;
             std::cerr << "PCG did not converge in Newton iteration " << newton_iter << std::endl;
         }
         
@@ -201,25 +310,32 @@ Real Integrator::inner_newton_step(
             }
         }
         
-        // Extract first active wall for line search
-        Vec3 wall_normal(0, 0, 0);
-        Real wall_offset = 0.0;
-        for (const auto& wall : constraints.walls) {
-            if (wall.active) {
-                wall_normal = wall.normal;
-                wall_offset = wall.offset;
-                break;
-            }
-        }
-        
         // Line search with extended direction (Section 3.5)
-        Real alpha = LineSearch::search(
-            mesh, state, direction, contacts,
-            pins_for_search, wall_normal, wall_offset,
-            1.25
-        );
+        LineSearchStats ls_stats;
+        Real alpha;
+        if (params.line_search_toi) {
+            PhaseTimer timer(profile.line_search_ms);
+            alpha = LineSearch::search_toi(
+                mesh, state, direction, contacts.pairs,
+                pins_for_search, constraints.walls,
+                1.25, params.line_search_toi_safety, 1e-6, &ls_stats
+            );
+        } else {
+            PhaseTimer timer(profile.line_search_ms);
+            alpha = LineSearch::search(
+                mesh, state, direction, contacts.pairs,
+                pins_for_search, constraints.walls,
+                1.25, 1e-6, &ls_stats
+            );
+        }
+        profile.line_search_calls++;
+        profile.line_search_backtracks += ls_stats.backtracks;
+        profile.line_search_sweeps += ls_stats.feasibility_checks;
+        profile.line_search_sweeps_saved += ls_stats.sweeps_saved;
+        profile.ccd_calls += ls_stats.ccd_calls;
         
         if (alpha < 1e-8) {
+            profile.line_search_failures++;
             return 0.0;
         }
         
@@ -247,7 +363,9 @@ void Integrator::compute_gradient(
     const Mesh& mesh,
     const State& state,
     const VecX& x_target,
-    const std::vector<ContactPair>& contacts,
+    std::vector<ContactPair>& contacts,
+    const std::vector<ContactPair>& wall_contacts,
+    const LaggedFriction& friction,
     Constraints& constraints,
     const SimParams& params,
     Real beta,
@@ -310,32 +428,13 @@ void Integrator::compute_gradient(
         constraints.clear_strain_limits();
     }
     
-    // 3. Barrier forces: Σ ∇V_barrier
-    // For each contact
-    for (const auto& contact : contacts) {
-        if (contact.type == ContactType::POINT_TRIANGLE ||
-            contact.type == ContactType::RIGID_POINT_TRIANGLE) {
-            // Extract H_block for vertex involved in contact
-            Mat3 H_block = Stiffness::extract_hessian_block(H_total, contact.idx0);
-            Real k_bar = Stiffness::compute_contact_stiffness(
-                contact, state, dt, H_elastic
-            );
-
-            if (contact.type == ContactType::POINT_TRIANGLE) {
-                Barrier::compute_contact_gradient(contact,
-                                                 params.contact_gap_max,
-                                                 k_bar,
-                                                 params.contact_normal_epsilon,
-                                                 gradient);
-            } else {
-                Barrier::compute_rigid_contact_gradient(contact,
-                                                        params.contact_gap_max,
-                                                        k_bar,
-                                                        params.contact_normal_epsilon,
-                                                        gradient);
-            }
-        }
-    }
+    // 3. Barrier forces: Σ ∇V_barrier (cloth and rigid point-triangle contacts, batched)
+    ContactBatch batch;
+    build_contact_batch(contacts, state, dt, H_elastic, batch);
+    Barrier::compute_contact_gradient_batch(batch,
+                                            params.contact_gap_max,
+                                            params.contact_normal_epsilon,
+                                            gradient);
     
     // 4. Pin and wall barrier gradients
     // Pins: gap = ||x_i - pin_target||
@@ -353,28 +452,38 @@ void Integrator::compute_gradient(
                                       gradient);
     }
 
-    // Walls: linear gap function g = n·x - offset
-    for (const auto& wall : constraints.walls) {
-        if (!wall.active) continue;
+    // Walls: linear gap function g = n·x - offset, only for vertices in the barrier domain
+    const ElasticFaceCache& elastic = Elasticity::face_constants(mesh);
+    for (const auto& contact : wall_contacts) {
+        const WallConstraint& wall = constraints.walls[contact.idx1];
+        const Index vi = contact.idx0;
 
-        // For each vertex, compute wall stiffness and gradient contribution
-        for (Index vi = 0; vi < static_cast<Index>(state.num_vertices()); ++vi) {
-            Mat3 H_block = Stiffness::extract_hessian_block(H_total, vi);
-            Real k_bar = Stiffness::compute_wall_stiffness(state.masses[vi], params.wall_gap,
-                                                           wall.normal, H_block, params.min_gap);
+        Mat3 H_block = vertex_base_block(elastic, state, vi, dt);
+        Real k_bar = Stiffness::compute_wall_stiffness(state.masses[vi], params.wall_gap,
+                                                       wall.normal, H_block, params.min_gap);
 
-            Barrier::compute_wall_gradient(vi, wall.normal, wall.offset, state,
-                                           params.contact_gap_max, k_bar,
-                                           params.contact_normal_epsilon,
-                                           gradient);
-        }
+        Barrier::compute_wall_gradient(vi, wall.normal, wall.offset, state,
+                                       params.contact_gap_max, k_bar,
+                                       params.contact_normal_epsilon,
+                                       gradient);
     }
     
     // 5. Friction forces (if enabled)
-    if (params.enable_friction && params.friction_mu > 0.0) {
+    if (params.enable_friction && params.friction_mu > 0.0 && params.friction_lagged) {
+        // Frozen n and k_f; only the tangential displacement follows x
+        for (size_t i = 0; i < friction.vertices.size(); ++i) {
+            const Index vi = friction.vertices[i];
+            gradient.segment<3>(3 * vi) += FrictionModel::compute_gradient(
+                state.positions[vi],
+                state.positions_prev[vi],
+                friction.normals[i],
+                friction.stiffness[i]
+            );
+        }
+    } else if (params.enable_friction && params.friction_mu > 0.0) {
         for (const auto& contact : contacts) {
             FrictionData fric;
-            if (!compute_friction_data(contact, state, dt, H_total, H_elastic, params, fric)) {
+            if (!compute_friction_data(contact, state, dt, H_elastic, params, fric)) {
                 continue;  // Skip stationary contacts
             }
             
@@ -398,7 +507,9 @@ void Integrator::compute_gradient(
 void Integrator::assemble_system_matrix(
     const Mesh& mesh,
     const State& state,
-    const std::vector<ContactPair>& contacts,
+    std::vector<ContactPair>& contacts,
+    const std::vector<ContactPair>& wall_contacts,
+    const LaggedFriction& friction,
     Constraints& constraints,
     const SimParams& params,
     Real beta,
@@ -447,34 +558,14 @@ void Integrator::assemble_system_matrix(
         constraints.clear_strain_limits();
     }
     
-    // 3. Barrier Hessians: Σ H_barrier
-    // For each contact
-    for (const auto& contact : contacts) {
-        if (contact.type == ContactType::POINT_TRIANGLE ||
-            contact.type == ContactType::RIGID_POINT_TRIANGLE) {
-            // Extract H_block for accurate stiffness
-            Mat3 H_block = Stiffness::extract_hessian_block(H_base, contact.idx0);
-            Real k_bar = Stiffness::compute_contact_stiffness(
-                contact, state, dt, H_elastic
-            );
-
-            if (contact.type == ContactType::POINT_TRIANGLE) {
-                Barrier::compute_contact_hessian(contact,
-                                                 params.contact_gap_max,
-                                                 k_bar,
-                                                 params.contact_normal_epsilon,
-                                                 params.barrier_tolerance,
-                                                 triplets);
-            } else {
-                Barrier::compute_rigid_contact_hessian(contact,
-                                                       params.contact_gap_max,
-                                                       k_bar,
-                                                       params.contact_normal_epsilon,
-                                                       params.barrier_tolerance,
-                                                       triplets);
-            }
-        }
-    }
+    // 3. Barrier Hessians: Σ H_barrier (batched)
+    ContactBatch batch;
+    build_contact_batch(contacts, state, dt, H_elastic, batch);
+    Barrier::compute_contact_hessian_batch(batch,
+                                           params.contact_gap_max,
+                                           params.contact_normal_epsilon,
+                                           params.barrier_tolerance,
+                                           triplets);
 
     // 4. Pin and wall Hessians
     // Pins
@@ -494,28 +585,42 @@ void Integrator::assemble_system_matrix(
                                      triplets);
     }
 
-    // Walls
-    for (const auto& wall : constraints.walls) {
-        if (!wall.active) continue;
+    // Walls (active set only)
+    const ElasticFaceCache& elastic = Elasticity::face_constants(mesh);
+    for (const auto& contact : wall_contacts) {
+        const WallConstraint& wall = constraints.walls[contact.idx1];
+        const Index vi = contact.idx0;
 
-        for (Index vi = 0; vi < static_cast<Index>(state.num_vertices()); ++vi) {
-            Mat3 H_block = Stiffness::extract_hessian_block(H_base, vi);
-            Real k_bar = Stiffness::compute_wall_stiffness(state.masses[vi], params.wall_gap,
-                                                           wall.normal, H_block, params.min_gap);
+        Mat3 H_block = vertex_base_block(elastic, state, vi, dt);
+        Real k_bar = Stiffness::compute_wall_stiffness(state.masses[vi], params.wall_gap,
+                                                       wall.normal, H_block, params.min_gap);
 
-            Barrier::compute_wall_hessian(vi, wall.normal, wall.offset, state,
-                                          params.contact_gap_max, k_bar,
-                                          params.contact_normal_epsilon,
-                                          params.barrier_tolerance,
-                                          triplets);
-        }
+        Barrier::compute_wall_hessian(vi, wall.normal, wall.offset, state,
+                                      params.contact_gap_max, k_bar,
+                                      params.contact_normal_epsilon,
+                                      params.barrier_tolerance,
+                                      triplets);
     }
 
     // 5. Friction Hessians (if enabled)
-    if (params.enable_friction && params.friction_mu > 0.0) {
+    if (params.enable_friction && params.friction_mu > 0.0 && params.friction_lagged) {
+        for (size_t i = 0; i < friction.vertices.size(); ++i) {
+            Mat3 friction_hess = FrictionModel::compute_hessian(friction.normals[i],
+                                                                friction.stiffness[i]);
+            const int idx = static_cast<int>(friction.vertices[i]);
+            for (int r = 0; r < 3; ++r) {
+                for (int c = 0; c < 3; ++c) {
+                    Real val = friction_hess(r, c);
+                    if (std::abs(val) > 1e-12) {
+                        triplets.push_back(Triplet(3*idx + r, 3*idx + c, val));
+                    }
+                }
+            }
+        }
+    } else if (params.enable_friction && params.friction_mu > 0.0) {
         for (const auto& contact : contacts) {
             FrictionData fric;
-            if (!compute_friction_data(contact, state, dt, H_base, H_elastic, params, fric)) {
+            if (!compute_friction_data(contact, state, dt, H_elastic, params, fric)) {
                 continue;  // Skip stationary contacts
             }
             
@@ -545,12 +650,215 @@ void Integrator::assemble_system_matrix(
 
 void Integrator::detect_collisions(const Mesh& mesh, const State& state,
                                   std::vector<ContactPair>& contacts,
-                                  const std::vector<RigidBody>* rigid_bodies) {
+                                  const std::vector<RigidBody>* rigid_bodies,
+                                  Real threshold,
+                                  Real margin,
+                                  const RigidSceneBVH* scene) {
     contacts.clear();
     if (rigid_bodies) {
-        Collision::detect_all_collisions(mesh, state, *rigid_bodies, contacts);
+        Collision::detect_all_collisions(mesh, state, *rigid_bodies, contacts, threshold, margin,
+                                         scene);
     } else {
-        Collision::detect_all_collisions(mesh, state, contacts);
+        Collision::detect_all_collisions(mesh, state, contacts, threshold, margin);
+    }
+}
+
+void Integrator::detect_step_contacts(const Mesh& mesh,
+                                      const State& state,
+                                      Constraints& constraints,
+                                      const SimParams& params,
+                                      const std::vector<RigidBody>* rigid_bodies,
+                                      StepContacts& contacts,
+                                      StepProfile& profile) {
+    if (params.enable_contact_cache) {
+        ContactCacheStats cache_stats;
+        const std::vector<RigidBody>* colliders =
+            rigid_bodies && !rigid_bodies->empty() ? rigid_bodies : nullptr;
+        constraints.contact_cache.update(mesh, state, colliders, contacts.threshold,
+                                         params.contact_cache_margin, contacts.margin,
+                                         contacts.pairs, &cache_stats, &constraints.rigid_scene);
+        fill_contact_stiffness(mesh, state, params.dt, contacts.pairs);
+        constraints.contact_cache.store(contacts.pairs);
+        profile.contact_cache_hits += cache_stats.hits;
+        profile.contact_cache_misses += cache_stats.misses;
+        profile.contact_cache_rebuilds += cache_stats.full_detections;
+    } else {
+        detect_collisions(mesh, state, contacts.pairs, rigid_bodies,
+                          contacts.threshold, contacts.margin, &constraints.rigid_scene);
+    }
+
+    if (params.adaptive_contact_detection) {
+        state.flatten_positions(contacts.detected_at);
+    }
+    profile.num_contacts = std::max(profile.num_contacts, static_cast<int>(contacts.pairs.size()));
+}
+
+void Integrator::refresh_contacts(const Mesh& mesh,
+                                  const State& state,
+                                  Constraints& constraints,
+                                  const SimParams& params,
+                                  const std::vector<RigidBody>* rigid_bodies,
+                                  StepContacts& contacts,
+                                  StepProfile& profile) {
+    PhaseTimer timer(profile.collision_ms);
+
+    const int n = static_cast<int>(state.num_vertices());
+    const VecX& x_detected = contacts.detected_at;
+    Real max_sq = 0.0;
+    // Per-thread maxima merged by hand: MSVC's OpenMP 2.0 has no min/max reductions
+    #pragma omp parallel if(n >= kParallelMinVertices)
+    {
+        Real local_max_sq = 0.0;
+        #pragma omp for schedule(static) nowait
+        for (int i = 0; i < n; ++i) {
+            const Vec3 detected(x_detected[3*i], x_detected[3*i+1], x_detected[3*i+2]);
+            local_max_sq = std::max(local_max_sq, (state.positions[i] - detected).squaredNorm());
+        }
+        #pragma omp critical(ando_contact_motion_max)
+        max_sq = std::max(max_sq, local_max_sq);
+    }
+    if (max_sq == 0.0) {
+        return;  // Nothing moved since detection
+    }
+
+    if (std::sqrt(max_sq) > params.contact_redetect_margin) {
+        ANDO_TRACE_SCOPE("Integrator::redetect_contacts");
+        profile.contact_redetections++;
+        detect_step_contacts(mesh, state, constraints, params, rigid_bodies, contacts, profile);
+        return;
+    }
+
+    // Still within the margin: same pairs, current gaps/normals/weights
+    std::vector<ContactPair>& pairs = contacts.pairs;
+    // Refresh the bodies' cached world vertices here, before the parallel loop reads them
+    std::vector<const std::vector<Vec3>*> rigid_vertices;
+    if (rigid_bodies) {
+        const bool has_rigid = std::any_of(pairs.begin(), pairs.end(), [](const ContactPair& c) {
+            return c.rigid_body_index >= 0;
+        });
+        if (has_rigid) {
+            rigid_vertices.reserve(rigid_bodies->size());
+            for (const auto& body : *rigid_bodies) {
+                rigid_vertices.push_back(&body.world_vertices());
+            }
+        }
+    }
+
+    const int num_pairs = static_cast<int>(pairs.size());
+    std::vector<char> keep(num_pairs);
+    #pragma omp parallel for schedule(static) if(num_pairs >= kParallelMinContacts)
+    for (int c = 0; c < num_pairs; ++c) {
+        ContactPair& pair = pairs[c];
+        const std::vector<Vec3>* body_vertices =
+            pair.rigid_body_index >= 0 ? rigid_vertices[pair.rigid_body_index] : nullptr;
+        keep[c] = Collision::update_contact(state, body_vertices, pair);
+    }
+
+    int kept = 0;
+    for (int c = 0; c < num_pairs; ++c) {
+        if (keep[c]) {
+            pairs[kept++] = pairs[c];
+        }
+    }
+    pairs.resize(kept);
+}
+
+void Integrator::build_contact_batch(std::vector<ContactPair>& contacts,
+                                     const State& state,
+                                     Real dt,
+                                     const SparseMatrix& H_elastic,
+                                     ContactBatch& batch) {
+    batch.clear();
+    batch.reserve(contacts.size());
+    for (auto& contact : contacts) {
+        if (contact.type != ContactType::POINT_TRIANGLE &&
+            contact.type != ContactType::RIGID_POINT_TRIANGLE) {
+            continue;
+        }
+        if (contact.stiffness < 0.0) {
+            contact.stiffness = Stiffness::compute_contact_stiffness(contact, state, dt, H_elastic);
+        }
+        batch.add(contact, contact.stiffness);
+    }
+}
+
+void Integrator::fill_contact_stiffness(const Mesh& mesh,
+                                        const State& state,
+                                        Real dt,
+                                        std::vector<ContactPair>& contacts) {
+    auto needs_stiffness = [](const ContactPair& contact) {
+        return contact.stiffness < 0.0 &&
+               (contact.type == ContactType::POINT_TRIANGLE ||
+                contact.type == ContactType::RIGID_POINT_TRIANGLE);
+    };
+    if (std::none_of(contacts.begin(), contacts.end(), needs_stiffness)) {
+        return;  // Every contact carried its k̄ over
+    }
+
+    const int n = static_cast<int>(state.num_vertices());
+    std::vector<Triplet> elastic_triplets;
+    Elasticity::compute_hessian(mesh, state, elastic_triplets);
+    SparseMatrix H_elastic;
+    H_elastic.resize(3 * n, 3 * n);
+    H_elastic.setFromTriplets(elastic_triplets.begin(), elastic_triplets.end());
+
+    for (auto& contact : contacts) {
+        if (needs_stiffness(contact)) {
+            contact.stiffness = Stiffness::compute_contact_stiffness(contact, state, dt, H_elastic);
+        }
+    }
+}
+
+void Integrator::lag_friction(const Mesh& mesh,
+                              const State& state,
+                              const std::vector<ContactPair>& contacts,
+                              const SimParams& params,
+                              LaggedFriction& friction) {
+    friction.clear();
+    if (contacts.empty()) {
+        return;
+    }
+
+    const int n = static_cast<int>(state.num_vertices());
+    std::vector<Triplet> elastic_triplets;
+    Elasticity::compute_hessian(mesh, state, elastic_triplets);
+    SparseMatrix H_elastic;
+    H_elastic.resize(3 * n, 3 * n);
+    H_elastic.setFromTriplets(elastic_triplets.begin(), elastic_triplets.end());
+
+    const int num_contacts = static_cast<int>(contacts.size());
+    std::vector<FrictionData> data(num_contacts);
+    #pragma omp parallel for schedule(static) if(num_contacts >= kParallelMinContacts)
+    for (int c = 0; c < num_contacts; ++c) {
+        compute_friction_data(contacts[c], state, params.dt, H_elastic, params, data[c]);
+    }
+
+    for (int c = 0; c < num_contacts; ++c) {
+        if (!data[c].should_apply) {
+            continue;  // No tangential motion when the β iteration started
+        }
+        friction.vertices.push_back(contacts[c].idx0);
+        friction.normals.push_back(contacts[c].normal);
+        friction.stiffness.push_back(data[c].k_friction);
+    }
+}
+
+void Integrator::detect_wall_contacts(const State& state,
+                                      const Constraints& constraints,
+                                      const SimParams& params,
+                                      std::vector<ContactPair>& wall_contacts) {
+    wall_contacts.clear();
+    for (size_t w = 0; w < constraints.walls.size(); ++w) {
+        const WallConstraint& wall = constraints.walls[w];
+        if (!wall.active) continue;
+
+        // The wall barrier vanishes beyond ḡ, so farther vertices contribute nothing
+        const size_t first = wall_contacts.size();
+        Collision::detect_wall_collisions(state, wall.normal, wall.offset, wall_contacts,
+                                          params.contact_gap_max);
+        for (size_t c = first; c < wall_contacts.size(); ++c) {
+            wall_contacts[c].idx1 = static_cast<Index>(w);
+        }
     }
 }
 
@@ -591,7 +899,8 @@ void Integrator::apply_contact_restitution(const Mesh& mesh,
 
     std::vector<ContactPair> contacts;
     if (rigid_bodies) {
-        Collision::detect_all_collisions(mesh, state, *rigid_bodies, contacts);
+        Collision::detect_all_collisions(mesh, state, *rigid_bodies, contacts,
+                                         kContactDetectionThreshold, 0.0, &constraints.rigid_scene);
     } else {
         Collision::detect_all_collisions(mesh, state, contacts);
     }
@@ -676,61 +985,47 @@ void Integrator::apply_contact_restitution(const Mesh& mesh,
 void Integrator::apply_rigid_coupling(const Mesh& mesh,
                                      const State& state,
                                      std::vector<RigidBody>& rigid_bodies,
-                                     const Constraints& constraints,
+                                     const std::vector<ContactPair>& step_contacts,
                                      const SimParams& params) {
     if (rigid_bodies.empty()) {
         return;
     }
 
-    (void)constraints;
-
-    std::vector<ContactPair> contacts;
-    Collision::detect_all_collisions(mesh, state, rigid_bodies, contacts);
-
-    const int n = static_cast<int>(state.num_vertices());
     const Real dt = params.dt;
+    const int num_bodies = static_cast<int>(rigid_bodies.size());
 
-    // Assemble base Hessians for stiffness extraction (mass + elasticity)
-    SparseMatrix H_total;
-    H_total.resize(3 * n, 3 * n);
-    std::vector<Triplet> base_triplets;
-    base_triplets.reserve(9 * n + 9 * mesh.triangles.size() * 9);
-
-    Real dt2_inv = 1.0 / (dt * dt);
-    for (int i = 0; i < n; ++i) {
-        Real mass_factor = state.masses[i] * dt2_inv;
-        for (int j = 0; j < 3; ++j) {
-            base_triplets.emplace_back(3 * i + j, 3 * i + j, mass_factor);
+    // The step's rigid pairs, moved to the final positions below
+    std::vector<ContactPair> contacts;
+    for (const ContactPair& pair : step_contacts) {
+        if (pair.type == ContactType::RIGID_POINT_TRIANGLE &&
+            pair.rigid_body_index >= 0 && pair.rigid_body_index < num_bodies) {
+            contacts.push_back(pair);
         }
     }
+    // Refresh the bodies' cached world vertices before the parallel loop reads them
+    std::vector<const std::vector<Vec3>*> rigid_vertices;
+    rigid_vertices.reserve(rigid_bodies.size());
+    for (const auto& body : rigid_bodies) {
+        rigid_vertices.push_back(&body.world_vertices());
+    }
 
-    std::vector<Triplet> elastic_triplets;
-    Elasticity::compute_hessian(mesh, state, elastic_triplets);
-    base_triplets.insert(base_triplets.end(), elastic_triplets.begin(), elastic_triplets.end());
-    H_total.setFromTriplets(base_triplets.begin(), base_triplets.end());
-
-    SparseMatrix H_elastic;
-    H_elastic.resize(3 * n, 3 * n);
-    H_elastic.setFromTriplets(elastic_triplets.begin(), elastic_triplets.end());
+    // Contacts that never got a k̄ fall back to the vertex's diagonal elastic
+    // block (rigid contacts touch one cloth vertex with weight 1)
+    const ElasticFaceCache& elastic = Elasticity::face_constants(mesh);
 
-    for (auto& body : rigid_bodies) {
-        body.clear_accumulators();
-    }
+    // Per-contact force and torque, then one reduction per body in contact order
+    const int num_contacts = static_cast<int>(contacts.size());
+    std::vector<Vec3> forces(num_contacts);
+    std::vector<Vec3> torques(num_contacts);
+    std::vector<char> applies(num_contacts, 0);
 
-    for (const auto& contact : contacts) {
-        if (contact.type != ContactType::RIGID_POINT_TRIANGLE) {
-            continue;
-        }
-        if (contact.rigid_body_index < 0 ||
-            contact.rigid_body_index >= static_cast<int>(rigid_bodies.size())) {
+    #pragma omp parallel for schedule(static) if(num_contacts >= kParallelMinContacts)
+    for (int c = 0; c < num_contacts; ++c) {
+        ContactPair& contact = contacts[c];
+        if (!Collision::update_contact(state, rigid_vertices[contact.rigid_body_index], contact)) {
             continue;
         }
 
-        Mat3 H_block = Stiffness::extract_hessian_block(H_total, contact.idx0);
-        Real k_bar = Stiffness::compute_contact_stiffness(
-            contact, state, dt, H_elastic
-        );
-
         Vec3 normal = contact.normal;
         Real norm = normal.norm();
         if (norm < Real(1e-8)) {
@@ -738,17 +1033,39 @@ void Integrator::apply_rigid_coupling(const Mesh& mesh,
         }
         normal /= norm;
 
+        // k̄ = m/Δt² + nᵀ H_vv n (Stiffness::compute_contact_stiffness for one vertex)
+        Real k_bar = contact.stiffness;
+        if (k_bar < 0.0) {
+            const Index vi = contact.idx0;
+            const Mat3 H_block = Elasticity::vertex_hessian_block(elastic, vi);
+            const Real elastic_term = std::max(normal.dot(H_block * normal), Real(0.0));
+            k_bar = state.masses[vi] / (dt * dt) + elastic_term;
+        }
+
         Real dV_dg = Barrier::compute_gradient(contact.gap, params.contact_gap_max, k_bar);
         if (std::abs(dV_dg) < Real(1e-12)) {
             continue;
         }
 
-        Vec3 force = dV_dg * normal;
-        RigidBody& body = rigid_bodies[contact.rigid_body_index];
-        body.apply_force(contact.witness_q, -force, Real(0.0));
+        const RigidBody& body = rigid_bodies[contact.rigid_body_index];
+        forces[c] = -dV_dg * normal;
+        torques[c] = (contact.witness_q - body.position()).cross(forces[c]);
+        applies[c] = 1;
     }
 
-    for (auto& body : rigid_bodies) {
+    std::vector<Vec3> body_forces(num_bodies, Vec3::Zero());
+    std::vector<Vec3> body_torques(num_bodies, Vec3::Zero());
+    for (int c = 0; c < num_contacts; ++c) {
+        if (applies[c]) {
+            body_forces[contacts[c].rigid_body_index] += forces[c];
+            body_torques[contacts[c].rigid_body_index] += torques[c];
+        }
+    }
+
+    for (int b = 0; b < num_bodies; ++b) {
+        RigidBody& body = rigid_bodies[b];
+        body.clear_accumulators();
+        body.accumulate_wrench(body_forces[b], body_torques[b]);
         body.integrate(params.dt);
     }
 }
@@ -6,6 +6,8 @@
 #include "constraints.h"
 #include "collision.h"
 #include "rigid_body.h"
+#include "step_profile.h"
+#include "barrier.h"
 #include <vector>
 
 namespace ando_barrier {
@@ -45,28 +47,80 @@ public:
                                                      const State& state,
                                                      const std::vector<RigidBody>* rigid_bodies = nullptr);
 
+    /**
+     * Phase timings and solver counters recorded by the most recent step()
+     * with these constraints
+     */
+    static const StepProfile& last_step_profile(const Constraints& constraints);
+
+    /**
+     * Contact pairs used by the most recent step() with these constraints,
+     * with the gaps and normals of their last detection or in-step refresh.
+     * Point-triangle pairs carry the k̄ the step evaluated them with.
+     */
+    static const std::vector<ContactPair>& last_step_contacts(const Constraints& constraints);
+
+    /**
+     * Totals and per-field peaks over all steps with these constraints
+     * since the last reset
+     */
+    static const StepProfileSummary& profile_summary(const Constraints& constraints);
+    static void reset_profile_summary(Constraints& constraints);
+
 private:
+    /**
+     * Contacts used by one step. In adaptive mode
+     * (SimParams::adaptive_contact_detection) they are detected with the
+     * tight threshold ḡ + 2·margin and refreshed inside the β loop.
+     */
+    struct StepContacts {
+        std::vector<ContactPair> pairs;
+        VecX detected_at;                 // Flattened positions at the last detection
+        Real threshold = kContactDetectionThreshold;
+        Real margin = 0.0;                // Broad-phase margin of the last detection
+    };
+
+    /**
+     * Lagged friction (SimParams::friction_lagged): per contact, the
+     * tangent projection (normal), the normal force estimate and k_f are
+     * frozen at the start of a β iteration, so its Newton solve sees a
+     * fixed quadratic friction term
+     */
+    struct LaggedFriction {
+        std::vector<Index> vertices;
+        std::vector<Vec3> normals;
+        std::vector<Real> stiffness;   // k_f
+
+        void clear() {
+            vertices.clear();
+            normals.clear();
+            stiffness.clear();
+        }
+    };
+
     /**
      * Inner Newton step: solve for search direction and take line search step
      * 
      * @param mesh Mesh topology
      * @param state Current state
      * @param x_target Target positions (x + βΔt v + βΔt² M⁻¹ f_ext)
-     * @param contacts Current contact constraints
+     * @param contacts Current contact constraints (refreshed in adaptive mode)
      * @param constraints Pin/wall constraints
      * @param params Simulation parameters
      * @param beta Current β value
+     * @param profile Step profile receiving phase timings and counters
      * @return Step length α taken (for β accumulation)
      */
     static Real inner_newton_step(
         const Mesh& mesh,
         State& state,
         const VecX& x_target,
-        const std::vector<ContactPair>& contacts,
+        StepContacts& contacts,
         Constraints& constraints,
         const SimParams& params,
         Real beta,
-        std::vector<RigidBody>* rigid_bodies
+        std::vector<RigidBody>* rigid_bodies,
+        StepProfile& profile
     );
     
     /**
@@ -79,6 +133,8 @@ private:
      * @param state Current state
      * @param x_target Target positions x̂
      * @param contacts Contact constraints
+     * @param wall_contacts Vertex-wall pairs inside the wall barrier domain
+     * @param friction Frozen friction terms (lagged mode only)
      * @param constraints Pin/wall constraints  
      * @param params Simulation parameters
      * @param beta Current β value (for barrier stiffness)
@@ -88,7 +144,9 @@ private:
         const Mesh& mesh,
         const State& state,
         const VecX& x_target,
-        const std::vector<ContactPair>& contacts,
+        std::vector<ContactPair>& contacts,
+        const std::vector<ContactPair>& wall_contacts,
+        const LaggedFriction& friction,
         Constraints& constraints,
         const SimParams& params,
         Real beta,
@@ -104,6 +162,8 @@ private:
      * @param mesh Mesh topology
      * @param state Current state
      * @param contacts Contact constraints
+     * @param wall_contacts Vertex-wall pairs inside the wall barrier domain
+     * @param friction Frozen friction terms (lagged mode only)
      * @param constraints Pin/wall constraints
      * @param params Simulation parameters
      * @param beta Current β value
@@ -112,7 +172,9 @@ private:
     static void assemble_system_matrix(
         const Mesh& mesh,
         const State& state,
-        const std::vector<ContactPair>& contacts,
+        std::vector<ContactPair>& contacts,
+        const std::vector<ContactPair>& wall_contacts,
+        const LaggedFriction& friction,
         Constraints& constraints,
         const SimParams& params,
         Real beta,
@@ -126,10 +188,82 @@ private:
      * @param mesh Mesh topology
      * @param state Current state
      * @param contacts Output contact pairs
+     * @param threshold Contact gap threshold
+     * @param margin Broad-phase margin (see Collision::detect_all_collisions)
+     * @param scene Optional rigid scene broad phase refit for rigid_bodies
      */
     static void detect_collisions(const Mesh& mesh, const State& state,
                                   std::vector<ContactPair>& contacts,
-                                  const std::vector<RigidBody>* rigid_bodies);
+                                  const std::vector<RigidBody>* rigid_bodies,
+                                  Real threshold = kContactDetectionThreshold,
+                                  Real margin = 0.0,
+                                  const RigidSceneBVH* scene = nullptr);
+
+    /**
+     * Detect the step's contacts (through the contact cache if enabled)
+     * and remember the positions they were detected at
+     */
+    static void detect_step_contacts(const Mesh& mesh,
+                                     const State& state,
+                                     Constraints& constraints,
+                                     const SimParams& params,
+                                     const std::vector<RigidBody>* rigid_bodies,
+                                     StepContacts& contacts,
+                                     StepProfile& profile);
+
+    /**
+     * Adaptive mode: re-detect once any vertex has moved more than
+     * contact_redetect_margin since the last detection; otherwise the
+     * contact set is still complete and only gaps, normals and weights
+     * are updated in place
+     */
+    static void refresh_contacts(const Mesh& mesh,
+                                 const State& state,
+                                 Constraints& constraints,
+                                 const SimParams& params,
+                                 const std::vector<RigidBody>* rigid_bodies,
+                                 StepContacts& contacts,
+                                 StepProfile& profile);
+
+    /**
+     * Gather point-triangle contacts (cloth and rigid) with their stiffness
+     * k̄ into SoA form for the batched barrier kernels. Contacts without a
+     * k̄ get one here and keep it until they are re-detected.
+     */
+    static void build_contact_batch(std::vector<ContactPair>& contacts,
+                                    const State& state,
+                                    Real dt,
+                                    const SparseMatrix& H_elastic,
+                                    ContactBatch& batch);
+
+    /**
+     * Contact-cache mode: compute k̄ once (start of step) for contacts that
+     * did not carry one over, so it stays fixed while the contact persists
+     */
+    static void fill_contact_stiffness(const Mesh& mesh,
+                                       const State& state,
+                                       Real dt,
+                                       std::vector<ContactPair>& contacts);
+
+    /**
+     * Active wall set: one WALL pair per vertex within ḡ of an active wall
+     * (idx1 = index into constraints.walls). Wall gradient and Hessian terms
+     * are only evaluated for these vertices.
+     */
+    static void detect_wall_contacts(const State& state,
+                                     const Constraints& constraints,
+                                     const SimParams& params,
+                                     std::vector<ContactPair>& wall_contacts);
+
+    /**
+     * Lagged friction: evaluate n, |F_n| = k̄·|g| and k_f for every contact
+     * with tangential motion, once, from the current state
+     */
+    static void lag_friction(const Mesh& mesh,
+                             const State& state,
+                             const std::vector<ContactPair>& contacts,
+                             const SimParams& params,
+                             LaggedFriction& friction);
 
     static void apply_velocity_damping(State& state, Real damping_factor);
     static void apply_contact_restitution(const Mesh& mesh,
@@ -138,10 +272,15 @@ private:
                                           const SimParams& params,
                                           std::vector<RigidBody>* rigid_bodies);
 
+    /**
+     * Reaction of the step's rigid contacts on their bodies: the pairs are
+     * moved to the final positions (Collision::update_contact) and push the
+     * bodies with the k̄ the step evaluated them with, then bodies integrate
+     */
     static void apply_rigid_coupling(const Mesh& mesh,
                                      const State& state,
                                      std::vector<RigidBody>& rigid_bodies,
-                                     const Constraints& constraints,
+                                     const std::vector<ContactPair>& step_contacts,
                                      const SimParams& params);
 };
 
@@ -1,24 +1,110 @@
 #include "line_search.h"
+#include "trace.h"
 #include <algorithm>
+#include <atomic>
 #include <cmath>
 #include <iostream>
 
 namespace ando_barrier {
 
+namespace {
+
+// Additive CCD tuning
+constexpr Real kAccdGapRatio = 0.1;      // Stop once distance < 10% of the initial distance
+constexpr Real kAccdStepFraction = 0.9;  // Advance by 90% of the guaranteed-safe interval
+constexpr Real kAccdMinDistance = 1e-9;  // Treat as already touching
+constexpr int kAccdMaxIterations = 64;
+
+// Below these sizes the OpenMP fork/join costs more than the sweep itself
+constexpr int kParallelMinContacts = 256;
+constexpr int kParallelMinVertices = 4096;
+
+/**
+ * Conservative advancement along t ∈ [0, 1]
+ * 
+ * The distance can shrink by at most max_speed per unit t, so advancing by
+ * fraction · d / max_speed can never skip past contact. Returns the first
+ * sampled t whose distance fell below kAccdGapRatio of the initial distance
+ * (distance there is still positive), or 1.0 if the whole interval is clear.
+ */
+template <typename DistanceFn>
+Real additive_ccd(Real max_speed, DistanceFn distance_at) {
+    if (max_speed <= Real(1e-12)) {
+        return 1.0;  // Rigid common translation: distance cannot change
+    }
+    
+    const Real d0 = distance_at(0.0);
+    if (d0 <= kAccdMinDistance) {
+        return 0.0;
+    }
+    
+    const Real target = kAccdGapRatio * d0;
+    Real t = 0.0;
+    Real step = (Real(1.0) - kAccdGapRatio) * d0 / max_speed;
+    
+    for (int iter = 0; iter < kAccdMaxIterations; ++iter) {
+        if (t + step >= 1.0) {
+            return 1.0;  // Remaining interval is shorter than the safe step
+        }
+        t += step;
+        const Real d = distance_at(t);
+        if (d < target) {
+            return t;
+        }
+        step = kAccdStepFraction * d / max_speed;
+    }
+    
+    return t;  // Slow convergence (grazing motion): report the safe time reached
+}
+
+} // namespace
+
+void WallSet::build(const std::vector<WallConstraint>& walls,
+                    const VecX& x,
+                    const VecX& extended_direction,
+                    Real gap_min) {
+    planes.clear();
+    const int n = static_cast<int>(x.size() / 3);
+    
+    for (const auto& wall : walls) {
+        if (!wall.active) continue;
+        Plane plane;
+        plane.normal = wall.normal;
+        plane.offset = wall.offset;
+        
+        for (int i = 0; i < n; ++i) {
+            const Vec3 pos(x[3*i], x[3*i+1], x[3*i+2]);
+            const Vec3 step(extended_direction[3*i], extended_direction[3*i+1],
+                            extended_direction[3*i+2]);
+            // Closest approach over α ∈ [0, 1] is at α = 0 or α = 1
+            const Real reach = std::min(Real(0.0), wall.normal.dot(step));
+            if (wall.normal.dot(pos) - wall.offset + reach < gap_min) {
+                plane.candidates.push_back(i);
+            }
+        }
+        planes.push_back(std::move(plane));
+    }
+}
+
+int WallSet::num_candidates() const {
+    int total = 0;
+    for (const auto& plane : planes) {
+        total += static_cast<int>(plane.candidates.size());
+    }
+    return total;
+}
+
 Real LineSearch::search(const Mesh& mesh,
                        const State& state,
                        const VecX& direction,
                        const std::vector<ContactPair>& contacts,
                        const std::vector<Pin>& pins,
-                       const Vec3& wall_normal,
-                       Real wall_offset,
+                       const std::vector<WallConstraint>& walls,
                        Real extension,
-                       Real min_alpha) {
-    
-    // Start with full extended step
-    Real alpha = 1.0;
-    const Real reduction_factor = 0.5;  // Geometric backtracking
-    const int max_iterations = 20;
+                       Real min_alpha,
+                       LineSearchStats* stats) {
+    ANDO_TRACE_SCOPE("LineSearch::search");
+    (void)mesh;
     
     // Compute extended direction: d_ext = extension * d
     VecX extended_direction = extension * direction;
@@ -27,18 +113,168 @@ Real LineSearch::search(const Mesh& mesh,
     VecX x;
     state.flatten_positions(x);
     
+    WallSet wall_set;
+    wall_set.build(walls, x, extended_direction);
+    if (stats) stats->wall_candidates += wall_set.num_candidates();
+    
+    // Start with full extended step
+    return backtrack(x, extended_direction, contacts, pins,
+                     wall_set, 1.0, min_alpha, stats);
+}
+
+Real LineSearch::search(const Mesh& mesh,
+                       const State& state,
+                       const VecX& direction,
+                       const std::vector<ContactPair>& contacts,
+                       const std::vector<Pin>& pins,
+                       const Vec3& wall_normal,
+                       Real wall_offset,
+                       Real extension,
+                       Real min_alpha,
+                       LineSearchStats* stats) {
+    std::vector<WallConstraint> walls;
+    if (wall_normal.squaredNorm() > 0.5) {
+        walls.push_back(WallConstraint{wall_normal, wall_offset, 0.0, true});
+    }
+    return search(mesh, state, direction, contacts, pins, walls,
+                  extension, min_alpha, stats);
+}
+
+Real LineSearch::search_toi(const Mesh& mesh,
+                           const State& state,
+                           const VecX& direction,
+                           const std::vector<ContactPair>& contacts,
+                           const std::vector<Pin>& pins,
+                           const std::vector<WallConstraint>& walls,
+                           Real extension,
+                           Real safety,
+                           Real min_alpha,
+                           LineSearchStats* stats) {
+    ANDO_TRACE_SCOPE("LineSearch::search_toi");
+    (void)mesh;
+    
+    VecX extended_direction = extension * direction;
+    VecX x;
+    state.flatten_positions(x);
+    
+    auto get_pos = [](const VecX& v, int i) -> Vec3 {
+        return Vec3(v[3*i], v[3*i+1], v[3*i+2]);
+    };
+    
+    // Single sweep: smallest time of impact over all constraints, t ∈ [0, 1]
+    if (stats) stats->feasibility_checks++;
+    Real t_max = 1.0;
+    
+    // 1. Contacts: CCD along the full extended step
+    const VecX x_end = x + extended_direction;
+    const int num_contacts = static_cast<int>(contacts.size());
+    int ccd_calls = 0;
+    // Per-thread minima merged by hand: MSVC's OpenMP 2.0 has no min/max reductions
+    #pragma omp parallel if(num_contacts >= kParallelMinContacts)
+    {
+        Real local_t_max = 1.0;
+        #pragma omp for schedule(dynamic, 64) reduction(+:ccd_calls) nowait
+        for (int c = 0; c < num_contacts; ++c) {
+            const ContactPair& contact = contacts[c];
+            Real toi = 1.0;
+            if (contact.type == ContactType::POINT_TRIANGLE) {
+                ccd_calls++;
+                toi = ccd_point_triangle(get_pos(x, contact.idx0), get_pos(x_end, contact.idx0),
+                                         get_pos(x, contact.idx1), get_pos(x_end, contact.idx1),
+                                         get_pos(x, contact.idx2), get_pos(x_end, contact.idx2),
+                                         get_pos(x, contact.idx3), get_pos(x_end, contact.idx3));
+            } else if (contact.type == ContactType::EDGE_EDGE) {
+                ccd_calls++;
+                toi = ccd_edge_edge(get_pos(x, contact.idx0), get_pos(x_end, contact.idx0),
+                                    get_pos(x, contact.idx1), get_pos(x_end, contact.idx1),
+                                    get_pos(x, contact.idx2), get_pos(x_end, contact.idx2),
+                                    get_pos(x, contact.idx3), get_pos(x_end, contact.idx3));
+            }
+            local_t_max = std::min(local_t_max, toi);
+        }
+        #pragma omp critical(ando_line_search_t_max)
+        t_max = std::min(t_max, local_t_max);
+    }
+    if (stats) stats->ccd_calls += ccd_calls;
+    
+    // 2. Pins: the feasibility test only requires a non-negative distance to
+    //    the target, which holds for every α, so pins never bound the step.
+    (void)pins;
+    
+    // 3. Walls: n·(x + t d) - offset = 0  →  t = (n·x - offset) / (-n·d) for approaching
+    //    vertices. Vertices outside the candidate lists cannot cross before t = 1.
+    WallSet wall_set;
+    wall_set.build(walls, x, extended_direction);
+    if (stats) stats->wall_candidates += wall_set.num_candidates();
+    for (const auto& plane : wall_set.planes) {
+        const int num_candidates = static_cast<int>(plane.candidates.size());
+        #pragma omp parallel if(num_candidates >= kParallelMinVertices)
+        {
+            Real local_t_max = 1.0;
+            #pragma omp for schedule(static) nowait
+            for (int k = 0; k < num_candidates; ++k) {
+                const int i = plane.candidates[k];
+                const Real approach = -plane.normal.dot(get_pos(extended_direction, i));
+                if (approach <= 0.0) continue;
+                const Real distance = plane.normal.dot(get_pos(x, i)) - plane.offset;
+                local_t_max = std::min(local_t_max, std::max(Real(0.0), distance) / approach);
+            }
+            #pragma omp critical(ando_line_search_t_max)
+            t_max = std::min(t_max, local_t_max);
+        }
+    }
+    
+    Real alpha;
+    if (t_max >= 1.0) {
+        // Nothing hit along the full step: the sweep above already is the CCD check
+        alpha = 1.0;
+    } else {
+        alpha = safety * t_max;
+        if (alpha < min_alpha) {
+            return 0.0;
+        }
+        alpha = backtrack(x, extended_direction, contacts, pins,
+                          wall_set, alpha, min_alpha, stats);
+    }
+    
+    if (stats && alpha > 0.0) {
+        // Backtracking from α = 1 needs one sweep per halving until α ≤ t_max
+        const int halvings = t_max >= 1.0 ? 0
+            : static_cast<int>(std::ceil(-std::log2(std::max(t_max, min_alpha))));
+        stats->sweeps_saved += std::max(0, halvings + 1 - stats->feasibility_checks);
+    }
+    return alpha;
+}
+
+Real LineSearch::backtrack(const VecX& x,
+                           const VecX& extended_direction,
+                           const std::vector<ContactPair>& contacts,
+                           const std::vector<Pin>& pins,
+                           const WallSet& walls,
+                           Real alpha_start,
+                           Real min_alpha,
+                           LineSearchStats* stats) {
+    Real alpha = alpha_start;
+    const Real reduction_factor = 0.5;  // Geometric backtracking
+    const int max_iterations = 20;
+    
+    // x is the start-of-step buffer shared by every trial; x_new is reused
+    VecX x_new(x.size());
+    
     // Try progressively smaller step lengths
     for (int iter = 0; iter < max_iterations; ++iter) {
         // Proposed new positions: x_new = x + α * extension * d
-        VecX x_new = x + alpha * extended_direction;
+        x_new.noalias() = x + alpha * extended_direction;
         
         // Check feasibility (constraint satisfaction only, no energy evaluation)
-        if (is_feasible(state, x_new, contacts, pins, wall_normal, wall_offset)) {
+        if (stats) stats->feasibility_checks++;
+        if (is_feasible(x, x_new, contacts, pins, walls, 0.0, stats)) {
             return alpha;  // Found feasible step
         }
         
         // Reduce step length geometrically
         alpha *= reduction_factor;
+        if (stats) stats->backtracks++;
         
         // Give up if step becomes too small
         if (alpha < min_alpha) {
@@ -49,25 +285,30 @@ Real LineSearch::search(const Mesh& mesh,
     return alpha;  // Return best attempt
 }
 
-bool LineSearch::is_feasible(const State& state,
+bool LineSearch::is_feasible(const VecX& x_old,
                              const VecX& x_new,
                              const std::vector<ContactPair>& contacts,
                              const std::vector<Pin>& pins,
-                             const Vec3& wall_normal,
-                             Real wall_offset,
-                             Real gap_min) {
-    
-    // Flatten old positions
-    VecX x_old;
-    state.flatten_positions(x_old);
-    const int n = static_cast<int>(x_old.size() / 3);
+                             const WallSet& walls,
+                             Real gap_min,
+                             LineSearchStats* stats) {
+    const int num_contacts = static_cast<int>(contacts.size());
     
     auto get_pos = [](const VecX& x, int i) -> Vec3 {
         return Vec3(x[3*i], x[3*i+1], x[3*i+2]);
     };
     
+    // Set by whichever thread finds the first violation; the others skip
+    // their remaining work (an OpenMP loop cannot break early).
+    std::atomic<bool> infeasible{false};
+    int ccd_calls = 0;
+    
     // 1. Check contact constraints with CCD
-    for (const auto& contact : contacts) {
+    #pragma omp parallel for schedule(dynamic, 64) reduction(+:ccd_calls) if(num_contacts >= kParallelMinContacts)
+    for (int c = 0; c < num_contacts; ++c) {
+        if (infeasible.load(std::memory_order_relaxed)) continue;
+        const ContactPair& contact = contacts[c];
+        
         if (contact.type == ContactType::POINT_TRIANGLE) {
             // Vertex vs triangle
             Vec3 p0 = get_pos(x_old, contact.idx0);
@@ -83,9 +324,11 @@ bool LineSearch::is_feasible(const State& state,
             Vec3 c1 = get_pos(x_new, contact.idx3);
             
             // CCD check: if collision time < 1.0, step is infeasible
+            ccd_calls++;
             Real toi = ccd_point_triangle(p0, p1, a0, a1, b0, b1, c0, c1);
             if (toi < 1.0) {
-                return false;  // Collision detected
+                infeasible.store(true, std::memory_order_relaxed);  // Collision detected
+                continue;
             }
             
             // Also check discrete gap at end state
@@ -94,7 +337,7 @@ bool LineSearch::is_feasible(const State& state,
             if (Collision::narrow_phase_point_triangle(p1, a1, b1, c1, 
                                                        distance, normal, witness_p, witness_q)) {
                 if (distance < gap_min) {
-                    return false;  // Gap too small
+                    infeasible.store(true, std::memory_order_relaxed);  // Gap too small
                 }
             }
         }
@@ -113,10 +356,12 @@ bool LineSearch::is_feasible(const State& state,
             Vec3 q1_1 = get_pos(x_new, contact.idx3);
             
             // CCD check
+            ccd_calls++;
             Real toi = ccd_edge_edge(p0_0, p0_1, p1_0, p1_1, 
                                     q0_0, q0_1, q1_0, q1_1);
             if (toi < 1.0) {
-                return false;  // Collision detected
+                infeasible.store(true, std::memory_order_relaxed);  // Collision detected
+                continue;
             }
             
             // Discrete gap check
@@ -125,11 +370,15 @@ bool LineSearch::is_feasible(const State& state,
             if (Collision::narrow_phase_edge_edge(p0_1, p1_1, q0_1, q1_1,
                                                   distance, normal, witness_p, witness_q)) {
                 if (distance < gap_min) {
-                    return false;  // Gap too small
+                    infeasible.store(true, std::memory_order_relaxed);  // Gap too small
                 }
             }
         }
     }
+    if (stats) stats->ccd_calls += ccd_calls;
+    if (infeasible.load()) {
+        return false;
+    }
     
     // 2. Check pin constraints (ensure they stay within barrier domain)
     for (const auto& pin : pins) {
@@ -144,106 +393,81 @@ bool LineSearch::is_feasible(const State& state,
         }
     }
     
-    // 3. Check wall constraint (if active)
+    // 3. Check wall constraints on their candidate vertices
     // Wall constraint: n·x - offset ≥ gap_min
-    if (wall_normal.squaredNorm() > 0.5) {  // Check if wall is active
-        for (int i = 0; i < n; ++i) {
-            Vec3 pos = get_pos(x_new, i);
-            Real signed_distance = wall_normal.dot(pos) - wall_offset;
+    for (const auto& plane : walls.planes) {
+        const int num_candidates = static_cast<int>(plane.candidates.size());
+        #pragma omp parallel for schedule(static) if(num_candidates >= kParallelMinVertices)
+        for (int k = 0; k < num_candidates; ++k) {
+            if (infeasible.load(std::memory_order_relaxed)) continue;
+            Vec3 pos = get_pos(x_new, plane.candidates[k]);
+            Real signed_distance = plane.normal.dot(pos) - plane.offset;
             
             if (signed_distance < gap_min) {
-                return false;  // Wall penetration
+                infeasible.store(true, std::memory_order_relaxed);  // Wall penetration
             }
         }
+        if (infeasible.load()) {
+            return false;
+        }
     }
     
-    return true;  // All constraints satisfied
+    return !infeasible.load();  // All constraints satisfied
 }
 
 Real LineSearch::ccd_point_triangle(const Vec3& p0, const Vec3& p1,
                                    const Vec3& a0, const Vec3& a1,
                                    const Vec3& b0, const Vec3& b1,
                                    const Vec3& c0, const Vec3& c1) {
-    // Conservative CCD using temporal sampling
-    // Check if point trajectory crosses the triangle plane
-    
+    // Displacements relative to their mean: a shared translation cannot
+    // change the distance, so it must not shrink the advancement step.
     Vec3 dp = p1 - p0;
     Vec3 da = a1 - a0;
     Vec3 db = b1 - b0;
     Vec3 dc = c1 - c0;
+    const Vec3 mean = (dp + da + db + dc) * Real(0.25);
+    dp -= mean;
+    da -= mean;
+    db -= mean;
+    dc -= mean;
     
-    // Early exit if no motion
-    if (dp.squaredNorm() < 1e-12 && da.squaredNorm() < 1e-12 &&
-        db.squaredNorm() < 1e-12 && dc.squaredNorm() < 1e-12) {
-        return 1.0;
-    }
+    // Upper bound on how fast the point-triangle distance can shrink
+    const Real max_speed = dp.norm() + std::max({da.norm(), db.norm(), dc.norm()});
     
-    // Sample at multiple time points for conservative detection
-    const int num_samples = 10;
-    for (int i = 1; i <= num_samples; ++i) {
-        Real t = static_cast<Real>(i) / num_samples;
-        
-        // Interpolate positions
-        Vec3 p_t = p0 + t * (p1 - p0);
-        Vec3 a_t = a0 + t * (a1 - a0);
-        Vec3 b_t = b0 + t * (b1 - b0);
-        Vec3 c_t = c0 + t * (c1 - c0);
-        
-        // Check distance
+    return additive_ccd(max_speed, [&](Real t) {
         Real distance;
         Vec3 normal, witness_p, witness_q;
-        if (Collision::narrow_phase_point_triangle(p_t, a_t, b_t, c_t,
-                                                   distance, normal, witness_p, witness_q)) {
-            if (distance < 1e-6) {  // Conservative threshold
-                return t;  // Collision detected at time t
-            }
-        }
-    }
-    
-    return 1.0;  // No collision detected
+        Collision::narrow_phase_point_triangle(p0 + t * (p1 - p0), a0 + t * (a1 - a0),
+                                               b0 + t * (b1 - b0), c0 + t * (c1 - c0),
+                                               distance, normal, witness_p, witness_q);
+        return distance;
+    });
 }
 
 Real LineSearch::ccd_edge_edge(const Vec3& p0_0, const Vec3& p0_1,
                               const Vec3& p1_0, const Vec3& p1_1,
                               const Vec3& q0_0, const Vec3& q0_1,
                               const Vec3& q1_0, const Vec3& q1_1) {
-    // Conservative CCD for edge-edge
-    // Sample at multiple time points
-    
-    // Check if motion is negligible
     Vec3 dp0 = p0_1 - p0_0;
     Vec3 dp1 = p1_1 - p1_0;
     Vec3 dq0 = q0_1 - q0_0;
     Vec3 dq1 = q1_1 - q1_0;
+    const Vec3 mean = (dp0 + dp1 + dq0 + dq1) * Real(0.25);
+    dp0 -= mean;
+    dp1 -= mean;
+    dq0 -= mean;
+    dq1 -= mean;
     
-    if (dp0.squaredNorm() < 1e-12 && dp1.squaredNorm() < 1e-12 &&
-        dq0.squaredNorm() < 1e-12 && dq1.squaredNorm() < 1e-12) {
-        return 1.0;  // No motion
-    }
+    const Real max_speed = std::max(dp0.norm(), dp1.norm()) + std::max(dq0.norm(), dq1.norm());
     
-    // Sample at multiple time points
-    const int num_samples = 10;
-    for (int i = 1; i <= num_samples; ++i) {
-        Real t = static_cast<Real>(i) / num_samples;
-        
-        // Interpolate edge positions
-        Vec3 p0_t = p0_0 + t * (p0_1 - p0_0);
-        Vec3 p1_t = p1_0 + t * (p1_1 - p1_0);
-        Vec3 q0_t = q0_0 + t * (q0_1 - q0_0);
-        Vec3 q1_t = q1_0 + t * (q1_1 - q1_0);
-        
-        // Check distance
+    return additive_ccd(max_speed, [&](Real t) {
         Real distance;
         Vec3 normal, witness_p, witness_q;
-        if (Collision::narrow_phase_edge_edge(p0_t, p1_t, q0_t, q1_t,
-                                              distance, normal, witness_p, witness_q)) {
-            if (distance < 1e-6) {  // Conservative threshold
-                return t;  // Collision detected at time t
-            }
-        }
-    }
-    
-    return 1.0;  // No collision detected
+        Collision::narrow_phase_edge_edge(p0_0 + t * (p0_1 - p0_0), p1_0 + t * (p1_1 - p1_0),
+                                          q0_0 + t * (q0_1 - q0_0), q1_0 + t * (q1_1 - q1_0),
+                                          distance, normal, witness_p, witness_q);
+        return distance;
+    });
 }
 
 } // namespace ando_barrier
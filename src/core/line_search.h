@@ -9,6 +9,41 @@
 
 namespace ando_barrier {
 
+// Work done by one line search (for profiling)
+struct LineSearchStats {
+    int backtracks = 0;           // α halvings
+    int feasibility_checks = 0;   // Full constraint sweeps
+    int ccd_calls = 0;            // Point-triangle + edge-edge CCD queries
+    int sweeps_saved = 0;         // Backtracking sweeps avoided by the TOI bound (estimate)
+    int wall_candidates = 0;      // Vertex-wall pairs within reach of the step
+};
+
+/**
+ * Active walls with the vertices that can reach them during one line search
+ * 
+ * Built once per search from the start positions x and the extended step d.
+ * Along x + α d the signed distance to a wall is s + α (n·d), so a vertex
+ * whose s + min(0, n·d) stays ≥ gap_min is clear of that wall for every
+ * α ∈ [0, 1] and is never checked again. Feasibility sweeps then only visit
+ * the candidate lists, so their cost scales with near-wall vertices instead
+ * of vertices × walls.
+ */
+struct WallSet {
+    struct Plane {
+        Vec3 normal;
+        Real offset;
+        std::vector<int> candidates;  // Vertices within reach of this wall
+    };
+    std::vector<Plane> planes;  // Active walls only
+    
+    void build(const std::vector<WallConstraint>& walls,
+               const VecX& x,
+               const VecX& extended_direction,
+               Real gap_min = 0.0);
+    
+    int num_candidates() const;
+};
+
 /**
  * Constraint-only line search with extended direction (Section 3.5, Algorithm 1 Line 13)
  * 
@@ -28,12 +63,23 @@ public:
      * @param direction Search direction (typically Newton direction)
      * @param contacts Current contact constraints
      * @param pins Pin constraints (if any)
-     * @param wall_normal Wall plane normal (if wall constraint active)
-     * @param wall_offset Wall plane offset (if wall constraint active)
+     * @param walls Wall constraints (all active walls are checked)
      * @param extension Extended direction multiplier (default 1.25 per paper)
      * @param min_alpha Minimum step length to consider (default 1e-6)
+     * @param stats Optional output: backtracks and CCD query counts
      * @return Maximum feasible α ∈ [0,1]
      */
+    static Real search(const Mesh& mesh,
+                      const State& state,
+                      const VecX& direction,
+                      const std::vector<ContactPair>& contacts,
+                      const std::vector<Pin>& pins,
+                      const std::vector<WallConstraint>& walls,
+                      Real extension = 1.25,
+                      Real min_alpha = 1e-6,
+                      LineSearchStats* stats = nullptr);
+    
+    // Single-wall form; a zero wall_normal means no wall
     static Real search(const Mesh& mesh,
                       const State& state,
                       const VecX& direction,
@@ -42,32 +88,43 @@ public:
                       const Vec3& wall_normal = Vec3(0, 0, 1),
                       Real wall_offset = 0.0,
                       Real extension = 1.25,
-                      Real min_alpha = 1e-6);
+                      Real min_alpha = 1e-6,
+                      LineSearchStats* stats = nullptr);
 
-private:
     /**
-     * Check if step is feasible for all constraints
+     * Direct time-of-impact line search
      * 
-     * @param state Current state
-     * @param x_new Proposed new positions
-     * @param contacts Contact constraints to check
-     * @param pins Pin constraints to check
-     * @param wall_normal Wall plane normal
-     * @param wall_offset Wall plane offset
-     * @param gap_min Minimum allowable gap (default 0)
-     * @return true if all constraints satisfied
+     * One pass over every contact (CCD), every active wall (closed-form
+     * plane crossing per vertex) and the pins bounds the largest feasible
+     * step t_max along the extended direction; the step taken is
+     * α = safety · t_max (α = 1 if nothing is hit). If the bounded step is
+     * still rejected by the feasibility check, geometric backtracking
+     * continues from there.
+     * 
+     * @param walls Wall constraints (inactive walls are skipped)
+     * @param safety Fraction of the TOI bound to take, in (0, 1)
+     * @return Feasible α ∈ [0,1], 0 if none
      */
-    static bool is_feasible(const State& state,
-                           const VecX& x_new,
-                           const std::vector<ContactPair>& contacts,
-                           const std::vector<Pin>& pins,
-                           const Vec3& wall_normal,
-                           Real wall_offset,
-                           Real gap_min = 0.0);
-    
+    static Real search_toi(const Mesh& mesh,
+                          const State& state,
+                          const VecX& direction,
+                          const std::vector<ContactPair>& contacts,
+                          const std::vector<Pin>& pins,
+                          const std::vector<WallConstraint>& walls,
+                          Real extension = 1.25,
+                          Real safety = 0.9,
+                          Real min_alpha = 1e-6,
+                          LineSearchStats* stats = nullptr);
+
     /**
      * Continuous Collision Detection for vertex-triangle pair
      * 
+     * Additive CCD (conservative advancement): the trajectory is advanced
+     * in steps no larger than the current distance divided by an upper
+     * bound on the relative speed, so the primitives can never pass through
+     * each other between evaluations. Stops once the distance falls below
+     * a fraction of its initial value.
+     * 
      * @param p0 Vertex position at t=0
      * @param p1 Vertex position at t=1
      * @param a0 Triangle vertex a at t=0
@@ -76,7 +133,7 @@ private:
      * @param b1 Triangle vertex b at t=1
      * @param c0 Triangle vertex c at t=0
      * @param c1 Triangle vertex c at t=1
-     * @return Time of impact (0 to 1) or 1.0 if no collision
+     * @return Conservative (collision-free) time of impact in [0, 1), or 1.0 if no collision
      */
     static Real ccd_point_triangle(const Vec3& p0, const Vec3& p1,
                                   const Vec3& a0, const Vec3& a1,
@@ -84,7 +141,7 @@ private:
                                   const Vec3& c0, const Vec3& c1);
     
     /**
-     * Continuous Collision Detection for edge-edge pair
+     * Continuous Collision Detection for edge-edge pair (additive CCD)
      * 
      * @param p0_0 Edge0 vertex 0 at t=0
      * @param p0_1 Edge0 vertex 0 at t=1
@@ -94,12 +151,47 @@ private:
      * @param q0_1 Edge1 vertex 0 at t=1
      * @param q1_0 Edge1 vertex 1 at t=0
      * @param q1_1 Edge1 vertex 1 at t=1
-     * @return Time of impact (0 to 1) or 1.0 if no collision
+     * @return Conservative (collision-free) time of impact in [0, 1), or 1.0 if no collision
      */
     static Real ccd_edge_edge(const Vec3& p0_0, const Vec3& p0_1,
                              const Vec3& p1_0, const Vec3& p1_1,
                              const Vec3& q0_0, const Vec3& q0_1,
                              const Vec3& q1_0, const Vec3& q1_1);
+
+private:
+    // Halve α from alpha_start until x + α·d_ext is feasible (shared by both modes)
+    static Real backtrack(const VecX& x,
+                          const VecX& extended_direction,
+                          const std::vector<ContactPair>& contacts,
+                          const std::vector<Pin>& pins,
+                          const WallSet& walls,
+                          Real alpha_start,
+                          Real min_alpha,
+                          LineSearchStats* stats);
+
+    /**
+     * Check if step is feasible for all constraints
+     * 
+     * Contacts and the wall sweep run in parallel (OpenMP) and stop early
+     * once any thread finds a violation. Walls only visit their candidate
+     * vertices.
+     * 
+     * @param x_old Start-of-step positions (flattened once per search)
+     * @param x_new Proposed new positions
+     * @param contacts Contact constraints to check
+     * @param pins Pin constraints to check
+     * @param walls Active walls with their candidate vertices
+     * @param gap_min Minimum allowable gap (default 0)
+     * @param stats Optional CCD query counter
+     * @return true if all constraints satisfied
+     */
+    static bool is_feasible(const VecX& x_old,
+                           const VecX& x_new,
+                           const std::vector<ContactPair>& contacts,
+                           const std::vector<Pin>& pins,
+                           const WallSet& walls,
+                           Real gap_min = 0.0,
+                           LineSearchStats* stats = nullptr);
 };
 
 } // namespace ando_barrier
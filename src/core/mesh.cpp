@@ -16,6 +16,7 @@ void Mesh::initialize(const std::vector<Vec3>& verts,
 }
 
 void Mesh::compute_rest_state() {
+    elastic_cache = ElasticFaceCache();
     compute_edges();
     build_topology();
     
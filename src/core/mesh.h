@@ -5,6 +5,19 @@
 
 namespace ando_barrier {
 
+// Per-face elastic constants derived from the rest state and material.
+// Filled by Elasticity on first use and rebuilt when the material changes.
+struct ElasticFaceCache {
+    bool valid = false;
+    Real youngs_modulus = 0.0;          // Material the constants were built for
+    Real poisson_ratio = 0.0;
+    Real thickness = 0.0;
+    std::vector<Real> stiffness;        // k = area·thickness·μ per face
+    std::vector<Mat3> hessian_blocks;   // 9 SPD 3×3 blocks per face, [a][b] row-major
+    std::vector<int> vertex_offsets;    // Per vertex: range into vertex_corners
+    std::vector<int> vertex_corners;    // 3·face + corner, faces in ascending order
+};
+
 // Shell/cloth mesh representation
 class Mesh {
 public:
@@ -24,6 +37,9 @@ public:
     // Material
     Material material;
     
+    // Elastic constants (cleared by compute_rest_state)
+    mutable ElasticFaceCache elastic_cache;
+    
     Mesh() = default;
     
     // Initialize from vertex positions and triangle indices
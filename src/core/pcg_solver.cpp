@@ -1,4 +1,5 @@
 #include "pcg_solver.h"
+#include "trace.h"
 #include <iostream>
 #include <algorithm>
 #include <cmath>
@@ -6,7 +7,17 @@
 namespace ando_barrier {
 
 bool PCGSolver::solve(const SparseMatrix& A, const VecX& b, VecX& x,
-                     Real tol, int max_iters) {
+                     Real tol, int max_iters, PCGStats* stats) {
+    ANDO_TRACE_SCOPE("PCGSolver::solve");
+    auto report = [&](int iterations, Real residual, bool converged) {
+        if (stats) {
+            stats->iterations = iterations;
+            stats->residual = residual;
+            stats->converged = converged;
+        }
+        return converged;
+    };
+
     const int n = static_cast<int>(b.size());
     const int num_vertices = n / 3;
     
@@ -20,7 +31,7 @@ bool PCGSolver::solve(const SparseMatrix& A, const VecX& b, VecX& x,
     // Check initial convergence
     Real rel_res = compute_relative_residual(r, b);
     if (rel_res < tol) {
-        return true;  // Already converged
+        return report(0, rel_res, true);  // Already converged
     }
     
     // Apply preconditioner: z = P⁻¹ r
@@ -42,7 +53,7 @@ bool PCGSolver::solve(const SparseMatrix& A, const VecX& b, VecX& x,
         Real pAp = p.dot(Ap);
         if (std::abs(pAp) < 1e-16) {
             std::cerr << "PCG: pAp near zero, matrix may not be SPD" << std::endl;
-            return false;
+            return report(iter, rel_res, false);
         }
         Real alpha = rz_old / pAp;
         
@@ -55,7 +66,7 @@ bool PCGSolver::solve(const SparseMatrix& A, const VecX& b, VecX& x,
         // Check convergence
         rel_res = compute_relative_residual(r, b);
         if (rel_res < tol) {
-            return true;  // Converged
+            return report(iter + 1, rel_res, true);  // Converged
         }
         
         // Apply preconditioner: z = P⁻¹ r
@@ -71,7 +82,7 @@ bool PCGSolver::solve(const SparseMatrix& A, const VecX& b, VecX& x,
     }
     
     std::cerr << "PCG: Max iterations reached, residual = " << rel_res << std::endl;
-    return false;  // Did not converge
+    return report(max_iters, rel_res, false);  // Did not converge
 }
 
 void PCGSolver::build_block_jacobi_preconditioner(
@@ -5,6 +5,13 @@
 
 namespace ando_barrier {
 
+// Outcome of one PCG solve (for profiling)
+struct PCGStats {
+    int iterations = 0;
+    Real residual = 0.0;     // Final relative residual (L∞)
+    bool converged = false;
+};
+
 /**
  * Preconditioned Conjugate Gradient solver with block-Jacobi preconditioner
  * 
@@ -21,10 +28,12 @@ public:
      * @param x Solution vector (input: initial guess, output: solution)
      * @param tol Relative residual tolerance (L∞ norm)
      * @param max_iters Maximum iterations
+     * @param stats Optional output: iteration count and final residual
      * @return true if converged, false if max iterations reached
      */
     static bool solve(const SparseMatrix& A, const VecX& b, VecX& x,
-                     Real tol = 1e-3, int max_iters = 100);
+                     Real tol = 1e-3, int max_iters = 100,
+                     PCGStats* stats = nullptr);
 
 private:
     /**
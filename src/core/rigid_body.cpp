@@ -7,7 +7,11 @@
 namespace ando_barrier {
 
 RigidBody::RigidBody()
-    : m_mass(1.0),
+    : m_local_min(Vec3::Zero()),
+      m_local_max(Vec3::Zero()),
+      m_rest_centroid(Vec3::Zero()),
+      m_world_valid(false),
+      m_mass(1.0),
       m_inertia_body(Mat3::Identity()),
       m_inertia_body_inv(Mat3::Identity()),
       m_position(Vec3::Zero()),
@@ -21,9 +25,13 @@ void RigidBody::initialize(const std::vector<Vec3>& vertices,
                            const std::vector<Triangle>& triangles,
                            Real density) {
     m_triangles = triangles;
+    m_world_valid = false;
 
     if (vertices.empty()) {
         m_vertices_local.clear();
+        m_local_min.setZero();
+        m_local_max.setZero();
+        m_rest_centroid.setZero();
         m_mass = 0.0;
         m_inertia_body.setZero();
         m_inertia_body_inv.setZero();
@@ -38,10 +46,15 @@ void RigidBody::initialize(const std::vector<Vec3>& vertices,
     centroid /= static_cast<Real>(vertices.size());
 
     m_vertices_local.resize(vertices.size());
+    m_local_min = Vec3::Constant(std::numeric_limits<Real>::max());
+    m_local_max = Vec3::Constant(-std::numeric_limits<Real>::max());
     for (size_t i = 0; i < vertices.size(); ++i) {
         m_vertices_local[i] = vertices[i] - centroid;
+        m_local_min = m_local_min.cwiseMin(m_vertices_local[i]);
+        m_local_max = m_local_max.cwiseMax(m_vertices_local[i]);
     }
 
+    m_rest_centroid = centroid;
     m_position = centroid;
     m_rotation = Mat3::Identity();
     m_linear_velocity.setZero();
@@ -90,13 +103,16 @@ void RigidBody::compute_mass_properties(Real density) {
     m_inertia_body_inv = m_inertia_body.inverse();
 }
 
-std::vector<Vec3> RigidBody::world_vertices() const {
-    std::vector<Vec3> out;
-    out.reserve(m_vertices_local.size());
-    for (const Vec3& v : m_vertices_local) {
-        out.push_back(m_position + m_rotation * v);
+const std::vector<Vec3>& RigidBody::world_vertices() const {
+    if (!m_world_valid || m_world_vertices.size() != m_vertices_local.size()) {
+        // Same size on every refresh, so the buffer (and Python views of it) stays put
+        m_world_vertices.resize(m_vertices_local.size());
+        for (size_t i = 0; i < m_vertices_local.size(); ++i) {
+            m_world_vertices[i] = m_position + m_rotation * m_vertices_local[i];
+        }
+        m_world_valid = true;
     }
-    return out;
+    return m_world_vertices;
 }
 
 Vec3 RigidBody::to_local(const Vec3& world_point) const {
@@ -148,6 +164,15 @@ void RigidBody::apply_force(const Vec3& world_point, const Vec3& force, Real dt)
     }
 }
 
+void RigidBody::accumulate_wrench(const Vec3& force, const Vec3& torque) {
+    if (m_mass <= Real(0)) {
+        return;
+    }
+
+    m_accumulated_force += force;
+    m_accumulated_torque += torque;
+}
+
 void RigidBody::integrate(Real dt) {
     if (m_mass <= Real(0)) {
         return;
@@ -162,6 +187,7 @@ void RigidBody::integrate(Real dt) {
     m_angular_velocity += angular_acc * dt;
 
     m_position += m_linear_velocity * dt;
+    m_world_valid = false;
 
     Real omega_norm = m_angular_velocity.norm();
     if (omega_norm > Real(1e-8)) {
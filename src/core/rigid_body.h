@@ -27,6 +27,10 @@ public:
     const std::vector<Vec3>& local_vertices() const { return m_vertices_local; }
     const std::vector<Triangle>& triangles() const { return m_triangles; }
 
+    // Bounding box of the local vertices (body frame)
+    const Vec3& local_bounds_min() const { return m_local_min; }
+    const Vec3& local_bounds_max() const { return m_local_max; }
+
     Real mass() const { return m_mass; }
     const Mat3& inertia_body() const { return m_inertia_body; }
 
@@ -36,13 +40,19 @@ public:
     const Vec3& linear_velocity() const { return m_linear_velocity; }
     const Vec3& angular_velocity() const { return m_angular_velocity; }
 
-    void set_position(const Vec3& p) { m_position = p; }
-    void set_rotation(const Mat3& R) { m_rotation = R; }
+    void set_position(const Vec3& p) { m_position = p; m_world_valid = false; }
+    void set_rotation(const Mat3& R) { m_rotation = R; m_world_valid = false; }
     void set_linear_velocity(const Vec3& v) { m_linear_velocity = v; }
     void set_angular_velocity(const Vec3& w) { m_angular_velocity = w; }
 
-    // Compute world-space vertex positions
-    std::vector<Vec3> world_vertices() const;
+    // World-space vertex positions. Cached until the next integrate /
+    // set_position / set_rotation; the first call after a move recomputes
+    // the buffer in place (not safe to call concurrently on one body).
+    const std::vector<Vec3>& world_vertices() const;
+
+    // Rigid transform mapping the initialisation-time (world) vertices to
+    // their current positions: x ↦ rotation()·x + rest_to_world_translation()
+    Vec3 rest_to_world_translation() const { return m_position - m_rotation * m_rest_centroid; }
 
     // Transform a world-space point into the local body frame
     Vec3 to_local(const Vec3& world_point) const;
@@ -57,6 +67,10 @@ public:
     // integration driven by barrier forces).
     void apply_force(const Vec3& world_point, const Vec3& force, Real dt);
 
+    // Add a net force and torque (about the centre of mass) to the
+    // accumulators, e.g. totals reduced over many contacts.
+    void accumulate_wrench(const Vec3& force, const Vec3& torque);
+
     // Advance the rigid body state using semi-implicit Euler integration.
     void integrate(Real dt);
 
@@ -71,6 +85,12 @@ private:
 
     std::vector<Vec3> m_vertices_local;
     std::vector<Triangle> m_triangles;
+    Vec3 m_local_min;
+    Vec3 m_local_max;
+    Vec3 m_rest_centroid;
+
+    mutable std::vector<Vec3> m_world_vertices;
+    mutable bool m_world_valid;
 
     Real m_mass;
     Mat3 m_inertia_body;
@@ -44,6 +44,13 @@ void State::update_velocities(Real beta_dt) {
     }
 }
 
+void State::apply_gravity(const Vec3& gravity, Real dt) {
+    for (size_t i = 0; i < positions.size(); ++i) {
+        velocities[i] += gravity * dt;
+        positions[i] += velocities[i] * dt;
+    }
+}
+
 void State::flatten_positions(VecX& x) const {
     x.resize(positions.size() * 3);
     for (size_t i = 0; i < positions.size(); ++i) {
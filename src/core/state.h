@@ -28,6 +28,9 @@ public:
     // Update from integration step
     void update_positions(const std::vector<Vec3>& new_positions);
     void update_velocities(Real beta_dt); // Δx / (βΔt)
+
+    // Explicit gravity substep: v += g·dt, then x += v·dt
+    void apply_gravity(const Vec3& gravity, Real dt);
     
     // Access
     size_t num_vertices() const { return positions.size(); }
@@ -0,0 +1,155 @@
+#pragma once
+
+#include "types.h"
+#include <algorithm>
+#include <chrono>
+
+namespace ando_barrier {
+
+// Per-step timing and work counters filled in by Integrator::step.
+// Times are wall-clock milliseconds.
+struct StepProfile {
+    // Phase timings
+    double prediction_ms = 0.0;        // x̂ = x + Δt v
+    double collision_ms = 0.0;         // Contact detection
+    double gradient_ms = 0.0;          // ∇E evaluation (all Newton iterations)
+    double assembly_ms = 0.0;          // Hessian assembly (all Newton iterations)
+    double pcg_ms = 0.0;               // Linear solves
+    double line_search_ms = 0.0;       // Feasibility search incl. CCD
+    double velocity_update_ms = 0.0;   // v = Δx/(βΔt), damping, restitution
+    double coupling_ms = 0.0;          // Contact forces on rigid bodies + their integration
+    double total_ms = 0.0;
+
+    // Solver work
+    int beta_iterations = 0;           // β accumulation iterations (excl. error reduction)
+    int newton_iterations = 0;         // Newton iterations across all inner solves
+    int pcg_solves = 0;
+    int pcg_iterations = 0;            // Summed over all solves
+    int pcg_failures = 0;              // Solves that hit max iterations / breakdown
+    Real pcg_residual = 0.0;           // Relative residual of the last solve
+    Real pcg_max_residual = 0.0;       // Worst final residual this step
+
+    // Line search work
+    int line_search_calls = 0;
+    int line_search_backtracks = 0;    // α halvings
+    int line_search_failures = 0;      // Searches returning α = 0
+    int line_search_sweeps = 0;        // Full feasibility sweeps (incl. TOI passes)
+    int line_search_sweeps_saved = 0;  // Sweeps avoided by the TOI line search (estimate)
+    int ccd_calls = 0;                 // Point-triangle + edge-edge CCD queries
+
+    int num_contacts = 0;              // Peak contact pairs (incl. re-detections)
+    int contact_redetections = 0;      // In-step re-detections (adaptive contact detection)
+    int contact_cache_hits = 0;        // Contacts carried over from the previous step
+    int contact_cache_misses = 0;      // New contacts
+    int contact_cache_rebuilds = 0;    // Full detections run by the contact cache
+    int active_wall_vertices = 0;      // Peak vertex-wall pairs in the barrier domain
+    Real final_beta = 0.0;
+};
+
+// Running totals and per-field maxima over many steps.
+struct StepProfileSummary {
+    int steps = 0;
+    StepProfile totals;
+    StepProfile peak;
+
+    void accumulate(const StepProfile& p) {
+        ++steps;
+        add(totals, p);
+        take_max(peak, p);
+    }
+
+    // Fold in another summary (e.g. the substeps of one frame)
+    void merge(const StepProfileSummary& other) {
+        steps += other.steps;
+        add(totals, other.totals);
+        take_max(peak, other.peak);
+    }
+
+    void reset() { *this = StepProfileSummary(); }
+
+private:
+    static void add(StepProfile& a, const StepProfile& b) {
+        a.prediction_ms += b.prediction_ms;
+        a.collision_ms += b.collision_ms;
+        a.gradient_ms += b.gradient_ms;
+        a.assembly_ms += b.assembly_ms;
+        a.pcg_ms += b.pcg_ms;
+        a.line_search_ms += b.line_search_ms;
+        a.velocity_update_ms += b.velocity_update_ms;
+        a.coupling_ms += b.coupling_ms;
+        a.total_ms += b.total_ms;
+        a.beta_iterations += b.beta_iterations;
+        a.newton_iterations += b.newton_iterations;
+        a.pcg_solves += b.pcg_solves;
+        a.pcg_iterations += b.pcg_iterations;
+        a.pcg_failures += b.pcg_failures;
+        a.pcg_residual += b.pcg_residual;
+        a.pcg_max_residual = std::max(a.pcg_max_residual, b.pcg_max_residual);
+        a.line_search_calls += b.line_search_calls;
+        a.line_search_backtracks += b.line_search_backtracks;
+        a.line_search_failures += b.line_search_failures;
+        a.line_search_sweeps += b.line_search_sweeps;
+        a.line_search_sweeps_saved += b.line_search_sweeps_saved;
+        a.ccd_calls += b.ccd_calls;
+        a.num_contacts += b.num_contacts;
+        a.contact_redetections += b.contact_redetections;
+        a.contact_cache_hits += b.contact_cache_hits;
+        a.contact_cache_misses += b.contact_cache_misses;
+        a.contact_cache_rebuilds += b.contact_cache_rebuilds;
+        a.active_wall_vertices += b.active_wall_vertices;
+        a.final_beta += b.final_beta;
+    }
+
+    static void take_max(StepProfile& a, const StepProfile& b) {
+        a.prediction_ms = std::max(a.prediction_ms, b.prediction_ms);
+        a.collision_ms = std::max(a.collision_ms, b.collision_ms);
+        a.gradient_ms = std::max(a.gradient_ms, b.gradient_ms);
+        a.assembly_ms = std::max(a.assembly_ms, b.assembly_ms);
+        a.pcg_ms = std::max(a.pcg_ms, b.pcg_ms);
+        a.line_search_ms = std::max(a.line_search_ms, b.line_search_ms);
+        a.velocity_update_ms = std::max(a.velocity_update_ms, b.velocity_update_ms);
+        a.coupling_ms = std::max(a.coupling_ms, b.coupling_ms);
+        a.total_ms = std::max(a.total_ms, b.total_ms);
+        a.beta_iterations = std::max(a.beta_iterations, b.beta_iterations);
+        a.newton_iterations = std::max(a.newton_iterations, b.newton_iterations);
+        a.pcg_solves = std::max(a.pcg_solves, b.pcg_solves);
+        a.pcg_iterations = std::max(a.pcg_iterations, b.pcg_iterations);
+        a.pcg_failures = std::max(a.pcg_failures, b.pcg_failures);
+        a.pcg_residual = std::max(a.pcg_residual, b.pcg_residual);
+        a.pcg_max_residual = std::max(a.pcg_max_residual, b.pcg_max_residual);
+        a.line_search_calls = std::max(a.line_search_calls, b.line_search_calls);
+        a.line_search_backtracks = std::max(a.line_search_backtracks, b.line_search_backtracks);
+        a.line_search_failures = std::max(a.line_search_failures, b.line_search_failures);
+        a.line_search_sweeps = std::max(a.line_search_sweeps, b.line_search_sweeps);
+        a.line_search_sweeps_saved = std::max(a.line_search_sweeps_saved, b.line_search_sweeps_saved);
+        a.ccd_calls = std::max(a.ccd_calls, b.ccd_calls);
+        a.num_contacts = std::max(a.num_contacts, b.num_contacts);
+        a.contact_redetections = std::max(a.contact_redetections, b.contact_redetections);
+        a.contact_cache_hits = std::max(a.contact_cache_hits, b.contact_cache_hits);
+        a.contact_cache_misses = std::max(a.contact_cache_misses, b.contact_cache_misses);
+        a.contact_cache_rebuilds = std::max(a.contact_cache_rebuilds, b.contact_cache_rebuilds);
+        a.active_wall_vertices = std::max(a.active_wall_vertices, b.active_wall_vertices);
+        a.final_beta = std::max(a.final_beta, b.final_beta);
+    }
+};
+
+// Adds the elapsed time of its scope to a millisecond accumulator.
+class PhaseTimer {
+public:
+    explicit PhaseTimer(double& accumulator_ms)
+        : m_accumulator_ms(accumulator_ms), m_start(std::chrono::steady_clock::now()) {}
+
+    ~PhaseTimer() {
+        auto end = std::chrono::steady_clock::now();
+        m_accumulator_ms += std::chrono::duration<double, std::milli>(end - m_start).count();
+    }
+
+    PhaseTimer(const PhaseTimer&) = delete;
+    PhaseTimer& operator=(const PhaseTimer&) = delete;
+
+private:
+    double& m_accumulator_ms;
+    std::chrono::steady_clock::time_point m_start;
+};
+
+} // namespace ando_barrier
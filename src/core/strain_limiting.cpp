@@ -11,6 +11,10 @@ namespace {
 
 constexpr Real kTinyValue = static_cast<Real>(1e-12);
 
+// Below these sizes the loops run serially
+constexpr int kParallelMinFaces = 2048;
+constexpr int kParallelMinConstraints = 256;
+
 } // namespace
 
 StrainLimiting::Mat32 StrainLimiting::compute_deformation_gradient(
@@ -25,21 +29,80 @@ StrainLimiting::Mat32 StrainLimiting::compute_deformation_gradient(
     return Ds * Dm_inv;
 }
 
+void StrainLimiting::compute_face_singular_values(
+    const Mesh& mesh,
+    const State& state,
+    std::vector<Vec2>& singular_values
+) {
+    const int num_faces = static_cast<int>(mesh.num_triangles());
+    singular_values.assign(num_faces, Vec2::Ones());
+
+    #pragma omp parallel for schedule(static) if(num_faces >= kParallelMinFaces)
+    for (int face = 0; face < num_faces; ++face) {
+        if (mesh.rest_areas[face] <= kTinyValue) {
+            continue; // Degenerate rest face
+        }
+        const Triangle& tri = mesh.triangles[face];
+        Mat32 F = compute_deformation_gradient(
+            state.positions[tri.v[0]],
+            state.positions[tri.v[1]],
+            state.positions[tri.v[2]],
+            mesh.Dm_inv[face]
+        );
+
+        Mat32 U;
+        Vec2 sigma;
+        Mat2 V;
+        if (compute_svd(F, U, sigma, V)) {
+            singular_values[face] = sigma;
+        }
+    }
+}
+
 bool StrainLimiting::compute_svd(
     const Mat32& F,
-    Eigen::Matrix<Real, 3, 2>& U,
+    Mat32& U,
     Vec2& singular_values,
     Mat2& V
 ) {
-    Eigen::JacobiSVD<Mat32> svd(
-        F,
-        Eigen::ComputeFullU | Eigen::ComputeFullV
-    );
-
-    singular_values = svd.singularValues();
-    U = svd.matrixU().leftCols<2>();
-    V = svd.matrixV();
+    const Vec3 f0 = F.col(0);
+    const Vec3 f1 = F.col(1);
+
+    // FᵀF = [a b; b d] has eigenvalues λ = m ± r; the larger one's
+    // eigenvector is at angle θ with tan 2θ = 2b / (a − d)
+    const Real a = f0.squaredNorm();
+    const Real b = f0.dot(f1);
+    const Real d = f1.squaredNorm();
+    const Real half_diff = Real(0.5) * (a - d);
+    const Real m = Real(0.5) * (a + d);
+    const Real r = std::sqrt(half_diff * half_diff + b * b);
+
+    const Real theta = Real(0.5) * std::atan2(b, half_diff);
+    const Real c = std::cos(theta);
+    const Real s = std::sin(theta);
+    V << c, -s,
+         s,  c;
+
+    // σ₁σ₂ = |f0 × f1| is more accurate for σ₂ than √λ₂
+    Real sigma1 = std::sqrt(m + r);
+    Real sigma2 = sigma1 > kTinyValue
+        ? std::min(f0.cross(f1).norm() / sigma1, sigma1)
+        : Real(0.0);
+
+    Vec3 u0 = F * V.col(0);
+    Vec3 u1 = F * V.col(1);
+    u0 = sigma1 > kTinyValue ? Vec3(u0 / sigma1) : Vec3::UnitX();
+    u1 -= u0.dot(u1) * u0;
+    if (sigma2 > kTinyValue && u1.norm() > kTinyValue) {
+        u1.normalize();
+    } else {
+        // Rank ≤ 1: any unit vector orthogonal to u0
+        u1 = u0.cross(std::abs(u0.x()) < Real(0.9) ? Vec3::UnitX() : Vec3::UnitY()).normalized();
+    }
+    U.col(0) = u0;
+    U.col(1) = u1;
 
+    singular_values = Vec2(sigma1, sigma2);
     if (singular_values[0] < kDegenerateThreshold ||
         singular_values[1] < kDegenerateThreshold) {
         singular_values[0] = std::max(singular_values[0], kDegenerateThreshold);
@@ -49,44 +112,39 @@ bool StrainLimiting::compute_svd(
     return std::isfinite(singular_values[0]) && std::isfinite(singular_values[1]);
 }
 
+bool StrainLimiting::cached_svd(
+    const StrainSVDCache& cache,
+    Index face,
+    const Mat32& F,
+    Mat32& U,
+    Vec2& singular_values,
+    Mat2& V
+) {
+    if (static_cast<size_t>(face) < cache.filled.size() &&
+        cache.filled[face] && cache.F[face] == F) {
+        U = cache.U[face];
+        singular_values = cache.sigma[face];
+        V = cache.V[face];
+        return cache.ok[face] != 0;
+    }
+    return compute_svd(F, U, singular_values, V);
+}
+
 StrainLimiting::Mat99 StrainLimiting::extract_face_hessian_block(
     const SparseMatrix& H,
     const Triangle& tri
 ) {
-    Mat99 block = Mat99::Zero();
-    std::array<Index, 3> verts = {tri.v[0], tri.v[1], tri.v[2]};
-
-    std::array<Index, 3> row_lookup = verts;
-
-    for (int outer = 0; outer < H.outerSize(); ++outer) {
-        for (SparseMatrix::InnerIterator it(H, outer); it; ++it) {
-            Index global_row = it.row() / 3;
-            Index global_col = it.col() / 3;
-
-            int local_row = -1;
-            int local_col = -1;
+    // 81 direct lookups (binary search per column) instead of a sweep over H
+    Mat99 block;
+    for (int a = 0; a < 3; ++a) {
+        for (int b = 0; b < 3; ++b) {
             for (int i = 0; i < 3; ++i) {
-                if (row_lookup[i] == global_row) {
-                    local_row = i;
+                for (int j = 0; j < 3; ++j) {
+                    block(a * 3 + i, b * 3 + j) = H.coeff(tri.v[a] * 3 + i, tri.v[b] * 3 + j);
                 }
-                if (row_lookup[i] == global_col) {
-                    local_col = i;
-                }
-            }
-
-            if (local_row < 0 || local_col < 0) {
-                continue;
             }
-
-            int row_component = static_cast<int>(it.row() % 3);
-            int col_component = static_cast<int>(it.col() % 3);
-
-            int r = local_row * 3 + row_component;
-            int c = local_col * 3 + col_component;
-            block(r, c) += it.value();
         }
     }
-
     return block;
 }
 
@@ -132,8 +190,19 @@ void StrainLimiting::rebuild_constraints(
     }
 
     const Real min_gap = std::max(params.min_gap, Real(1e-8));
+    const int num_faces = static_cast<int>(mesh.num_triangles());
+
+    StrainSVDCache& cache = constraints.strain_svd_cache;
+    if (cache.F.size() != static_cast<size_t>(num_faces)) {
+        cache.resize(num_faces);
+    }
+
+    // Up to two constraints per face, compacted in face order afterwards
+    std::vector<StrainConstraint> candidates(2 * static_cast<size_t>(num_faces));
+    std::vector<char> is_candidate(2 * static_cast<size_t>(num_faces), 0);
 
-    for (size_t face = 0; face < mesh.num_triangles(); ++face) {
+    #pragma omp parallel for schedule(static) if(num_faces >= kParallelMinFaces)
+    for (int face = 0; face < num_faces; ++face) {
         const Triangle& tri = mesh.triangles[face];
         const Mat2& Dm_inv = mesh.Dm_inv[face];
 
@@ -148,10 +217,23 @@ void StrainLimiting::rebuild_constraints(
             Dm_inv
         );
 
-        Eigen::Matrix<Real, 3, 2> U;
-        Vec2 sigma;
-        Mat2 V;
-        if (!compute_svd(F, U, sigma, V)) {
+        // Refresh this face's cache entry unless F is unchanged
+        if (!cache.filled[face] || cache.F[face] != F) {
+            cache.F[face] = F;
+            cache.ok[face] = compute_svd(F, cache.U[face], cache.sigma[face], cache.V[face]);
+            cache.filled[face] = 1;
+        }
+        if (!cache.ok[face]) {
+            continue;
+        }
+        const Vec2& sigma = cache.sigma[face];
+
+        bool in_domain[2];
+        for (int s = 0; s < 2; ++s) {
+            Real gap = (Real(1.0) + tau + epsilon) - sigma[s];
+            in_domain[s] = Barrier::in_domain(gap, epsilon);
+        }
+        if (!in_domain[0] && !in_domain[1]) {
             continue;
         }
 
@@ -170,24 +252,29 @@ void StrainLimiting::rebuild_constraints(
         elastic_term = std::max(elastic_term, Real(0.0));
 
         for (int s = 0; s < 2; ++s) {
-            Real sigma_val = sigma[s];
-            Real gap = (Real(1.0) + tau + epsilon) - sigma_val;
-            if (!Barrier::in_domain(gap, epsilon)) {
+            if (!in_domain[s]) {
                 continue;
             }
+            Real sigma_val = sigma[s];
+            Real gap = (Real(1.0) + tau + epsilon) - sigma_val;
 
             Real gap_clamped = std::max(std::abs(gap), min_gap);
             Real inertial_term = face_mass / (gap_clamped * gap_clamped);
             Real stiffness = inertial_term + elastic_term;
 
-            StrainConstraint constraint;
+            StrainConstraint& constraint = candidates[2 * face + s];
             constraint.face_idx = static_cast<Index>(face);
             constraint.sigma = sigma_val;
             constraint.singular_index = s;
             constraint.stiffness = stiffness;
             constraint.active = true;
+            is_candidate[2 * face + s] = 1;
+        }
+    }
 
-            constraints.strain_limits.push_back(constraint);
+    for (size_t i = 0; i < candidates.size(); ++i) {
+        if (is_candidate[i]) {
+            constraints.strain_limits.push_back(candidates[i]);
         }
     }
 }
@@ -209,7 +296,13 @@ void StrainLimiting::accumulate_gradient(
         : tau;
     const Real svd_epsilon = std::max(params.strain_svd_epsilon, Real(1e-8));
 
-    for (const auto& constraint : constraints.strain_limits) {
+    const int num_limits = static_cast<int>(constraints.strain_limits.size());
+    std::vector<std::array<Vec3, 3>> face_gradients(num_limits);
+    std::vector<char> applies(num_limits, 0);
+
+    #pragma omp parallel for schedule(static) if(num_limits >= kParallelMinConstraints)
+    for (int c = 0; c < num_limits; ++c) {
+        const StrainConstraint& constraint = constraints.strain_limits[c];
         if (!constraint.active) {
             continue;
         }
@@ -230,16 +323,16 @@ void StrainLimiting::accumulate_gradient(
             Dm_inv
         );
 
-        Eigen::Matrix<Real, 3, 2> U;
+        Mat32 U;
         Vec2 sigma;
         Mat2 V;
-        if (!compute_svd(F, U, sigma, V)) {
+        if (!cached_svd(constraints.strain_svd_cache, face_idx, F, U, sigma, V)) {
             continue;
         }
 
         int idx = std::clamp(constraint.singular_index, 0, 1);
 
-        Eigen::Matrix<Real, 3, 2> dSigma_dF;
+        Mat32 dSigma_dF;
         if (std::abs(sigma[0] - sigma[1]) < svd_epsilon) {
             dSigma_dF = (U.col(0) * V.col(0).transpose() +
                          U.col(1) * V.col(1).transpose()) * Real(0.5);
@@ -262,12 +355,72 @@ void StrainLimiting::accumulate_gradient(
 
         Vec3 grad1 = mapped.col(0);
         Vec3 grad2 = mapped.col(1);
-        Vec3 grad0 = -(grad1 + grad2);
+        face_gradients[c] = {-(grad1 + grad2), grad1, grad2};
+        applies[c] = 1;
+    }
+
+    // Scatter in constraint order (faces share vertices)
+    for (int c = 0; c < num_limits; ++c) {
+        if (!applies[c]) {
+            continue;
+        }
+        const Triangle& tri = mesh.triangles[constraints.strain_limits[c].face_idx];
+        for (int k = 0; k < 3; ++k) {
+            gradient.segment<3>(tri.v[k] * 3) += face_gradients[c][k];
+        }
+    }
+}
+
+Real StrainLimiting::compute_energy(
+    const Mesh& mesh,
+    const State& state,
+    const Constraints& constraints,
+    const SimParams& params
+) {
+    if (!params.enable_strain_limiting || constraints.strain_limits.empty()) {
+        return Real(0.0);
+    }
+
+    Real tau = to_fraction(params.strain_tau);
+    Real epsilon = params.strain_epsilon > Real(0.0)
+        ? to_fraction(params.strain_epsilon)
+        : tau;
+
+    const int num_limits = static_cast<int>(constraints.strain_limits.size());
+    Real energy = 0.0;
+    #pragma omp parallel for schedule(static) reduction(+:energy) if(num_limits >= kParallelMinConstraints)
+    for (int c = 0; c < num_limits; ++c) {
+        const StrainConstraint& constraint = constraints.strain_limits[c];
+        if (!constraint.active) {
+            continue;
+        }
+
+        Index face_idx = constraint.face_idx;
+        if (face_idx < 0 ||
+            static_cast<size_t>(face_idx) >= mesh.num_triangles()) {
+            continue;
+        }
+
+        const Triangle& tri = mesh.triangles[face_idx];
+        Mat32 F = compute_deformation_gradient(
+            state.positions[tri.v[0]],
+            state.positions[tri.v[1]],
+            state.positions[tri.v[2]],
+            mesh.Dm_inv[face_idx]
+        );
 
-        gradient.segment<3>(tri.v[0] * 3) += grad0;
-        gradient.segment<3>(tri.v[1] * 3) += grad1;
-        gradient.segment<3>(tri.v[2] * 3) += grad2;
+        Mat32 U;
+        Vec2 sigma;
+        Mat2 V;
+        if (!cached_svd(constraints.strain_svd_cache, face_idx, F, U, sigma, V)) {
+            continue;
+        }
+
+        int idx = std::clamp(constraint.singular_index, 0, 1);
+        Real gap = (Real(1.0) + tau + epsilon) - sigma[idx];
+        energy += Barrier::compute_energy(gap, epsilon, constraint.stiffness);
     }
+    return energy;
 }
 
 void StrainLimiting::accumulate_hessian(
@@ -287,7 +440,14 @@ void StrainLimiting::accumulate_hessian(
         : tau;
     const Real svd_epsilon = std::max(params.strain_svd_epsilon, Real(1e-8));
 
-    for (const auto& constraint : constraints.strain_limits) {
+    // Per-constraint triplets, appended in constraint order afterwards
+    const int num_limits = static_cast<int>(constraints.strain_limits.size());
+    std::vector<std::array<Triplet, 81>> local(num_limits);
+    std::vector<int> counts(num_limits, 0);
+
+    #pragma omp parallel for schedule(static) if(num_limits >= kParallelMinConstraints)
+    for (int c = 0; c < num_limits; ++c) {
+        const StrainConstraint& constraint = constraints.strain_limits[c];
         if (!constraint.active) {
             continue;
         }
@@ -308,16 +468,16 @@ void StrainLimiting::accumulate_hessian(
             Dm_inv
         );
 
-        Eigen::Matrix<Real, 3, 2> U;
+        Mat32 U;
         Vec2 sigma;
         Mat2 V;
-        if (!compute_svd(F, U, sigma, V)) {
+        if (!cached_svd(constraints.strain_svd_cache, face_idx, F, U, sigma, V)) {
             continue;
         }
 
         int idx = std::clamp(constraint.singular_index, 0, 1);
 
-        Eigen::Matrix<Real, 3, 2> dSigma_dF;
+        Mat32 dSigma_dF;
         if (std::abs(sigma[0] - sigma[1]) < svd_epsilon) {
             dSigma_dF = (U.col(0) * V.col(0).transpose() +
                          U.col(1) * V.col(1).transpose()) * Real(0.5);
@@ -331,7 +491,7 @@ void StrainLimiting::accumulate_hessian(
         Vec3 dSigma_dx2 = dSigma_dX.col(1);
         Vec3 dSigma_dx0 = -(dSigma_dx1 + dSigma_dx2);
 
-        Eigen::Matrix<Real, 9, 1> J;
+        Vec9 J;
         J.segment<3>(0) = dSigma_dx0;
         J.segment<3>(3) = dSigma_dx1;
         J.segment<3>(6) = dSigma_dx2;
@@ -346,9 +506,10 @@ void StrainLimiting::accumulate_hessian(
             continue;
         }
 
-        Eigen::Matrix<Real, 9, 9> H_local = d2V * (J * J.transpose());
+        Mat99 H_local = d2V * (J * J.transpose());
 
         Index vertices[3] = {tri.v[0], tri.v[1], tri.v[2]};
+        int& count = counts[c];
 
         for (int a = 0; a < 3; ++a) {
             for (int b = 0; b < 3; ++b) {
@@ -366,12 +527,16 @@ void StrainLimiting::accumulate_hessian(
                         if (std::abs(value) < kTinyValue) {
                             continue;
                         }
-                        triplets.emplace_back(ia * 3 + i, ib * 3 + j, value);
+                        local[c][count++] = Triplet(ia * 3 + i, ib * 3 + j, value);
                     }
                 }
             }
         }
     }
+
+    for (int c = 0; c < num_limits; ++c) {
+        triplets.insert(triplets.end(), local[c].begin(), local[c].begin() + counts[c]);
+    }
 }
 
 } // namespace ando_barrier
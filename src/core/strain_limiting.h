@@ -6,7 +6,7 @@
 #include "constraints.h"
 
 #include <Eigen/Dense>
-#include <Eigen/SVD>
+#include <vector>
 
 namespace ando_barrier {
 
@@ -53,10 +53,45 @@ public:
         std::vector<Triplet>& triplets
     );
 
+    /**
+     * Barrier energy Σ Ψ_SL(σ) of the active strain constraints at the
+     * current positions (σ from the SVD cache while a face's F is unchanged).
+     */
+    static Real compute_energy(
+        const Mesh& mesh,
+        const State& state,
+        const Constraints& constraints,
+        const SimParams& params
+    );
+
+    /**
+     * Singular values (σ₁ ≥ σ₂) of every face's F = Ds·Dm⁻¹ at the current
+     * positions, whether or not strain limiting is enabled. Degenerate faces
+     * report (1, 1).
+     */
+    static void compute_face_singular_values(
+        const Mesh& mesh,
+        const State& state,
+        std::vector<Vec2>& singular_values
+    );
+
+    using Mat32 = Eigen::Matrix<Real, 3, 2>;
+
+    /**
+     * Closed-form thin SVD F = U Σ Vᵀ of a 3×2 deformation gradient from the
+     * 2×2 eigenproblem of FᵀF. Singular values are sorted (σ₁ ≥ σ₂) and
+     * clamped to at least 1e-6; returns false if they are not finite.
+     */
+    static bool compute_svd(
+        const Mat32& F,
+        Mat32& U,
+        Vec2& singular_values,
+        Mat2& V
+    );
+
 private:
     static constexpr Real kDegenerateThreshold = static_cast<Real>(1e-6);
 
-    using Mat32 = Eigen::Matrix<Real, 3, 2>;
     using Vec9 = Eigen::Matrix<Real, 9, 1>;
     using Mat99 = Eigen::Matrix<Real, 9, 9>;
 
@@ -67,9 +102,12 @@ private:
         const Mat2& Dm_inv
     );
 
-    static bool compute_svd(
+    // SVD of a face's F, taken from the cache while its F is unchanged
+    static bool cached_svd(
+        const StrainSVDCache& cache,
+        Index face,
         const Mat32& F,
-        Eigen::Matrix<Real, 3, 2>& U,
+        Mat32& U,
         Vec2& singular_values,
         Mat2& V
     );
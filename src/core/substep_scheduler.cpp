@@ -0,0 +1,159 @@
+#include "substep_scheduler.h"
+#include "adaptive_timestep.h"
+#include "integrator.h"
+#include "trace.h"
+#include <algorithm>
+
+namespace ando_barrier {
+
+namespace {
+
+// β below this means the step did not move the cloth (as in Integrator::step)
+constexpr Real kNoProgressBeta = 1e-6;
+
+// Floor under settings.dt_min so repeated shrinking always terminates
+constexpr Real kSmallestSubstep = 1e-7;
+
+// Rigid body motion undone when a substep is retried
+struct RigidSnapshot {
+    Vec3 position;
+    Mat3 rotation;
+    Vec3 linear_velocity;
+    Vec3 angular_velocity;
+};
+
+} // namespace
+
+SubstepScheduler::SubstepScheduler(Real initial_dt) : m_dt(initial_dt) {}
+
+void SubstepScheduler::set_dt(Real dt) {
+    m_dt = clamp_dt(dt);
+}
+
+Real SubstepScheduler::clamp_dt(Real dt) const {
+    const Real lower = std::max(settings.dt_min, kSmallestSubstep);
+    return std::clamp(dt, lower, std::max(lower, settings.dt_max));
+}
+
+Real SubstepScheduler::cfl_limit(const Mesh& mesh, const State& state) const {
+    Real max_velocity = 0.0;
+    Real min_edge = 0.0;
+    AdaptiveTimestep::compute_motion_statistics(mesh, state, max_velocity, min_edge);
+    if (max_velocity <= Real(1e-6)) {
+        return settings.dt_max;
+    }
+    return AdaptiveTimestep::compute_cfl_timestep(max_velocity, std::max(min_edge, Real(1e-5)),
+                                                  settings.cfl_safety);
+}
+
+int SubstepScheduler::adapt(const StepProfile& profile, const SimParams& params) {
+    const Real previous = m_dt;
+
+    const bool hard = profile.line_search_failures > 0 || profile.pcg_failures > 0 ||
+                      profile.final_beta < params.beta_max ||
+                      profile.beta_iterations >= settings.stall_beta_iterations;
+    if (hard) {
+        m_dt = clamp_dt(std::min(m_dt, params.dt) * settings.shrink_factor);
+        return m_dt < previous ? -1 : 0;
+    }
+
+    const int average_pcg = profile.pcg_solves > 0 ? profile.pcg_iterations / profile.pcg_solves : 0;
+    const bool easy = profile.beta_iterations <= 1 && profile.line_search_backtracks == 0 &&
+                      profile.newton_iterations <= settings.easy_newton_iterations &&
+                      average_pcg <= settings.easy_pcg_iterations;
+
+    // Only a full-size step says anything about a larger one
+    if (easy && params.dt >= m_dt) {
+        m_dt = clamp_dt(m_dt * settings.grow_factor);
+        return m_dt > previous ? 1 : 0;
+    }
+    return 0;
+}
+
+FrameReport SubstepScheduler::advance_frame(Mesh& mesh,
+                                            State& state,
+                                            Constraints& constraints,
+                                            const SimParams& params,
+                                            std::vector<RigidBody>* rigid_bodies,
+                                            Real frame_dt,
+                                            const Vec3& gravity) {
+    ANDO_TRACE_SCOPE("SubstepScheduler::advance_frame");
+    FrameReport report;
+    m_dt = clamp_dt(m_dt);
+
+    SimParams step_params = params;
+    std::vector<Vec3> saved_positions;
+    std::vector<Vec3> saved_velocities;
+    std::vector<RigidSnapshot> saved_rigid;
+
+    // Time in double so the frame closes exactly
+    double& elapsed = report.simulated;
+    bool done = frame_dt <= Real(0);
+    while (!done) {
+        Real dt = m_dt;
+        if (settings.cfl_safety > Real(0)) {
+            dt = clamp_dt(std::min(dt, cfl_limit(mesh, state)));
+        }
+
+        // Land on the frame boundary: take the rest when it fits, and split
+        // it in two instead of leaving a sliver for the last substep
+        const double remaining = static_cast<double>(frame_dt) - elapsed;
+        bool last = false;
+        if (dt >= remaining) {
+            dt = static_cast<Real>(remaining);
+            last = true;
+        } else if (dt > 0.5 * remaining) {
+            dt = static_cast<Real>(0.5 * remaining);
+        }
+
+        saved_positions = state.positions;
+        saved_velocities = state.velocities;
+        if (rigid_bodies) {
+            saved_rigid.clear();
+            for (const RigidBody& body : *rigid_bodies) {
+                saved_rigid.push_back({body.position(), body.rotation(),
+                                       body.linear_velocity(), body.angular_velocity()});
+            }
+        }
+
+        state.apply_gravity(gravity, dt);
+        step_params.dt = dt;
+        Integrator::step(mesh, state, constraints, step_params, rigid_bodies);
+        const StepProfile profile = Integrator::last_step_profile(constraints);
+
+        const int change = adapt(profile, step_params);
+        if (change < 0) {
+            report.shrunk++;
+        } else if (change > 0) {
+            report.grown++;
+        }
+
+        // No β progress: undo and retry while dt can still shrink
+        if (profile.final_beta <= kNoProgressBeta && m_dt < dt) {
+            state.positions = saved_positions;
+            state.velocities = saved_velocities;
+            if (rigid_bodies) {
+                for (size_t b = 0; b < rigid_bodies->size(); ++b) {
+                    RigidBody& body = (*rigid_bodies)[b];
+                    body.set_position(saved_rigid[b].position);
+                    body.set_rotation(saved_rigid[b].rotation);
+                    body.set_linear_velocity(saved_rigid[b].linear_velocity);
+                    body.set_angular_velocity(saved_rigid[b].angular_velocity);
+                }
+            }
+            report.rejected++;
+            continue;
+        }
+
+        report.min_dt = report.substeps == 0 ? dt : std::min(report.min_dt, dt);
+        report.max_dt = std::max(report.max_dt, dt);
+        report.substeps++;
+        report.profile.accumulate(profile);
+
+        elapsed += dt;
+        done = last;
+    }
+    return report;
+}
+
+} // namespace ando_barrier
@@ -0,0 +1,88 @@
+#pragma once
+
+#include "types.h"
+#include "mesh.h"
+#include "state.h"
+#include "constraints.h"
+#include "rigid_body.h"
+#include "step_profile.h"
+#include <vector>
+
+namespace ando_barrier {
+
+// Step size adaptation rules of SubstepScheduler
+struct SubstepSettings {
+    Real dt_min = 1e-4;               // Smallest substep (s)
+    Real dt_max = 0.01;               // Largest substep (s)
+    Real grow_factor = 1.25;          // dt ×= grow_factor after an easy step
+    Real shrink_factor = 0.5;         // dt ×= shrink_factor after a hard step
+    int easy_newton_iterations = 2;   // Easy: at most this many Newton iterations...
+    int easy_pcg_iterations = 50;     // ...and PCG iterations per solve on average
+    int stall_beta_iterations = 4;    // Hard: β needed this many iterations (or never reached β_max)
+    Real cfl_safety = 0.0;            // > 0: also cap dt by the CFL bound (AdaptiveTimestep)
+};
+
+// What one advance_frame() call did
+struct FrameReport {
+    int substeps = 0;                 // Accepted substeps
+    int rejected = 0;                 // Substeps retried with a smaller dt (no β progress)
+    int grown = 0;                    // Easy substeps that grew dt
+    int shrunk = 0;                   // Hard substeps that shrank dt
+    Real min_dt = 0.0;                // Smallest / largest accepted substep
+    Real max_dt = 0.0;
+    double simulated = 0.0;           // Sum of accepted substeps (the frame interval)
+    StepProfileSummary profile;       // Step profiles of the accepted substeps
+};
+
+/**
+ * Variable substepping within an output frame
+ *
+ * advance_frame() fills the frame interval with substeps whose size follows
+ * the solver: a step with one β iteration, no line-search backtracking,
+ * few Newton iterations and cheap PCG solves grows dt; a line-search
+ * failure, PCG failure or β stall shrinks it. A step that made no β
+ * progress at all is undone (positions, velocities and rigid body motion)
+ * and retried with the smaller dt. The last substeps are resized so the
+ * frame ends exactly on the interval, without changing the preferred dt
+ * carried into the next frame.
+ *
+ * Every substep applies gravity (State::apply_gravity) and then calls
+ * Integrator::step, like the fixed-step loops in the add-on and demos.
+ */
+class SubstepScheduler {
+public:
+    explicit SubstepScheduler(Real initial_dt = 0.002);
+
+    SubstepSettings settings;
+
+    /**
+     * Simulate one frame of length frame_dt
+     *
+     * @param params Step parameters; params.dt is replaced by the scheduled substep
+     * @param rigid_bodies Optional rigid colliders, stepped with the cloth
+     */
+    FrameReport advance_frame(Mesh& mesh,
+                              State& state,
+                              Constraints& constraints,
+                              const SimParams& params,
+                              std::vector<RigidBody>* rigid_bodies,
+                              Real frame_dt,
+                              const Vec3& gravity);
+
+    /**
+     * Adapt the preferred dt to the statistics of a step taken with params.dt
+     * @return +1 if dt grew, -1 if it shrank, 0 if unchanged
+     */
+    int adapt(const StepProfile& profile, const SimParams& params);
+
+    Real dt() const { return m_dt; }
+    void set_dt(Real dt);
+
+private:
+    Real clamp_dt(Real dt) const;
+    Real cfl_limit(const Mesh& mesh, const State& state) const;
+
+    Real m_dt;
+};
+
+} // namespace ando_barrier
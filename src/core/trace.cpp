@@ -0,0 +1,108 @@
+#include "trace.h"
+
+#include <cstdlib>
+#include <fstream>
+#include <iostream>
+#include <thread>
+
+namespace ando_barrier {
+
+namespace {
+
+// ANDO_TRACE=1 records in memory; any other non-"0" value is an output path.
+const char* trace_env() {
+    const char* env = std::getenv("ANDO_TRACE");
+    return (env && *env && std::string(env) != "0") ? env : nullptr;
+}
+
+uint32_t current_thread_id() {
+    static std::atomic<uint32_t> next_id{1};
+    thread_local uint32_t id = next_id.fetch_add(1, std::memory_order_relaxed);
+    return id;
+}
+
+} // namespace
+
+std::atomic<bool> TraceRecorder::s_enabled{trace_env() != nullptr};
+
+TraceRecorder& TraceRecorder::instance() {
+    static TraceRecorder recorder;
+    return recorder;
+}
+
+TraceRecorder::TraceRecorder() : m_epoch(std::chrono::steady_clock::now()) {
+    const char* env = trace_env();
+    if (env && std::string(env) != "1") {
+        m_exit_path = env;
+    }
+}
+
+TraceRecorder::~TraceRecorder() {
+    if (!m_exit_path.empty() && !m_events.empty()) {
+        write_chrome_trace(m_exit_path);
+    }
+}
+
+void TraceRecorder::set_enabled(bool enabled) {
+    s_enabled.store(enabled, std::memory_order_relaxed);
+}
+
+void TraceRecorder::record(const char* name, std::chrono::steady_clock::time_point start,
+                           std::chrono::steady_clock::time_point end) {
+    using std::chrono::duration_cast;
+    using std::chrono::microseconds;
+
+    Event event;
+    event.name = name;
+    event.start_us = duration_cast<microseconds>(start - m_epoch).count();
+    event.duration_us = duration_cast<microseconds>(end - start).count();
+    event.thread_id = current_thread_id();
+
+    std::lock_guard<std::mutex> lock(m_mutex);
+    if (m_events.size() >= kMaxEvents) {
+        ++m_dropped;
+        return;
+    }
+    m_events.push_back(event);
+}
+
+void TraceRecorder::clear() {
+    std::lock_guard<std::mutex> lock(m_mutex);
+    m_events.clear();
+    m_dropped = 0;
+}
+
+size_t TraceRecorder::event_count() const {
+    std::lock_guard<std::mutex> lock(m_mutex);
+    return m_events.size();
+}
+
+size_t TraceRecorder::dropped_events() const {
+    std::lock_guard<std::mutex> lock(m_mutex);
+    return m_dropped;
+}
+
+bool TraceRecorder::write_chrome_trace(const std::string& path) const {
+    std::ofstream out(path);
+    if (!out) {
+        std::cerr << "Trace: cannot open " << path << " for writing" << std::endl;
+        return false;
+    }
+
+    std::lock_guard<std::mutex> lock(m_mutex);
+    out << "{\"displayTimeUnit\":\"ms\",\"otherData\":{\"dropped_events\":" << m_dropped
+        << "},\"traceEvents\":[\n";
+    out << "{\"name\":\"process_name\",\"ph\":\"M\",\"pid\":1,\"tid\":0,"
+           "\"args\":{\"name\":\"ando_barrier_core\"}}";
+    for (const Event& e : m_events) {
+        // Scope labels are fixed identifiers in the core, so no JSON escaping is needed.
+        out << ",\n{\"name\":\"" << e.name << "\",\"cat\":\"ando\",\"ph\":\"X\",\"pid\":1"
+            << ",\"tid\":" << e.thread_id
+            << ",\"ts\":" << e.start_us
+            << ",\"dur\":" << e.duration_us << "}";
+    }
+    out << "\n]}\n";
+    return static_cast<bool>(out);
+}
+
+} // namespace ando_barrier
@@ -0,0 +1,114 @@
+#pragma once
+
+#include <atomic>
+#include <chrono>
+#include <cstdint>
+#include <mutex>
+#include <string>
+#include <vector>
+
+namespace ando_barrier {
+
+/**
+ * Timeline recorder producing Chrome trace / Perfetto JSON
+ *
+ * Scopes instrumented with ANDO_TRACE_SCOPE record one complete ("X")
+ * event each while recording is enabled. When disabled a scope costs a
+ * single relaxed atomic load.
+ *
+ * Recording is enabled by set_enabled(), by the ANDO_TRACE environment
+ * variable, or for the steps run with SimParams::enable_trace. If ANDO_TRACE names a file (anything
+ * other than "1"), the trace is written there when the process exits.
+ */
+class TraceRecorder {
+public:
+    struct Event {
+        const char* name;       // Static string (scope label)
+        int64_t start_us;       // Relative to recorder epoch
+        int64_t duration_us;
+        uint32_t thread_id;
+    };
+
+    static TraceRecorder& instance();
+
+    static bool enabled() { return s_enabled.load(std::memory_order_relaxed); }
+    void set_enabled(bool enabled);
+
+    void record(const char* name, std::chrono::steady_clock::time_point start,
+                std::chrono::steady_clock::time_point end);
+
+    void clear();
+    size_t event_count() const;
+    size_t dropped_events() const;
+
+    /**
+     * Write recorded events as Chrome trace JSON (chrome://tracing, ui.perfetto.dev)
+     *
+     * @param path Output file
+     * @return true on success
+     */
+    bool write_chrome_trace(const std::string& path) const;
+
+    ~TraceRecorder();
+
+private:
+    TraceRecorder();
+
+    static std::atomic<bool> s_enabled;
+    static constexpr size_t kMaxEvents = 4000000;  // ~100 MB cap on long bakes
+
+    std::chrono::steady_clock::time_point m_epoch;
+    mutable std::mutex m_mutex;
+    std::vector<Event> m_events;
+    size_t m_dropped = 0;
+    std::string m_exit_path;
+};
+
+// RAII scope that records an event on destruction when tracing is enabled.
+class TraceScope {
+public:
+    explicit TraceScope(const char* name)
+        : m_name(TraceRecorder::enabled() ? name : nullptr) {
+        if (m_name) m_start = std::chrono::steady_clock::now();
+    }
+
+    ~TraceScope() {
+        if (m_name) {
+            TraceRecorder::instance().record(m_name, m_start, std::chrono::steady_clock::now());
+        }
+    }
+
+    TraceScope(const TraceScope&) = delete;
+    TraceScope& operator=(const TraceScope&) = delete;
+
+private:
+    const char* m_name;
+    std::chrono::steady_clock::time_point m_start;
+};
+
+// RAII switch that turns recording on for its lifetime (if requested) and
+// restores the previous state on destruction.
+class TraceEnableScope {
+public:
+    explicit TraceEnableScope(bool enable)
+        : m_restore(enable && !TraceRecorder::enabled()) {
+        if (m_restore) TraceRecorder::instance().set_enabled(true);
+    }
+
+    ~TraceEnableScope() {
+        if (m_restore) TraceRecorder::instance().set_enabled(false);
+    }
+
+    TraceEnableScope(const TraceEnableScope&) = delete;
+    TraceEnableScope& operator=(const TraceEnableScope&) = delete;
+
+private:
+    bool m_restore;
+};
+
+} // namespace ando_barrier
+
+#define ANDO_TRACE_CONCAT_INNER(a, b) a##b
+#define ANDO_TRACE_CONCAT(a, b) ANDO_TRACE_CONCAT_INNER(a, b)
+#define ANDO_TRACE_SCOPE(name) \
+    ::ando_barrier::TraceScope ANDO_TRACE_CONCAT(ando_trace_scope_, __LINE__)(name)
@@ -70,18 +70,27 @@ struct SimParams {
     Real pcg_tol = 1e-3;            // Relative L∞ tolerance
     int pcg_max_iters = 1000;
 
+    // Line search
+    bool line_search_toi = false;       // α = safety · min TOI instead of geometric backtracking
+    Real line_search_toi_safety = 0.9;  // Fraction of the TOI bound taken
+
     // Contact parameters
     Real contact_gap_max = 0.001;   // ḡ = 1 mm default
     Real wall_gap = 0.001;          // g_wall for walls
     bool enable_ccd = true;
     Real contact_normal_epsilon = 1e-8; // Normal normalization guard
     Real barrier_tolerance = 1e-12;      // Triplet drop tolerance
+    bool enable_contact_cache = false;   // Carry contacts and k̄ across steps (contact_cache.h)
+    Real contact_cache_margin = 0.002;   // Vertex motion allowed before full re-detection
+    bool adaptive_contact_detection = false; // Detect within ḡ + 2·margin, re-detect inside the β loop
+    Real contact_redetect_margin = 0.001;    // Vertex motion allowed before re-detecting in a step
 
     // Friction (optional)
     bool enable_friction = false;
     Real friction_mu = 0.1;
     Real friction_epsilon = 1e-5;   // 0.01 mm
     Real friction_tangent_threshold = 1e-6;
+    bool friction_lagged = false;   // Freeze n, |F_n| and k_f per β iteration (no Newton floor)
 
     // Global damping and restitution controls
     Real velocity_damping = 0.0;     // Fraction of velocity removed each step
@@ -97,6 +106,9 @@ struct SimParams {
     // Numerical safeguards
     Real hessian_epsilon = 1e-8;    // For SPD enforcement
     Real min_gap = 1e-8;            // Minimum gap for numerical stability
+
+    // Instrumentation
+    bool enable_trace = false;      // Record Chrome trace events of steps with this set (see trace.h)
 };
 
 // Version info
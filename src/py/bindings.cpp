@@ -12,18 +12,81 @@
 #include "state.h"
 #include "constraints.h"
 #include "elasticity.h"
+#include "strain_limiting.h"
 #include "barrier.h"
 #include "stiffness.h"
 #include "integrator.h"
 #include "collision.h"
 #include "energy_tracker.h"
 #include "collision_validator.h"
+#include "diagnostics.h"
 #include "adaptive_timestep.h"
+#include "substep_scheduler.h"
 #include "rigid_body.h"
+#include "trace.h"
 
 namespace py = pybind11;
 using namespace ando_barrier;
 
+namespace {
+
+// Flatten a StepProfile into a dict; `scale` turns totals into per-step means.
+py::dict step_profile_to_dict(const StepProfile& p, double scale = 1.0) {
+    py::dict d;
+    d["prediction_ms"] = p.prediction_ms * scale;
+    d["collision_ms"] = p.collision_ms * scale;
+    d["gradient_ms"] = p.gradient_ms * scale;
+    d["assembly_ms"] = p.assembly_ms * scale;
+    d["pcg_ms"] = p.pcg_ms * scale;
+    d["line_search_ms"] = p.line_search_ms * scale;
+    d["velocity_update_ms"] = p.velocity_update_ms * scale;
+    d["coupling_ms"] = p.coupling_ms * scale;
+    d["total_ms"] = p.total_ms * scale;
+    if (scale == 1.0) {
+        d["beta_iterations"] = p.beta_iterations;
+        d["newton_iterations"] = p.newton_iterations;
+        d["pcg_solves"] = p.pcg_solves;
+        d["pcg_iterations"] = p.pcg_iterations;
+        d["pcg_failures"] = p.pcg_failures;
+        d["line_search_calls"] = p.line_search_calls;
+        d["line_search_backtracks"] = p.line_search_backtracks;
+        d["line_search_failures"] = p.line_search_failures;
+        d["line_search_sweeps"] = p.line_search_sweeps;
+        d["line_search_sweeps_saved"] = p.line_search_sweeps_saved;
+        d["ccd_calls"] = p.ccd_calls;
+        d["num_contacts"] = p.num_contacts;
+        d["contact_redetections"] = p.contact_redetections;
+        d["contact_cache_hits"] = p.contact_cache_hits;
+        d["contact_cache_misses"] = p.contact_cache_misses;
+        d["contact_cache_rebuilds"] = p.contact_cache_rebuilds;
+        d["active_wall_vertices"] = p.active_wall_vertices;
+    } else {
+        d["beta_iterations"] = p.beta_iterations * scale;
+        d["newton_iterations"] = p.newton_iterations * scale;
+        d["pcg_solves"] = p.pcg_solves * scale;
+        d["pcg_iterations"] = p.pcg_iterations * scale;
+        d["pcg_failures"] = p.pcg_failures * scale;
+        d["line_search_calls"] = p.line_search_calls * scale;
+        d["line_search_backtracks"] = p.line_search_backtracks * scale;
+        d["line_search_failures"] = p.line_search_failures * scale;
+        d["line_search_sweeps"] = p.line_search_sweeps * scale;
+        d["line_search_sweeps_saved"] = p.line_search_sweeps_saved * scale;
+        d["ccd_calls"] = p.ccd_calls * scale;
+        d["num_contacts"] = p.num_contacts * scale;
+        d["contact_redetections"] = p.contact_redetections * scale;
+        d["contact_cache_hits"] = p.contact_cache_hits * scale;
+        d["contact_cache_misses"] = p.contact_cache_misses * scale;
+        d["contact_cache_rebuilds"] = p.contact_cache_rebuilds * scale;
+        d["active_wall_vertices"] = p.active_wall_vertices * scale;
+    }
+    d["pcg_residual"] = p.pcg_residual * scale;
+    d["pcg_max_residual"] = p.pcg_max_residual;
+    d["final_beta"] = p.final_beta * scale;
+    return d;
+}
+
+} // namespace
+
 PYBIND11_MODULE(ando_barrier_core, m) {
     m.doc() = "Ando 2024 Cubic Barrier with Elasticity-Inclusive Dynamic Stiffness";
     
@@ -74,17 +137,25 @@ PYBIND11_MODULE(ando_barrier_core, m) {
         .def_readwrite("max_newton_steps", &SimParams::max_newton_steps)
         .def_readwrite("pcg_tol", &SimParams::pcg_tol)
         .def_readwrite("pcg_max_iters", &SimParams::pcg_max_iters)
+        .def_readwrite("line_search_toi", &SimParams::line_search_toi)
+        .def_readwrite("line_search_toi_safety", &SimParams::line_search_toi_safety)
         .def_readwrite("contact_gap_max", &SimParams::contact_gap_max)
         .def_readwrite("wall_gap", &SimParams::wall_gap)
+        .def_readwrite("enable_contact_cache", &SimParams::enable_contact_cache)
+        .def_readwrite("contact_cache_margin", &SimParams::contact_cache_margin)
+        .def_readwrite("adaptive_contact_detection", &SimParams::adaptive_contact_detection)
+        .def_readwrite("contact_redetect_margin", &SimParams::contact_redetect_margin)
         .def_readwrite("enable_ccd", &SimParams::enable_ccd)
         .def_readwrite("enable_friction", &SimParams::enable_friction)
         .def_readwrite("friction_mu", &SimParams::friction_mu)
         .def_readwrite("friction_epsilon", &SimParams::friction_epsilon)
+        .def_readwrite("friction_lagged", &SimParams::friction_lagged)
         .def_readwrite("velocity_damping", &SimParams::velocity_damping)
         .def_readwrite("contact_restitution", &SimParams::contact_restitution)
         .def_readwrite("enable_strain_limiting", &SimParams::enable_strain_limiting)
         .def_readwrite("strain_limit", &SimParams::strain_limit)
-        .def_readwrite("strain_tau", &SimParams::strain_tau);
+        .def_readwrite("strain_tau", &SimParams::strain_tau)
+        .def_readwrite("enable_trace", &SimParams::enable_trace);
     
     // Triangle class
     py::class_<Triangle>(m, "Triangle")
@@ -153,6 +224,17 @@ PYBIND11_MODULE(ando_barrier_core, m) {
            "Initialize mesh from array-like vertex and triangle data")
         .def("num_vertices", &Mesh::num_vertices)
         .def("num_triangles", &Mesh::num_triangles)
+        .def("get_triangles", [](const Mesh& mesh) {
+            py::array_t<int32_t> result({mesh.num_triangles(), size_t(3)});
+            auto r = result.mutable_unchecked<2>();
+            for (size_t i = 0; i < mesh.num_triangles(); ++i) {
+                r(i, 0) = mesh.triangles[i].v[0];
+                r(i, 1) = mesh.triangles[i].v[1];
+                r(i, 2) = mesh.triangles[i].v[2];
+            }
+            return result;
+        }, "Triangle vertex indices, shape (M, 3)")
+        .def_readwrite("material", &Mesh::material)
         .def("get_vertices", [](const Mesh& mesh) {
             py::array_t<Real> result({mesh.num_vertices(), size_t(3)});
             auto r = result.mutable_unchecked<2>();
@@ -292,11 +374,7 @@ PYBIND11_MODULE(ando_barrier_core, m) {
             }
 
             auto g = gravity.unchecked<1>();
-            Vec3 grav(g(0), g(1), g(2));
-            for (size_t i = 0; i < state.num_vertices(); ++i) {
-                state.velocities[i] += grav * dt;
-                state.positions[i] += state.velocities[i] * dt;
-            }
+            state.apply_gravity(Vec3(g(0), g(1), g(2)), dt);
         }, "Apply gravity acceleration to all vertices");
     
     // Constraints class
@@ -319,6 +397,18 @@ PYBIND11_MODULE(ando_barrier_core, m) {
             c.add_wall(Vec3(n(0), n(1), n(2)), offset, gap);
         }, py::arg("normal"), py::arg("offset"), py::arg("gap"))
         .def("num_active_pins", &Constraints::num_active_pins)
+        .def("contact_cache_stats", [](const Constraints& c) {
+            const ContactCacheStats& t = c.contact_cache.totals();
+            py::dict d;
+            d["hits"] = t.hits;
+            d["misses"] = t.misses;
+            d["full_detections"] = t.full_detections;
+            d["revalidations"] = t.revalidations;
+            d["candidates"] = c.contact_cache.num_candidates();
+            return d;
+        }, "Running contact cache totals (enable with SimParams.enable_contact_cache)")
+        .def("clear_contact_cache", [](Constraints& c) { c.contact_cache.clear(); },
+             "Drop cached contacts, e.g. after teleporting vertices")
         .def("num_active_contacts", [](const Constraints& c) {
             return c.num_active_contacts() + c.num_active_walls();
         })
@@ -374,7 +464,9 @@ PYBIND11_MODULE(ando_barrier_core, m) {
         .def_property_readonly("gap", [](const ContactPair& c) { return c.gap; })
         .def_property_readonly("normal", [](const ContactPair& c) { return c.normal; })
         .def_property_readonly("witness_p", [](const ContactPair& c) { return c.witness_p; })
-        .def_property_readonly("witness_q", [](const ContactPair& c) { return c.witness_q; });
+        .def_property_readonly("witness_q", [](const ContactPair& c) { return c.witness_q; })
+        .def_property_readonly("stiffness", [](const ContactPair& c) { return c.stiffness; },
+                               "Barrier stiffness k̄ of the step (negative when not evaluated)");
 
     py::class_<RigidBody>(m, "RigidBody")
         .def(py::init<>())
@@ -403,17 +495,49 @@ PYBIND11_MODULE(ando_barrier_core, m) {
             [](const RigidBody& body) { return std::vector<Real>{body.linear_velocity()[0], body.linear_velocity()[1], body.linear_velocity()[2]}; },
             [](RigidBody& body, const std::vector<Real>& v) { body.set_linear_velocity(Vec3(v[0], v[1], v[2])); })
         .def_property_readonly("mass", &RigidBody::mass)
-        .def("world_vertices", [](const RigidBody& body) {
-            auto verts = body.world_vertices();
-            py::array_t<Real> result({verts.size(), size_t(3)});
+        .def_property("rotation",
+            [](const RigidBody& body) {
+                py::array_t<Real> result({size_t(3), size_t(3)});
+                auto r = result.mutable_unchecked<2>();
+                for (int i = 0; i < 3; ++i) {
+                    for (int j = 0; j < 3; ++j) {
+                        r(i, j) = body.rotation()(i, j);
+                    }
+                }
+                return result;
+            },
+            [](RigidBody& body, py::array_t<Real> rotation) {
+                auto r = rotation.unchecked<2>();
+                Mat3 R;
+                for (int i = 0; i < 3; ++i) {
+                    for (int j = 0; j < 3; ++j) {
+                        R(i, j) = r(i, j);
+                    }
+                }
+                body.set_rotation(R);
+            })
+        .def("transform", [](const RigidBody& body) {
+            const Mat3& R = body.rotation();
+            const Vec3 t = body.rest_to_world_translation();
+            py::array_t<Real> result({size_t(4), size_t(4)});
             auto r = result.mutable_unchecked<2>();
-            for (size_t i = 0; i < verts.size(); ++i) {
-                r(i, 0) = verts[i][0];
-                r(i, 1) = verts[i][1];
-                r(i, 2) = verts[i][2];
+            for (int i = 0; i < 4; ++i) {
+                for (int j = 0; j < 4; ++j) {
+                    r(i, j) = i < 3 ? (j < 3 ? R(i, j) : t[i]) : (j < 3 ? Real(0) : Real(1));
+                }
             }
             return result;
-        })
+        }, "4x4 matrix mapping the vertices given to initialize() to their current world positions")
+        .def("world_vertices", [](py::object self) {
+            // Read-only view of the body's cached buffer, kept alive by the body
+            const std::vector<Vec3>& verts = self.cast<const RigidBody&>().world_vertices();
+            py::array_t<Real> result({verts.size(), size_t(3)},
+                                     {sizeof(Vec3), sizeof(Real)},
+                                     verts.empty() ? nullptr : verts.front().data(),
+                                     self);
+            result.attr("setflags")(py::arg("write") = false);
+            return result;
+        }, "World-space vertices (N, 3) as a zero-copy view, refreshed by each call after the body moves")
         .def("apply_impulse", &RigidBody::apply_impulse)
         .def("integrate", &RigidBody::integrate);
     
@@ -464,6 +588,80 @@ PYBIND11_MODULE(ando_barrier_core, m) {
         "Create mesh from numpy arrays (vertices Nx3, triangles Mx3)");
     
     // Integrator class (static methods for simulation)
+    // Step profiling
+    py::class_<StepProfile>(m, "StepProfile")
+        .def(py::init<>())
+        .def_readonly("prediction_ms", &StepProfile::prediction_ms)
+        .def_readonly("collision_ms", &StepProfile::collision_ms)
+        .def_readonly("gradient_ms", &StepProfile::gradient_ms)
+        .def_readonly("assembly_ms", &StepProfile::assembly_ms)
+        .def_readonly("pcg_ms", &StepProfile::pcg_ms)
+        .def_readonly("line_search_ms", &StepProfile::line_search_ms)
+        .def_readonly("velocity_update_ms", &StepProfile::velocity_update_ms)
+        .def_readonly("coupling_ms", &StepProfile::coupling_ms)
+        .def_readonly("total_ms", &StepProfile::total_ms)
+        .def_readonly("beta_iterations", &StepProfile::beta_iterations)
+        .def_readonly("newton_iterations", &StepProfile::newton_iterations)
+        .def_readonly("pcg_solves", &StepProfile::pcg_solves)
+        .def_readonly("pcg_iterations", &StepProfile::pcg_iterations)
+        .def_readonly("pcg_failures", &StepProfile::pcg_failures)
+        .def_readonly("pcg_residual", &StepProfile::pcg_residual)
+        .def_readonly("pcg_max_residual", &StepProfile::pcg_max_residual)
+        .def_readonly("line_search_calls", &StepProfile::line_search_calls)
+        .def_readonly("line_search_backtracks", &StepProfile::line_search_backtracks)
+        .def_readonly("line_search_failures", &StepProfile::line_search_failures)
+        .def_readonly("line_search_sweeps", &StepProfile::line_search_sweeps)
+        .def_readonly("line_search_sweeps_saved", &StepProfile::line_search_sweeps_saved)
+        .def_readonly("ccd_calls", &StepProfile::ccd_calls)
+        .def_readonly("num_contacts", &StepProfile::num_contacts)
+        .def_readonly("contact_redetections", &StepProfile::contact_redetections)
+        .def_readonly("contact_cache_hits", &StepProfile::contact_cache_hits)
+        .def_readonly("contact_cache_misses", &StepProfile::contact_cache_misses)
+        .def_readonly("contact_cache_rebuilds", &StepProfile::contact_cache_rebuilds)
+        .def_readonly("active_wall_vertices", &StepProfile::active_wall_vertices)
+        .def_readonly("final_beta", &StepProfile::final_beta)
+        .def("to_dict", [](const StepProfile& p) { return step_profile_to_dict(p); },
+             "Return all fields as a dict");
+
+    py::class_<StepProfileSummary>(m, "StepProfileSummary")
+        .def(py::init<>())
+        .def_readonly("steps", &StepProfileSummary::steps)
+        .def_readonly("totals", &StepProfileSummary::totals)
+        .def_readonly("peak", &StepProfileSummary::peak)
+        .def("accumulate", &StepProfileSummary::accumulate, py::arg("profile"))
+        .def("merge", &StepProfileSummary::merge, py::arg("other"))
+        .def("reset", &StepProfileSummary::reset)
+        .def("mean", [](const StepProfileSummary& s) {
+                return step_profile_to_dict(s.totals, s.steps > 0 ? 1.0 / s.steps : 0.0);
+            },
+            "Per-step averages as a dict (pcg_max_residual stays the worst value)")
+        .def("to_dict", [](const StepProfileSummary& s) {
+                py::dict d;
+                d["steps"] = s.steps;
+                d["totals"] = step_profile_to_dict(s.totals);
+                d["peak"] = step_profile_to_dict(s.peak);
+                d["mean"] = step_profile_to_dict(s.totals, s.steps > 0 ? 1.0 / s.steps : 0.0);
+                return d;
+            },
+            "Return steps, totals, peak and mean as nested dicts");
+
+    // Chrome trace / Perfetto timeline recorder
+    py::class_<TraceRecorder, std::unique_ptr<TraceRecorder, py::nodelete>>(m, "TraceRecorder")
+        .def_static("enable", []() { TraceRecorder::instance().set_enabled(true); },
+                    "Start recording trace events")
+        .def_static("disable", []() { TraceRecorder::instance().set_enabled(false); },
+                    "Stop recording trace events (recorded events are kept)")
+        .def_static("is_enabled", &TraceRecorder::enabled)
+        .def_static("clear", []() { TraceRecorder::instance().clear(); },
+                    "Discard recorded events")
+        .def_static("event_count", []() { return TraceRecorder::instance().event_count(); })
+        .def_static("dropped_events", []() { return TraceRecorder::instance().dropped_events(); })
+        .def_static("write", [](const std::string& path) {
+                return TraceRecorder::instance().write_chrome_trace(path);
+            },
+            py::arg("path"),
+            "Write recorded events as Chrome trace JSON (chrome://tracing or ui.perfetto.dev)");
+
     py::class_<Integrator>(m, "Integrator")
         .def(py::init<>())
         .def_static("step",
@@ -506,14 +704,91 @@ PYBIND11_MODULE(ando_barrier_core, m) {
                 return Integrator::compute_contacts(mesh, state, &storage);
             },
             py::arg("mesh"), py::arg("state"), py::arg("rigid_bodies") = py::none(),
-            "Detect all collision contacts for the current mesh/state");
+            "Detect all collision contacts for the current mesh/state")
+        .def_static("last_step_profile", &Integrator::last_step_profile,
+            py::arg("constraints"),
+            "Phase timings and solver counters of the most recent step with these constraints")
+        .def_static("profile_summary", &Integrator::profile_summary,
+            py::arg("constraints"),
+            "Accumulated step profile of the steps with these constraints since the last reset")
+        .def_static("reset_profile_summary", &Integrator::reset_profile_summary,
+            py::arg("constraints"),
+            "Clear the accumulated step profile of these constraints");
     
+    // Variable substepping within a frame
+    py::class_<SubstepSettings>(m, "SubstepSettings")
+        .def(py::init<>())
+        .def_readwrite("dt_min", &SubstepSettings::dt_min)
+        .def_readwrite("dt_max", &SubstepSettings::dt_max)
+        .def_readwrite("grow_factor", &SubstepSettings::grow_factor)
+        .def_readwrite("shrink_factor", &SubstepSettings::shrink_factor)
+        .def_readwrite("easy_newton_iterations", &SubstepSettings::easy_newton_iterations)
+        .def_readwrite("easy_pcg_iterations", &SubstepSettings::easy_pcg_iterations)
+        .def_readwrite("stall_beta_iterations", &SubstepSettings::stall_beta_iterations)
+        .def_readwrite("cfl_safety", &SubstepSettings::cfl_safety);
+
+    py::class_<FrameReport>(m, "FrameReport")
+        .def(py::init<>())
+        .def_readonly("substeps", &FrameReport::substeps)
+        .def_readonly("rejected", &FrameReport::rejected)
+        .def_readonly("grown", &FrameReport::grown)
+        .def_readonly("shrunk", &FrameReport::shrunk)
+        .def_readonly("min_dt", &FrameReport::min_dt)
+        .def_readonly("max_dt", &FrameReport::max_dt)
+        .def_readonly("simulated", &FrameReport::simulated)
+        .def_readonly("profile", &FrameReport::profile);
+
+    py::class_<SubstepScheduler>(m, "SubstepScheduler")
+        .def(py::init<Real>(), py::arg("initial_dt") = 0.002)
+        .def_readwrite("settings", &SubstepScheduler::settings)
+        .def_property("dt", &SubstepScheduler::dt, &SubstepScheduler::set_dt,
+            "Preferred substep size carried into the next frame (s)")
+        .def("adapt", &SubstepScheduler::adapt, py::arg("profile"), py::arg("params"),
+            "Grow or shrink dt from the profile of a step taken with params.dt")
+        .def("advance_frame",
+            [](SubstepScheduler& scheduler, Mesh& mesh, State& state, Constraints& constraints,
+               const SimParams& params, Real frame_dt, py::object gravity_obj, py::object rigid_list) {
+                auto gravity = py::array_t<Real, py::array::forcecast>::ensure(gravity_obj);
+                if (!gravity || gravity.ndim() != 1 || gravity.shape(0) != 3) {
+                    throw py::value_error("Gravity must be a 3D vector");
+                }
+                auto g = gravity.unchecked<1>();
+                const Vec3 grav(g(0), g(1), g(2));
+
+                if (rigid_list.is_none()) {
+                    return scheduler.advance_frame(mesh, state, constraints, params, nullptr,
+                                                   frame_dt, grav);
+                }
+
+                std::vector<RigidBody*> handles;
+                std::vector<RigidBody> storage;
+                handles.reserve(py::len(rigid_list));
+                storage.reserve(py::len(rigid_list));
+                for (auto item : rigid_list) {
+                    RigidBody& body = item.cast<RigidBody&>();
+                    handles.push_back(&body);
+                    storage.push_back(body);
+                }
+
+                FrameReport report = scheduler.advance_frame(mesh, state, constraints, params,
+                                                             &storage, frame_dt, grav);
+                for (size_t i = 0; i < handles.size(); ++i) {
+                    *handles[i] = storage[i];
+                }
+                return report;
+            },
+            py::arg("mesh"), py::arg("state"), py::arg("constraints"), py::arg("params"),
+            py::arg("frame_dt"), py::arg("gravity"), py::arg("rigid_bodies") = py::none(),
+            "Fill frame_dt with variable substeps (gravity + Integrator.step each)");
+
     // EnergyDiagnostics struct
     py::class_<EnergyDiagnostics>(m, "EnergyDiagnostics")
         .def(py::init<>())
         .def_readonly("kinetic_energy", &EnergyDiagnostics::kinetic_energy)
         .def_readonly("elastic_energy", &EnergyDiagnostics::elastic_energy)
         .def_readonly("barrier_energy", &EnergyDiagnostics::barrier_energy)
+        .def_readonly("strain_limit_energy", &EnergyDiagnostics::strain_limit_energy)
+        .def_readonly("friction_energy", &EnergyDiagnostics::friction_energy)
         .def_readonly("total_energy", &EnergyDiagnostics::total_energy)
         .def_readonly("energy_drift_percent", &EnergyDiagnostics::energy_drift_percent)
         .def_readonly("energy_drift_absolute", &EnergyDiagnostics::energy_drift_absolute)
@@ -531,9 +806,18 @@ PYBIND11_MODULE(ando_barrier_core, m) {
     // EnergyTracker class
     py::class_<EnergyTracker>(m, "EnergyTracker")
         .def(py::init<>())
-        .def_static("compute", &EnergyTracker::compute,
+        .def_static("compute",
+            [](const Mesh& mesh, const State& state, const Constraints& constraints,
+               const SimParams& params, py::object contacts) {
+                if (contacts.is_none()) {
+                    return EnergyTracker::compute(mesh, state, constraints, params);
+                }
+                const auto pairs = contacts.cast<std::vector<ContactPair>>();
+                return EnergyTracker::compute(mesh, state, constraints, params, &pairs);
+            },
             py::arg("mesh"), py::arg("state"), py::arg("constraints"), py::arg("params"),
-            "Compute comprehensive energy diagnostics")
+            py::arg("contacts") = py::none(),
+            "Compute comprehensive energy diagnostics (contact terms from the given contacts or the last step's)")
         .def_static("compute_kinetic_energy", &EnergyTracker::compute_kinetic_energy,
             "Compute kinetic energy")
         .def_static("compute_linear_momentum", 
@@ -594,9 +878,121 @@ PYBIND11_MODULE(ando_barrier_core, m) {
             },
             "Get maximum penetration depth");
     
+    // Fused post-step diagnostics
+    py::class_<FrameDiagnostics>(m, "FrameDiagnostics")
+        .def(py::init<>())
+        .def_readonly("energy", &FrameDiagnostics::energy)
+        .def_readonly("collision", &FrameDiagnostics::collision)
+        .def_property_readonly("num_contacts", [](const FrameDiagnostics& d) {
+            return d.contact_types.size();
+        })
+        .def_property_readonly("contact_counts", [](const FrameDiagnostics& d) {
+            // Same names as the ContactType enum above
+            static const char* const names[] = {
+                "POINT_TRIANGLE", "EDGE_EDGE", "WALL", "RIGID_POINT_TRIANGLE"};
+            py::dict counts;
+            for (size_t type = 0; type < d.contact_type_counts.size(); ++type) {
+                if (d.contact_type_counts[type] > 0) {
+                    counts[names[type]] = d.contact_type_counts[type];
+                }
+            }
+            return counts;
+        }, "Number of contacts per ContactType name (types with contacts only)")
+        .def_property_readonly("contact_positions", [](const FrameDiagnostics& d) {
+            py::array_t<Real> result({d.contact_positions.size(), size_t(3)});
+            auto r = result.mutable_unchecked<2>();
+            for (size_t i = 0; i < d.contact_positions.size(); ++i) {
+                r(i, 0) = d.contact_positions[i][0];
+                r(i, 1) = d.contact_positions[i][1];
+                r(i, 2) = d.contact_positions[i][2];
+            }
+            return result;
+        }, "Witness points on primitive 0, shape (N, 3)")
+        .def_property_readonly("contact_normals", [](const FrameDiagnostics& d) {
+            py::array_t<Real> result({d.contact_normals.size(), size_t(3)});
+            auto r = result.mutable_unchecked<2>();
+            for (size_t i = 0; i < d.contact_normals.size(); ++i) {
+                r(i, 0) = d.contact_normals[i][0];
+                r(i, 1) = d.contact_normals[i][1];
+                r(i, 2) = d.contact_normals[i][2];
+            }
+            return result;
+        }, "Contact normals, shape (N, 3)")
+        .def_property_readonly("contact_gaps", [](const FrameDiagnostics& d) {
+            py::array_t<Real> result(d.contact_gaps.size());
+            std::copy(d.contact_gaps.begin(), d.contact_gaps.end(), result.mutable_data());
+            return result;
+        }, "Contact gaps at the current positions, shape (N,)")
+        .def_property_readonly("contact_types", [](const FrameDiagnostics& d) {
+            py::array_t<int> result(d.contact_types.size());
+            std::copy(d.contact_types.begin(), d.contact_types.end(), result.mutable_data());
+            return result;
+        }, "ContactType values as integers, shape (N,)")
+        .def_property_readonly("contact_vertices", [](const FrameDiagnostics& d) {
+            py::array_t<Index> result({d.contact_vertices.size(), size_t(4)});
+            auto r = result.mutable_unchecked<2>();
+            for (size_t i = 0; i < d.contact_vertices.size(); ++i) {
+                for (int k = 0; k < 4; ++k) {
+                    r(i, k) = d.contact_vertices[i][k];
+                }
+            }
+            return result;
+        }, "Cloth vertex indices of each contact (idx0..idx3, -1 where unused), shape (N, 4)");
+
+    py::class_<StrainLimiting>(m, "StrainLimiting")
+        .def_static("face_singular_values", [](const Mesh& mesh, const State& state) {
+                std::vector<Vec2> sigma;
+                StrainLimiting::compute_face_singular_values(mesh, state, sigma);
+                py::array_t<Real> result({sigma.size(), size_t(2)});
+                auto r = result.mutable_unchecked<2>();
+                for (size_t i = 0; i < sigma.size(); ++i) {
+                    r(i, 0) = sigma[i][0];
+                    r(i, 1) = sigma[i][1];
+                }
+                return result;
+            },
+            py::arg("mesh"), py::arg("state"),
+            "Singular values (σ₁ ≥ σ₂) of each face's deformation gradient against the rest shape, shape (M, 2)");
+
+    py::class_<Diagnostics>(m, "Diagnostics")
+        .def_static("compute",
+            [](const Mesh& mesh, const State& state, const Constraints& constraints,
+               const SimParams& params, py::object rigid_list) {
+                if (rigid_list.is_none()) {
+                    return Diagnostics::compute(mesh, state, constraints, params, nullptr);
+                }
+
+                std::vector<RigidBody> storage;
+                storage.reserve(py::len(rigid_list));
+                for (auto item : rigid_list) {
+                    storage.push_back(item.cast<RigidBody>());
+                }
+                return Diagnostics::compute(mesh, state, constraints, params, &storage);
+            },
+            py::arg("mesh"), py::arg("state"), py::arg("constraints"), py::arg("params"),
+            py::arg("rigid_bodies") = py::none(),
+            "Energy, momentum and contact diagnostics from the last step's contacts (no re-detection)");
+    
     // AdaptiveTimestep class
     py::class_<AdaptiveTimestep>(m, "AdaptiveTimestep")
-        .def(py::init<>())
+        .def(py::init<size_t>(), py::arg("history_capacity") = 100)
+        .def("next_dt", &AdaptiveTimestep::next_dt,
+            py::arg("mesh"), py::arg("state"), py::arg("current_dt"),
+            py::arg("dt_min"), py::arg("dt_max"), py::arg("safety") = 0.5,
+            "Next CFL timestep from the current state; records it in dt_history")
+        .def("reset", &AdaptiveTimestep::reset,
+            "Drop cached edge statistics and the dt history")
+        .def_property_readonly("rest_min_edge_length", &AdaptiveTimestep::rest_min_edge_length)
+        .def_property_readonly("current_min_edge_length", &AdaptiveTimestep::current_min_edge_length)
+        .def_property_readonly("last_max_velocity", &AdaptiveTimestep::last_max_velocity)
+        .def_property("history_capacity", &AdaptiveTimestep::history_capacity,
+            &AdaptiveTimestep::set_history_capacity)
+        .def_property_readonly("dt_history", [](const AdaptiveTimestep& controller) {
+            const std::vector<Real> history = controller.dt_history();
+            py::array_t<Real> result(history.size());
+            std::copy(history.begin(), history.end(), result.mutable_data());
+            return result;
+        }, "Chosen timesteps in seconds, oldest first")
         .def_static("compute_next_dt",
             [](const VecX& velocities, const Mesh& mesh, double current_dt,
                double dt_min, double dt_max, double safety) {
@@ -630,5 +1026,14 @@ PYBIND11_MODULE(ando_barrier_core, m) {
         .def_static("compute_max_velocity",
             &AdaptiveTimestep::compute_max_velocity,
             py::arg("velocities"),
-            "Compute maximum velocity magnitude");
+            "Compute maximum velocity magnitude")
+        .def_static("compute_motion_statistics",
+            [](const Mesh& mesh, const State& state) {
+                Real max_velocity = 0.0;
+                Real min_edge_length = 0.0;
+                AdaptiveTimestep::compute_motion_statistics(mesh, state, max_velocity, min_edge_length);
+                return py::make_tuple(max_velocity, min_edge_length);
+            },
+            py::arg("mesh"), py::arg("state"),
+            "(max velocity, min current edge length) in one pass over the state");
 }
@@ -0,0 +1,71 @@
+"""
+Shared scene builders for the Python tests
+Cloth grids, rigid ground quads/boxes and the ground wall used across the test files
+The core is imported inside the builders so grid() also serves tests that run without it
+"""
+
+import numpy as np
+
+
+BOX_TRIANGLES = np.array([[0, 2, 1], [1, 2, 3], [4, 5, 6], [5, 7, 6],
+                          [0, 1, 4], [1, 5, 4], [2, 6, 3], [3, 6, 7],
+                          [0, 4, 2], [2, 4, 6], [1, 3, 5], [3, 7, 5]], dtype=np.int32)
+QUAD_TRIANGLES = np.array([[0, 1, 2], [0, 2, 3]], dtype=np.int32)
+
+
+def grid(res=6, size=0.4, height=0.0, tilt=0.0):
+    """Square res×res sheet of side size centred on the z axis at height (z += tilt·x)"""
+    xs = np.linspace(-size / 2, size / 2, res)
+    vertices = np.array([[x, y, height + tilt * x] for y in xs for x in xs], dtype=np.float32)
+    triangles = []
+    for yi in range(res - 1):
+        for xi in range(res - 1):
+            i0 = yi * res + xi
+            triangles.append([i0, i0 + res, i0 + 1])
+            triangles.append([i0 + 1, i0 + res, i0 + res + 1])
+    return vertices, np.array(triangles, dtype=np.int32)
+
+
+def make_cloth(vertices, triangles, youngs_modulus=1e5, density=300.0, thickness=0.001):
+    """Mesh and state for a cloth sheet with the tests' default material"""
+    import ando_barrier_core as abc
+
+    material = abc.Material()
+    material.youngs_modulus = youngs_modulus
+    material.density = density
+    material.thickness = thickness
+
+    mesh = abc.Mesh()
+    mesh.initialize(vertices, triangles, material)
+    state = abc.State()
+    state.initialize(mesh)
+    return mesh, state
+
+
+def ground_quad(center=(0.0, 0.0, 0.0), half=1.0, mass=1e6):
+    """Horizontal rigid quad centred at center"""
+    import ando_barrier_core as abc
+
+    cx, cy, cz = center
+    vertices = np.array([[cx - half, cy - half, cz], [cx + half, cy - half, cz],
+                         [cx + half, cy + half, cz], [cx - half, cy + half, cz]], dtype=np.float32)
+    body = abc.RigidBody()
+    body.initialize(vertices, QUAD_TRIANGLES, mass)
+    return body
+
+
+def rigid_box(half_extents, mass=5000.0):
+    """Rigid box centred on the z axis standing on z = 0"""
+    import ando_barrier_core as abc
+
+    hx, hy, hz = half_extents
+    vertices = np.array([[hx * sx, hy * sy, hz + hz * sz]
+                         for sz in (-1, 1) for sy in (-1, 1) for sx in (-1, 1)], dtype=np.float32)
+    body = abc.RigidBody()
+    body.initialize(vertices, BOX_TRIANGLES, mass)
+    return body
+
+
+def add_ground_wall(constraints, gap=0.001):
+    """Floor wall at z = 0 facing +z"""
+    constraints.add_wall(np.array([0.0, 0.0, 1.0], dtype=np.float32), 0.0, gap)
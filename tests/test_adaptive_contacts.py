@@ -0,0 +1,72 @@
+"""
+Tests for adaptive contact detection (SimParams.adaptive_contact_detection)
+Contacts are detected within ḡ + 2·margin and re-detected inside the β loop once vertices move past the margin
+"""
+
+import sys
+sys.path.insert(0, 'build')
+
+try:
+    import ando_barrier_core as abc
+    import numpy as np
+    from scene_helpers import grid, ground_quad, make_cloth
+except ImportError as e:
+    print(f"Error importing modules: {e}")
+    print("Make sure to build the project first: ./build.sh")
+    sys.exit(1)
+
+
+GRAVITY = np.array([0.0, 0.0, -9.81], dtype=np.float32)
+
+
+def _make_scene(res=6, height=0.005, adaptive=True):
+    """Cloth sheet falling onto a rigid ground quad"""
+    mesh, state = make_cloth(*grid(res, 0.4, height))
+    params = abc.SimParams()
+    params.dt = 0.005
+    params.adaptive_contact_detection = adaptive
+    params.contact_redetect_margin = 0.0005
+    return mesh, state, abc.Constraints(), params, [ground_quad()]
+
+
+def _run(adaptive, steps):
+    mesh, state, constraints, params, rigid_bodies = _make_scene(adaptive=adaptive)
+    history = []
+    for _ in range(steps):
+        state.apply_gravity(GRAVITY, params.dt)
+        abc.Integrator.step(mesh, state, constraints, params, rigid_bodies)
+        profile = abc.Integrator.last_step_profile(constraints)
+        history.append((profile.num_contacts, profile.contact_redetections))
+    return history
+
+
+def test_adaptive_detection_disabled_by_default():
+    """The default pipeline keeps the conservative threshold and never re-detects"""
+    assert not abc.SimParams().adaptive_contact_detection
+    history = _run(adaptive=False, steps=2)
+    assert history[0][0] > 0  # 5 mm is inside the 1 cm detection threshold
+    assert all(redetections == 0 for _, redetections in history)
+
+
+def test_tight_threshold_skips_distant_pairs():
+    """With ḡ + 2·margin = 2 mm nothing 5 mm away is a contact"""
+    history = _run(adaptive=True, steps=1)
+    assert history[0][0] == 0
+
+
+def test_contacts_redetected_while_approaching():
+    """Falling cloth triggers in-step re-detections that pick up the ground"""
+    adaptive = _run(adaptive=True, steps=4)
+    full = _run(adaptive=False, steps=4)
+
+    assert sum(redetections for _, redetections in adaptive) > 0
+    assert adaptive[-1][0] > 0
+    assert all(a[0] <= f[0] for a, f in zip(adaptive, full))
+    assert 'contact_redetections' in abc.StepProfile().to_dict()
+
+
+if __name__ == '__main__':
+    test_adaptive_detection_disabled_by_default()
+    test_tight_threshold_skips_distant_pairs()
+    test_contacts_redetected_while_approaching()
+    print("All adaptive contact detection tests passed")
@@ -408,6 +408,70 @@ def test_numerical_stability():
     
     print("\n[PASS] All numerical stability tests passed!")
 
+def test_controller():
+    """Test the stateful controller against the static path"""
+    print("\n" + "="*60)
+    print("Test: Stateful Controller")
+    print("="*60)
+    
+    material = abc.Material()
+    res = 70  # 9522 edges: above the parallel threshold
+    xs = np.linspace(0.0, 1.0, res)
+    vertices = [[x, y, 0.0] for y in xs for x in xs]
+    triangles = []
+    for yi in range(res - 1):
+        for xi in range(res - 1):
+            i0 = yi * res + xi
+            triangles += [i0, i0 + res, i0 + 1, i0 + 1, i0 + res, i0 + res + 1]
+    mesh = create_mesh_from_lists(vertices, triangles, material)
+    state = abc.State()
+    state.initialize(mesh)
+    
+    rng = np.random.default_rng(0)
+    velocities = rng.normal(0.0, 0.5, (res * res, 3)).astype(np.float32)
+    state.set_velocities(velocities)
+    
+    # Fused pass matches the separate computations
+    max_vel, min_edge = abc.AdaptiveTimestep.compute_motion_statistics(mesh, state)
+    assert abs(max_vel - abc.AdaptiveTimestep.compute_max_velocity(velocities.reshape(-1))) < 1e-6
+    assert abs(min_edge - abc.AdaptiveTimestep.compute_min_edge_length(mesh)) < 1e-6
+    print(f"  Fused pass: max_velocity = {max_vel:.4f} m/s, min_edge = {min_edge:.6f} m")
+    
+    # Undeformed cloth: same dt as the static path, recorded in the history
+    controller = abc.AdaptiveTimestep(history_capacity=3)
+    dt = 0.01
+    expected = abc.AdaptiveTimestep.compute_next_dt(velocities.reshape(-1), mesh, dt, 1e-4, 0.1, 0.5)
+    dt = controller.next_dt(mesh, state, dt, 1e-4, 0.1, 0.5)
+    assert abs(dt - expected) < 1e-7, f"Controller dt {dt} != static dt {expected}"
+    assert abs(controller.rest_min_edge_length - min_edge) < 1e-6
+    print(f"  [PASS] Controller dt = {dt:.6f} s matches static path")
+    
+    # Compressed cloth: the current min edge shortens dt
+    compressed = np.array(vertices, dtype=np.float32)
+    compressed[:, 0] *= 0.5
+    compressed_mesh = create_mesh_from_lists(compressed, triangles, material)
+    state = abc.State()
+    state.initialize(compressed_mesh)
+    state.set_velocities(velocities)
+    compressed_dt = controller.next_dt(mesh, state, dt, 1e-6, 0.1, 0.5)
+    assert controller.current_min_edge_length < controller.rest_min_edge_length
+    assert compressed_dt < dt, "Compressed cloth should shrink dt"
+    print(f"  [PASS] Compressed cloth: dt = {compressed_dt:.6f} s")
+    
+    # Ring buffer keeps the newest entries, oldest first
+    for _ in range(3):
+        controller.next_dt(mesh, state, compressed_dt, 1e-6, 0.1, 0.5)
+    history = controller.dt_history
+    assert len(history) == 3
+    assert abs(history[-1] - compressed_dt) < 1e-7
+    controller.history_capacity = 5
+    assert len(controller.dt_history) == 3
+    controller.reset()
+    assert len(controller.dt_history) == 0
+    print("  [PASS] dt history kept natively")
+    
+    print("\n[PASS] All controller tests passed!")
+
 def run_all_tests():
     """Run all adaptive timestep unit tests"""
     print("\n" + "="*70)
@@ -421,6 +485,7 @@ def run_all_tests():
         ("Max Velocity", test_max_velocity),
         ("Complete Next DT", test_compute_next_dt),
         ("Numerical Stability", test_numerical_stability),
+        ("Stateful Controller", test_controller),
     ]
     
     passed = 0
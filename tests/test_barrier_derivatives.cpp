@@ -8,6 +8,10 @@
 #include <cmath>
 #include <cassert>
 #include <iomanip>
+#include <map>
+#include <random>
+#include <utility>
+#include <vector>
 
 using namespace ando_barrier;
 
@@ -235,6 +239,83 @@ void test_barrier_consistency() {
     std::cout << "  ✓ Consistent across gap range" << std::endl;
 }
 
+/**
+ * Batched SoA contact kernels against the per-contact path
+ */
+void test_barrier_batch_matches_scalar() {
+    std::cout << "\nTesting batched contact barrier vs scalar path..." << std::endl;
+
+    const int num_vertices = 40;
+    const Real g_max = 0.01;
+    const Real normal_eps = 1e-8;
+    std::mt19937 rng(7);
+    std::uniform_real_distribution<Real> unit(0.0, 1.0);
+    std::uniform_int_distribution<int> vertex(0, num_vertices - 1);
+
+    // 150 contacts spans several chunks; includes out-of-domain gaps,
+    // degenerate normals and rigid-style contacts with non-DOF vertices
+    std::vector<ContactPair> contacts;
+    ContactBatch batch;
+    std::vector<Real> k_bars;
+    for (int c = 0; c < 150; ++c) {
+        ContactPair contact;
+        contact.type = ContactType::POINT_TRIANGLE;
+        contact.idx0 = vertex(rng);
+        contact.idx1 = vertex(rng);
+        contact.idx2 = c % 7 == 0 ? -1 : vertex(rng);
+        contact.idx3 = vertex(rng);
+        contact.vertex_count = c % 11 == 0 ? 1 : 4;
+        contact.gap = 1.5 * g_max * unit(rng);
+        contact.normal = c % 13 == 0 ? Vec3::Zero()
+                                     : Vec3(unit(rng) - 0.5, unit(rng) - 0.5, unit(rng) + 0.1);
+        Real b0 = unit(rng), b1 = unit(rng) * (1 - b0);
+        contact.weights = {1.0, -b0, -b1, -(1 - b0 - b1)};
+        Real k_bar = 100.0 + 1000.0 * unit(rng);
+
+        contacts.push_back(contact);
+        k_bars.push_back(k_bar);
+        batch.add(contact, k_bar);
+    }
+    assert(batch.size() == contacts.size());
+
+    // Gradient
+    VecX g_scalar = VecX::Zero(3 * num_vertices);
+    VecX g_batch = VecX::Zero(3 * num_vertices);
+    for (size_t c = 0; c < contacts.size(); ++c) {
+        Barrier::compute_contact_gradient(contacts[c], g_max, k_bars[c], normal_eps, g_scalar);
+    }
+    Barrier::compute_contact_gradient_batch(batch, g_max, normal_eps, g_batch);
+    Real grad_error = (g_scalar - g_batch).norm() / (g_scalar.norm() + 1e-12);
+    assert(g_scalar.norm() > 0.0);
+    assert(grad_error < 1e-5);
+
+    // Hessian: same entries once duplicates are summed
+    std::vector<Triplet> t_scalar, t_batch;
+    for (size_t c = 0; c < contacts.size(); ++c) {
+        Barrier::compute_contact_hessian(contacts[c], g_max, k_bars[c], normal_eps, 1e-12, t_scalar);
+    }
+    Barrier::compute_contact_hessian_batch(batch, g_max, normal_eps, 1e-12, t_batch);
+    assert(t_scalar.size() == t_batch.size());
+
+    std::map<std::pair<int, int>, Real> h_scalar, h_batch;
+    for (const auto& t : t_scalar) h_scalar[{t.row(), t.col()}] += t.value();
+    for (const auto& t : t_batch) h_batch[{t.row(), t.col()}] += t.value();
+    assert(h_scalar.size() == h_batch.size());
+    // Summed entries can nearly cancel, so compare against the largest entry
+    Real max_entry = 0.0, max_diff = 0.0;
+    for (const auto& entry : h_scalar) {
+        max_entry = std::max(max_entry, std::abs(entry.second));
+        max_diff = std::max(max_diff, std::abs(entry.second - h_batch[entry.first]));
+    }
+    Real max_rel = max_diff / max_entry;
+    assert(max_rel < 1e-5);
+
+    std::cout << "  Gradient rel error = " << grad_error << std::endl;
+    std::cout << "  Hessian max rel error = " << max_rel << " over "
+              << t_batch.size() << " triplets" << std::endl;
+    std::cout << "  ✓ Batched kernels match per-contact evaluation" << std::endl;
+}
+
 int main() {
     std::cout << std::setprecision(6) << std::fixed;
     std::cout << "\n========================================" << std::endl;
@@ -248,6 +329,7 @@ int main() {
     test_barrier_smoothness();
     test_barrier_force_direction();
     test_barrier_consistency();
+    test_barrier_batch_matches_scalar();
     
     std::cout << "\n========================================" << std::endl;
     std::cout << "✓ All barrier derivative tests passed!" << std::endl;
@@ -0,0 +1,177 @@
+"""
+Tests for the headless batch baker (demos/batch_bake.py)
+Covers the binary cache round trip, scene loading and a small parallel bake
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, 'build')
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'demos'))
+
+try:
+    import numpy as np
+    import batch_bake
+    from scene_helpers import grid
+except ImportError as e:
+    print(f"Error importing modules: {e}")
+    print("Make sure to build the project first: ./build.sh")
+    sys.exit(1)
+
+
+def _grid(res=4, size=0.5, height=0.5):
+    vertices, triangles = grid(res, size, height)
+    return vertices.tolist(), triangles.tolist()
+
+
+def test_cache_round_trip():
+    """Cache files preserve frames, topology and timing metadata"""
+    frames = np.random.default_rng(0).random((5, 16, 3), dtype=np.float32)
+    triangles = np.arange(18, dtype=np.int32).reshape(6, 3)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'cloth' + batch_bake.CACHE_EXTENSION)
+        batch_bake.write_cache(path, frames, triangles, frame_start=3, fps=30.0, dt=0.004)
+        data = batch_bake.read_cache(path)
+
+    assert np.array_equal(data['frames'], frames)
+    assert np.array_equal(data['triangles'], triangles)
+    assert data['frame_start'] == 3
+    assert abs(data['fps'] - 30.0) < 1e-6
+    assert abs(data['dt'] - 0.004) < 1e-6
+
+
+def test_scene_overrides():
+    """Per-job material/params override scene-level defaults"""
+    vertices, triangles = _grid()
+    scene = {
+        'version': 1,
+        'frame_start': 1,
+        'frame_end': 10,
+        'material': {'density': 300.0, 'thickness': 0.001},
+        'params': {'dt': 0.01, 'beta_max': 0.25},
+        'jobs': [
+            {'name': 'a', 'vertices': vertices, 'triangles': triangles},
+            {'name': 'b', 'vertices': vertices, 'triangles': triangles,
+             'params': {'beta_max': 0.1}, 'frame_end': 4},
+        ],
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'scene.json')
+        with open(path, 'w') as f:
+            json.dump(scene, f)
+        jobs = batch_bake.load_scene(path)
+
+    assert [job['name'] for job in jobs] == ['a', 'b']
+    assert jobs[0]['params']['beta_max'] == 0.25
+    assert jobs[1]['params']['beta_max'] == 0.1
+    assert jobs[1]['params']['dt'] == 0.01
+    assert jobs[1]['frame_end'] == 4
+    assert jobs[0]['material']['density'] == 300.0
+
+
+def test_colliding_names_rejected():
+    """Jobs whose names share a cache file are rejected at load time"""
+    vertices, triangles = _grid()
+    scene = {
+        'version': 1,
+        'jobs': [
+            {'name': 'Cloth 1', 'vertices': vertices, 'triangles': triangles},
+            {'name': 'Cloth_1', 'vertices': vertices, 'triangles': triangles},
+        ],
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'scene.json')
+        with open(path, 'w') as f:
+            json.dump(scene, f)
+        try:
+            batch_bake.load_scene(path)
+        except ValueError as e:
+            assert 'Cloth_1.andocache' in str(e)
+        else:
+            raise AssertionError("Colliding job names were accepted")
+
+
+def test_param_fields():
+    """Every SimParams field is accepted; unknown fields are an error"""
+    try:
+        import ando_barrier_core as abc
+    except ImportError:
+        print("  [SKIP] ando_barrier_core not built")
+        return
+    if not hasattr(abc, 'Integrator'):
+        print("  [SKIP] native core not available")
+        return
+
+    params = batch_bake._apply_fields(abc.SimParams(), {
+        'line_search_toi': False,
+        'enable_contact_cache': True,
+        'contact_cache_margin': 0.004,
+        'adaptive_contact_detection': True,
+    }, 'params')
+    assert params.line_search_toi is False
+    assert params.enable_contact_cache is True
+    assert abs(params.contact_cache_margin - 0.004) < 1e-9
+    assert params.adaptive_contact_detection is True
+
+    try:
+        batch_bake._apply_fields(abc.SimParams(), {'beta_maxx': 0.1}, 'params')
+    except ValueError as e:
+        assert 'beta_maxx' in str(e)
+    else:
+        raise AssertionError("Unknown param field was accepted")
+
+
+def test_parallel_bake():
+    """Two jobs bake in a pool and produce readable caches"""
+    try:
+        import ando_barrier_core as abc
+    except ImportError:
+        print("  [SKIP] ando_barrier_core not built")
+        return
+    if not hasattr(abc, 'Integrator'):
+        print("  [SKIP] native core not available")
+        return
+
+    vertices, triangles = _grid()
+    jobs = []
+    for index, name in enumerate(['left', 'right']):
+        jobs.append({
+            'index': index,
+            'name': name,
+            'vertices': vertices,
+            'triangles': triangles,
+            'pins': [0, 3],
+            'material': {'youngs_modulus': 1e5, 'density': 300.0, 'thickness': 0.001},
+            'params': {'dt': 1.0 / 48.0},
+            'gravity': [0.0, 0.0, -9.81],
+            'ground_plane': {'height': 0.0},
+            'fps': 24.0,
+            'frame_start': 1,
+            'frame_end': 2,
+        })
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results, wall_seconds, workers = batch_bake.run_batch(jobs, tmp, workers=2)
+        report = batch_bake.throughput_report(results, wall_seconds, workers)
+        for result in results:
+            data = batch_bake.read_cache(result['cache'])
+            assert data['frames'].shape == (3, len(vertices), 3)
+            assert np.all(np.isfinite(data['frames']))
+
+    assert report['jobs'] == 2
+    assert abs(report['sim_seconds'] - 2 * 2 * 2 * (1.0 / 48.0)) < 1e-6
+    assert report['throughput_per_core'] > 0.0
+
+
+if __name__ == '__main__':
+    test_cache_round_trip()
+    test_scene_overrides()
+    test_colliding_names_rejected()
+    test_param_fields()
+    test_parallel_bake()
+    print("All batch bake tests passed")
@@ -0,0 +1,82 @@
+"""
+Tests for the performance benchmark harness (demos/benchmark.py)
+Covers the canonical scenes and the baseline regression check
+"""
+
+import os
+import sys
+
+sys.path.insert(0, 'build')
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'demos'))
+
+try:
+    import numpy as np
+    import benchmark
+except ImportError as e:
+    print(f"Error importing modules: {e}")
+    print("Make sure to build the project first: ./build.sh")
+    sys.exit(1)
+
+
+def _document(**metrics):
+    case = {'mean_step_ms': 10.0, 'steps_per_second': 100.0, 'peak_memory_mb': 50.0,
+            'mean_pcg_iterations': 20.0, 'pcg_ms': 4.0}
+    case.update(metrics)
+    return {'cases': {'drape@10': case}}
+
+
+def test_compare_flags_regressions():
+    """Slower steps / fewer steps per second beyond tolerance are regressions"""
+    baseline = _document()
+    current = _document(mean_step_ms=12.0, steps_per_second=83.0, pcg_ms=4.1)
+    findings = {f['metric']: f for f in benchmark.compare(current, baseline, tolerance=0.1)}
+
+    assert findings['mean_step_ms']['regression']
+    assert findings['steps_per_second']['regression']
+    assert not findings['pcg_ms']['regression']
+    assert not findings['peak_memory_mb']['regression']
+    assert abs(findings['mean_step_ms']['change'] - 0.2) < 1e-9
+
+
+def test_compare_tolerances_and_floors():
+    """Per-metric tolerances override the default; tiny absolute changes are noise"""
+    baseline = _document(pcg_ms=0.01)
+    current = _document(mean_step_ms=12.0, pcg_ms=0.03)
+    findings = {f['metric']: f for f in benchmark.compare(
+        current, baseline, tolerance=0.1, metric_tolerances={'mean_step_ms': 0.5})}
+
+    assert not findings['mean_step_ms']['regression']
+    assert not findings['pcg_ms']['regression']  # +200% but below the ms floor
+
+    # Faster is never a regression; unmatched cases are skipped
+    faster = _document(mean_step_ms=5.0, steps_per_second=200.0)
+    assert not any(f['regression'] for f in benchmark.compare(faster, _document()))
+    assert benchmark.compare({'cases': {'fold@10': {}}}, baseline) == []
+
+
+def test_canonical_scenes_run():
+    """Every canonical scene builds and steps at a small resolution"""
+    try:
+        import ando_barrier_core as abc
+    except ImportError:
+        print("  [SKIP] ando_barrier_core not built")
+        return
+    if not hasattr(abc, 'Integrator'):
+        print("  [SKIP] native core not available")
+        return
+
+    for scene in benchmark.SCENES:
+        result = benchmark.run_case(scene, resolution=4, steps=2, warmup=0)
+        assert result['finite'], scene
+        assert result['vertices'] == 16
+        assert result['steps_per_second'] > 0.0
+        assert result['mean_pcg_iterations'] > 0.0
+        for phase in benchmark.PHASES:
+            assert result[f'{phase}_ms'] >= 0.0
+
+
+if __name__ == '__main__':
+    test_compare_flags_regressions()
+    test_compare_tolerances_and_floors()
+    test_canonical_scenes_run()
+    print("All benchmark tests passed")
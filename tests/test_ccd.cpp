@@ -0,0 +1,229 @@
+#include "../src/core/types.h"
+#include "../src/core/mesh.h"
+#include "../src/core/state.h"
+#include "../src/core/collision.h"
+#include "../src/core/constraints.h"
+#include "../src/core/line_search.h"
+#include <cassert>
+#include <cmath>
+#include <iostream>
+#include <vector>
+
+using namespace ando_barrier;
+
+namespace {
+
+// Fixed unit triangle in the z = 0 plane
+const Vec3 kA(0.0, 0.0, 0.0);
+const Vec3 kB(1.0, 0.0, 0.0);
+const Vec3 kC(0.0, 1.0, 0.0);
+
+Vec3 lerp(const Vec3& a, const Vec3& b, Real t) {
+    return a + t * (b - a);
+}
+
+void test_point_triangle_thin_crossing() {
+    std::cout << "Testing point-triangle CCD on a crossing missed by sampling..." << std::endl;
+
+    // Starts 5 cm above the triangle and ends 95 cm below it: the
+    // penetration happens before the first of 10 uniform samples (t = 0.1).
+    const Vec3 p0(0.25, 0.25, 0.05);
+    const Vec3 p1(0.25, 0.25, -0.95);
+    Real toi = LineSearch::ccd_point_triangle(p0, p1, kA, kA, kB, kB, kC, kC);
+
+    assert(toi < 1.0);
+    assert(toi < 0.05);                        // Before the plane crossing at t = 0.05
+    assert(lerp(p0, p1, toi).z() > 0.0);       // Still on the original side
+
+    std::cout << "  ✓ TOI " << toi << " stops before the plane" << std::endl;
+}
+
+void test_point_triangle_moving_triangle() {
+    std::cout << "Testing point-triangle CCD with both primitives moving..." << std::endl;
+
+    // Triangle sweeps upward through a slowly falling point
+    const Vec3 lift(0.0, 0.0, 1.0);
+    const Vec3 p0(0.25, 0.25, 0.02);
+    const Vec3 p1(0.25, 0.25, 0.0);
+    Real toi = LineSearch::ccd_point_triangle(p0, p1, kA, kA + lift, kB, kB + lift, kC, kC + lift);
+
+    assert(toi < 1.0);
+    Real z_point = lerp(p0, p1, toi).z();
+    Real z_tri = toi * lift.z();
+    assert(z_point - z_tri > 0.0);
+
+    std::cout << "  ✓ Moving triangle caught at t = " << toi << std::endl;
+}
+
+void test_point_triangle_clear_paths() {
+    std::cout << "Testing point-triangle CCD without collision..." << std::endl;
+
+    // Sliding parallel above the triangle
+    Real toi = LineSearch::ccd_point_triangle(Vec3(0.2, 0.2, 0.1), Vec3(0.4, 0.2, 0.1),
+                                              kA, kA, kB, kB, kC, kC);
+    assert(toi == 1.0);
+
+    // Passing beside the triangle
+    toi = LineSearch::ccd_point_triangle(Vec3(2.0, 2.0, 0.5), Vec3(2.0, 2.0, -0.5),
+                                         kA, kA, kB, kB, kC, kC);
+    assert(toi == 1.0);
+
+    // Common translation of all four points
+    const Vec3 shift(0.3, -0.2, 5.0);
+    const Vec3 p(0.25, 0.25, 0.001);
+    toi = LineSearch::ccd_point_triangle(p, p + shift, kA, kA + shift,
+                                         kB, kB + shift, kC, kC + shift);
+    assert(toi == 1.0);
+
+    std::cout << "  ✓ No false positives" << std::endl;
+}
+
+void test_edge_edge_thin_crossing() {
+    std::cout << "Testing edge-edge CCD on a crossing missed by sampling..." << std::endl;
+
+    // Edge along x falls through a fixed edge along y
+    const Vec3 p0_0(-0.5, 0.0, 0.05), p0_1(-0.5, 0.0, -0.95);
+    const Vec3 p1_0(0.5, 0.0, 0.05), p1_1(0.5, 0.0, -0.95);
+    const Vec3 q0(0.0, -0.5, 0.0), q1(0.0, 0.5, 0.0);
+
+    Real toi = LineSearch::ccd_edge_edge(p0_0, p0_1, p1_0, p1_1, q0, q0, q1, q1);
+    assert(toi < 0.05);
+    assert(lerp(p0_0, p0_1, toi).z() > 0.0);
+
+    // Same edges, but the moving one passes beyond the end of the fixed one
+    const Vec3 shift(0.0, 1.0, 0.0);
+    toi = LineSearch::ccd_edge_edge(p0_0 + shift, p0_1 + shift, p1_0 + shift, p1_1 + shift,
+                                    q0, q0, q1, q1);
+    assert(toi == 1.0);
+
+    std::cout << "  ✓ Edge-edge TOI " << LineSearch::ccd_edge_edge(p0_0, p0_1, p1_0, p1_1, q0, q0, q1, q1)
+              << std::endl;
+}
+
+void test_line_search_prevents_tunneling() {
+    std::cout << "Testing line search against a fast vertex..." << std::endl;
+
+    // Fixed triangle (0,1,2) and a small falling triangle (3,4,5) whose
+    // vertex 3 sits 1 cm above the first one.
+    std::vector<Vec3> vertices = {
+        Vec3(-1.0, -1.0, 0.0), Vec3(1.0, -1.0, 0.0), Vec3(0.0, 1.0, 0.0),
+        Vec3(0.0, 0.0, 0.01), Vec3(0.1, 0.0, 0.11), Vec3(0.0, 0.1, 0.11)
+    };
+    std::vector<Triangle> triangles = {Triangle(0, 1, 2), Triangle(3, 4, 5)};
+
+    Mesh mesh;
+    mesh.initialize(vertices, triangles, Material());
+    State state;
+    state.initialize(mesh);
+
+    ContactPair contact;
+    contact.type = ContactType::POINT_TRIANGLE;
+    contact.idx0 = 3;
+    contact.idx1 = 0;
+    contact.idx2 = 1;
+    contact.idx3 = 2;
+    std::vector<ContactPair> contacts = {contact};
+
+    // Newton direction moving the small triangle 1 m down
+    VecX direction = VecX::Zero(3 * vertices.size());
+    for (int v = 3; v < 6; ++v) {
+        direction[3 * v + 2] = -1.0;
+    }
+
+    std::vector<Pin> pins;
+    const Vec3 no_wall(0.0, 0.0, 0.0);
+    Real alpha = LineSearch::search(mesh, state, direction, contacts, pins, no_wall, 0.0);
+    Real z_after = vertices[3].z() + alpha * 1.25 * direction[3 * 3 + 2];
+    assert(alpha > 0.0);
+    assert(z_after > 0.0);
+
+    std::vector<WallConstraint> walls;
+    Real alpha_toi = LineSearch::search_toi(mesh, state, direction, contacts, pins, walls);
+    Real z_toi = vertices[3].z() + alpha_toi * 1.25 * direction[3 * 3 + 2];
+    assert(alpha_toi > 0.0);
+    assert(z_toi > 0.0);
+
+    std::cout << "  ✓ Backtracking α = " << alpha << ", TOI α = " << alpha_toi << std::endl;
+
+    // Enough contacts to take the parallel feasibility path; the result
+    // (including early exit on the first violation) must not change.
+    std::vector<ContactPair> many_contacts(1000, contact);
+    Real alpha_many = LineSearch::search(mesh, state, direction, many_contacts, pins, no_wall, 0.0);
+    Real alpha_many_toi = LineSearch::search_toi(mesh, state, direction, many_contacts, pins, walls);
+    assert(alpha_many == alpha);
+    assert(alpha_many_toi == alpha_toi);
+
+    std::cout << "  ✓ Parallel sweep over " << many_contacts.size() << " contacts agrees" << std::endl;
+}
+
+void test_line_search_multiple_walls() {
+    std::cout << "Testing line search against several walls..." << std::endl;
+
+    // Row of vertices resting 0.5 above a floor; only vertex 0 sits near a
+    // side wall at x = 0 and moves towards it.
+    std::vector<Vec3> vertices;
+    for (int i = 0; i < 8; ++i) {
+        vertices.push_back(Vec3(0.1 + i, 0.0, 0.5));
+    }
+    std::vector<Triangle> triangles = {Triangle(0, 1, 2)};
+
+    Mesh mesh;
+    mesh.initialize(vertices, triangles, Material());
+    State state;
+    state.initialize(mesh);
+
+    VecX direction = VecX::Zero(3 * vertices.size());
+    direction[0] = -0.4;  // Vertex 0 would end at x = -0.4 (extension 1.25)
+
+    std::vector<WallConstraint> walls = {
+        WallConstraint{Vec3(0, 0, 1), 0.0, 0.0, true},   // Floor (not in the way)
+        WallConstraint{Vec3(1, 0, 0), 0.0, 0.0, true},   // Side wall (in the way)
+        WallConstraint{Vec3(0, 1, 0), -5.0, 0.0, false}, // Inactive, would reject everything
+    };
+
+    // Only vertex 0 can reach a wall within the step
+    VecX x;
+    state.flatten_positions(x);
+    WallSet wall_set;
+    wall_set.build(walls, x, 1.25 * direction);
+    assert(wall_set.planes.size() == 2);
+    assert(wall_set.planes[0].candidates.empty());
+    assert(wall_set.planes[1].candidates.size() == 1);
+    assert(wall_set.planes[1].candidates[0] == 0);
+
+    std::vector<ContactPair> contacts;
+    std::vector<Pin> pins;
+    LineSearchStats stats;
+    Real alpha = LineSearch::search(mesh, state, direction, contacts, pins, walls,
+                                    1.25, 1e-6, &stats);
+    Real x_after = vertices[0].x() + alpha * 1.25 * direction[0];
+    assert(alpha > 0.0 && alpha < 1.0);
+    assert(x_after >= 0.0);
+    assert(stats.wall_candidates == 1);
+
+    // The single-wall form only sees the floor and lets the vertex through
+    Real alpha_floor = LineSearch::search(mesh, state, direction, contacts, pins,
+                                          Vec3(0, 0, 1), 0.0);
+    assert(alpha_floor == 1.0);
+
+    Real alpha_toi = LineSearch::search_toi(mesh, state, direction, contacts, pins, walls);
+    assert(alpha_toi > 0.0);
+    assert(vertices[0].x() + alpha_toi * 1.25 * direction[0] >= 0.0);
+
+    std::cout << "  ✓ Side wall limits α to " << alpha << " (TOI " << alpha_toi
+              << "), 1 candidate vertex" << std::endl;
+}
+
+} // namespace
+
+int main() {
+    std::cout << "\n========= CCD Tests =========\n" << std::endl;
+    test_point_triangle_thin_crossing();
+    test_point_triangle_moving_triangle();
+    test_point_triangle_clear_paths();
+    test_edge_edge_thin_crossing();
+    test_line_search_prevents_tunneling();
+    test_line_search_multiple_walls();
+    std::cout << "\n========= All CCD Tests Passed =========\n" << std::endl;
+    return 0;
+}
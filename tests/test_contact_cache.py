@@ -0,0 +1,83 @@
+"""
+Tests for the contact manifold cache (SimParams.enable_contact_cache)
+Contacts and k̄ persist across steps; full detection only runs once motion exceeds the margin
+"""
+
+import sys
+sys.path.insert(0, 'build')
+
+try:
+    import ando_barrier_core as abc
+    import numpy as np
+    from scene_helpers import grid, ground_quad, make_cloth
+except ImportError as e:
+    print(f"Error importing modules: {e}")
+    print("Make sure to build the project first: ./build.sh")
+    sys.exit(1)
+
+
+def _make_scene(res=6, height=0.004, cache=True):
+    """Cloth sheet resting just above a rigid ground quad"""
+    mesh, state = make_cloth(*grid(res, 0.4, height))
+    params = abc.SimParams()
+    params.dt = 0.005
+    params.enable_contact_cache = cache
+    return mesh, state, abc.Constraints(), params, [ground_quad()]
+
+
+def test_cache_disabled_by_default():
+    """Without the flag the cache does no work"""
+    assert not abc.SimParams().enable_contact_cache
+    mesh, state, constraints, params, rigid_bodies = _make_scene(cache=False)
+    abc.Integrator.step(mesh, state, constraints, params, rigid_bodies)
+
+    profile = abc.Integrator.last_step_profile(constraints)
+    assert profile.num_contacts > 0
+    assert profile.contact_cache_hits == 0
+    assert profile.contact_cache_rebuilds == 0
+    assert constraints.contact_cache_stats()['full_detections'] == 0
+
+
+def test_contacts_persist_across_steps():
+    """First step detects everything, the next one revalidates and hits"""
+    mesh, state, constraints, params, rigid_bodies = _make_scene()
+
+    abc.Integrator.step(mesh, state, constraints, params, rigid_bodies)
+    first = abc.Integrator.last_step_profile(constraints)
+    assert first.num_contacts > 0
+    assert first.contact_cache_rebuilds == 1
+    assert first.contact_cache_misses == first.num_contacts
+
+    abc.Integrator.step(mesh, state, constraints, params, rigid_bodies)
+    second = abc.Integrator.last_step_profile(constraints)
+    assert second.contact_cache_rebuilds == 0
+    assert second.contact_cache_hits == second.num_contacts
+
+    stats = constraints.contact_cache_stats()
+    assert stats['revalidations'] == 1
+    assert stats['hits'] == second.num_contacts
+
+    constraints.clear_contact_cache()
+    assert constraints.contact_cache_stats()['candidates'] == 0
+
+
+def test_cached_contacts_match_full_detection():
+    """Same contact set, and nearly the same motion, with and without the cache"""
+    results = []
+    for cache in (False, True):
+        mesh, state, constraints, params, rigid_bodies = _make_scene(cache=cache)
+        counts = []
+        for _ in range(3):
+            abc.Integrator.step(mesh, state, constraints, params, rigid_bodies)
+            counts.append(abc.Integrator.last_step_profile(constraints).num_contacts)
+        results.append((counts, np.array(state.get_positions())))
+
+    assert results[0][0] == results[1][0]
+    assert np.allclose(results[0][1], results[1][1], atol=1e-4)
+
+
+if __name__ == '__main__':
+    test_cache_disabled_by_default()
+    test_contacts_persist_across_steps()
+    test_cached_contacts_match_full_detection()
+    print("All contact cache tests passed")
@@ -0,0 +1,104 @@
+"""
+Tests for the fused post-step diagnostics
+Diagnostics.compute reuses the last step's contacts and matches EnergyTracker + compute_contacts + CollisionValidator
+"""
+
+import sys
+sys.path.insert(0, 'build')
+
+try:
+    import ando_barrier_core as abc
+    import numpy as np
+    from scene_helpers import grid, ground_quad, make_cloth
+except ImportError as e:
+    print(f"Error importing modules: {e}")
+    print("Make sure to build the project first: ./build.sh")
+    sys.exit(1)
+
+
+GRAVITY = np.array([0.0, 0.0, -9.81], dtype=np.float32)
+
+
+def _make_scene(res=6, height=0.005):
+    """Cloth sheet just above a rigid ground quad"""
+    mesh, state = make_cloth(*grid(res, 0.4, height))
+    params = abc.SimParams()
+    params.dt = 0.002
+    return mesh, state, abc.Constraints(), params, [ground_quad()]
+
+
+def _step(mesh, state, constraints, params, rigid_bodies):
+    state.apply_gravity(GRAVITY, params.dt)
+    abc.Integrator.step(mesh, state, constraints, params, rigid_bodies)
+
+
+def test_matches_separate_calls():
+    mesh, state, constraints, params, bodies = _make_scene()
+    _step(mesh, state, constraints, params, bodies)
+
+    diag = abc.Diagnostics.compute(mesh, state, constraints, params, bodies)
+    contacts = abc.Integrator.compute_contacts(mesh, state, bodies)
+    metrics = abc.CollisionValidator.compute_metrics(mesh, state, contacts,
+                                                     params.contact_gap_max, params.enable_ccd)
+    energy = abc.EnergyTracker.compute(mesh, state, constraints, params)
+
+    assert diag.num_contacts == len(contacts) > 0
+    assert diag.contact_counts == {'RIGID_POINT_TRIANGLE': len(contacts)}
+    assert np.allclose(np.sort(diag.contact_gaps), np.sort([c.gap for c in contacts]), atol=1e-7)
+    assert abs(diag.collision.min_gap - metrics.min_gap) < 1e-7
+    assert abs(diag.collision.avg_gap - metrics.avg_gap) < 1e-7
+    assert diag.collision.num_penetrations == metrics.num_penetrations
+    assert diag.collision.quality_level() == metrics.quality_level()
+
+    assert np.isclose(diag.energy.kinetic_energy, energy.kinetic_energy, rtol=1e-5)
+    assert np.isclose(diag.energy.total_energy, energy.total_energy, rtol=1e-5)
+    assert np.allclose(diag.energy.linear_momentum, energy.linear_momentum, rtol=1e-5, atol=1e-9)
+    assert np.isclose(diag.energy.max_velocity, energy.max_velocity, rtol=1e-5)
+
+
+def test_contact_arrays():
+    mesh, state, constraints, params, bodies = _make_scene()
+    _step(mesh, state, constraints, params, bodies)
+    diag = abc.Diagnostics.compute(mesh, state, constraints, params, bodies)
+
+    n = diag.num_contacts
+    assert diag.contact_positions.shape == (n, 3)
+    assert diag.contact_normals.shape == (n, 3)
+    assert diag.contact_gaps.shape == (n,)
+    assert diag.contact_types.shape == (n,)
+    assert np.all(diag.contact_types == int(abc.ContactType.RIGID_POINT_TRIANGLE))
+    assert np.allclose(np.linalg.norm(diag.contact_normals, axis=1), 1.0, atol=1e-5)
+    assert diag.contact_vertices.shape == (n, 4)
+    assert np.all(diag.contact_vertices[:, 1:] == -1)
+
+    # Witness points are the cloth vertices, at their current positions
+    positions = np.array(state.get_positions())
+    nearest = np.min(np.linalg.norm(diag.contact_positions[:, None, :] - positions[None], axis=2), axis=1)
+    assert np.all(nearest < 1e-6)
+    assert np.allclose(diag.contact_positions, positions[diag.contact_vertices[:, 0]], atol=1e-6)
+
+
+def test_rigid_contacts_need_bodies_and_simulations_are_separate():
+    mesh, state, constraints, params, bodies = _make_scene()
+    _step(mesh, state, constraints, params, bodies)
+    assert abc.Diagnostics.compute(mesh, state, constraints, params).num_contacts == 0
+
+    # Each simulation reads the contacts of its own last step
+    other = _make_scene(res=10)
+    _step(*other)
+    diag = abc.Diagnostics.compute(mesh, state, constraints, params, bodies)
+    other_diag = abc.Diagnostics.compute(*other)
+    assert diag.num_contacts == len(abc.Integrator.compute_contacts(mesh, state, bodies))
+    assert other_diag.num_contacts == len(abc.Integrator.compute_contacts(other[0], other[1], other[4]))
+    assert diag.num_contacts != other_diag.num_contacts
+
+    fresh_mesh, fresh_state, fresh_constraints, fresh_params, fresh_bodies = _make_scene()
+    assert abc.Diagnostics.compute(fresh_mesh, fresh_state, fresh_constraints, fresh_params,
+                                   fresh_bodies).num_contacts == 0
+
+
+if __name__ == '__main__':
+    test_matches_separate_calls()
+    test_contact_arrays()
+    test_rigid_contacts_need_bodies_and_simulations_are_separate()
+    print("All diagnostics tests passed")
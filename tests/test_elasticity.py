@@ -0,0 +1,105 @@
+"""
+Tests for the elastic gradient with precomputed per-face constants
+k = area·thickness·μ is cached per mesh and rebuilt when the material changes
+"""
+
+import sys
+sys.path.insert(0, 'build')
+
+try:
+    import ando_barrier_core as abc
+    import numpy as np
+    from scene_helpers import grid, make_cloth
+except ImportError as e:
+    print(f"Error importing modules: {e}")
+    print("Make sure to build the project first: ./build.sh")
+    sys.exit(1)
+
+
+def _make_deformed_grid(res=12, youngs_modulus=1e5, seed=0):
+    vertices, triangles = grid(res, 1.0)
+    mesh, state = make_cloth(vertices, triangles, youngs_modulus=youngs_modulus)
+
+    rng = np.random.default_rng(seed)
+    deformed = vertices + rng.normal(0.0, 0.01, vertices.shape).astype(np.float32)
+    mesh.set_positions(deformed)
+    return mesh, state, vertices, deformed, triangles
+
+
+def _reference_gradient(rest, deformed, triangles, youngs_modulus, poisson_ratio, thickness):
+    """ARAP gradient 2k (F - I) Dm⁻ᵀ mapped through the deformed tangent frame"""
+    mu = youngs_modulus / (2.0 * (1.0 + poisson_ratio))
+    gradient = np.zeros_like(deformed, dtype=np.float64)
+    for tri in triangles:
+        r0, r1, r2 = rest[tri].astype(np.float64)
+        d0, d1, d2 = deformed[tri].astype(np.float64)
+
+        # Rest shape in its own 2D frame
+        u1, u2 = r1 - r0, r2 - r0
+        t1 = u1 / np.linalg.norm(u1)
+        n = np.cross(u1, u2)
+        t2 = np.cross(n / np.linalg.norm(n), t1)
+        Dm = np.array([[u1 @ t1, u2 @ t1], [u1 @ t2, u2 @ t2]])
+        area = 0.5 * abs(np.linalg.det(Dm))
+
+        # Deformed shape in the deformed frame
+        e1, e2 = d1 - d0, d2 - d0
+        s1 = e1 / np.linalg.norm(e1)
+        m = np.cross(e1, e2)
+        s2 = np.cross(m / np.linalg.norm(m), s1)
+        Ds = np.array([[e1 @ s1, e2 @ s1], [e1 @ s2, e2 @ s2]])
+
+        Dm_inv = np.linalg.inv(Dm)
+        F = Ds @ Dm_inv
+        k = area * thickness * mu
+        H = 2.0 * k * (F - np.eye(2)) @ Dm_inv.T
+        f1 = H[0, 0] * s1 + H[1, 0] * s2
+        f2 = H[0, 1] * s1 + H[1, 1] * s2
+        gradient[tri[0]] -= f1 + f2
+        gradient[tri[1]] += f1
+        gradient[tri[2]] += f2
+    return gradient.reshape(-1)
+
+
+def test_gradient_matches_reference():
+    mesh, state, rest, deformed, triangles = _make_deformed_grid()
+    gradient = np.zeros(3 * len(rest), dtype=np.float32)
+    abc.Elasticity.compute_gradient(mesh, state, gradient)
+
+    expected = _reference_gradient(rest, deformed, triangles, 1e5, 0.3, 0.001)
+    scale = np.abs(expected).max()
+    assert scale > 0.0
+    assert np.abs(gradient - expected).max() < 1e-3 * scale
+
+
+def test_material_change_rebuilds_constants():
+    """Changing E after the first evaluation must not reuse the cached k"""
+    mesh, state, rest, _, _ = _make_deformed_grid()
+    before = np.zeros(3 * len(rest), dtype=np.float32)
+    abc.Elasticity.compute_gradient(mesh, state, before)
+    energy_before = abc.Elasticity.compute_energy(mesh, state)
+
+    mesh.material.youngs_modulus = 3e5
+    after = np.zeros(3 * len(rest), dtype=np.float32)
+    abc.Elasticity.compute_gradient(mesh, state, after)
+
+    assert np.allclose(after, 3.0 * before, rtol=1e-5, atol=1e-6)
+    assert abs(abc.Elasticity.compute_energy(mesh, state) - 3.0 * energy_before) < 1e-4 * energy_before
+
+
+def test_parallel_path_matches_reference():
+    """Above the parallel face threshold (2048 faces) the gather gives the same forces"""
+    mesh, state, rest, deformed, triangles = _make_deformed_grid(res=34, seed=1)
+    assert mesh.num_triangles() >= 2048
+    gradient = np.zeros(3 * len(rest), dtype=np.float32)
+    abc.Elasticity.compute_gradient(mesh, state, gradient)
+
+    expected = _reference_gradient(rest, deformed, triangles, 1e5, 0.3, 0.001)
+    assert np.abs(gradient - expected).max() < 1e-3 * np.abs(expected).max()
+
+
+if __name__ == '__main__':
+    test_gradient_matches_reference()
+    test_material_change_rebuilds_constants()
+    test_parallel_path_matches_reference()
+    print("All elasticity tests passed")
@@ -0,0 +1,93 @@
+"""
+Tests for EnergyTracker constraint energies
+Barrier energy reuses the k̄ of the last step, strain-limit energy the step's SVDs; both count towards the total
+"""
+
+import sys
+sys.path.insert(0, 'build')
+
+try:
+    import ando_barrier_core as abc
+    import numpy as np
+    from scene_helpers import add_ground_wall, grid, make_cloth, rigid_box
+except ImportError as e:
+    print(f"Error importing modules: {e}")
+    print("Make sure to build the project first: ./build.sh")
+    sys.exit(1)
+
+
+GRAVITY = np.array([0.0, 0.0, -9.81], dtype=np.float32)
+
+
+def _make_scene(res=6, height=0.5):
+    """Cloth sheet over a ground wall"""
+    mesh, state = make_cloth(*grid(res, 0.4, height))
+    params = abc.SimParams()
+    params.dt = 0.002
+    params.contact_gap_max = 0.002
+    params.wall_gap = 0.001
+    constraints = abc.Constraints()
+    add_ground_wall(constraints, params.wall_gap)
+    return mesh, state, constraints, params
+
+
+def test_wall_barrier_energy():
+    """A sheet inside the wall's gap has barrier energy; far above it has none"""
+    mesh, state, constraints, params = _make_scene(height=0.0015)
+    diag = abc.EnergyTracker.compute(mesh, state, constraints, params, [])
+    assert diag.barrier_energy > 0.0
+    assert np.isclose(diag.total_energy,
+                      diag.kinetic_energy + diag.elastic_energy + diag.barrier_energy +
+                      diag.strain_limit_energy, rtol=1e-6)
+
+    mesh, state, constraints, params = _make_scene(height=0.5)
+    assert abc.EnergyTracker.compute(mesh, state, constraints, params, []).barrier_energy == 0.0
+
+
+def test_contact_barrier_uses_step_stiffness():
+    """Contacts of the last step carry k̄; freshly detected ones do not and add no energy"""
+    mesh, state, constraints, params = _make_scene(height=0.1015)
+    bodies = [rigid_box((0.1, 0.1, 0.05))]
+    state.apply_gravity(GRAVITY, params.dt)
+    abc.Integrator.step(mesh, state, constraints, params, bodies)
+
+    contacts = abc.Integrator.compute_contacts(mesh, state, bodies)
+    assert len(contacts) > 0
+    assert all(c.stiffness < 0.0 for c in contacts)
+    assert abc.EnergyTracker.compute(mesh, state, constraints, params, contacts).barrier_energy == 0.0
+
+    diag = abc.Diagnostics.compute(mesh, state, constraints, params, bodies)
+    assert diag.num_contacts > 0
+    assert diag.energy.barrier_energy > 0.0
+    assert abc.EnergyTracker.compute(mesh, state, constraints, params).barrier_energy > 0.0
+
+
+def test_strain_limit_energy():
+    """Stretching past the limit with strain limiting on adds strain-limit energy"""
+    mesh, state, constraints, params = _make_scene()
+    params.enable_strain_limiting = True
+    positions = np.array(state.get_positions())
+    velocities = np.zeros_like(positions)
+    velocities[:, 0] = 50.0 * positions[:, 0]
+    state.set_velocities(velocities.astype(np.float32))
+    abc.Integrator.step(mesh, state, constraints, params)
+
+    sigma = abc.StrainLimiting.face_singular_values(mesh, state)
+    assert sigma.shape == (mesh.num_triangles(), 2)
+    assert np.all(sigma[:, 0] >= sigma[:, 1])
+    assert sigma[:, 0].max() > 1.0 + params.strain_tau
+
+    diag = abc.EnergyTracker.compute(mesh, state, constraints, params)
+    assert diag.strain_limit_energy > 0.0
+    assert diag.total_energy >= diag.kinetic_energy + diag.strain_limit_energy - 1e-9
+
+    params.enable_strain_limiting = False
+    abc.Integrator.step(mesh, state, constraints, params)
+    assert abc.EnergyTracker.compute(mesh, state, constraints, params).strain_limit_energy == 0.0
+
+
+if __name__ == '__main__':
+    test_wall_barrier_energy()
+    test_contact_barrier_uses_step_stiffness()
+    test_strain_limit_energy()
+    print("All energy tracker tests passed")
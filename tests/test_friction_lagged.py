@@ -0,0 +1,71 @@
+"""
+Tests for lagged friction (SimParams.friction_lagged)
+Normals, normal force estimates and k_f are frozen once per β iteration
+"""
+
+import sys
+sys.path.insert(0, 'build')
+
+try:
+    import ando_barrier_core as abc
+    import numpy as np
+    from scene_helpers import grid, ground_quad, make_cloth
+except ImportError as e:
+    print(f"Error importing modules: {e}")
+    print("Make sure to build the project first: ./build.sh")
+    sys.exit(1)
+
+
+GRAVITY = np.array([0.0, 0.0, -9.81], dtype=np.float32)
+
+
+def _make_scene(res=8, height=0.003):
+    """Cloth sheet sliding along x just above a rigid ground quad"""
+    vertices, triangles = grid(res, 0.4, height)
+    mesh, state = make_cloth(vertices, triangles)
+    velocities = np.tile(np.array([0.5, 0.0, 0.0], dtype=np.float32), (len(vertices), 1))
+    state.set_velocities(velocities)
+
+    params = abc.SimParams()
+    params.dt = 0.005
+    params.friction_mu = 0.4
+    return mesh, state, abc.Constraints(), params, [ground_quad()]
+
+
+def _run(friction, lagged, steps=10):
+    mesh, state, constraints, params, rigid_bodies = _make_scene()
+    params.enable_friction = friction
+    params.friction_lagged = lagged
+    abc.Integrator.reset_profile_summary(constraints)
+    for _ in range(steps):
+        state.apply_gravity(GRAVITY, params.dt)
+        abc.Integrator.step(mesh, state, constraints, params, rigid_bodies)
+    return np.array(state.get_positions()), abc.Integrator.profile_summary(constraints)
+
+
+def test_lagged_friction_disabled_by_default():
+    assert not abc.SimParams().friction_lagged
+
+
+def test_lagged_friction_slows_sliding():
+    """Frozen friction still opposes the tangential motion"""
+    frictionless, _ = _run(friction=False, lagged=False)
+    lagged, summary = _run(friction=True, lagged=True)
+    assert summary.mean()['num_contacts'] > 0
+    assert np.all(np.isfinite(lagged))
+    assert lagged[:, 0].mean() < frictionless[:, 0].mean()
+
+
+def test_lagged_matches_live_friction():
+    """With one Newton iteration per β iteration the frozen problem equals the live one"""
+    live, live_summary = _run(friction=True, lagged=False)
+    lagged, lagged_summary = _run(friction=True, lagged=True)
+    assert np.allclose(live, lagged, atol=1e-4)
+    assert lagged_summary.totals.newton_iterations <= live_summary.totals.newton_iterations
+
+
+if __name__ == '__main__':
+    test_lagged_friction_disabled_by_default()
+    test_lagged_friction_slows_sliding()
+    test_lagged_matches_live_friction()
+    print("All lagged friction tests passed")
@@ -0,0 +1,68 @@
+"""
+Tests for the direct time-of-impact line search (SimParams.line_search_toi)
+"""
+
+import sys
+sys.path.insert(0, 'build')
+
+try:
+    import ando_barrier_core as abc
+    import numpy as np
+    from scene_helpers import add_ground_wall, grid, make_cloth
+except ImportError as e:
+    print(f"Error importing modules: {e}")
+    print("Make sure to build the project first: ./build.sh")
+    sys.exit(1)
+
+
+def _make_falling_sheet(res=5, height=0.05, speed=8.0, toi=True):
+    vertices, triangles = grid(res, 0.4, height)
+    mesh, state = make_cloth(vertices, triangles)
+    velocities = np.zeros_like(vertices)
+    velocities[:, 2] = -speed  # Would cross the ground within one step
+    state.set_velocities(velocities)
+
+    constraints = abc.Constraints()
+    add_ground_wall(constraints)
+
+    params = abc.SimParams()
+    params.dt = 0.01
+    params.line_search_toi = toi
+    return mesh, state, constraints, params
+
+
+def test_toi_step_stays_above_wall():
+    """The TOI bound stops a fast-moving sheet at the wall in one sweep"""
+    mesh, state, constraints, params = _make_falling_sheet()
+    abc.Integrator.reset_profile_summary(constraints)
+    for _ in range(3):
+        abc.Integrator.step(mesh, state, constraints, params)
+
+    positions = state.get_positions()
+    assert np.all(np.isfinite(positions))
+    assert positions[:, 2].min() >= 0.0
+
+    summary = abc.Integrator.profile_summary(constraints)
+    assert summary.totals.line_search_sweeps_saved > 0
+    assert summary.totals.line_search_backtracks == 0
+    assert summary.totals.line_search_sweeps <= 2 * summary.totals.line_search_calls
+
+
+def test_toi_saves_sweeps_over_backtracking():
+    """Backtracking needs more feasibility sweeps for the same scene"""
+    sweeps = {}
+    for toi in (False, True):
+        mesh, state, constraints, params = _make_falling_sheet(toi=toi)
+        abc.Integrator.step(mesh, state, constraints, params)
+        profile = abc.Integrator.last_step_profile(constraints)
+        sweeps[toi] = profile.line_search_sweeps / max(1, profile.line_search_calls)
+        if not toi:
+            assert profile.line_search_sweeps_saved == 0
+
+    assert sweeps[True] < sweeps[False]
+
+
+if __name__ == '__main__':
+    test_toi_step_stays_above_wall()
+    test_toi_saves_sweeps_over_backtracking()
+    print("All TOI line search tests passed")
@@ -0,0 +1,67 @@
+"""
+Tests for the parameter sweep runner (demos/param_sweep.py)
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, 'build')
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'demos'))
+
+try:
+    import numpy as np
+    import param_sweep
+except ImportError as e:
+    print(f"Error importing modules: {e}")
+    print("Make sure to build the project first: ./build.sh")
+    sys.exit(1)
+
+
+def _fake_result(overrides, step_ms, stable=True):
+    result = {name: 1.0 for name in param_sweep.METRIC_COLUMNS}
+    result.update({'overrides': overrides, 'stable': stable,
+                   'mean_step_ms': step_ms, 'error': ''})
+    return result
+
+
+def test_grid_expansion():
+    """Every combination is produced and integer solver params stay integers"""
+    grid = param_sweep.parse_param_args(['beta_max=0.1,0.25', 'max_newton_steps=4,8,16'])
+    combos = param_sweep.expand_grid(grid)
+
+    assert len(combos) == 6
+    assert {c['beta_max'] for c in combos} == {0.1, 0.25}
+    assert all(isinstance(c['max_newton_steps'], int) for c in combos)
+
+
+def test_table_and_ranking():
+    """Tables round-trip as CSV/NPZ and unstable runs rank last"""
+    results = [
+        _fake_result({'pcg_tol': 1e-3}, 5.0),
+        _fake_result({'pcg_tol': 1e-2}, 1.0, stable=False),
+        _fake_result({'pcg_tol': 1e-4}, 3.0),
+    ]
+
+    ranked = param_sweep.rank_results(results)
+    assert [r['mean_step_ms'] for r in ranked] == [3.0, 5.0, 1.0]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        npz_path = os.path.join(tmp, 'sweep.npz')
+        param_sweep.write_table(results, npz_path)
+        table = np.load(npz_path)
+        assert np.allclose(table['pcg_tol'], [1e-3, 1e-2, 1e-4])
+        assert table['stable'].tolist() == [True, False, True]
+
+        csv_path = os.path.join(tmp, 'sweep.csv')
+        param_sweep.write_table(results, csv_path)
+        with open(csv_path) as f:
+            lines = f.read().strip().splitlines()
+        assert lines[0].startswith('pcg_tol,stable,mean_step_ms')
+        assert len(lines) == 4
+
+
+if __name__ == '__main__':
+    test_grid_expansion()
+    test_table_and_ranking()
+    print("All parameter sweep tests passed")
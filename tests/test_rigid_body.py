@@ -0,0 +1,79 @@
+"""
+Tests for RigidBody world-space vertices and transform
+world_vertices() is a cached zero-copy view; transform() maps the initial vertices to the current ones
+"""
+
+import sys
+sys.path.insert(0, 'build')
+
+try:
+    import ando_barrier_core as abc
+    import numpy as np
+except ImportError as e:
+    print(f"Error importing modules: {e}")
+    print("Make sure to build the project first: ./build.sh")
+    sys.exit(1)
+
+
+def _make_box():
+    vertices = np.array([[x, y, z] for z in (0.0, 0.5) for y in (0.0, 1.0) for x in (1.0, 3.0)],
+                        dtype=np.float32)
+    triangles = np.array([[0, 1, 3], [0, 3, 2], [4, 6, 7], [4, 7, 5],
+                          [0, 4, 5], [0, 5, 1], [2, 3, 7], [2, 7, 6],
+                          [0, 2, 6], [0, 6, 4], [1, 5, 7], [1, 7, 3]], dtype=np.int32)
+    body = abc.RigidBody()
+    body.initialize(vertices, triangles, 100.0)
+    return body, vertices
+
+
+def _apply(transform, points):
+    return points @ transform[:3, :3].T + transform[:3, 3]
+
+
+def test_world_vertices_is_readonly_view():
+    body, vertices = _make_box()
+    view = body.world_vertices()
+    assert view.shape == (8, 3)
+    assert np.allclose(view, vertices, atol=1e-6)
+    assert not view.flags.writeable
+    assert not view.flags.owndata
+
+    # Same buffer on every call while the body does not move
+    assert body.world_vertices().__array_interface__['data'][0] == view.__array_interface__['data'][0]
+
+
+def test_world_vertices_follow_moves():
+    body, vertices = _make_box()
+    body.world_vertices()
+    body.position = [float(c) + 1.0 for c in body.position]
+    assert np.allclose(body.world_vertices(), vertices + 1.0, atol=1e-6)
+
+    rotation = np.array([[0, -1, 0], [1, 0, 0], [0, 0, 1]], dtype=np.float32)
+    body.rotation = rotation
+    assert np.allclose(body.rotation, rotation)
+    center = np.array(body.position)
+    expected = (vertices - vertices.mean(axis=0)) @ rotation.T + center
+    assert np.allclose(body.world_vertices(), expected, atol=1e-5)
+
+
+def test_transform_matches_world_vertices_after_integration():
+    """Off-centre impulse spins the body; the transform reproduces its vertices"""
+    body, vertices = _make_box()
+    assert np.allclose(body.transform(), np.eye(4), atol=1e-6)
+
+    body.apply_impulse(np.array([3.0, 1.0, 0.5], dtype=np.float32),
+                       np.array([0.0, 0.0, 50.0], dtype=np.float32))
+    for _ in range(10):
+        body.integrate(0.01)
+
+    transform = body.transform()
+    assert not np.allclose(transform[:3, :3], np.eye(3), atol=1e-3)
+    assert np.allclose(transform[3], [0.0, 0.0, 0.0, 1.0])
+    assert np.allclose(_apply(transform, vertices), body.world_vertices(), atol=1e-5)
+
+
+if __name__ == '__main__':
+    test_world_vertices_is_readonly_view()
+    test_world_vertices_follow_moves()
+    test_transform_matches_world_vertices_after_integration()
+    print("All rigid body tests passed")
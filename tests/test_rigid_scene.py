@@ -0,0 +1,91 @@
+"""
+Tests for the scene-level rigid broad phase
+Cloth-vs-rigid detection only visits bodies whose bounds overlap the cloth's bounds
+"""
+
+import sys
+sys.path.insert(0, 'build')
+
+try:
+    import ando_barrier_core as abc
+    import numpy as np
+    from scene_helpers import grid, ground_quad, make_cloth
+except ImportError as e:
+    print(f"Error importing modules: {e}")
+    print("Make sure to build the project first: ./build.sh")
+    sys.exit(1)
+
+
+GRAVITY = np.array([0.0, 0.0, -9.81], dtype=np.float32)
+
+
+def _make_cloth(res=6, height=0.005):
+    return make_cloth(*grid(res, 0.4, height))
+
+
+def _props(count, offset=5.0):
+    """Small quads on a grid far away from the cloth"""
+    side = int(np.ceil(np.sqrt(count)))
+    return [ground_quad((offset + 0.5 * (i % side), offset + 0.5 * (i // side), 0.0), 0.1)
+            for i in range(count)]
+
+
+def _key(contacts):
+    return [(c.idx0, c.idx1, c.idx2, c.idx3, c.rigid_body_index, round(c.gap, 6)) for c in contacts]
+
+
+def test_far_bodies_produce_no_contacts():
+    mesh, state = _make_cloth()
+    ground = ground_quad((0.0, 0.0, 0.0), 1.0)
+    alone = abc.Integrator.compute_contacts(mesh, state, [ground])
+    assert len(alone) > 0
+
+    crowded = abc.Integrator.compute_contacts(mesh, state, [ground] + _props(200))
+    assert _key(crowded) == _key(alone)
+
+
+def test_body_index_preserved_among_many():
+    """A nearby body in the middle of the list keeps its scene index"""
+    mesh, state = _make_cloth()
+    props = _props(50)
+    props.insert(17, ground_quad((0.0, 0.0, 0.0), 1.0))
+    contacts = abc.Integrator.compute_contacts(mesh, state, props)
+    rigid = [c for c in contacts if c.rigid_body_index >= 0]
+    assert len(rigid) > 0
+    assert all(c.rigid_body_index == 17 for c in rigid)
+
+
+def test_moved_body_is_found_after_refit():
+    """Bounds follow the body transform"""
+    mesh, state = _make_cloth()
+    body = ground_quad((3.0, 0.0, 0.0), 1.0)
+    assert len(abc.Integrator.compute_contacts(mesh, state, [body])) == 0
+
+    body.position = [0.0, 0.0, -0.002]
+    assert len(abc.Integrator.compute_contacts(mesh, state, [body])) > 0
+
+    body.position = [0.0, 0.0, -1.0]
+    assert len(abc.Integrator.compute_contacts(mesh, state, [body])) == 0
+
+
+def test_step_with_many_props_matches_single_body():
+    """Stepping with far props gives the same cloth motion"""
+    trajectories = []
+    for bodies in ([ground_quad((0.0, 0.0, 0.0), 1.0)], [ground_quad((0.0, 0.0, 0.0), 1.0)] + _props(100)):
+        mesh, state = _make_cloth()
+        constraints = abc.Constraints()
+        params = abc.SimParams()
+        params.dt = 0.005
+        for _ in range(3):
+            state.apply_gravity(GRAVITY, params.dt)
+            abc.Integrator.step(mesh, state, constraints, params, bodies)
+        trajectories.append(np.array(state.get_positions()))
+    assert np.array_equal(trajectories[0], trajectories[1])
+
+
+if __name__ == '__main__':
+    test_far_bodies_produce_no_contacts()
+    test_body_index_preserved_among_many()
+    test_moved_body_is_found_after_refit()
+    test_step_with_many_props_matches_single_body()
+    print("All rigid scene broad phase tests passed")
@@ -0,0 +1,117 @@
+"""
+Tests for the native per-step profile (Integrator.last_step_profile / profile_summary)
+"""
+
+import sys
+sys.path.insert(0, 'build')
+
+try:
+    import ando_barrier_core as abc
+    import numpy as np
+    from scene_helpers import add_ground_wall, grid, ground_quad, make_cloth
+except ImportError as e:
+    print(f"Error importing modules: {e}")
+    print("Make sure to build the project first: ./build.sh")
+    sys.exit(1)
+
+
+def _make_drape(res=6, height=0.05):
+    vertices, triangles = grid(res, 0.5, height)
+    mesh, state = make_cloth(vertices, triangles)
+    constraints = abc.Constraints()
+    constraints.add_pin(0, vertices[0])
+    add_ground_wall(constraints)
+    params = abc.SimParams()
+    params.dt = 0.005
+    return mesh, state, constraints, params
+
+
+def test_step_profile_fields():
+    """Each step records phase timings and solver counters"""
+    mesh, state, constraints, params = _make_drape()
+    gravity = np.array([0.0, 0.0, -9.81], dtype=np.float32)
+
+    abc.Integrator.reset_profile_summary(constraints)
+    num_steps = 4
+    for _ in range(num_steps):
+        state.apply_gravity(gravity, params.dt)
+        abc.Integrator.step(mesh, state, constraints, params)
+
+    profile = abc.Integrator.last_step_profile(constraints)
+    assert profile.total_ms > 0.0
+    assert profile.beta_iterations >= 1
+    assert profile.newton_iterations >= profile.pcg_solves >= 1
+    assert profile.line_search_calls == profile.pcg_solves
+    phases = (profile.prediction_ms + profile.collision_ms + profile.gradient_ms +
+              profile.assembly_ms + profile.pcg_ms + profile.line_search_ms +
+              profile.velocity_update_ms)
+    assert phases <= profile.total_ms * 1.01
+
+    d = profile.to_dict()
+    assert d['pcg_iterations'] == profile.pcg_iterations
+    assert 'ccd_calls' in d and 'line_search_backtracks' in d
+
+
+def test_profile_summary_aggregates():
+    """The run summary counts steps and averages totals"""
+    mesh, state, constraints, params = _make_drape()
+    gravity = np.array([0.0, 0.0, -9.81], dtype=np.float32)
+
+    abc.Integrator.reset_profile_summary(constraints)
+    local = abc.StepProfileSummary()
+    newton_total = 0
+    for _ in range(3):
+        state.apply_gravity(gravity, params.dt)
+        abc.Integrator.step(mesh, state, constraints, params)
+        profile = abc.Integrator.last_step_profile(constraints)
+        local.accumulate(profile)
+        newton_total += profile.newton_iterations
+
+    summary = abc.Integrator.profile_summary(constraints)
+    assert summary.steps == 3
+    assert local.steps == 3
+    assert summary.totals.newton_iterations == newton_total
+    assert abs(summary.mean()['newton_iterations'] - newton_total / 3.0) < 1e-9
+    assert summary.peak.total_ms <= summary.totals.total_ms
+
+    abc.Integrator.reset_profile_summary(constraints)
+    assert abc.Integrator.profile_summary(constraints).steps == 0
+
+
+def test_profile_summary_per_simulation():
+    """Each simulation's constraints keep their own summary"""
+    mesh_a, state_a, constraints_a, params_a = _make_drape()
+    mesh_b, state_b, constraints_b, params_b = _make_drape()
+    for _ in range(2):
+        abc.Integrator.step(mesh_a, state_a, constraints_a, params_a)
+    abc.Integrator.step(mesh_b, state_b, constraints_b, params_b)
+
+    assert abc.Integrator.profile_summary(constraints_a).steps == 2
+    assert abc.Integrator.profile_summary(constraints_b).steps == 1
+
+    abc.Integrator.reset_profile_summary(constraints_a)
+    assert abc.Integrator.profile_summary(constraints_a).steps == 0
+    assert abc.Integrator.profile_summary(constraints_b).steps == 1
+
+
+def test_rigid_coupling_timed_separately():
+    """coupling_ms covers the rigid body stage and stays zero without bodies"""
+    mesh, state, constraints, params = _make_drape()
+    abc.Integrator.step(mesh, state, constraints, params)
+    assert abc.Integrator.last_step_profile(constraints).coupling_ms == 0.0
+
+    rigid_bodies = [ground_quad()]
+    abc.Integrator.step(mesh, state, constraints, params, rigid_bodies)
+
+    profile = abc.Integrator.last_step_profile(constraints)
+    assert profile.coupling_ms > 0.0
+    assert profile.coupling_ms <= profile.total_ms
+    assert 'coupling_ms' in profile.to_dict()
+
+
+if __name__ == '__main__':
+    test_step_profile_fields()
+    test_profile_summary_aggregates()
+    test_profile_summary_per_simulation()
+    test_rigid_coupling_timed_separately()
+    print("All step profile tests passed")
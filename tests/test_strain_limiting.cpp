@@ -0,0 +1,214 @@
+#include "../src/core/types.h"
+#include "../src/core/mesh.h"
+#include "../src/core/state.h"
+#include "../src/core/constraints.h"
+#include "../src/core/strain_limiting.h"
+#include <Eigen/SVD>
+#include <cassert>
+#include <cmath>
+#include <iostream>
+#include <random>
+#include <vector>
+
+using namespace ando_barrier;
+
+namespace {
+
+using Mat32 = StrainLimiting::Mat32;
+
+void check_factorization(const Mat32& F, const Mat32& U, const Vec2& sigma, const Mat2& V) {
+    assert(sigma[0] >= sigma[1]);
+    assert((U.transpose() * U - Mat2::Identity()).cwiseAbs().maxCoeff() < 1e-4);
+    assert((V.transpose() * V - Mat2::Identity()).cwiseAbs().maxCoeff() < 1e-4);
+    assert((U * sigma.asDiagonal() * V.transpose() - F).cwiseAbs().maxCoeff() < 1e-4 * (1.0 + F.norm()));
+}
+
+void test_svd_matches_jacobi() {
+    std::cout << "Testing closed-form 3×2 SVD against JacobiSVD..." << std::endl;
+
+    std::mt19937 rng(7);
+    std::uniform_real_distribution<Real> entry(-2.0, 2.0);
+    Real max_error = 0.0;
+    for (int trial = 0; trial < 1000; ++trial) {
+        Mat32 F;
+        for (int i = 0; i < 3; ++i) {
+            for (int j = 0; j < 2; ++j) {
+                F(i, j) = entry(rng);
+            }
+        }
+
+        Mat32 U;
+        Vec2 sigma;
+        Mat2 V;
+        assert(StrainLimiting::compute_svd(F, U, sigma, V));
+        check_factorization(F, U, sigma, V);
+
+        Eigen::JacobiSVD<Mat32> reference(F);
+        Vec2 expected = reference.singularValues();
+        max_error = std::max(max_error, (sigma - expected).cwiseAbs().maxCoeff() / expected[0]);
+    }
+    assert(max_error < 1e-5);
+
+    std::cout << "  ✓ Max relative singular value error " << max_error << std::endl;
+}
+
+void test_svd_degenerate_cases() {
+    std::cout << "Testing closed-form SVD on degenerate deformation gradients..." << std::endl;
+
+    Mat32 U;
+    Vec2 sigma;
+    Mat2 V;
+
+    // Pure rotation: repeated singular values
+    Mat32 rotation;
+    rotation << 0.0, -1.0,
+                1.0,  0.0,
+                0.0,  0.0;
+    assert(StrainLimiting::compute_svd(rotation, U, sigma, V));
+    assert(std::abs(sigma[0] - 1.0) < 1e-5 && std::abs(sigma[1] - 1.0) < 1e-5);
+    check_factorization(rotation, U, sigma, V);
+
+    // Collapsed face: rank one, σ₂ clamped and U still orthonormal
+    Mat32 collapsed;
+    collapsed << 1.0, 2.0,
+                 0.0, 0.0,
+                 1.0, 2.0;
+    assert(StrainLimiting::compute_svd(collapsed, U, sigma, V));
+    assert(sigma[1] <= 1e-5);
+    assert((U.transpose() * U - Mat2::Identity()).cwiseAbs().maxCoeff() < 1e-4);
+
+    // Zero F
+    assert(StrainLimiting::compute_svd(Mat32::Zero(), U, sigma, V));
+    assert(sigma.allFinite());
+
+    std::cout << "  ✓ Repeated, rank-one and zero F handled" << std::endl;
+}
+
+// Grid with more faces than the parallel threshold, stretched 7% along x
+void build_stretched_grid(int res, Mesh& mesh, State& state) {
+    std::vector<Vec3> vertices;
+    std::vector<Triangle> triangles;
+    for (int y = 0; y < res; ++y) {
+        for (int x = 0; x < res; ++x) {
+            vertices.emplace_back(Real(x) / (res - 1), Real(y) / (res - 1), 0.0);
+        }
+    }
+    for (int y = 0; y < res - 1; ++y) {
+        for (int x = 0; x < res - 1; ++x) {
+            int i0 = y * res + x;
+            triangles.emplace_back(i0, i0 + res, i0 + 1);
+            triangles.emplace_back(i0 + 1, i0 + res, i0 + res + 1);
+        }
+    }
+    mesh.initialize(vertices, triangles, Material());
+    state.initialize(mesh);
+
+    std::mt19937 rng(3);
+    std::uniform_real_distribution<Real> stretch(1.06, 1.09);
+    for (Vec3& p : state.positions) {
+        p.x() *= stretch(rng);
+    }
+}
+
+void test_constraints_reuse_cached_svd() {
+    std::cout << "Testing strain constraint rebuild with the per-face SVD cache..." << std::endl;
+
+    Mesh mesh;
+    State state;
+    build_stretched_grid(34, mesh, state);
+    assert(mesh.num_triangles() >= 2048);
+
+    SimParams params;
+    params.enable_strain_limiting = true;
+    const int dofs = static_cast<int>(3 * mesh.num_vertices());
+    SparseMatrix H_elastic(dofs, dofs);
+
+    Constraints constraints;
+    StrainLimiting::rebuild_constraints(mesh, state, params, H_elastic, constraints);
+    const size_t num_limits = constraints.strain_limits.size();
+    assert(num_limits > 0);
+    for (size_t i = 1; i < num_limits; ++i) {
+        const StrainConstraint& a = constraints.strain_limits[i - 1];
+        const StrainConstraint& b = constraints.strain_limits[i];
+        assert(a.face_idx < b.face_idx ||
+               (a.face_idx == b.face_idx && a.singular_index < b.singular_index));
+    }
+
+    // Same positions: rebuild from the cache gives the same constraints
+    std::vector<StrainConstraint> first = constraints.strain_limits;
+    StrainLimiting::rebuild_constraints(mesh, state, params, H_elastic, constraints);
+    assert(constraints.strain_limits.size() == num_limits);
+    for (size_t i = 0; i < num_limits; ++i) {
+        assert(constraints.strain_limits[i].face_idx == first[i].face_idx);
+        assert(constraints.strain_limits[i].sigma == first[i].sigma);
+        assert(constraints.strain_limits[i].stiffness == first[i].stiffness);
+    }
+
+    // Gradient and Hessian are identical with and without the cache
+    VecX cached_gradient = VecX::Zero(dofs);
+    std::vector<Triplet> cached_triplets;
+    StrainLimiting::accumulate_gradient(mesh, state, constraints, params, cached_gradient);
+    StrainLimiting::accumulate_hessian(mesh, state, constraints, params, cached_triplets);
+
+    Constraints uncached = constraints;
+    uncached.strain_svd_cache.resize(0);
+    VecX gradient = VecX::Zero(dofs);
+    std::vector<Triplet> triplets;
+    StrainLimiting::accumulate_gradient(mesh, state, uncached, params, gradient);
+    StrainLimiting::accumulate_hessian(mesh, state, uncached, params, triplets);
+
+    assert(cached_gradient.norm() > 0.0);
+    assert(cached_gradient == gradient);
+    assert(cached_triplets.size() == triplets.size());
+    for (size_t i = 0; i < triplets.size(); ++i) {
+        assert(cached_triplets[i].row() == triplets[i].row());
+        assert(cached_triplets[i].col() == triplets[i].col());
+        assert(cached_triplets[i].value() == triplets[i].value());
+    }
+
+    std::cout << "  ✓ " << num_limits << " constraints, cached and fresh SVDs agree" << std::endl;
+}
+
+void test_face_singular_values() {
+    std::cout << "Testing per-face singular values of F..." << std::endl;
+
+    Mesh mesh;
+    State state;
+    build_stretched_grid(34, mesh, state);
+
+    // Uniform stretch: σ = (1.25, 0.9) on every face
+    for (size_t i = 0; i < state.positions.size(); ++i) {
+        state.positions[i] = Vec3(1.25 * mesh.vertices[i].x(), 0.9 * mesh.vertices[i].y(), 0.0);
+    }
+    std::vector<Vec2> sigma;
+    StrainLimiting::compute_face_singular_values(mesh, state, sigma);
+    assert(sigma.size() == mesh.num_triangles());
+    for (const Vec2& s : sigma) {
+        assert(std::abs(s[0] - 1.25) < 1e-4);
+        assert(std::abs(s[1] - 0.9) < 1e-4);
+    }
+
+    // Rigid rotation does not strain
+    for (size_t i = 0; i < state.positions.size(); ++i) {
+        const Vec3& x = mesh.vertices[i];
+        state.positions[i] = Vec3(x.z(), x.x(), x.y());
+    }
+    StrainLimiting::compute_face_singular_values(mesh, state, sigma);
+    for (const Vec2& s : sigma) {
+        assert((s - Vec2::Ones()).cwiseAbs().maxCoeff() < 1e-4);
+    }
+
+    std::cout << "  ✓ " << sigma.size() << " faces" << std::endl;
+}
+
+} // namespace
+
+int main() {
+    std::cout << "\n========= Strain Limiting Tests =========\n" << std::endl;
+    test_svd_matches_jacobi();
+    test_svd_degenerate_cases();
+    test_constraints_reuse_cached_svd();
+    test_face_singular_values();
+    std::cout << "\n========= All Strain Limiting Tests Passed =========\n" << std::endl;
+    return 0;
+}
@@ -0,0 +1,99 @@
+"""
+Tests for SubstepScheduler (variable substeps within an output frame)
+dt grows on easy steps, shrinks on line-search failures / β stalls, and every frame closes exactly
+"""
+
+import sys
+sys.path.insert(0, 'build')
+
+try:
+    import ando_barrier_core as abc
+    import numpy as np
+    from scene_helpers import add_ground_wall, grid, make_cloth, rigid_box
+except ImportError as e:
+    print(f"Error importing modules: {e}")
+    print("Make sure to build the project first: ./build.sh")
+    sys.exit(1)
+
+
+GRAVITY = np.array([0.0, 0.0, -9.81], dtype=np.float32)
+FRAME_DT = 1.0 / 24.0
+
+
+def _make_scene(res=6, height=0.5):
+    """Free cloth sheet"""
+    mesh, state = make_cloth(*grid(res, 0.4, height))
+    return mesh, state, abc.Constraints(), abc.SimParams()
+
+
+def _make_tablecloth(res=8):
+    """Cloth dropped over a rigid box standing on a ground wall (the benchmark tablecloth)"""
+    mesh, state = make_cloth(*grid(res, 1.0, 0.32), youngs_modulus=5e5)
+
+    params = abc.SimParams()
+    params.beta_max = 0.25
+    params.contact_gap_max = 0.002
+    params.wall_gap = 0.001
+    params.enable_ccd = True
+
+    constraints = abc.Constraints()
+    add_ground_wall(constraints, params.wall_gap)
+    return mesh, state, constraints, params, [rigid_box((0.2, 0.2, 0.15))]
+
+
+def test_fixed_schedule_matches_manual_loop():
+    """With growth and shrinking disabled the frame is dt-sized substeps"""
+    mesh, state, constraints, params = _make_scene()
+    scheduler = abc.SubstepScheduler(FRAME_DT / 8)
+    scheduler.settings.dt_min = FRAME_DT / 8
+    scheduler.settings.dt_max = FRAME_DT / 8
+    report = scheduler.advance_frame(mesh, state, constraints, params, FRAME_DT, GRAVITY)
+    assert report.substeps == 8
+    assert report.profile.steps == 8
+
+    mesh_ref, state_ref, constraints_ref, params_ref = _make_scene()
+    params_ref.dt = FRAME_DT / 8
+    for _ in range(8):
+        state_ref.apply_gravity(GRAVITY, params_ref.dt)
+        abc.Integrator.step(mesh_ref, state_ref, constraints_ref, params_ref)
+    assert np.allclose(state.get_positions(), state_ref.get_positions(), atol=1e-6)
+
+
+def test_easy_frames_grow_dt():
+    """Free fall is easy: substeps per frame drop to the dt_max floor"""
+    mesh, state, constraints, params = _make_scene()
+    scheduler = abc.SubstepScheduler(0.002)
+    scheduler.settings.dt_max = 0.02
+    counts = []
+    for _ in range(6):
+        report = scheduler.advance_frame(mesh, state, constraints, params, FRAME_DT, GRAVITY)
+        counts.append(report.substeps)
+        assert report.max_dt <= 0.02 + 1e-7
+        assert abs(report.simulated - FRAME_DT) < 1e-6
+    assert counts[-1] < counts[0]
+    assert counts[-1] <= int(np.ceil(FRAME_DT / 0.02)) + 1
+    assert abs(scheduler.dt - 0.02) < 1e-6
+
+
+def test_hard_steps_shrink_dt():
+    """Large substeps onto the box fail the line search; dt shrinks and the cloth stays above ground"""
+    mesh, state, constraints, params, rigid_bodies = _make_tablecloth()
+    scheduler = abc.SubstepScheduler(0.02)
+    scheduler.settings.dt_max = 0.02
+    shrunk = 0
+    for _ in range(8):
+        report = scheduler.advance_frame(mesh, state, constraints, params, FRAME_DT, GRAVITY,
+                                         rigid_bodies)
+        shrunk += report.shrunk
+        assert abs(report.simulated - FRAME_DT) < 1e-6
+    assert shrunk > 0
+    positions = np.array(state.get_positions())
+    assert np.all(np.isfinite(positions))
+    assert positions[:, 2].min() > 0.0
+
+
+if __name__ == '__main__':
+    test_fixed_schedule_matches_manual_loop()
+    test_easy_frames_grow_dt()
+    test_hard_steps_shrink_dt()
+    print("All substep scheduler tests passed")
@@ -0,0 +1,91 @@
+"""
+Tests for the Chrome trace recorder (TraceRecorder / SimParams.enable_trace)
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, 'build')
+
+try:
+    import numpy as np
+    import ando_barrier_core as abc
+    from scene_helpers import add_ground_wall, grid, make_cloth
+except ImportError as e:
+    print(f"Error importing modules: {e}")
+    print("Make sure to build the project first: ./build.sh")
+    sys.exit(1)
+
+
+def _setup(res=4, size=0.5, height=0.02):
+    vertices, triangles = grid(res, size, height)
+    mesh, state = make_cloth(vertices, triangles)
+    constraints = abc.Constraints()
+    constraints.add_pin(0, vertices[0])
+    add_ground_wall(constraints)
+
+    params = abc.SimParams()
+    params.dt = 0.01
+    return mesh, state, constraints, params
+
+
+def _step(mesh, state, constraints, params, steps=2):
+    gravity = np.array([0.0, 0.0, -9.81], dtype=np.float32)
+    for _ in range(steps):
+        state.apply_gravity(gravity, params.dt)
+        abc.Integrator.step(mesh, state, constraints, params)
+
+
+def test_disabled_records_nothing():
+    """No events are recorded while tracing is off"""
+    abc.TraceRecorder.disable()
+    abc.TraceRecorder.clear()
+    _step(*_setup())
+    assert abc.TraceRecorder.event_count() == 0
+
+
+def test_trace_written_as_chrome_json():
+    """Enabled via SimParams, a step produces nested phase events"""
+    abc.TraceRecorder.disable()
+    abc.TraceRecorder.clear()
+    mesh, state, constraints, params = _setup()
+    params.enable_trace = True
+    _step(mesh, state, constraints, params)
+    assert not abc.TraceRecorder.is_enabled()
+
+    count = abc.TraceRecorder.event_count()
+    assert count > 0
+
+    # Steps without the switch do not keep recording
+    params.enable_trace = False
+    abc.Integrator.step(mesh, state, constraints, params)
+    assert abc.TraceRecorder.event_count() == count
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'run.trace.json')
+        assert abc.TraceRecorder.write(path)
+        with open(path, 'r') as f:
+            trace = json.load(f)
+
+    events = [e for e in trace['traceEvents'] if e['ph'] == 'X']
+    names = {e['name'] for e in events}
+    for expected in ('Integrator::step', 'Integrator::inner_newton_step',
+                     'Collision::detect_all_collisions', 'PCGSolver::solve',
+                     'LineSearch::search'):
+        assert expected in names, expected
+    assert sum(e['name'] == 'Integrator::step' for e in events) == 2
+
+    # Phases nest inside their step
+    step = next(e for e in events if e['name'] == 'Integrator::step')
+    inner = [e for e in events if e['name'] == 'PCGSolver::solve'
+             and step['ts'] <= e['ts'] <= step['ts'] + step['dur']]
+    assert inner
+    abc.TraceRecorder.clear()
+
+
+if __name__ == '__main__':
+    test_disabled_records_nothing()
+    test_trace_written_as_chrome_json()
+    print("All trace tests passed")
@@ -0,0 +1,54 @@
+"""
+Tests for active-set wall contacts (StepProfile.active_wall_vertices)
+Wall barrier terms are only evaluated for vertices within ḡ of a wall
+"""
+
+import sys
+sys.path.insert(0, 'build')
+
+try:
+    import ando_barrier_core as abc
+    from scene_helpers import add_ground_wall, grid, make_cloth
+except ImportError as e:
+    print(f"Error importing modules: {e}")
+    print("Make sure to build the project first: ./build.sh")
+    sys.exit(1)
+
+
+def _make_sheet(res=4, height=0.5, tilt=0.0):
+    mesh, state = make_cloth(*grid(res, 0.4, height, tilt))
+    constraints = abc.Constraints()
+    add_ground_wall(constraints)
+
+    params = abc.SimParams()
+    params.dt = 0.005
+    params.contact_gap_max = 0.002
+    return mesh, state, constraints, params
+
+
+def test_far_sheet_has_no_active_wall_vertices():
+    """A sheet well above the ground does no wall barrier work"""
+    mesh, state, constraints, params = _make_sheet(height=0.5)
+    abc.Integrator.step(mesh, state, constraints, params)
+    assert abc.Integrator.last_step_profile(constraints).active_wall_vertices == 0
+
+
+def test_only_near_vertices_are_active():
+    """A tilted sheet touching the ground activates only its low column"""
+    res = 4
+    # x = -0.2 column sits 1 mm above the ground, the rest rises to 0.1
+    mesh, state, constraints, params = _make_sheet(res=res, height=0.051, tilt=0.25)
+    abc.Integrator.step(mesh, state, constraints, params)
+
+    active = abc.Integrator.last_step_profile(constraints).active_wall_vertices
+    assert 0 < active <= res
+    assert state.get_positions()[:, 2].min() >= 0.0
+
+    profile = abc.Integrator.last_step_profile(constraints).to_dict()
+    assert profile['active_wall_vertices'] == active
+
+
+if __name__ == '__main__':
+    test_far_sheet_has_no_active_wall_vertices()
+    test_only_near_vertices_are_active()
+    print("All wall active-set tests passed")